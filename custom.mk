@@ -4,3 +4,21 @@
 # generated-target redefinitions, and help entries are invalid; the standardized
 # FLEXT verbs in base.mk own those. Add project-specific actions as
 # `_custom_<verb>_<what>` (e.g. run WHAT=<what>) or wrap a verb with a hook.
+
+# Benchmarks (`make test WHAT=benchmarks`): run the performance suite with
+# pytest-benchmark enabled, compare against the latest stored baseline and
+# fail when any mean regresses by more than 25%. Record a new baseline with
+# `make test WHAT=benchmarks-baseline` after an accepted change. Without a
+# stored baseline there is nothing to compare against, so the run fails.
+_custom_test_benchmarks: _builtin_require_environment
+	@if [ -z "$$(find .benchmarks -name '*.json' 2>/dev/null | head -n 1)" ]; then \
+		printf 'ERROR: no benchmark baseline in .benchmarks; run make test WHAT=benchmarks-baseline\n' >&2; \
+		exit 1; \
+	fi
+	@$(PYTEST_BOUNDED) $(UV_RUN) pytest tests/benchmarks -m performance \
+		--benchmark-enable --benchmark-storage=.benchmarks \
+		--benchmark-compare --benchmark-compare-fail=mean:25%
+
+_custom_test_benchmarks-baseline: _builtin_require_environment
+	@$(PYTEST_BOUNDED) $(UV_RUN) pytest tests/benchmarks -m performance \
+		--benchmark-enable --benchmark-storage=.benchmarks --benchmark-autosave
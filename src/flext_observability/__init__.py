@@ -54,7 +54,12 @@ _LAZY_MODULES: dict[str, tuple[str, ...]] = {
     ".models": ("FlextObservabilityModels", "m"),
     ".protocols": ("FlextObservabilityProtocols", "p"),
     ".services.advanced_context": ("FlextObservabilityAdvancedContext",),
+    ".services.aggregation": ("FlextObservabilityAggregation",),
+    ".services.alerting": ("FlextObservabilityAlerting",),
+    ".services.cardinality": ("FlextObservabilityCardinality",),
+    ".services.columnar": ("FlextObservabilityColumnar",),
     ".services.context": ("FlextObservabilityContext",),
+    ".services.core": ("FlextObservabilityCore",),
     ".services.custom_metrics": ("FlextObservabilityCustomMetrics",),
     ".services.error_handling": ("FlextObservabilityErrorHandling",),
     ".services.health": ("FlextObservabilityHealth",),
@@ -62,9 +67,17 @@ _LAZY_MODULES: dict[str, tuple[str, ...]] = {
     ".services.http_instrumentation": ("FlextObservabilityHTTP",),
     ".services.logging_integration": ("FlextObservabilityLogging",),
     ".services.monitoring": ("FlextObservabilityMonitor",),
+    ".services.multiprocess": ("FlextObservabilityMultiprocess",),
+    ".services.overhead": ("FlextObservabilityOverhead",),
     ".services.performance": ("FlextObservabilityPerformance",),
+    ".services.profiler": ("FlextObservabilityProfiler",),
     ".services.sampling": ("FlextObservabilitySampling",),
+    ".services.series": ("FlextObservabilitySeries",),
     ".services.services": ("FlextObservabilityServices",),
+    ".services.spill": ("FlextObservabilitySpill",),
+    ".services.stats_server": ("FlextObservabilityStatsServer",),
+    ".services.switches": ("FlextObservabilitySwitches",),
+    ".services.temporality": ("FlextObservabilityTemporality",),
     ".typings": ("FlextObservabilityTypes", "t"),
     ".utilities": ("FlextObservabilityUtilities", "u"),
     "flext_cli": ("d", "e", "h", "r", "s", "x"),
@@ -81,9 +94,14 @@ _LAZY_IMPORTS = build_lazy_import_map(
 _PUBLIC_EXPORTS: tuple[str, ...] = (
     "FlextObservability",
     "FlextObservabilityAdvancedContext",
+    "FlextObservabilityAggregation",
+    "FlextObservabilityAlerting",
+    "FlextObservabilityCardinality",
+    "FlextObservabilityColumnar",
     "FlextObservabilityConfig",
     "FlextObservabilityConstants",
     "FlextObservabilityContext",
+    "FlextObservabilityCore",
     "FlextObservabilityCustomMetrics",
     "FlextObservabilityErrorHandling",
     "FlextObservabilityHealth",
@@ -92,11 +110,19 @@ _PUBLIC_EXPORTS: tuple[str, ...] = (
     "FlextObservabilityLogging",
     "FlextObservabilityModels",
     "FlextObservabilityMonitor",
+    "FlextObservabilityMultiprocess",
+    "FlextObservabilityOverhead",
     "FlextObservabilityPerformance",
+    "FlextObservabilityProfiler",
     "FlextObservabilityProtocols",
     "FlextObservabilitySampling",
+    "FlextObservabilitySeries",
     "FlextObservabilityServices",
     "FlextObservabilitySettings",
+    "FlextObservabilitySpill",
+    "FlextObservabilityStatsServer",
+    "FlextObservabilitySwitches",
+    "FlextObservabilityTemporality",
     "FlextObservabilityTypes",
     "FlextObservabilityUtilities",
     "__author__",
@@ -2,7 +2,9 @@
 
 Model-less: business rules live in ``config/*.yaml`` under the ``Observability:`` key and
 are exposed through the open ``config.Observability`` namespace (``extra="allow"``), with
-no per-domain model. Access is ``config.Observability.<domain>[<key>...]``.
+no per-domain model. Access is ``config.Observability.<domain>[<key>...]``. The
+``config`` singleton (and its YAML loading) is built on first attribute access
+(PEP 562), not when the module is imported.
 
 Copyright (c) 2025 FLEXT Team. All rights reserved.
 SPDX-License-Identifier: MIT
@@ -10,6 +12,8 @@ SPDX-License-Identifier: MIT
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from flext_cli import FlextCliConfig, m
 
 
@@ -25,7 +29,17 @@ class FlextObservabilityConfig(FlextCliConfig):
     Observability: _ObservabilityNamespace = _ObservabilityNamespace()
 
 
-config: FlextObservabilityConfig = FlextObservabilityConfig.fetch_global()
-"""Pre-instantiated frozen config singleton — ``from flext_observability import config``."""
+if TYPE_CHECKING:
+    config: FlextObservabilityConfig
+    """Frozen config singleton — ``from flext_observability import config``."""
+
+
+def __getattr__(name: str) -> FlextObservabilityConfig:
+    """Build the ``config`` singleton (loading ``config/*.yaml``) on first access."""
+    if name == "config":
+        return FlextObservabilityConfig.fetch_global()
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
 
 __all__: list[str] = ["FlextObservabilityConfig", "config"]
@@ -1,12 +1,14 @@
 """FLEXT Observability Configuration - namespaced under ``settings.Observability``.
 
-Layer-0: imports only stdlib + pydantic + ``FlextSettings``. The universal
-runtime fields (``debug``/``trace``/``log_level``/``timezone``/``async_logging``)
-come from ``FlextSettings`` by MRO and are NOT redeclared here. Every project
-field lives inside the ``Observability`` namespace group with simple scalar types
-so each is settable via ``.env`` / env vars / params
+Layer-0: imports only stdlib + pydantic + ``FlextSettings`` and the project
+constants (for enum-typed fields). The universal runtime fields
+(``debug``/``trace``/``log_level``/``timezone``/``async_logging``) come from
+``FlextSettings`` by MRO and are NOT redeclared here. Every project field lives
+inside the ``Observability`` namespace group with simple scalar (or ``StrEnum``)
+types so each is settable via ``.env`` / env vars / params
 (``FLEXT_OBSERVABILITY_OBSERVABILITY__SERVICE_NAME`` …). Defaults are inlined
-from ``flext_observability.constants`` (SSOT).
+from ``flext_observability.constants`` (SSOT). The ``settings`` singleton is
+built on first attribute access (PEP 562), not when the module is imported.
 
 Copyright (c) 2025 FLEXT Team. All rights reserved.
 SPDX-License-Identifier: MIT
@@ -19,6 +21,7 @@ from typing import TYPE_CHECKING, Annotated
 from pydantic_settings import SettingsConfigDict
 
 from flext_core import FlextSettings, m
+from flext_observability.constants import c
 
 
 class FlextObservabilitySettings(FlextSettings):
@@ -60,6 +63,30 @@ class FlextObservabilitySettings(FlextSettings):
                 description="Interval in seconds between metric flushes",
             ),
         ]
+        multiprocess_dir: Annotated[
+            str | None,
+            m.Field(
+                default=None,
+                description="Shared directory of per-worker metric segments "
+                "(enables multiprocess aggregation)",
+            ),
+        ]
+        metrics_temporality: Annotated[
+            c.Observability.Temporality,
+            m.Field(
+                default=c.Observability.Temporality.CUMULATIVE,
+                description="Default temporality of exported metrics "
+                "(cumulative or delta)",
+            ),
+        ]
+        overhead_accounting: Annotated[
+            bool,
+            m.Field(
+                default=False,
+                description="Account the time spent inside observability hot "
+                "paths (self-measurement mode)",
+            ),
+        ]
 
     if TYPE_CHECKING:
         Observability: _Observability
@@ -70,7 +97,17 @@ class FlextObservabilitySettings(FlextSettings):
         )
 
 
-settings: FlextObservabilitySettings = FlextObservabilitySettings.fetch_global()
-"""Pre-instantiated project settings singleton — ``from flext_observability import settings``."""
+if TYPE_CHECKING:
+    settings: FlextObservabilitySettings
+    """Project settings singleton — ``from flext_observability import settings``."""
+
+
+def __getattr__(name: str) -> FlextObservabilitySettings:
+    """Build the ``settings`` singleton on first access."""
+    if name == "settings":
+        return FlextObservabilitySettings.fetch_global()
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
 
 __all__: list[str] = ["FlextObservabilitySettings", "settings"]
@@ -1,7 +1,11 @@
 """FlextObservability MRO facade and master factory.
 
 All service methods come from mixins via MRO. Only factory methods,
-model aliases, and Constants are defined locally.
+model aliases, and Constants are defined locally. Code that needs only
+context, metrics and sampling can import FlextObservabilityCore instead
+and attach the heavier services as plug-ins. Services added since (metric
+aggregation, alerting, multiprocess, spill, stats server, profiler) are not
+facade bases; they are reached through ``FlextObservabilityCore.attach``.
 
 Copyright (c) 2025 FLEXT Team. All rights reserved.
 SPDX-License-Identifier: MIT
@@ -20,6 +24,7 @@ from flext_observability import c, m, p, r, t, u
 from flext_observability.services.advanced_context import (
     FlextObservabilityAdvancedContext,
 )
+from flext_observability.services.columnar import FlextObservabilityColumnar
 from flext_observability.services.context import FlextObservabilityContext
 from flext_observability.services.custom_metrics import FlextObservabilityCustomMetrics
 from flext_observability.services.error_handling import FlextObservabilityErrorHandling
@@ -82,11 +87,7 @@ class FlextObservability(
     @staticmethod
     def _metric_type_for_name(name: str) -> c.Observability.MetricType:
         """Resolve metric type from a metric name suffix."""
-        if name.endswith(("_total", "_count")):
-            return c.Observability.MetricType.COUNTER
-        if name.endswith(("_duration", "_seconds")):
-            return c.Observability.MetricType.HISTOGRAM
-        return c.Observability.MetricType.GAUGE
+        return FlextObservabilityColumnar.metric_type_for_name(name)
 
     @staticmethod
     def flext_metric(
@@ -0,0 +1,411 @@
+"""flext-observability command line interface.
+
+Attaches to a running process - through its ``/metrics`` endpoint or its
+local Unix-socket snapshot server - and shows a live, refreshing top-style
+view of the busiest operations (rate and latency percentiles), sampling
+rates, error fingerprints and resource usage.
+
+FLEXT Pattern:
+- Single FlextObservabilityCli class
+- Nested Row and TopView (incremental frame builder)
+- Commands registered through the flext_cli application facade
+
+Key Features:
+- Prometheus text and length-prefixed JSON snapshot sources
+- Incremental updates: only series whose count moved are recomputed and
+  only the top rows are formatted, so 10k watched series stay cheap
+- Unchanged frames are not redrawn
+"""
+
+from __future__ import annotations
+
+import heapq
+import http.client
+import json
+import math
+import re
+import socket
+import struct
+import time
+from collections.abc import Mapping, Sequence
+from urllib.parse import urlsplit
+
+from flext_cli import cli
+from flext_observability import c, t, u
+
+
+class FlextObservabilityCli:
+    """Command line tools for inspecting a running process.
+
+    Usage:
+        ```bash
+        # Prometheus endpoint served by FlextObservabilityHTTP endpoints
+        flext-observability top --target http://127.0.0.1:8000/metrics
+
+        # Snapshot server on a Unix domain socket
+        flext-observability top --target unix:/run/app/observability.sock
+        ```
+
+    Nested Classes:
+        Row: Derived statistics of one histogram series
+        TopView: Incremental frame builder over successive snapshots
+    """
+
+    logger = u.fetch_logger(__name__)
+    _label_pair = re.compile(r'([a-zA-Z_][a-zA-Z0-9_]*)="((?:[^"\\]|\\.)*)"')
+
+    class Row:
+        """Derived statistics of one histogram series between two snapshots."""
+
+        __slots__ = ("buckets", "count", "label", "percentiles", "rate", "seen_at")
+
+        def __init__(self, label: str, count: int, buckets: Sequence[int]) -> None:
+            """Initialize a row from the first snapshot of a series."""
+            self.label = label
+            self.count = count
+            self.buckets = tuple(buckets)
+            self.rate = 0.0
+            self.percentiles: tuple[float, ...] = ()
+            self.seen_at = 0.0
+
+    class TopView:
+        """Incremental top-style frame builder.
+
+        Each ``update`` only recomputes series whose observation count moved
+        since the previous snapshot; the top rows are selected with a bounded
+        heap and formatted, and ``None`` is returned while the frame text is
+        unchanged.
+        """
+
+        def __init__(self, limit: int = c.Observability.CLI_TOP_LIMIT) -> None:
+            """Initialize an empty view showing at most ``limit`` operations."""
+            self._limit = limit
+            self._rows: dict[str, FlextObservabilityCli.Row] = {}
+            self._frame = ""
+
+        def update(self, snapshot: t.JsonMapping, now: float) -> str | None:
+            """Fold a snapshot and return the new frame (None when unchanged)."""
+            metrics = snapshot.get("metrics")
+            if isinstance(metrics, Sequence):
+                self._fold(metrics, now)
+            section = FlextObservabilityCli.section
+            frame = "\n".join((
+                self._operations(),
+                section("Sampling", snapshot.get("sampling")),
+                section("Error fingerprints", snapshot.get("errors")),
+                section("Resources", snapshot.get("resources")),
+            ))
+            if frame == self._frame:
+                return None
+            self._frame = frame
+            return frame
+
+        def _fold(self, metrics: Sequence[t.JsonValue], now: float) -> None:
+            """Update rows of histogram series whose count changed."""
+            rows = self._rows
+            for series in metrics:
+                if not isinstance(series, Mapping) or "buckets" not in series:
+                    continue
+                count = int(series.get("count", 0))
+                labels = series.get("labels") or {}
+                label = str(series["name"]) + (
+                    "{" + ",".join(f"{k}={v}" for k, v in labels.items()) + "}"
+                    if labels
+                    else ""
+                )
+                row = rows.get(label)
+                if row is None:
+                    row = FlextObservabilityCli.Row(label, count, series["buckets"])
+                    row.percentiles = FlextObservabilityCli.percentiles(
+                        series["bounds"], row.buckets
+                    )
+                    row.seen_at = now
+                    rows[label] = row
+                    continue
+                if count == row.count:
+                    if row.rate:
+                        row.rate = 0.0
+                        row.seen_at = now
+                    continue
+                buckets = tuple(series["buckets"])
+                elapsed = now - row.seen_at
+                if count > row.count:
+                    row.rate = (count - row.count) / elapsed if elapsed > 0 else 0.0
+                    window = [
+                        new - old
+                        for new, old in zip(buckets, row.buckets, strict=False)
+                    ]
+                else:
+                    # Counter reset in the target: restart from its totals
+                    row.rate = 0.0
+                    window = list(buckets)
+                row.percentiles = FlextObservabilityCli.percentiles(
+                    series["bounds"], window
+                )
+                row.count = count
+                row.buckets = buckets
+                row.seen_at = now
+
+        def _operations(self) -> str:
+            """Format the top rows by rate, then by total count."""
+            top = heapq.nlargest(
+                self._limit, self._rows.values(), key=lambda row: (row.rate, row.count)
+            )
+            header = f"{'OPERATION':<48} {'RATE/s':>9} {'COUNT':>9} " + " ".join(
+                f"{f'p{round(q * 100)}':>9}" for q in c.Observability.CLI_PERCENTILES
+            )
+            lines = [f"Top operations ({len(self._rows)} series)", header]
+            lines.extend(
+                f"{row.label[:48]:<48} {row.rate:>9.1f} {row.count:>9} "
+                + " ".join(
+                    f"{FlextObservabilityCli.format_seconds(value):>9}"
+                    for value in row.percentiles
+                )
+                for row in top
+            )
+            return "\n".join(lines)
+
+    @staticmethod
+    def percentiles(
+        bounds: Sequence[float], buckets: Sequence[int]
+    ) -> tuple[float, ...]:
+        """Estimate the configured percentiles from histogram bucket counts.
+
+        Interpolates linearly inside the bucket holding each rank; ranks in
+        the overflow bucket report the largest finite bound.
+        """
+        total = sum(buckets)
+        if not total:
+            return tuple(math.nan for _ in c.Observability.CLI_PERCENTILES)
+        estimates: list[float] = []
+        for quantile in c.Observability.CLI_PERCENTILES:
+            rank = quantile * total
+            cumulative = 0
+            estimate = bounds[-1] if bounds else math.nan
+            for index, bucket_count in enumerate(buckets):
+                if cumulative + bucket_count >= rank and bucket_count:
+                    if index >= len(bounds):
+                        break
+                    lower = bounds[index - 1] if index else 0.0
+                    fraction = (rank - cumulative) / bucket_count
+                    estimate = lower + (bounds[index] - lower) * fraction
+                    break
+                cumulative += bucket_count
+            estimates.append(estimate)
+        return tuple(estimates)
+
+    @staticmethod
+    def format_seconds(value: float) -> str:
+        """Format a latency in seconds with an adaptive unit."""
+        if math.isnan(value):
+            return "-"
+        if value >= 1:
+            return f"{value:.2f}s"
+        if value >= c.Observability.CLI_MILLISECOND_SEC:
+            return f"{value / c.Observability.CLI_MILLISECOND_SEC:.1f}ms"
+        return f"{value * 1e6:.0f}us"
+
+    @staticmethod
+    def section(title: str, payload: t.JsonValue | None) -> str:
+        """Format a mapping or list-of-mappings snapshot section."""
+        lines = [f"\n{title}"]
+        if isinstance(payload, Mapping):
+            lines.extend(f"  {key:<32} {value}" for key, value in payload.items())
+        elif isinstance(payload, Sequence) and not isinstance(payload, str):
+            lines.extend(
+                "  " + "  ".join(f"{key}={value}" for key, value in item.items())
+                for item in payload[: c.Observability.CLI_TOP_LIMIT]
+                if isinstance(item, Mapping)
+            )
+        if len(lines) == 1:
+            lines.append("  (not available from this source)")
+        return "\n".join(lines)
+
+    @staticmethod
+    def parse_prometheus(text: str) -> list[t.JsonDict]:
+        """Convert Prometheus text exposition back into series snapshots.
+
+        Histograms are reassembled from their ``_bucket`` (de-cumulated),
+        ``_sum`` and ``_count`` samples; other samples become scalar series.
+        Lines are split by position and each distinct label string is parsed
+        once per scrape, so large expositions parse in a single cheap pass.
+        """
+        types: dict[str, str] = {}
+        samples: dict[str, tuple[str, str]] = {}
+        series: dict[tuple[str, str], t.JsonDict] = {}
+        for line in text.splitlines():
+            if not line or line[0] == "#":
+                if line.startswith("# TYPE "):
+                    _, _, name, metric_type = line.split(" ", 3)
+                    types[name] = metric_type.strip()
+                continue
+            close = line.rfind("}")
+            if close >= 0:
+                open_ = line.index("{")
+                sample = line[:open_]
+                raw_labels = line[open_ + 1 : close]
+                raw_value = line[close + 1 :].split()[0]
+            else:
+                sample, raw_value, *_ = line.split()
+                raw_labels = ""
+            resolved = samples.get(sample)
+            if resolved is None:
+                resolved = FlextObservabilityCli._resolve_sample(sample, types)
+                samples[sample] = resolved
+            base, suffix = resolved
+            le = None
+            if suffix == "_bucket":
+                raw_labels, le = FlextObservabilityCli._split_le(raw_labels)
+            entry = series.get((base, raw_labels))
+            if entry is None:
+                entry = {
+                    "name": base,
+                    "labels": dict(
+                        FlextObservabilityCli._label_pair.findall(raw_labels)
+                    ),
+                    "type": types.get(base, "untyped"),
+                    "count": 0,
+                    "value": 0.0,
+                }
+                series[base, raw_labels] = entry
+            value = float(raw_value)
+            if le is not None:
+                # Set with the first bucket: a lone +Inf bucket has no bounds
+                bounds = entry.setdefault("bounds", [])
+                if le != "+Inf":
+                    bounds.append(float(le))
+                entry.setdefault("cumulative", []).append(int(value))
+            elif suffix == "_count":
+                entry["count"] = int(value)
+            elif suffix == "_sum":
+                entry["sum"] = value
+            else:
+                entry["value"] = value
+        for entry in series.values():
+            cumulative = entry.pop("cumulative", None)
+            if cumulative is not None:
+                entry["buckets"] = [
+                    upper - lower
+                    for lower, upper in zip(
+                        [0, *cumulative[:-1]], cumulative, strict=True
+                    )
+                ]
+        return list(series.values())
+
+    @staticmethod
+    def _resolve_sample(sample: str, types: Mapping[str, str]) -> tuple[str, str]:
+        """Split a sample name into its family name and histogram suffix."""
+        for suffix in ("_bucket", "_sum", "_count"):
+            base = sample.removesuffix(suffix)
+            if base != sample and types.get(base) in {"histogram", "summary"}:
+                return base, suffix
+        return sample, ""
+
+    @staticmethod
+    def _split_le(raw_labels: str) -> tuple[str, str | None]:
+        """Remove the ``le`` label from a bucket's label string."""
+        position = raw_labels.rfind('le="')
+        if position >= 0 and (position == 0 or raw_labels[position - 1] == ","):
+            le = raw_labels[position + 4 : -1]
+            if '"' not in le:
+                return raw_labels[: max(position - 1, 0)], le
+        labels = dict(FlextObservabilityCli._label_pair.findall(raw_labels))
+        le = labels.pop("le", None)
+        return ",".join(f'{key}="{value}"' for key, value in labels.items()), le
+
+    @staticmethod
+    def fetch_snapshot(
+        target: str, timeout_sec: float = c.Observability.CLI_FETCH_TIMEOUT_SEC
+    ) -> t.JsonDict:
+        """Fetch one snapshot from an HTTP metrics URL or ``unix:<path>``.
+
+        Args:
+            target: ``http(s)://host:port/metrics`` or ``unix:/path/to.sock``
+            timeout_sec: Connect and read timeout
+
+        Returns:
+            dict - Snapshot with at least a ``metrics`` list
+
+        """
+        if target.startswith("unix:"):
+            return FlextObservabilityCli._fetch_socket(
+                target.removeprefix("unix:"), timeout_sec
+            )
+        url = urlsplit(target)
+        connection_type = (
+            http.client.HTTPSConnection
+            if url.scheme == "https"
+            else http.client.HTTPConnection
+        )
+        connection = connection_type(url.netloc, timeout=timeout_sec)
+        try:
+            connection.request("GET", url.path or c.Observability.METRICS_ENDPOINT_PATH)
+            body = connection.getresponse().read().decode()
+        finally:
+            connection.close()
+        return {"metrics": FlextObservabilityCli.parse_prometheus(body)}
+
+    @staticmethod
+    def _fetch_socket(path: str, timeout_sec: float) -> t.JsonDict:
+        """Read one length-prefixed JSON snapshot from a Unix socket."""
+        prefix = struct.Struct(c.Observability.SNAPSHOT_LENGTH_PREFIX_FORMAT)
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.settimeout(timeout_sec)
+            client.connect(path)
+            stream = client.makefile("rb")
+            (size,) = prefix.unpack(stream.read(prefix.size))
+            payload: t.JsonDict = json.loads(stream.read(size))
+        return payload
+
+    @staticmethod
+    def top(
+        target: str = c.Observability.CLI_DEFAULT_TARGET,
+        interval: float = c.Observability.CLI_REFRESH_INTERVAL_SEC,
+        limit: int = c.Observability.CLI_TOP_LIMIT,
+        iterations: int = 0,
+    ) -> None:
+        """Show a live top-style view of a running process.
+
+        Args:
+            target: Metrics URL or ``unix:<socket path>``
+            interval: Refresh interval in seconds
+            limit: Number of operations shown
+            iterations: Stop after this many refreshes (0 = until interrupted)
+
+        """
+        view = FlextObservabilityCli.TopView(limit)
+        refreshes = 0
+        try:
+            while not iterations or refreshes < iterations:
+                refreshes += 1
+                FlextObservabilityCli._refresh(view, target, interval)
+                time.sleep(interval)
+        except KeyboardInterrupt:
+            return
+
+    @staticmethod
+    def _refresh(
+        view: FlextObservabilityCli.TopView, target: str, interval: float
+    ) -> None:
+        """Fetch one snapshot and redraw the view; read errors are printed."""
+        try:
+            snapshot = FlextObservabilityCli.fetch_snapshot(target)
+        except (OSError, ValueError, struct.error) as e:
+            cli.print(f"Cannot read {target}: {e}")
+            return
+        frame = view.update(snapshot, time.monotonic())
+        if frame is not None:
+            cli.print(f"\x1b[H\x1b[J{target}  (every {interval}s)\n{frame}")
+
+
+def main() -> None:
+    """Run the flext-observability command line interface."""
+    app = cli.create_app_with_common_params(
+        name="flext-observability",
+        help_text="Inspect running flext-observability instrumented processes",
+    )
+    app.command("top")(FlextObservabilityCli.top)
+    app()
+
+
+__all__: list[str] = ["FlextObservabilityCli", "main"]
@@ -9,7 +9,9 @@ SPDX-License-Identifier: MIT
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from enum import StrEnum, unique
+from types import MappingProxyType
 from typing import ClassVar, Final
 
 from flext_cli import c
@@ -44,6 +46,162 @@ class FlextObservabilityConstants(c):
         DEFAULT_TRACES_ENABLED: Final[bool] = True
         DEFAULT_ALERTS_ENABLED: Final[bool] = True
         HTTP_ERROR_STATUS_THRESHOLD: ClassVar[int] = 400
+        METRIC_BUFFER_FLUSH_SIZE: ClassVar[int] = 1024
+        FINGERPRINT_MEMO_SIZE: ClassVar[int] = 4096
+        FINGERPRINT_VARIABLE_PATTERN: ClassVar[str] = (
+            r"""(?P<quoted>(?<!\w)"(?:[^"\\]|\\.)*"|(?<!\w)'(?:[^'\\]|\\.)*')"""
+            r"|(?P<uuid>\b[0-9a-fA-F]{8}(?:-[0-9a-fA-F]{4}){3}-[0-9a-fA-F]{12}\b)"
+            r"|(?P<ip>\b(?:\d{1,3}\.){3}\d{1,3}(?::\d+)?\b)"
+            r"|(?P<hex>\b0[xX][0-9a-fA-F]+\b"
+            r"|\b(?=[0-9a-fA-F]*[a-fA-F])(?=[0-9a-fA-F]*\d)[0-9a-fA-F]{8,}\b)"
+            r"|(?P<number>\d+(?:\.\d+)?)"
+        )
+        FINGERPRINT_VARIABLE_PLACEHOLDERS: ClassVar[Mapping[str, str]] = (
+            MappingProxyType({
+                "quoted": "<str>",
+                "uuid": "<uuid>",
+                "ip": "<ip>",
+                "hex": "<hex>",
+                "number": "<num>",
+            })
+        )
+        ERROR_BUFFER_SIZE: ClassVar[int] = 1024
+        ERROR_WINDOW_SEC: ClassVar[int] = 300
+        ERROR_WINDOW_BUCKET_SEC: ClassVar[int] = 10
+        MAX_TRACKED_FINGERPRINTS: ClassVar[int] = 10_000
+        ALERT_QUEUE_SIZE: ClassVar[int] = 10_000
+        ALERT_COALESCE_WINDOW_SEC: ClassVar[float] = 5.0
+        ALERT_WEBHOOK_TIMEOUT_SEC: ClassVar[float] = 2.0
+        HEALTH_CHECK_TIMEOUT_SEC: ClassVar[float] = 2.0
+        HEALTH_CHECK_TTL_SEC: ClassVar[float] = 10.0
+        HEALTH_CHECK_WORKERS: ClassVar[int] = 8
+        ENDPOINT_CACHE_TTL_SEC: ClassVar[float] = 1.0
+        HEALTH_ENDPOINT_PATH: ClassVar[str] = "/health"
+        READY_ENDPOINT_PATH: ClassVar[str] = "/ready"
+        METRICS_ENDPOINT_PATH: ClassVar[str] = "/metrics"
+        HTTP_CONTENT_TYPE_JSON: ClassVar[str] = "application/json"
+        PROMETHEUS_CONTENT_TYPE: ClassVar[str] = (
+            "text/plain; version=0.0.4; charset=utf-8"
+        )
+        OPENMETRICS_ENDPOINT_PATH: ClassVar[str] = "/metrics/openmetrics"
+        OPENMETRICS_CONTENT_TYPE: ClassVar[str] = (
+            "application/openmetrics-text; version=1.0.0; charset=utf-8"
+        )
+        HTTP_SERVER_DURATION_METRIC: ClassVar[str] = (
+            "http_server_request_duration_seconds"
+        )
+        PROMETHEUS_NAME_INVALID_PATTERN: ClassVar[str] = r"[^a-zA-Z0-9_:]"
+        CLI_DEFAULT_TARGET: ClassVar[str] = "http://127.0.0.1:8000/metrics"
+        CLI_REFRESH_INTERVAL_SEC: ClassVar[float] = 1.0
+        CLI_FETCH_TIMEOUT_SEC: ClassVar[float] = 2.0
+        CLI_TOP_LIMIT: ClassVar[int] = 20
+        CLI_PERCENTILES: ClassVar[tuple[float, ...]] = (0.5, 0.95, 0.99)
+        CLI_MILLISECOND_SEC: ClassVar[float] = 1e-3
+        SNAPSHOT_LENGTH_PREFIX_FORMAT: ClassVar[str] = "!I"
+        SNAPSHOT_FORMAT_VERSION: ClassVar[int] = 1
+        STATS_SOCKET_NAME: ClassVar[str] = "flext-observability-{pid}.sock"
+        STATS_SOCKET_MODE: ClassVar[int] = 0o600
+        STATS_SOCKET_BACKLOG: ClassVar[int] = 16
+        STATS_CLIENT_TIMEOUT_SEC: ClassVar[float] = 1.0
+        STATS_SNAPSHOT_TTL_SEC: ClassVar[float] = 0.5
+        STATS_TOP_FINGERPRINTS: ClassVar[int] = 20
+        OVERHEAD_BUDGET_RATIO: ClassVar[float] = 0.02
+        PROFILER_SAMPLE_HZ: ClassVar[float] = 100.0
+        PROFILER_MAX_STACKS: ClassVar[int] = 10_000
+        PROFILER_MAX_DEPTH: ClassVar[int] = 64
+        PROFILER_HOT_FRAMES: ClassVar[int] = 10
+        SERIES_CACHE_SIZE: ClassVar[int] = 65_536
+        SERIES_LIMIT: ClassVar[int] = 200_000
+        SERIES_LIMIT_PER_METRIC: ClassVar[int] = 2000
+        SERIES_OVERFLOW_LABEL: ClassVar[str] = "otel.metric.overflow"
+        CARDINALITY_SKETCH_SIZE: ClassVar[int] = 128
+        CARDINALITY_TOP_K: ClassVar[int] = 10
+        COLUMNAR_FOOTPRINT_SAMPLE: ClassVar[int] = 1000
+        CORE_PLUGINS: ClassVar[Mapping[str, tuple[str, str]]] = MappingProxyType({
+            "aggregation": (
+                "flext_observability.services.aggregation",
+                "FlextObservabilityAggregation",
+            ),
+            "alerting": (
+                "flext_observability.services.alerting",
+                "FlextObservabilityAlerting",
+            ),
+            "health": (
+                "flext_observability.services.health",
+                "FlextObservabilityHealth",
+            ),
+            "http": (
+                "flext_observability.services.http_instrumentation",
+                "FlextObservabilityHTTP",
+            ),
+            "http_client": (
+                "flext_observability.services.http_client_instrumentation",
+                "FlextObservabilityHTTPClient",
+            ),
+            "logging": (
+                "flext_observability.services.logging_integration",
+                "FlextObservabilityLogging",
+            ),
+            "monitoring": (
+                "flext_observability.services.monitoring",
+                "FlextObservabilityMonitor",
+            ),
+            "multiprocess": (
+                "flext_observability.services.multiprocess",
+                "FlextObservabilityMultiprocess",
+            ),
+            "performance": (
+                "flext_observability.services.performance",
+                "FlextObservabilityPerformance",
+            ),
+            "profiler": (
+                "flext_observability.services.profiler",
+                "FlextObservabilityProfiler",
+            ),
+            "spill": ("flext_observability.services.spill", "FlextObservabilitySpill"),
+            "stats_server": (
+                "flext_observability.services.stats_server",
+                "FlextObservabilityStatsServer",
+            ),
+        })
+        MULTIPROCESS_SEGMENT_MAGIC: ClassVar[bytes] = b"FXMP"
+        MULTIPROCESS_FORMAT_VERSION: ClassVar[int] = 1
+        MULTIPROCESS_SEGMENT_SIZE: ClassVar[int] = 64 * 1024
+        MULTIPROCESS_PUBLISH_INTERVAL_SEC: ClassVar[float] = 1.0
+        MULTIPROCESS_READ_RETRIES: ClassVar[int] = 20
+        MULTIPROCESS_LIVE_PREFIX: ClassVar[str] = "worker-"
+        MULTIPROCESS_DEAD_PREFIX: ClassVar[str] = "dead-"
+        MULTIPROCESS_SEGMENT_SUFFIX: ClassVar[str] = ".db"
+        SPILL_SEGMENT_MAGIC: ClassVar[bytes] = b"FXSP"
+        SPILL_FORMAT_VERSION: ClassVar[int] = 1
+        SPILL_SEGMENT_SIZE: ClassVar[int] = 4 * 1024 * 1024
+        SPILL_MAX_BYTES: ClassVar[int] = 256 * 1024 * 1024
+        SPILL_SEGMENT_PREFIX: ClassVar[str] = "spill-"
+        SPILL_SEGMENT_SUFFIX: ClassVar[str] = ".seg"
+        SPILL_EXPORT_TIMEOUT_SEC: ClassVar[float] = 5.0
+        SPILL_RETRY_INTERVAL_SEC: ClassVar[float] = 1.0
+        SPILL_MAX_RETRY_INTERVAL_SEC: ClassVar[float] = 30.0
+        HEALTH_STATUS_GAUGE_VALUES: ClassVar[Mapping[str, float]] = MappingProxyType({
+            "healthy": 1.0,
+            "degraded": 0.5,
+            "unhealthy": 0.0,
+        })
+        DEFAULT_HISTOGRAM_BUCKETS: ClassVar[tuple[float, ...]] = (
+            0.005,
+            0.01,
+            0.025,
+            0.05,
+            0.075,
+            0.1,
+            0.25,
+            0.5,
+            0.75,
+            1.0,
+            2.5,
+            5.0,
+            7.5,
+            10.0,
+        )
         METRIC_VALID_UNITS: ClassVar[frozenset[str]] = frozenset({
             "count",
             "percent",
@@ -166,6 +324,56 @@ class FlextObservabilityConstants(c):
             SAMPLED = "sampled"
             NOT_SAMPLED = "not_sampled"
 
+        @unique
+        class Signal(StrEnum):
+            """Observability signal enumeration.
+
+            DRY Pattern:
+                StrEnum is the single source of truth. Use Signal.METRICS.value
+                or Signal.METRICS directly - no base strings needed.
+            """
+
+            METRICS = "metrics"
+            TRACES = "traces"
+
+        @unique
+        class Temporality(StrEnum):
+            """Metric export temporality enumeration.
+
+            DRY Pattern:
+                StrEnum is the single source of truth. Use Temporality.DELTA.value
+                or Temporality.DELTA directly - no base strings needed.
+            """
+
+            CUMULATIVE = "cumulative"
+            DELTA = "delta"
+
+        @unique
+        class FingerprintMode(StrEnum):
+            """Error fingerprint algorithm enumeration.
+
+            DRY Pattern:
+                StrEnum is the single source of truth. Use FingerprintMode.FAST.value
+                or FingerprintMode.FAST directly - no base strings needed.
+            """
+
+            FAST = "fast"
+            SECURE = "secure"
+
+        @unique
+        class GaugeMergePolicy(StrEnum):
+            """Gauge merge policy across worker processes.
+
+            DRY Pattern:
+                StrEnum is the single source of truth. Use GaugeMergePolicy.SUM.value
+                or GaugeMergePolicy.SUM directly - no base strings needed.
+            """
+
+            SUM = "sum"
+            MAX = "max"
+            MIN = "min"
+            LATEST = "latest"
+
         @unique
         class ErrorSeverity(StrEnum):
             """Error severity enumeration.
@@ -253,7 +253,10 @@ class FlextObservabilityModels(m):
                 u.Field(description="Error severity level"),
             ] = c.Observability.ErrorSeverity.ERROR
             fingerprint: Annotated[
-                str, u.Field(description="SHA256 deduplication fingerprint")
+                str,
+                u.Field(
+                    description="Deduplication fingerprint (SHA256 or fast 64-bit)"
+                ),
             ] = ""
             correlation_id: Annotated[
                 str, u.Field(description="Correlation identifier")
@@ -262,14 +265,22 @@ class FlextObservabilityModels(m):
             def calculate_fingerprint(self) -> Self:
                 """Calculate SHA256 fingerprint from error type and message.
 
+                The message is normalised like the error handler's, so the
+                value equals its default ``secure`` fingerprint.
+
                 Returns:
                     Self: A new instance with the fingerprint populated.
 
                 """
+                from flext_observability.utilities import FlextObservabilityUtilities
+
+                normalized = FlextObservabilityUtilities.Observability.Fingerprint.normalize_message(
+                    self.message
+                )
                 return self.model_copy(
                     update={
                         "fingerprint": sha256(
-                            f"{self.error_type}:{self.message}".encode()
+                            f"{self.error_type}:{normalized}".encode()
                         ).hexdigest()
                     }
                 )
@@ -6,7 +6,7 @@ SPDX-License-Identifier: MIT
 
 from __future__ import annotations
 
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Iterable, MutableMapping
 from typing import Protocol, runtime_checkable
 
 from flext_cli import m, p
@@ -55,6 +55,34 @@ class FlextObservabilityProtocols(p):
                 """Get summary of collected metrics."""
                 ...
 
+        @runtime_checkable
+        class AlertSink(Protocol):
+            """Protocol for alert delivery sinks used by the alert dispatcher."""
+
+            def deliver(self, alert: t.JsonDict) -> p.Result[bool]:
+                """Deliver one (possibly coalesced) alert payload."""
+                ...
+
+        @runtime_checkable
+        class BatchSender(Protocol):
+            """Protocol for telemetry batch transports used by the spill exporter."""
+
+            def send(self, payload: bytes) -> p.Result[bool]:
+                """Send one encoded batch; failure keeps it spilled for replay."""
+                ...
+
+        @runtime_checkable
+        class Flusher(Protocol):
+            """Protocol for deferred writers folded into a store before reads."""
+
+            def flush(self) -> int:
+                """Fold pending observations into the store; return how many."""
+                ...
+
+            def clear(self) -> None:
+                """Drop pending observations without folding them."""
+                ...
+
         class Http:
             """Protocols for Flask and FastAPI HTTP instrumentation."""
 
@@ -86,6 +114,32 @@ class FlextObservabilityProtocols(p):
                     FlextObservabilityProtocols.Observability.Http.FlaskErrorHandler
                 )
 
+            @runtime_checkable
+            class WSGIApplication(Protocol):
+                """Protocol for a WSGI callable (e.g. ``Flask.wsgi_app``)."""
+
+                def __call__(
+                    self,
+                    environ: MutableMapping[str, object],
+                    start_response: Callable[..., Callable[[bytes], object]],
+                ) -> Iterable[bytes]:
+                    """Handle one WSGI request."""
+                    ...
+
+            @runtime_checkable
+            class FlaskWSGIApp(Protocol):
+                """Protocol for a Flask application exposing its WSGI callable."""
+
+                wsgi_app: FlextObservabilityProtocols.Observability.Http.WSGIApplication
+
+            @runtime_checkable
+            class FlaskGlobals(Protocol):
+                """Protocol for the Flask ``g`` attributes the hooks keep."""
+
+                flext_start_time: float
+                flext_correlation_id: str
+                flext_overhead_start_ns: int
+
             @runtime_checkable
             class FastAPIApp(Protocol):
                 """Protocol for FastAPI application."""
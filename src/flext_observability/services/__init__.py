@@ -11,7 +11,16 @@ if TYPE_CHECKING:
     from .advanced_context import (
         FlextObservabilityAdvancedContext as FlextObservabilityAdvancedContext,
     )
+    from .aggregation import (
+        FlextObservabilityAggregation as FlextObservabilityAggregation,
+    )
+    from .alerting import FlextObservabilityAlerting as FlextObservabilityAlerting
+    from .cardinality import (
+        FlextObservabilityCardinality as FlextObservabilityCardinality,
+    )
+    from .columnar import FlextObservabilityColumnar as FlextObservabilityColumnar
     from .context import FlextObservabilityContext as FlextObservabilityContext
+    from .core import FlextObservabilityCore as FlextObservabilityCore
     from .custom_metrics import (
         FlextObservabilityCustomMetrics as FlextObservabilityCustomMetrics,
     )
@@ -28,15 +37,34 @@ if TYPE_CHECKING:
     )
     from .monitoring import FlextObservabilityMonitor as FlextObservabilityMonitor
     from .monitoring import flext_monitor_function as flext_monitor_function
+    from .multiprocess import (
+        FlextObservabilityMultiprocess as FlextObservabilityMultiprocess,
+    )
+    from .overhead import FlextObservabilityOverhead as FlextObservabilityOverhead
     from .performance import (
         FlextObservabilityPerformance as FlextObservabilityPerformance,
     )
+    from .profiler import FlextObservabilityProfiler as FlextObservabilityProfiler
     from .sampling import FlextObservabilitySampling as FlextObservabilitySampling
+    from .series import FlextObservabilitySeries as FlextObservabilitySeries
     from .services import FlextObservabilityServices as FlextObservabilityServices
+    from .spill import FlextObservabilitySpill as FlextObservabilitySpill
+    from .stats_server import (
+        FlextObservabilityStatsServer as FlextObservabilityStatsServer,
+    )
+    from .switches import FlextObservabilitySwitches as FlextObservabilitySwitches
+    from .temporality import (
+        FlextObservabilityTemporality as FlextObservabilityTemporality,
+    )
 
 _LAZY_MODULES: dict[str, tuple[str, ...]] = {
     ".advanced_context": ("FlextObservabilityAdvancedContext",),
+    ".aggregation": ("FlextObservabilityAggregation",),
+    ".alerting": ("FlextObservabilityAlerting",),
+    ".cardinality": ("FlextObservabilityCardinality",),
+    ".columnar": ("FlextObservabilityColumnar",),
     ".context": ("FlextObservabilityContext",),
+    ".core": ("FlextObservabilityCore",),
     ".custom_metrics": ("FlextObservabilityCustomMetrics",),
     ".error_handling": ("FlextObservabilityErrorHandling",),
     ".health": ("FlextObservabilityHealth",),
@@ -44,9 +72,17 @@ _LAZY_MODULES: dict[str, tuple[str, ...]] = {
     ".http_instrumentation": ("FlextObservabilityHTTP",),
     ".logging_integration": ("FlextObservabilityLogging",),
     ".monitoring": ("FlextObservabilityMonitor", "flext_monitor_function"),
+    ".multiprocess": ("FlextObservabilityMultiprocess",),
+    ".overhead": ("FlextObservabilityOverhead",),
     ".performance": ("FlextObservabilityPerformance",),
+    ".profiler": ("FlextObservabilityProfiler",),
     ".sampling": ("FlextObservabilitySampling",),
+    ".series": ("FlextObservabilitySeries",),
     ".services": ("FlextObservabilityServices",),
+    ".spill": ("FlextObservabilitySpill",),
+    ".stats_server": ("FlextObservabilityStatsServer",),
+    ".switches": ("FlextObservabilitySwitches",),
+    ".temporality": ("FlextObservabilityTemporality",),
 }
 
 
@@ -59,7 +95,12 @@ _LAZY_IMPORTS = build_lazy_import_map(
 
 _PUBLIC_EXPORTS: tuple[str, ...] = (
     "FlextObservabilityAdvancedContext",
+    "FlextObservabilityAggregation",
+    "FlextObservabilityAlerting",
+    "FlextObservabilityCardinality",
+    "FlextObservabilityColumnar",
     "FlextObservabilityContext",
+    "FlextObservabilityCore",
     "FlextObservabilityCustomMetrics",
     "FlextObservabilityErrorHandling",
     "FlextObservabilityHTTP",
@@ -67,9 +108,17 @@ _PUBLIC_EXPORTS: tuple[str, ...] = (
     "FlextObservabilityHealth",
     "FlextObservabilityLogging",
     "FlextObservabilityMonitor",
+    "FlextObservabilityMultiprocess",
+    "FlextObservabilityOverhead",
     "FlextObservabilityPerformance",
+    "FlextObservabilityProfiler",
     "FlextObservabilitySampling",
+    "FlextObservabilitySeries",
     "FlextObservabilityServices",
+    "FlextObservabilitySpill",
+    "FlextObservabilityStatsServer",
+    "FlextObservabilitySwitches",
+    "FlextObservabilityTemporality",
     "flext_monitor_function",
 )
 
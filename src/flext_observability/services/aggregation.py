@@ -0,0 +1,973 @@
+"""In-process metric aggregation with vectorized bulk recording.
+
+Folds recorded metric values into per-series aggregates (count, sum, min, max,
+last value and histogram buckets) so high-volume callers such as ETL batch
+jobs can record thousands of observations in a single pass instead of one
+``flext_record_metric`` call per value.
+
+FLEXT Pattern:
+- Single FlextObservabilityAggregation class
+- Nested Series aggregate and Store registry
+- Thread-safe global store
+- Optional NumPy fast path (used when NumPy is already imported)
+
+Key Features:
+- Pre-resolved series handles for hot recording paths
+- Deferred observation buffers folded in batches (lock-free appends)
+- Bulk recording from NumPy arrays or Python sequences
+- Label-set indices for grouped bulk recording
+- Histogram bucket increments via ``np.bincount``/``np.searchsorted``
+- Series keyed by FlextObservabilitySeries IDs (int-keyed recording)
+- Histogram exemplars: latest sampled trace per bucket, fixed memory
+- Prometheus text and OpenMetrics (with exemplars) exposition
+"""
+
+from __future__ import annotations
+
+import math
+import re
+import sys
+import threading
+import time
+import weakref
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Sequence
+from itertools import accumulate
+from types import ModuleType
+from typing import ClassVar
+
+from flext_observability import c, m, p, r, t, u
+from flext_observability.services.series import FlextObservabilitySeries
+
+
+class FlextObservabilityAggregation:
+    """In-process metric aggregation store.
+
+    Usage:
+        ```python
+        import numpy as np
+        from flext_observability import FlextObservabilityAggregation
+
+        store = FlextObservabilityAggregation.active_store()
+
+        # One observation
+        store.record("etl_row_duration_seconds", 0.012)
+
+        # One vectorized pass over a whole batch, grouped by label set
+        latencies = np.array([0.010, 0.030, 0.250, 0.004])
+        store.record_bulk(
+            "etl_row_duration_seconds",
+            latencies,
+            label_sets=[{"step": "extract"}, {"step": "load"}],
+            label_indices=np.array([0, 0, 1, 1]),
+        )
+        ```
+
+    Nested Classes:
+        Exemplars: Latest sampled observation per histogram bucket
+        Series: Aggregate state for one metric name and label set
+        Buffer: Deferred observations folded into a series in batches
+        Store: Series registry with single and bulk recording
+    """
+
+    logger = u.fetch_logger(__name__)
+    _store_instance: FlextObservabilityAggregation.Store | None = None
+    _invalid_name = re.compile(c.Observability.PROMETHEUS_NAME_INVALID_PATTERN)
+    _bound_labels: ClassVar[dict[tuple[float, ...], tuple[str, ...]]] = {}
+    _label_escapes = str.maketrans({"\\": "\\\\", "\n": "\\n", '"': '\\"'})
+
+    @staticmethod
+    def label_set(labels: t.StrMapping | None) -> t.Observability.LabelSet:
+        """Return the canonical (sorted, hashable) form of a label mapping."""
+        if not labels:
+            return ()
+        return tuple(sorted((str(key), str(value)) for key, value in labels.items()))
+
+    @staticmethod
+    def prometheus_name(name: str) -> str:
+        """Return ``name`` with characters invalid in Prometheus replaced."""
+        return FlextObservabilityAggregation._invalid_name.sub("_", name)
+
+    @staticmethod
+    def prometheus_labels(
+        labels: t.Observability.LabelSet, extra: tuple[str, str] | None = None
+    ) -> str:
+        """Render a label set (plus an optional extra pair) as ``{k="v",...}``."""
+        pairs = [*labels, extra] if extra is not None else labels
+        if not pairs:
+            return ""
+        escapes = FlextObservabilityAggregation._label_escapes
+        rendered = ",".join(
+            f'{FlextObservabilityAggregation.prometheus_name(key)}="'
+            f'{value.translate(escapes)}"'
+            for key, value in pairs
+        )
+        return f"{{{rendered}}}"
+
+    @staticmethod
+    def prometheus_bounds(bounds: tuple[float, ...]) -> tuple[str, ...]:
+        """Return the rendered ``le`` values of a bucket layout (memoized)."""
+        rendered = FlextObservabilityAggregation._bound_labels.get(bounds)
+        if rendered is None:
+            rendered = tuple(
+                FlextObservabilityAggregation.prometheus_value(bound)
+                for bound in (*bounds, math.inf)
+            )
+            FlextObservabilityAggregation._bound_labels[bounds] = rendered
+        return rendered
+
+    @staticmethod
+    def prometheus_value(value: float) -> str:
+        """Render a sample value (``+Inf``/``-Inf``/``NaN`` aware)."""
+        if math.isnan(value):
+            return "NaN"
+        if math.isinf(value):
+            return "+Inf" if value > 0 else "-Inf"
+        return repr(float(value))
+
+    class Exemplars:
+        """Latest sampled observation of each histogram bucket.
+
+        One preallocated slot per bucket, overwritten by every newer sampled
+        observation (OpenTelemetry's aligned histogram bucket reservoir), so
+        memory is fixed by the bucket layout however many requests are
+        sampled.
+        """
+
+        __slots__ = ("span_ids", "times", "trace_ids", "values")
+
+        def __init__(self, size: int) -> None:
+            """Initialize ``size`` empty bucket slots."""
+            self.trace_ids: list[str] = [""] * size
+            self.span_ids: list[str] = [""] * size
+            self.values: array[float] = array("d", bytes(8 * size))
+            self.times: array[int] = array("q", bytes(8 * size))
+
+        def offer(
+            self,
+            index: int,
+            value: float,
+            trace_id: str,
+            span_id: str = "",
+            time_ns: int | None = None,
+        ) -> None:
+            """Make an observation the exemplar of bucket ``index``."""
+            self.trace_ids[index] = trace_id
+            self.span_ids[index] = span_id
+            self.values[index] = value
+            self.times[index] = time.time_ns() if time_ns is None else time_ns
+
+        def copy(self) -> FlextObservabilityAggregation.Exemplars:
+            """Return a detached copy of every slot."""
+            clone = FlextObservabilityAggregation.Exemplars(0)
+            clone.trace_ids = self.trace_ids.copy()
+            clone.span_ids = self.span_ids.copy()
+            clone.values = array("d", self.values)
+            clone.times = array("q", self.times)
+            return clone
+
+        def snapshot(self) -> list[t.JsonDict]:
+            """Return the filled slots in OTLP exemplar shape."""
+            return [
+                {
+                    "bucket": index,
+                    "as_double": self.values[index],
+                    "time_unix_nano": self.times[index],
+                    "trace_id": trace_id,
+                    "span_id": self.span_ids[index],
+                }
+                for index, trace_id in enumerate(self.trace_ids)
+                if trace_id
+            ]
+
+        def openmetrics(self, index: int) -> str:
+            """Return the `` # {trace_id=...} value timestamp`` bucket suffix."""
+            trace_id = self.trace_ids[index]
+            if not trace_id:
+                return ""
+            aggregation = FlextObservabilityAggregation
+            pairs = [("trace_id", trace_id)]
+            if self.span_ids[index]:
+                pairs.append(("span_id", self.span_ids[index]))
+            return (
+                f" # {aggregation.prometheus_labels(tuple(pairs))} "
+                f"{aggregation.prometheus_value(self.values[index])} "
+                f"{self.times[index] / 1e9:.3f}"
+            )
+
+    class Series:
+        """Aggregate state for one metric series."""
+
+        __slots__ = (
+            "bounds",
+            "buckets",
+            "count",
+            "exemplars",
+            "labels",
+            "last",
+            "max",
+            "metric_type",
+            "min",
+            "name",
+            "sum",
+        )
+
+        def __init__(
+            self,
+            name: str,
+            labels: t.Observability.LabelSet,
+            metric_type: c.Observability.MetricType,
+            bounds: tuple[float, ...],
+        ) -> None:
+            """Initialize an empty series aggregate."""
+            self.name = name
+            self.labels = labels
+            self.metric_type = metric_type
+            self.bounds = (
+                bounds if metric_type == c.Observability.MetricType.HISTOGRAM else ()
+            )
+            self.buckets: list[int] = [0] * (len(self.bounds) + 1 if self.bounds else 0)
+            self.count = 0
+            self.sum = 0.0
+            self.min = math.inf
+            self.max = -math.inf
+            self.last = 0.0
+            self.exemplars: FlextObservabilityAggregation.Exemplars | None = None
+
+        def observe(self, value: float) -> None:
+            """Fold one observation into the aggregate."""
+            self.count += 1
+            self.sum += value
+            self.last = value
+            self.min = min(self.min, value)
+            self.max = max(self.max, value)
+            if self.bounds:
+                self.buckets[bisect_left(self.bounds, value)] += 1
+
+        def exemplar(self, value: float, trace_id: str, span_id: str = "") -> None:
+            """Keep a sampled observation as the exemplar of its bucket.
+
+            Only the exemplar slot is written - the observation itself is
+            counted by ``observe`` (or a buffer) as usual. The slots are
+            allocated by the first exemplar, so series that never see a
+            sampled request pay nothing; non-histograms ignore the call.
+            """
+            if not self.bounds or not trace_id:
+                return
+            if self.exemplars is None:
+                self.exemplars = FlextObservabilityAggregation.Exemplars(
+                    len(self.buckets)
+                )
+            self.exemplars.offer(
+                bisect_left(self.bounds, value), value, trace_id, span_id
+            )
+
+        def observe_many(self, values: Sequence[float]) -> None:
+            """Fold a batch of observations using C-level builtins.
+
+            Aggregates come from ``sum``/``min``/``max`` and bucket counts from
+            bisecting each bound into the sorted batch, so the cost per value
+            stays far below one ``observe`` call.
+            """
+            if not values:
+                return
+            buckets: list[int] | None = None
+            if self.bounds:
+                ordered = sorted(values)
+                cumulative = [bisect_right(ordered, bound) for bound in self.bounds]
+                cumulative.append(len(ordered))
+                buckets = [
+                    upper - lower
+                    for lower, upper in zip(
+                        [0, *cumulative[:-1]], cumulative, strict=True
+                    )
+                ]
+            self.merge(
+                count=len(values),
+                total=sum(values),
+                minimum=min(values),
+                maximum=max(values),
+                last=values[-1],
+                buckets=buckets,
+            )
+
+        def reset(self) -> None:
+            """Zero the aggregate while keeping the series registered."""
+            self.count = 0
+            self.sum = 0.0
+            self.min = math.inf
+            self.max = -math.inf
+            self.last = 0.0
+            self.buckets = [0] * len(self.buckets)
+            self.exemplars = None
+
+        def merge(
+            self,
+            *,
+            count: int,
+            total: float,
+            minimum: float,
+            maximum: float,
+            last: float,
+            buckets: Sequence[int] | None = None,
+        ) -> None:
+            """Fold pre-aggregated values into the aggregate."""
+            if count <= 0:
+                return
+            self.count += count
+            self.sum += total
+            self.last = last
+            self.min = min(self.min, minimum)
+            self.max = max(self.max, maximum)
+            if self.bounds and buckets is not None:
+                for index, bucket_count in enumerate(buckets):
+                    self.buckets[index] += int(bucket_count)
+
+        @property
+        def value(self) -> float:
+            """Current scalar value (sum for counters, last value otherwise)."""
+            if self.metric_type == c.Observability.MetricType.COUNTER:
+                return self.sum
+            return self.last
+
+        def copy(self) -> FlextObservabilityAggregation.Series:
+            """Return a detached copy of the aggregate state.
+
+            Copying is a handful of attribute reads, so the store lock is held
+            only for the copy; serializing happens on the detached state.
+            """
+            clone = FlextObservabilityAggregation.Series.__new__(
+                FlextObservabilityAggregation.Series
+            )
+            clone.name = self.name
+            clone.labels = self.labels
+            clone.metric_type = self.metric_type
+            clone.bounds = self.bounds
+            clone.buckets = self.buckets.copy()
+            clone.count = self.count
+            clone.sum = self.sum
+            clone.min = self.min
+            clone.max = self.max
+            clone.last = self.last
+            clone.exemplars = None if self.exemplars is None else self.exemplars.copy()
+            return clone
+
+        def snapshot(self) -> t.JsonDict:
+            """Return a JSON-compatible copy of the aggregate."""
+            payload: t.JsonDict = {
+                "name": self.name,
+                "labels": dict(self.labels),
+                "type": self.metric_type.value,
+                "count": self.count,
+                "sum": self.sum,
+                "value": self.value,
+                "min": self.min if self.count else 0.0,
+                "max": self.max if self.count else 0.0,
+            }
+            if self.bounds:
+                payload["bounds"] = list(self.bounds)
+                payload["buckets"] = list(self.buckets)
+            if self.exemplars is not None:
+                payload["exemplars"] = self.exemplars.snapshot()
+            return payload
+
+        def prometheus_lines(self, name: str, *, exemplars: bool = False) -> list[str]:
+            """Return the exposition sample lines of this series.
+
+            Histograms expand into cumulative ``_bucket`` samples plus
+            ``_sum`` and ``_count``; summaries into ``_sum`` and ``_count``.
+            With ``exemplars`` (OpenMetrics only) bucket samples carry their
+            bucket's exemplar.
+            """
+            aggregation = FlextObservabilityAggregation
+            labels = aggregation.prometheus_labels(self.labels)
+            if self.metric_type == c.Observability.MetricType.HISTOGRAM:
+                prefix = (
+                    f'{name}_bucket{{{labels[1:-1]},le="'
+                    if labels
+                    else f'{name}_bucket{{le="'
+                )
+                lines = [
+                    f'{prefix}{le}"}} {cumulative}'
+                    for le, cumulative in zip(
+                        aggregation.prometheus_bounds(self.bounds),
+                        accumulate(self.buckets),
+                        strict=True,
+                    )
+                ]
+                if exemplars and self.exemplars is not None:
+                    lines = [
+                        line + self.exemplars.openmetrics(index)
+                        for index, line in enumerate(lines)
+                    ]
+                lines.extend((
+                    f"{name}_sum{labels} {aggregation.prometheus_value(self.sum)}",
+                    f"{name}_count{labels} {self.count}",
+                ))
+                return lines
+            if self.metric_type == c.Observability.MetricType.SUMMARY:
+                return [
+                    f"{name}_sum{labels} {aggregation.prometheus_value(self.sum)}",
+                    f"{name}_count{labels} {self.count}",
+                ]
+            return [f"{name}{labels} {aggregation.prometheus_value(self.value)}"]
+
+    class Buffer:
+        """Deferred observations for one series, folded in batches.
+
+        Hot paths call the pre-bound ``append`` (a plain ``list.append``, no
+        lock) and the owning store folds pending values on ``flush``, on
+        ``snapshot``/``series`` and whenever the owner sees ``pending`` reach
+        ``c.Observability.METRIC_BUFFER_FLUSH_SIZE``. An optional ``tally``
+        series counts one per folded observation (e.g. a success counter next
+        to a duration histogram).
+        """
+
+        __slots__ = ("__weakref__", "append", "lock", "pending", "series", "tally")
+
+        def __init__(
+            self,
+            series: FlextObservabilityAggregation.Series,
+            lock: threading.Lock,
+            tally: FlextObservabilityAggregation.Series | None = None,
+        ) -> None:
+            """Initialize an empty buffer feeding ``series``."""
+            self.series = series
+            self.tally = tally
+            self.lock = lock
+            self.pending: list[float] = []
+            self.append = self.pending.append
+
+        def flush(self) -> int:
+            """Fold pending observations into the series; return how many."""
+            pending = self.pending
+            with self.lock:
+                size = len(pending)
+                if not size:
+                    return 0
+                batch = pending[:size]
+                del pending[:size]
+                self.series.observe_many(batch)
+                if self.tally is not None:
+                    self.tally.merge(
+                        count=size,
+                        total=float(size),
+                        minimum=1.0,
+                        maximum=1.0,
+                        last=1.0,
+                    )
+            return size
+
+        def clear(self) -> None:
+            """Drop pending observations without folding them."""
+            with self.lock:
+                del self.pending[:]
+
+    class Store:
+        """Registry of metric series with single and bulk recording."""
+
+        def __init__(
+            self,
+            bounds: tuple[float, ...] | None = None,
+            registry: FlextObservabilitySeries.Registry | None = None,
+        ) -> None:
+            """Initialize the store with histogram bucket upper bounds.
+
+            Series are keyed by their ID in ``registry`` (the global series
+            registry by default).
+            """
+            self._bounds: tuple[float, ...] = tuple(
+                sorted(bounds or c.Observability.DEFAULT_HISTOGRAM_BUCKETS)
+            )
+            self._registry = (
+                FlextObservabilitySeries.active_registry()
+                if registry is None
+                else registry
+            )
+            self._series: dict[int, FlextObservabilityAggregation.Series] = {}
+            self._types: dict[str, c.Observability.MetricType] = {}
+            self._conflicts: set[tuple[int, str]] = set()
+            self._lock = threading.Lock()
+            self._buffers: weakref.WeakSet[p.Observability.Flusher] = weakref.WeakSet()
+
+        @property
+        def bounds(self) -> tuple[float, ...]:
+            """Histogram bucket upper bounds used for new series."""
+            return self._bounds
+
+        @property
+        def registry(self) -> FlextObservabilitySeries.Registry:
+            """Series registry assigning the IDs this store is keyed by."""
+            return self._registry
+
+        @property
+        def lock(self) -> threading.Lock:
+            """Lock guarding series updates; hold it around ``Series.observe``."""
+            return self._lock
+
+        def handle(
+            self,
+            name: str,
+            metric_type: str = c.Observability.MetricType.GAUGE,
+            labels: t.StrMapping | None = None,
+        ) -> p.Result[FlextObservabilityAggregation.Series]:
+            """Resolve (creating on first use) the series for a name and label set.
+
+            The resolved series can be kept by hot paths and fed through
+            ``Series.observe`` without any further lookup.
+
+            Returns:
+                r[Series] - The series, or a failure when the name is
+                already registered with another metric type
+
+            """
+            return self.handle_id(self._registry.series_id(name, labels), metric_type)
+
+        def handle_id(
+            self, series_id: int, metric_type: str = c.Observability.MetricType.GAUGE
+        ) -> p.Result[FlextObservabilityAggregation.Series]:
+            """Resolve (creating on first use) the series of a registry ID.
+
+            Name and labels are decoded from the registry once, when the
+            series is created. Every series of one exposition name shares the
+            type the name was first registered with, so a family renders a
+            single ``# TYPE`` line; asking for another type is refused (and
+            logged once per name and type).
+
+            Returns:
+                r[Series] - The series, or a failure on a type conflict
+
+            """
+            series = self._series.get(series_id)
+            if series is None:
+                series = self._create(series_id, metric_type)
+            if series is None or series.metric_type != metric_type:
+                return self._type_conflict(series_id, metric_type)
+            return r[FlextObservabilityAggregation.Series].ok(series)
+
+        def _create(
+            self, series_id: int, metric_type: str
+        ) -> FlextObservabilityAggregation.Series | None:
+            """Register the series of a registry ID unless another thread did.
+
+            Returns ``None`` when the name is registered with another type.
+            """
+            name, labels = self._registry.decode(series_id)
+            family = FlextObservabilityAggregation.prometheus_name(name)
+            kind = c.Observability.MetricType(metric_type)
+            with self._lock:
+                series = self._series.get(series_id)
+                if series is None:
+                    if self._types.setdefault(family, kind) != kind:
+                        return None
+                    series = FlextObservabilityAggregation.Series(
+                        name, labels, kind, self._bounds
+                    )
+                    self._series[series_id] = series
+            return series
+
+        def _type_conflict(
+            self, series_id: int, metric_type: str
+        ) -> p.Result[FlextObservabilityAggregation.Series]:
+            """Refuse a series requested with a type its name does not have."""
+            name, labels = self._registry.decode(series_id)
+            registered = self._types[
+                FlextObservabilityAggregation.prometheus_name(name)
+            ]
+            error = (
+                f"metric {name}{FlextObservabilityAggregation.prometheus_labels(labels)}"
+                f" is a {registered.value}, not a {metric_type}"
+            )
+            conflict = (series_id, str(metric_type))
+            if conflict not in self._conflicts:
+                self._conflicts.add(conflict)
+                FlextObservabilityAggregation.logger.warning(
+                    "Refusing metric series: %s", error
+                )
+            return r[FlextObservabilityAggregation.Series].fail_op(
+                "resolve metric series", error
+            )
+
+        def buffer(
+            self,
+            series: FlextObservabilityAggregation.Series,
+            tally: FlextObservabilityAggregation.Series | None = None,
+        ) -> FlextObservabilityAggregation.Buffer:
+            """Create a deferred buffer feeding a series of this store.
+
+            The store keeps a weak reference and flushes the buffer before
+            every ``series``/``snapshot`` read.
+            """
+            buffer = FlextObservabilityAggregation.Buffer(series, self._lock, tally)
+            with self._lock:
+                self._buffers.add(buffer)
+            return buffer
+
+        def attach(self, flusher: p.Observability.Flusher) -> None:
+            """Flush ``flusher`` (weakly held) before every read, like a buffer."""
+            with self._lock:
+                self._buffers.add(flusher)
+
+        def flush(self) -> int:
+            """Fold every pending buffered observation; return how many."""
+            return sum(buffer.flush() for buffer in list(self._buffers))
+
+        def record(
+            self,
+            name: str,
+            value: float,
+            metric_type: str = c.Observability.MetricType.GAUGE,
+            labels: t.StrMapping | None = None,
+        ) -> p.Result[bool]:
+            """Fold one observation into its series.
+
+            Returns:
+                r[bool] - True once folded, or the type conflict failure
+
+            """
+            return self.record_id(
+                self._registry.series_id(name, labels), value, metric_type
+            )
+
+        def record_id(
+            self,
+            series_id: int,
+            value: float,
+            metric_type: str = c.Observability.MetricType.GAUGE,
+        ) -> p.Result[bool]:
+            """Fold one observation into the series of a registry ID.
+
+            Returns:
+                r[bool] - True once folded, or the type conflict failure
+
+            """
+            resolved = self.handle_id(series_id, metric_type)
+            if resolved.failure:
+                return r[bool].fail(resolved.error or "metric type conflict")
+            with self._lock:
+                resolved.value.observe(float(value))
+            return r[bool].ok(True)
+
+        def record_bulk(
+            self,
+            name: str,
+            values: Sequence[float],
+            metric_type: str = c.Observability.MetricType.HISTOGRAM,
+            *,
+            labels: t.StrMapping | None = None,
+            label_sets: Sequence[t.StrMapping] | None = None,
+            label_indices: Sequence[int] | None = None,
+        ) -> p.Result[int]:
+            """Fold a batch of observations into the store in one pass.
+
+            Args:
+                name: Metric name
+                values: NumPy array or Python sequence of observations
+                metric_type: Metric type shared by every observation
+                labels: Label set applied to every observation
+                label_sets: Distinct label sets referenced by ``label_indices``
+                label_indices: Per-observation index into ``label_sets``
+
+            Returns:
+                r[int] - Number of observations folded
+
+            Behavior:
+                - Uses NumPy (``bincount``/``searchsorted``) when it is already
+                  imported by the caller and every histogram group shares one
+                  bucket layout, pure Python otherwise
+                - Fails when the name is registered with another metric type
+                - Takes the store lock once per label set, not per value
+
+            """
+            try:
+                folded = self._fold_bulk(
+                    name, values, metric_type, labels, label_sets, label_indices
+                )
+            except c.EXC_BASIC_TYPE as exc:
+                return r[int].fail_op("record bulk metrics", exc)
+            return r[int].ok(folded)
+
+        def _fold_bulk(
+            self,
+            name: str,
+            values: Sequence[float],
+            metric_type: str,
+            labels: t.StrMapping | None,
+            label_sets: Sequence[t.StrMapping] | None,
+            label_indices: Sequence[int] | None,
+        ) -> int:
+            """Resolve the grouped series of a bulk batch and fold it."""
+            groups = self._resolve_groups(labels, label_sets, label_indices, values)
+            series_list: list[FlextObservabilityAggregation.Series] = []
+            for group_labels in groups:
+                resolved = self.handle(name, metric_type, group_labels)
+                if resolved.failure:
+                    raise ValueError(resolved.error)
+                series_list.append(resolved.value)
+            numpy = sys.modules.get("numpy")
+            layouts = {series.bounds for series in series_list if series.bounds}
+            if numpy is not None and len(layouts) <= 1:
+                return self._fold_numpy(numpy, series_list, values, label_indices)
+            return self._fold_python(series_list, values, label_indices)
+
+        @staticmethod
+        def _resolve_groups(
+            labels: t.StrMapping | None,
+            label_sets: Sequence[t.StrMapping] | None,
+            label_indices: Sequence[int] | None,
+            values: Sequence[float],
+        ) -> Sequence[t.StrMapping | None]:
+            """Validate bulk grouping arguments and resolve the label sets."""
+            if label_indices is None:
+                return [labels]
+            if not label_sets:
+                msg = "label_sets is required when label_indices is given"
+                raise ValueError(msg)
+            if len(label_indices) != len(values):
+                msg = "label_indices and values must have the same length"
+                raise ValueError(msg)
+            return [{**(labels or {}), **label_set} for label_set in label_sets]
+
+        def _fold_python(
+            self,
+            series_list: Sequence[FlextObservabilityAggregation.Series],
+            values: Sequence[float],
+            label_indices: Sequence[int] | None,
+        ) -> int:
+            """Fold a batch with plain Python loops (no NumPy, or mixed buckets)."""
+            if label_indices is None:
+                with self._lock:
+                    series = series_list[0]
+                    for value in values:
+                        series.observe(float(value))
+                return len(values)
+            group_count = len(series_list)
+            for index in label_indices:
+                if not 0 <= int(index) < group_count:
+                    msg = (
+                        f"label index {index} out of range for {group_count} label sets"
+                    )
+                    raise ValueError(msg)
+            with self._lock:
+                for index, value in zip(label_indices, values, strict=True):
+                    series_list[int(index)].observe(float(value))
+            return len(values)
+
+        def _fold_numpy(
+            self,
+            numpy: ModuleType,
+            series_list: Sequence[FlextObservabilityAggregation.Series],
+            values: Sequence[float],
+            label_indices: Sequence[int] | None,
+        ) -> int:
+            """Fold a batch with one vectorized NumPy pass per aggregate."""
+            array = numpy.asarray(values, dtype=numpy.float64).ravel()
+            size = int(array.size)
+            if size == 0:
+                return 0
+            group_count = len(series_list)
+            if label_indices is None:
+                groups = numpy.zeros(size, dtype=numpy.intp)
+            else:
+                groups = numpy.asarray(label_indices, dtype=numpy.intp).ravel()
+                if int(groups.min()) < 0 or int(groups.max()) >= group_count:
+                    msg = f"label indices out of range for {group_count} label sets"
+                    raise ValueError(msg)
+            counts = numpy.bincount(groups, minlength=group_count)
+            sums = numpy.bincount(groups, weights=array, minlength=group_count)
+            minimums = numpy.full(group_count, numpy.inf)
+            maximums = numpy.full(group_count, -numpy.inf)
+            numpy.minimum.at(minimums, groups, array)
+            numpy.maximum.at(maximums, groups, array)
+            lasts = numpy.zeros(group_count)
+            reversed_groups = groups[::-1]
+            present, first_from_end = numpy.unique(reversed_groups, return_index=True)
+            lasts[present] = array[size - 1 - first_from_end]
+            bucket_matrix = None
+            bounds = next(
+                (series.bounds for series in series_list if series.bounds), ()
+            )
+            if bounds:
+                bucket_width = len(bounds) + 1
+                bucket_index = numpy.searchsorted(
+                    numpy.asarray(bounds), array, side="left"
+                )
+                bucket_matrix = numpy.bincount(
+                    groups * bucket_width + bucket_index,
+                    minlength=group_count * bucket_width,
+                ).reshape(group_count, bucket_width)
+            with self._lock:
+                for index, series in enumerate(series_list):
+                    series.merge(
+                        count=int(counts[index]),
+                        total=float(sums[index]),
+                        minimum=float(minimums[index]),
+                        maximum=float(maximums[index]),
+                        last=float(lasts[index]),
+                        buckets=None
+                        if bucket_matrix is None
+                        else bucket_matrix[index].tolist(),
+                    )
+            return size
+
+        def clear(self) -> None:
+            """Reset every series to zero.
+
+            Series stay registered so handles pre-resolved by hot paths keep
+            feeding the store after a clear. Pending buffered observations
+            and attached recorders are dropped too, so nothing recorded
+            before the clear is folded in afterwards.
+            """
+            for flusher in list(self._buffers):
+                flusher.clear()
+            with self._lock:
+                for series in self._series.values():
+                    series.reset()
+
+        def series(self) -> Sequence[FlextObservabilityAggregation.Series]:
+            """Return the currently registered series."""
+            _ = self.flush()
+            with self._lock:
+                return list(self._series.values())
+
+        def capture(self) -> Sequence[FlextObservabilityAggregation.Series]:
+            """Return a consistent, detached copy of every series.
+
+            Pending buffers are folded first; the lock is then held only while
+            the raw aggregates are copied, so writers are paused for the copy
+            and never for serialization of the result.
+            """
+            _ = self.flush()
+            with self._lock:
+                return [series.copy() for series in self._series.values()]
+
+        def snapshot(self) -> Sequence[t.JsonDict]:
+            """Return a consistent JSON-compatible copy of every series."""
+            return [series.snapshot() for series in self.capture()]
+
+        def render_prometheus(self) -> str:
+            """Render every series in the Prometheus text exposition format."""
+            lines: list[str] = []
+            for name, metric_type, members in self._families(openmetrics=False):
+                lines.append(f"# TYPE {name} {metric_type.value}")
+                for sample, series in members:
+                    lines.extend(series.prometheus_lines(sample))
+            lines.append("")
+            return "\n".join(lines)
+
+        def render_openmetrics(self) -> str:
+            """Render every series in the OpenMetrics text format.
+
+            Counter families drop a ``_total`` suffix from their name and
+            their samples carry it; histogram buckets carry their exemplars
+            and the exposition ends with ``# EOF``.
+            """
+            lines: list[str] = []
+            for name, metric_type, members in self._families(openmetrics=True):
+                lines.append(f"# TYPE {name} {metric_type.value}")
+                for sample, series in members:
+                    lines.extend(series.prometheus_lines(sample, exemplars=True))
+            lines.extend(("# EOF", ""))
+            return "\n".join(lines)
+
+        def _families(
+            self, *, openmetrics: bool
+        ) -> list[
+            tuple[
+                str,
+                c.Observability.MetricType,
+                list[tuple[str, FlextObservabilityAggregation.Series]],
+            ]
+        ]:
+            """Group captured series into exposition families.
+
+            Each family keeps the type of its first series; a series of
+            another type rendering under the same family name is left out,
+            so every family has exactly one ``# TYPE`` line.
+            """
+            counter = c.Observability.MetricType.COUNTER
+            families: dict[
+                str,
+                tuple[
+                    c.Observability.MetricType,
+                    list[tuple[str, FlextObservabilityAggregation.Series]],
+                ],
+            ] = {}
+            ordered = sorted(
+                self.capture(), key=lambda series: (series.name, series.labels)
+            )
+            for series in ordered:
+                name = FlextObservabilityAggregation.prometheus_name(series.name)
+                sample = name
+                if openmetrics and series.metric_type == counter:
+                    name = name.removesuffix("_total")
+                    sample = f"{name}_total"
+                metric_type, members = families.setdefault(
+                    name, (series.metric_type, [])
+                )
+                if series.metric_type == metric_type:
+                    members.append((sample, series))
+            return [
+                (name, metric_type, members)
+                for name, (metric_type, members) in sorted(families.items())
+            ]
+
+    @staticmethod
+    def active_store() -> FlextObservabilityAggregation.Store:
+        """Return the global aggregation store instance.
+
+        Returns:
+            Store - Global aggregation store
+
+        """
+        if FlextObservabilityAggregation._store_instance is None:
+            FlextObservabilityAggregation._store_instance = (
+                FlextObservabilityAggregation.Store()
+            )
+        return FlextObservabilityAggregation._store_instance
+
+    @staticmethod
+    def record_bulk(
+        name: str,
+        values: Sequence[float],
+        metric_type: str = c.Observability.MetricType.HISTOGRAM,
+        *,
+        labels: t.StrMapping | None = None,
+        label_sets: Sequence[t.StrMapping] | None = None,
+        label_indices: Sequence[int] | None = None,
+    ) -> p.Result[int]:
+        """Fold a batch of observations into the global store.
+
+        Args:
+            name: Metric name
+            values: NumPy array or Python sequence of observations
+            metric_type: Metric type shared by every observation
+            labels: Label set applied to every observation
+            label_sets: Distinct label sets referenced by ``label_indices``
+            label_indices: Per-observation index into ``label_sets``
+
+        Returns:
+            r[int] - Number of observations folded
+
+        """
+        store = FlextObservabilityAggregation.active_store()
+        return store.record_bulk(
+            name,
+            values,
+            metric_type,
+            labels=labels,
+            label_sets=label_sets,
+            label_indices=label_indices,
+        )
+
+    @staticmethod
+    def metrics_snapshot() -> m.Dict:
+        """Return a snapshot of the global store keyed by metric name."""
+        grouped: dict[str, list[t.JsonDict]] = {}
+        for series in FlextObservabilityAggregation.active_store().snapshot():
+            grouped.setdefault(str(series["name"]), []).append(series)
+        return m.Dict(grouped)
+
+
+__all__: list[str] = ["FlextObservabilityAggregation"]
@@ -0,0 +1,518 @@
+"""Asynchronous alert dispatch with coalescing and pluggable sinks.
+
+Moves alert delivery off the failing call path: producers enqueue a slotted
+notice onto a bounded queue in O(1) and a background worker coalesces notices
+sharing a fingerprint, applies the error handler's alert cooldown (and, opt-in,
+its escalation threshold) and delivers the survivors through pluggable sinks.
+
+FLEXT Pattern:
+- Single FlextObservabilityAlerting class
+- Nested Notice, sinks and Dispatcher
+- Thread-safe global dispatcher with a lazily started daemon worker
+
+Key Features:
+- O(1) bounded enqueue (overflow is dropped and counted, never blocks)
+- Coalescing of same-fingerprint alerts inside a window (with count)
+- Handler alert cooldowns before delivery; escalation threshold opt-in
+- Callback, local webhook and JSON-lines file sinks
+- Own drop, suppression, delivery and latency metrics
+"""
+
+from __future__ import annotations
+
+import http.client
+import os
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Sequence
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from flext_observability import c, m, p, r, t, u
+from flext_observability.services.aggregation import FlextObservabilityAggregation
+from flext_observability.services.error_handling import FlextObservabilityErrorHandling
+
+
+class FlextObservabilityAlerting:
+    """Alert dispatch pipeline.
+
+    Usage:
+        ```python
+        from flext_observability import FlextObservabilityAlerting
+
+        dispatcher = FlextObservabilityAlerting.active_dispatcher()
+        dispatcher.add_sink(FlextObservabilityAlerting.CallbackSink(print))
+        dispatcher.add_sink(FlextObservabilityAlerting.FileSink("alerts.jsonl"))
+
+        # O(1), never blocks the caller
+        dispatcher.enqueue(
+            "Database unavailable",
+            "Connection refused",
+            severity=c.Observability.ErrorSeverity.CRITICAL,
+            fingerprint=fingerprint,
+        )
+        ```
+
+    Nested Classes:
+        Notice: Queued (and coalesced) alert
+        CallbackSink: In-process callback sink
+        WebhookSink: Local webhook sink (JSON POST)
+        FileSink: JSON-lines file sink
+        LogSink: Logger sink used when no sink is configured
+        Dispatcher: Bounded queue, coalescing worker and delivery
+    """
+
+    logger = u.fetch_logger(__name__)
+    _dispatcher_instance: FlextObservabilityAlerting.Dispatcher | None = None
+
+    class Notice:
+        """Queued alert; coalesced notices carry the number of occurrences."""
+
+        __slots__ = (
+            "count",
+            "enqueued_ns",
+            "fingerprint",
+            "labels",
+            "message",
+            "severity",
+            "source",
+            "title",
+        )
+
+        def __init__(
+            self,
+            title: str,
+            message: str,
+            severity: c.Observability.ErrorSeverity,
+            source: str,
+            fingerprint: str,
+            labels: t.StrMapping | None,
+        ) -> None:
+            """Initialize a notice stamped with its enqueue time."""
+            self.title = title
+            self.message = message
+            self.severity = severity
+            self.source = source
+            self.fingerprint = fingerprint
+            self.labels = labels
+            self.count = 1
+            self.enqueued_ns = time.perf_counter_ns()
+
+        def to_payload(self) -> t.JsonDict:
+            """Return the JSON payload handed to sinks."""
+            return {
+                "title": self.title,
+                "message": self.message,
+                "severity": self.severity.value,
+                "source": self.source,
+                "fingerprint": self.fingerprint,
+                "count": self.count,
+                "labels": dict(self.labels or {}),
+            }
+
+        def to_error_event(self) -> m.Observability.ErrorEvent:
+            """Materialise the notice for the error handler's alert policy."""
+            return m.Observability.ErrorEvent(
+                error_type=self.title,
+                message=self.message,
+                severity=self.severity,
+                fingerprint=self.fingerprint,
+            )
+
+    class CallbackSink:
+        """Deliver alerts to an in-process callback."""
+
+        def __init__(self, callback: Callable[[t.JsonDict], None]) -> None:
+            """Initialize the sink with the callback receiving each payload."""
+            self._callback = callback
+
+        def deliver(self, alert: t.JsonDict) -> p.Result[bool]:
+            """Invoke the callback with the alert payload."""
+            try:
+                self._callback(alert)
+                return r[bool].ok(value=True)
+            except c.EXC_BASIC_TYPE as e:
+                return r[bool].fail_op("deliver alert to callback", e)
+
+    class WebhookSink:
+        """POST alerts as JSON to a local webhook endpoint."""
+
+        def __init__(
+            self,
+            url: str,
+            timeout_sec: float = c.Observability.ALERT_WEBHOOK_TIMEOUT_SEC,
+        ) -> None:
+            """Initialize the sink with the endpoint URL and request timeout."""
+            self._url = url
+            self._timeout_sec = timeout_sec
+
+        def deliver(self, alert: t.JsonDict) -> p.Result[bool]:
+            """POST the alert payload; error responses fail."""
+            try:
+                status = self._post(u.Cli.json_dumps(alert).unwrap().encode())
+            except c.EXC_BASIC_TYPE as e:
+                return r[bool].fail_op("deliver alert to webhook", e)
+            if status >= c.Observability.HTTP_ERROR_STATUS_THRESHOLD:
+                return r[bool].fail_op("deliver alert to webhook", f"HTTP {status}")
+            return r[bool].ok(value=True)
+
+        def _post(self, body: bytes) -> int:
+            """POST a JSON body to the endpoint and return the response status."""
+            target = urlsplit(self._url)
+            connection_type = (
+                http.client.HTTPSConnection
+                if target.scheme == "https"
+                else http.client.HTTPConnection
+            )
+            connection = connection_type(target.netloc, timeout=self._timeout_sec)
+            try:
+                connection.request(
+                    "POST",
+                    target.path or "/",
+                    body=body,
+                    headers={"Content-Type": "application/json"},
+                )
+                return connection.getresponse().status
+            finally:
+                connection.close()
+
+    class FileSink:
+        """Append alerts as JSON lines to a local file."""
+
+        def __init__(self, path: str | Path) -> None:
+            """Initialize the sink with the target file path."""
+            self._path = Path(path)
+            self._lock = threading.Lock()
+
+        def deliver(self, alert: t.JsonDict) -> p.Result[bool]:
+            """Append one JSON line."""
+            try:
+                line = u.Cli.json_dumps(alert).unwrap()
+                with self._lock, self._path.open("a", encoding="utf-8") as handle:
+                    _ = handle.write(f"{line}\n")
+                return r[bool].ok(value=True)
+            except c.EXC_BASIC_TYPE as e:
+                return r[bool].fail_op("deliver alert to file", e)
+
+    class LogSink:
+        """Log alerts; used while no other sink is configured."""
+
+        def deliver(self, alert: t.JsonDict) -> p.Result[bool]:
+            """Log the alert at warning level."""
+            FlextObservabilityAlerting.logger.warning(
+                f"Alert: {alert['title']} x{alert['count']} ({alert['severity']}): {alert['message']}"
+            )
+            return r[bool].ok(value=True)
+
+    class Dispatcher:
+        """Bounded alert queue drained by a coalescing background worker."""
+
+        def __init__(
+            self,
+            capacity: int = c.Observability.ALERT_QUEUE_SIZE,
+            coalesce_window_sec: float = c.Observability.ALERT_COALESCE_WINDOW_SEC,
+            handler: FlextObservabilityErrorHandling.Handler | None = None,
+            *,
+            escalation: bool = False,
+        ) -> None:
+            """Initialize the dispatcher; the worker starts on first enqueue.
+
+            Args:
+                capacity: Maximum queued notices; overflow is dropped
+                coalesce_window_sec: Window in which same-fingerprint notices
+                    are merged into one alert
+                handler: Error handler whose cooldown policy gates delivery
+                    (None = global handler)
+                escalation: Also hold back non-critical alerts until their
+                    count reaches the handler's escalation threshold (off:
+                    every alert outside the cooldown is delivered, so a
+                    single failure still alerts)
+
+            """
+            self._capacity = capacity
+            self._escalation = escalation
+            self._window_ns = int(coalesce_window_sec * 1e9)
+            self._handler = handler
+            self._queue: deque[FlextObservabilityAlerting.Notice] = deque()
+            self._pending: dict[str, FlextObservabilityAlerting.Notice] = {}
+            self._sinks: list[p.Observability.AlertSink] = []
+            self._wakeup = threading.Event()
+            self._stopping = threading.Event()
+            self._process_lock = threading.Lock()
+            self._worker: threading.Thread | None = None
+            self._worker_lock = threading.Lock()
+            self._fork_hook_installed = False
+            store = FlextObservabilityAggregation.active_store()
+            counter = c.Observability.MetricType.COUNTER
+            self._dropped = store.handle("flext_alerts_dropped_total", counter).unwrap()
+            self._received = store.handle(
+                "flext_alerts_received_total", counter
+            ).unwrap()
+            self._coalesced = store.handle(
+                "flext_alerts_coalesced_total", counter
+            ).unwrap()
+            self._suppressed = store.handle(
+                "flext_alerts_suppressed_total", counter
+            ).unwrap()
+            self._delivered = store.handle(
+                "flext_alerts_delivered_total", counter
+            ).unwrap()
+            self._sink_errors = store.handle(
+                "flext_alert_sink_errors_total", counter
+            ).unwrap()
+            self._latency = store.handle(
+                "flext_alert_dispatch_latency_seconds",
+                c.Observability.MetricType.HISTOGRAM,
+            ).unwrap()
+            self._lock = store.lock
+
+        @property
+        def sinks(self) -> Sequence[p.Observability.AlertSink]:
+            """Configured sinks (a log sink is used while empty)."""
+            return tuple(self._sinks)
+
+        def add_sink(self, sink: p.Observability.AlertSink) -> None:
+            """Register a delivery sink."""
+            self._sinks.append(sink)
+
+        def enqueue(
+            self,
+            title: str,
+            message: str,
+            *,
+            severity: c.Observability.ErrorSeverity = c.Observability.ErrorSeverity.ERROR,
+            source: str = "system",
+            fingerprint: str | None = None,
+            labels: t.StrMapping | None = None,
+        ) -> bool:
+            """Queue an alert without blocking.
+
+            Args:
+                title: Alert title (also the coalescing error type)
+                message: Alert message
+                severity: Alert severity
+                source: Alert source
+                fingerprint: Coalescing key (None = handler fingerprint of
+                    title and message)
+                labels: Extra labels forwarded to sinks
+
+            Returns:
+                bool - False when the queue is full and the alert was dropped
+
+            """
+            queue = self._queue
+            if len(queue) >= self._capacity:
+                with self._lock:
+                    self._dropped.observe(1.0)
+                return False
+            queue.append(
+                FlextObservabilityAlerting.Notice(
+                    title, message, severity, source, fingerprint or "", labels
+                )
+            )
+            if self._worker is None:
+                self._start_worker()
+            self._wakeup.set()
+            return True
+
+        def drain(self, *, force: bool = False) -> int:
+            """Coalesce queued notices and deliver the due ones.
+
+            Each coalesced notice's occurrences are counted in the error
+            handler before its alert cooldown decides on delivery; with
+            ``escalation`` its full ``should_alert_for_error`` policy
+            (cooldown, escalation threshold, critical bypass) decides.
+
+            Args:
+                force: Deliver every pending notice, ignoring the window
+
+            Returns:
+                int - Number of alerts delivered
+
+            """
+            with self._process_lock:
+                self._coalesce()
+                return self._deliver_due(force=force)
+
+        def stop(self, timeout_sec: float = 5.0) -> None:
+            """Stop the worker and deliver everything still pending."""
+            self._stopping.set()
+            self._wakeup.set()
+            worker = self._worker
+            if worker is not None:
+                worker.join(timeout_sec)
+            self._worker = None
+            self._stopping.clear()
+            _ = self.drain(force=True)
+
+        def _start_worker(self) -> None:
+            """Start the daemon worker once (per process)."""
+            with self._worker_lock:
+                if self._worker is not None:
+                    return
+                worker = threading.Thread(
+                    target=self._run, name="flext-alert-dispatcher", daemon=True
+                )
+                self._worker = worker
+                worker.start()
+                if not self._fork_hook_installed:
+                    self._fork_hook_installed = True
+                    os.register_at_fork(after_in_child=self._after_fork)
+
+        def _after_fork(self) -> None:
+            """Give a forked child an empty queue and no worker.
+
+            Only the forking thread survives ``fork()``, so the inherited
+            worker reference is stale and its locks may be held. The child
+            drops the notices it copied (the parent still delivers them) and
+            starts its own worker on its first enqueue.
+            """
+            self._queue = deque()
+            self._pending = {}
+            self._wakeup = threading.Event()
+            self._stopping = threading.Event()
+            self._process_lock = threading.Lock()
+            self._worker_lock = threading.Lock()
+            self._worker = None
+
+        def _run(self) -> None:
+            """Worker loop: wake on enqueue or when the oldest window closes."""
+            window_sec = self._window_ns / 1e9
+            while not self._stopping.is_set():
+                _ = self._wakeup.wait(window_sec if self._pending else None)
+                self._wakeup.clear()
+                try:
+                    _ = self.drain()
+                except c.EXC_BASIC_TYPE as e:
+                    FlextObservabilityAlerting.logger.warning(
+                        f"Alert dispatch failed: {e}"
+                    )
+
+        def _active_handler(self) -> FlextObservabilityErrorHandling.Handler:
+            """Return the handler whose policy gates delivery."""
+            return self._handler or FlextObservabilityErrorHandling.active_handler()
+
+        def _coalesce(self) -> None:
+            """Move queued notices into the pending map, merging by fingerprint."""
+            queue = self._queue
+            pending = self._pending
+            received = 0
+            merged = 0
+            handler = self._active_handler()
+            while queue:
+                notice = queue.popleft()
+                received += 1
+                if not notice.fingerprint:
+                    notice.fingerprint = handler.fingerprint(
+                        notice.title, notice.message
+                    )
+                current = pending.get(notice.fingerprint)
+                if current is None:
+                    pending[notice.fingerprint] = notice
+                else:
+                    current.count += 1
+                    current.message = notice.message
+                    merged += 1
+            if received:
+                with self._lock:
+                    self._received.merge(
+                        count=received,
+                        total=float(received),
+                        minimum=1.0,
+                        maximum=1.0,
+                        last=1.0,
+                    )
+                    if merged:
+                        self._coalesced.merge(
+                            count=merged,
+                            total=float(merged),
+                            minimum=1.0,
+                            maximum=1.0,
+                            last=1.0,
+                        )
+
+        def _deliver_due(self, *, force: bool) -> int:
+            """Deliver pending notices whose coalescing window has closed."""
+            now_ns = time.perf_counter_ns()
+            due = [
+                notice
+                for notice in self._pending.values()
+                if force or now_ns - notice.enqueued_ns >= self._window_ns
+            ]
+            handler = self._active_handler()
+            sinks = self._sinks or [FlextObservabilityAlerting.LogSink()]
+            delivered = 0
+            for notice in due:
+                del self._pending[notice.fingerprint]
+                _ = handler.record_occurrences(notice.fingerprint, notice.count)
+                event = notice.to_error_event()
+                if (
+                    not handler.should_alert_for_error(event)
+                    if self._escalation
+                    else handler.in_alert_cooldown(event)
+                ):
+                    with self._lock:
+                        self._suppressed.observe(1.0)
+                    continue
+                handler.record_alert_sent(event)
+                payload = notice.to_payload()
+                failures = 0
+                for sink in sinks:
+                    result = sink.deliver(payload)
+                    if result.failure:
+                        failures += 1
+                        FlextObservabilityAlerting.logger.warning(
+                            f"Alert sink failed: {result.error}"
+                        )
+                with self._lock:
+                    self._latency.observe(
+                        (time.perf_counter_ns() - notice.enqueued_ns) / 1e9
+                    )
+                    self._delivered.observe(1.0)
+                    if failures:
+                        self._sink_errors.observe(float(failures))
+                delivered += 1
+            return delivered
+
+    @staticmethod
+    def active_dispatcher() -> FlextObservabilityAlerting.Dispatcher:
+        """Return the global alert dispatcher instance.
+
+        Returns:
+            Dispatcher - Global alert dispatcher
+
+        """
+        if FlextObservabilityAlerting._dispatcher_instance is None:
+            FlextObservabilityAlerting._dispatcher_instance = (
+                FlextObservabilityAlerting.Dispatcher()
+            )
+        return FlextObservabilityAlerting._dispatcher_instance
+
+    @staticmethod
+    def dispatch_alert(
+        title: str,
+        message: str,
+        *,
+        severity: c.Observability.ErrorSeverity = c.Observability.ErrorSeverity.ERROR,
+        source: str = "system",
+        fingerprint: str | None = None,
+        labels: t.StrMapping | None = None,
+    ) -> bool:
+        """Queue an alert on the global dispatcher.
+
+        Returns:
+            bool - False when the queue is full and the alert was dropped
+
+        """
+        return FlextObservabilityAlerting.active_dispatcher().enqueue(
+            title,
+            message,
+            severity=severity,
+            source=source,
+            fingerprint=fingerprint,
+            labels=labels,
+        )
+
+
+__all__: list[str] = ["FlextObservabilityAlerting"]
@@ -0,0 +1,185 @@
+"""Series cardinality limits with overflow folding and heavy-hitter reports.
+
+A label carrying user IDs or raw request paths creates a new series per
+value until the process runs out of memory. The limiter caps the series of
+each metric and of the whole registry; past a cap, new label sets are folded
+into the metric's ``otel.metric.overflow="true"`` series (the OpenTelemetry
+convention) instead of being created. Space-Saving sketches of fixed size
+track which label keys keep introducing new values and which label values
+land in overflow, so the offending label can be found without storing it.
+
+FLEXT Pattern:
+- Single FlextObservabilityCardinality class
+- Nested SpaceSaving (top-k sketch) and Limiter (limits and reports)
+- Enforced by FlextObservabilitySeries.Registry when it creates a series
+
+Key Features:
+- Per-metric limits (overridable per metric) and a global limit
+- One overflow series per metric, never refused
+- Fixed-memory top-k of label keys and overflowed label values
+"""
+
+from __future__ import annotations
+
+import heapq
+import threading
+from collections.abc import Iterable
+
+from flext_observability import c, t
+
+
+class FlextObservabilityCardinality:
+    """Cardinality limits for metric series.
+
+    Usage:
+        ```python
+        from flext_observability import (
+            FlextObservabilityCardinality,
+            FlextObservabilitySeries,
+        )
+
+        limiter = FlextObservabilityCardinality.Limiter(max_series_per_metric=500)
+        registry = FlextObservabilitySeries.Registry(limiter=limiter)
+        limiter.set_limit("checkout_seconds", 50)
+
+        # Which labels are exploding
+        limiter.report()["top_label_keys"]
+        ```
+
+    Nested Classes:
+        SpaceSaving: Fixed-size heavy-hitter sketch
+        Limiter: Series limits, overflow accounting and reports
+    """
+
+    class SpaceSaving:
+        """Space-Saving top-k sketch (Metwally et al.) over ``capacity`` slots.
+
+        Counts are overestimates by at most the reported ``error``; any item
+        occurring more than ``total / capacity`` times is guaranteed a slot.
+        """
+
+        def __init__(
+            self, capacity: int = c.Observability.CARDINALITY_SKETCH_SIZE
+        ) -> None:
+            """Initialize an empty sketch."""
+            self.capacity = capacity
+            self.total = 0
+            self._counts: dict[str, list[int]] = {}
+
+        def __len__(self) -> int:
+            """Number of tracked items."""
+            return len(self._counts)
+
+        def offer(self, item: str, weight: int = 1) -> None:
+            """Count ``weight`` occurrences of ``item``.
+
+            An untracked item on a full sketch replaces the smallest entry and
+            inherits its count as error.
+            """
+            self.total += weight
+            entry = self._counts.get(item)
+            if entry is not None:
+                entry[0] += weight
+                return
+            if len(self._counts) < self.capacity:
+                self._counts[item] = [weight, 0]
+                return
+            evicted = min(self._counts, key=lambda key: self._counts[key][0])
+            floor = self._counts.pop(evicted)[0]
+            self._counts[item] = [floor + weight, floor]
+
+        def top(
+            self, limit: int = c.Observability.CARDINALITY_TOP_K
+        ) -> list[t.JsonDict]:
+            """Return the ``limit`` heaviest items as ``{item, count, error}``."""
+            heaviest = heapq.nlargest(
+                limit, self._counts.items(), key=lambda item: item[1][0]
+            )
+            return [
+                {"item": item, "count": count, "error": error}
+                for item, (count, error) in heaviest
+            ]
+
+    class Limiter:
+        """Series limits consulted by the series registry."""
+
+        def __init__(
+            self,
+            *,
+            max_series: int | None = None,
+            max_series_per_metric: int | None = None,
+            sketch_size: int = c.Observability.CARDINALITY_SKETCH_SIZE,
+        ) -> None:
+            """Initialize a limiter; ``None`` limits are unbounded."""
+            self.max_series = max_series
+            self.max_series_per_metric = max_series_per_metric
+            self.overflows = 0
+            self._limits: dict[str, int | None] = {}
+            self._overflowed: dict[str, int] = {}
+            self._label_keys = FlextObservabilityCardinality.SpaceSaving(sketch_size)
+            self._label_values = FlextObservabilityCardinality.SpaceSaving(sketch_size)
+            self._lock = threading.Lock()
+
+        def set_limit(self, name: str, max_series: int | None) -> None:
+            """Override the per-metric limit of ``name`` (``None``: unbounded)."""
+            with self._lock:
+                self._limits[name] = max_series
+
+        def limit(self, name: str) -> int | None:
+            """Return the series limit that applies to metric ``name``."""
+            return self._limits.get(name, self.max_series_per_metric)
+
+        def admit(self, name: str, metric_series: int, total_series: int) -> bool:
+            """Return whether metric ``name`` may create another series.
+
+            Args:
+                name: Metric name
+                metric_series: Series the metric already has
+                total_series: Series the registry already has (overflow
+                    series excluded)
+
+            Returns:
+                bool - False once either limit is reached
+
+            """
+            limit = self.limit(name)
+            if limit is not None and metric_series >= limit:
+                return False
+            return self.max_series is None or total_series < self.max_series
+
+        def observe_new_values(self, name: str, keys: Iterable[str]) -> None:
+            """Count label keys that brought a never-seen value to ``name``."""
+            with self._lock:
+                for key in keys:
+                    self._label_keys.offer(f"{name}{{{key}}}")
+
+        def observe_overflow(self, name: str, labels: t.Observability.LabelSet) -> None:
+            """Account one label set of ``name`` folded into overflow."""
+            with self._lock:
+                self.overflows += 1
+                self._overflowed[name] = self._overflowed.get(name, 0) + 1
+                for key, value in labels:
+                    self._label_values.offer(f'{name}{{{key}="{value}"}}')
+
+        def report(self, limit: int = c.Observability.CARDINALITY_TOP_K) -> t.JsonDict:
+            """Return limits, overflow counts and the top cardinality drivers.
+
+            Returns:
+                dict - ``max_series``, ``max_series_per_metric``,
+                ``overflows``, ``overflowed_metrics`` (label sets folded per
+                metric), ``top_label_keys`` (keys adding new values) and
+                ``top_label_values`` (values folded into overflow)
+
+            """
+            with self._lock:
+                return {
+                    "max_series": self.max_series,
+                    "max_series_per_metric": self.max_series_per_metric,
+                    "overflows": self.overflows,
+                    "overflowed_metrics": dict(sorted(self._overflowed.items())),
+                    "top_label_keys": self._label_keys.top(limit),
+                    "top_label_values": self._label_values.top(limit),
+                }
+
+
+__all__: list[str] = ["FlextObservabilityCardinality"]
@@ -0,0 +1,535 @@
+"""Columnar (struct-of-arrays) batch for high-volume observability records.
+
+The entity factories build a pydantic model per record: a uuid, a validated
+label mapping and an empty ``domain_events`` list, several hundred bytes and
+a full validation pass each. A batch instead appends every record as one row
+of parallel typed arrays - timestamps, values, interned string IDs and
+interned label-set IDs - and only builds the entity when a row is read.
+
+FLEXT Pattern:
+- Single FlextObservabilityColumnar class
+- Nested Strings / LabelSets (interning tables), per-kind column groups and
+  Batch (the container the factories append to)
+- Thread-safe global batch created on demand
+
+Key Features:
+- ``Batch.flext_metric`` / ``flext_log_entry`` / ``flext_alert`` mirror the
+  facade factories but return the row index instead of an entity
+- Entities materialised lazily with stable per-row ids
+- ``Batch.footprint`` reports bytes per sample against the pydantic models
+"""
+
+from __future__ import annotations
+
+import math
+import sys
+import threading
+import time
+import tracemalloc
+from array import array
+from collections.abc import Iterator, Mapping
+from datetime import UTC, datetime
+from typing import ClassVar
+from uuid import UUID, uuid4
+
+from flext_observability import c, m, p, r, t, u
+from flext_observability.services.series import FlextObservabilitySeries
+
+
+class FlextObservabilityColumnar:
+    """Struct-of-arrays storage for metrics, log entries and alerts.
+
+    Usage:
+        ```python
+        from flext_observability import FlextObservabilityColumnar
+
+        batch = FlextObservabilityColumnar.active_batch()
+        row = batch.flext_metric("http_requests_total", 1.0, labels={"code": "200"})
+
+        # Entities only when a row is read
+        metric = batch.metric(row.value).value
+        batch.footprint()  # bytes per sample vs the pydantic models
+        ```
+
+    Nested Classes:
+        Strings: Interned strings addressed by integer ID
+        LabelSets: Interned sorted label sets addressed by integer ID
+        MetricColumns / LogColumns / AlertColumns: Parallel arrays per kind
+        Batch: Append-only container with lazy entity materialisation
+    """
+
+    _batch_instance: ClassVar[FlextObservabilityColumnar.Batch | None] = None
+
+    @staticmethod
+    def metric_type_for_name(name: str) -> c.Observability.MetricType:
+        """Resolve metric type from a metric name suffix."""
+        if name.endswith(("_total", "_count")):
+            return c.Observability.MetricType.COUNTER
+        if name.endswith(("_duration", "_seconds")):
+            return c.Observability.MetricType.HISTOGRAM
+        return c.Observability.MetricType.GAUGE
+
+    @staticmethod
+    def array_bytes(*columns: array[int] | array[float]) -> int:
+        """Return the payload bytes held by typed array columns."""
+        return sum(len(column) * column.itemsize for column in columns)
+
+    class Strings:
+        """Append-only string table: each distinct string stored once."""
+
+        def __init__(self) -> None:
+            """Initialize an empty table."""
+            self._values: list[str] = []
+            self._ids: dict[str, int] = {}
+
+        def __len__(self) -> int:
+            """Number of distinct strings."""
+            return len(self._values)
+
+        @property
+        def nbytes(self) -> int:
+            """Approximate bytes held by the table and its strings."""
+            return (
+                sys.getsizeof(self._values)
+                + sys.getsizeof(self._ids)
+                + sum(sys.getsizeof(value) for value in self._values)
+            )
+
+        def intern(self, value: str) -> int:
+            """Return the ID of ``value``, adding it on first sight."""
+            string_id = self._ids.get(value)
+            if string_id is None:
+                string_id = len(self._values)
+                self._values.append(value)
+                self._ids[value] = string_id
+            return string_id
+
+        def value(self, string_id: int) -> str:
+            """Return the string stored under ``string_id``."""
+            return self._values[string_id]
+
+    class LabelSets:
+        """Append-only table of sorted label sets addressed by integer ID."""
+
+        def __init__(self) -> None:
+            """Initialize a table whose ID 0 is the empty label set."""
+            self._values: list[t.Observability.ScalarLabelSet] = [()]
+            self._ids: dict[t.Observability.ScalarLabelSet, int] = {(): 0}
+
+        def __len__(self) -> int:
+            """Number of distinct label sets (the empty one included)."""
+            return len(self._values)
+
+        @property
+        def nbytes(self) -> int:
+            """Approximate bytes held by the table and its label tuples."""
+            return (
+                sys.getsizeof(self._values)
+                + sys.getsizeof(self._ids)
+                + sum(
+                    sys.getsizeof(labels) + sum(sys.getsizeof(pair) for pair in labels)
+                    for labels in self._values
+                )
+            )
+
+        def intern(self, labels: t.ScalarMapping | None) -> int:
+            """Return the ID of a label mapping, adding it on first sight.
+
+            Non-primitive values are stored as their string form, as the
+            alert factory does.
+            """
+            if not labels:
+                return 0
+            key = tuple(
+                sorted(
+                    (
+                        str(name),
+                        value if value is None or u.primitive(value) else str(value),
+                    )
+                    for name, value in labels.items()
+                )
+            )
+            label_id = self._ids.get(key)
+            if label_id is None:
+                label_id = len(self._values)
+                self._values.append(key)
+                self._ids[key] = label_id
+            return label_id
+
+        def labels(self, label_id: int) -> t.MutableScalarMapping:
+            """Return a fresh mapping of the label set ``label_id``."""
+            return dict(self._values[label_id])
+
+    class MetricColumns:
+        """Parallel arrays holding one metric per row."""
+
+        def __init__(self) -> None:
+            """Initialize empty columns."""
+            self.timestamps: array[float] = array("d")
+            self.values: array[float] = array("d")
+            self.name_ids: array[int] = array("I")
+            self.unit_ids: array[int] = array("I")
+            self.type_ids: array[int] = array("I")
+            self.label_ids: array[int] = array("I")
+
+        def __len__(self) -> int:
+            """Number of rows."""
+            return len(self.timestamps)
+
+        @property
+        def nbytes(self) -> int:
+            """Payload bytes of every column."""
+            return FlextObservabilityColumnar.array_bytes(
+                self.timestamps,
+                self.values,
+                self.name_ids,
+                self.unit_ids,
+                self.type_ids,
+                self.label_ids,
+            )
+
+    class LogColumns:
+        """Parallel arrays holding one log entry per row."""
+
+        def __init__(self) -> None:
+            """Initialize empty columns."""
+            self.timestamps: array[float] = array("d")
+            self.message_ids: array[int] = array("I")
+            self.level_ids: array[int] = array("I")
+            self.component_ids: array[int] = array("I")
+            self.label_ids: array[int] = array("I")
+
+        def __len__(self) -> int:
+            """Number of rows."""
+            return len(self.timestamps)
+
+        @property
+        def nbytes(self) -> int:
+            """Payload bytes of every column."""
+            return FlextObservabilityColumnar.array_bytes(
+                self.timestamps,
+                self.message_ids,
+                self.level_ids,
+                self.component_ids,
+                self.label_ids,
+            )
+
+    class AlertColumns:
+        """Parallel arrays holding one alert per row."""
+
+        def __init__(self) -> None:
+            """Initialize empty columns."""
+            self.timestamps: array[float] = array("d")
+            self.title_ids: array[int] = array("I")
+            self.message_ids: array[int] = array("I")
+            self.severity_ids: array[int] = array("I")
+            self.source_ids: array[int] = array("I")
+            self.label_ids: array[int] = array("I")
+
+        def __len__(self) -> int:
+            """Number of rows."""
+            return len(self.timestamps)
+
+        @property
+        def nbytes(self) -> int:
+            """Payload bytes of every column."""
+            return FlextObservabilityColumnar.array_bytes(
+                self.timestamps,
+                self.title_ids,
+                self.message_ids,
+                self.severity_ids,
+                self.source_ids,
+                self.label_ids,
+            )
+
+    class Batch:
+        """Append-only columnar container the record factories write to.
+
+        Rows are validated as cheaply as the models would validate them, so
+        every accepted row materialises into a valid entity later. Metric
+        label sets go through the series registry's cardinality limiter: a
+        refused label set is stored as the overflow label set.
+        """
+
+        def __init__(
+            self, registry: FlextObservabilitySeries.Registry | None = None
+        ) -> None:
+            """Initialize an empty batch limited by ``registry`` (global default)."""
+            self.registry = (
+                FlextObservabilitySeries.active_registry()
+                if registry is None
+                else registry
+            )
+            self.strings = FlextObservabilityColumnar.Strings()
+            self.label_sets = FlextObservabilityColumnar.LabelSets()
+            self.metrics = FlextObservabilityColumnar.MetricColumns()
+            self.logs = FlextObservabilityColumnar.LogColumns()
+            self.alerts = FlextObservabilityColumnar.AlertColumns()
+            self._id_base = uuid4().int
+            self._lock = threading.Lock()
+
+        def __len__(self) -> int:
+            """Number of rows of every kind."""
+            return len(self.metrics) + len(self.logs) + len(self.alerts)
+
+        @property
+        def nbytes(self) -> int:
+            """Approximate bytes held by the columns and interning tables."""
+            return (
+                self.metrics.nbytes
+                + self.logs.nbytes
+                + self.alerts.nbytes
+                + self.strings.nbytes
+                + self.label_sets.nbytes
+            )
+
+        def clear(self) -> None:
+            """Drop every row and interned value."""
+            with self._lock:
+                self.strings = FlextObservabilityColumnar.Strings()
+                self.label_sets = FlextObservabilityColumnar.LabelSets()
+                self.metrics = FlextObservabilityColumnar.MetricColumns()
+                self.logs = FlextObservabilityColumnar.LogColumns()
+                self.alerts = FlextObservabilityColumnar.AlertColumns()
+                self._id_base = uuid4().int
+
+        def flext_metric(
+            self, name: str, value: float, unit: str = "count", **kwargs: t.JsonPayload
+        ) -> p.Result[int]:
+            """Append a metric row; same arguments as the facade factory.
+
+            Returns:
+                r[int] - Row index in ``metrics``
+
+            """
+            if not name or not unit:
+                return r[int].fail_op(
+                    "append metric", "Metric name and unit must be non-empty"
+                )
+            if math.isnan(value) or value <= 0:
+                return r[int].fail_op(
+                    "append metric", f"Metric value must be positive: {value}"
+                )
+            metric_type_raw = kwargs.get("metric_type")
+            try:
+                metric_type = (
+                    c.Observability.MetricType(str(metric_type_raw))
+                    if metric_type_raw is not None
+                    else FlextObservabilityColumnar.metric_type_for_name(name)
+                )
+            except ValueError as e:
+                return r[int].fail_op("append metric", e)
+            labels: t.MutableScalarMapping = {}
+            for source_key in ("tags", "labels"):
+                source = kwargs.get(source_key)
+                if isinstance(source, Mapping):
+                    labels.update(source)
+            if labels and self.registry.overflowed(
+                self.registry.series_id(name, labels)
+            ):
+                labels = {c.Observability.SERIES_OVERFLOW_LABEL: "true"}
+            with self._lock:
+                columns = self.metrics
+                columns.timestamps.append(time.time())
+                columns.values.append(float(value))
+                columns.name_ids.append(self.strings.intern(name))
+                columns.unit_ids.append(self.strings.intern(unit))
+                columns.type_ids.append(self.strings.intern(metric_type.value))
+                columns.label_ids.append(self.label_sets.intern(labels))
+                return r[int].ok(len(columns) - 1)
+
+        def flext_log_entry(
+            self,
+            message: str,
+            level: c.Observability.ErrorSeverity = c.Observability.ErrorSeverity.INFO,
+            component: str = "application",
+            timestamp: datetime | None = None,
+            context: t.ScalarMapping | None = None,
+        ) -> p.Result[int]:
+            """Append a log entry row; same arguments as the facade factory.
+
+            Returns:
+                r[int] - Row index in ``logs``
+
+            """
+            if not message or not component:
+                return r[int].fail_op(
+                    "append log entry", "Log message and component cannot be empty"
+                )
+            with self._lock:
+                columns = self.logs
+                columns.timestamps.append(
+                    timestamp.timestamp() if timestamp is not None else time.time()
+                )
+                columns.message_ids.append(self.strings.intern(message))
+                columns.level_ids.append(self.strings.intern(str(level)))
+                columns.component_ids.append(self.strings.intern(component))
+                columns.label_ids.append(self.label_sets.intern(context))
+                return r[int].ok(len(columns) - 1)
+
+        def flext_alert(
+            self,
+            title: str,
+            message: str,
+            severity: str = c.Observability.AlertLevel.WARNING,
+            source: str = "system",
+            labels: t.ScalarMapping | None = None,
+        ) -> p.Result[int]:
+            """Append an alert row.
+
+            Returns:
+                r[int] - Row index in ``alerts``
+
+            """
+            if not title or not message or not severity or not source:
+                return r[int].fail_op(
+                    "append alert",
+                    "Alert title, message, severity and source cannot be empty",
+                )
+            with self._lock:
+                columns = self.alerts
+                columns.timestamps.append(time.time())
+                columns.title_ids.append(self.strings.intern(title))
+                columns.message_ids.append(self.strings.intern(message))
+                columns.severity_ids.append(self.strings.intern(str(severity)))
+                columns.source_ids.append(self.strings.intern(source))
+                columns.label_ids.append(self.label_sets.intern(labels))
+                return r[int].ok(len(columns) - 1)
+
+        def metric(self, row: int) -> p.Result[m.Observability.Metric]:
+            """Materialise the metric entity of ``row``."""
+            columns, strings = self.metrics, self.strings
+            try:
+                return r[m.Observability.Metric].ok(
+                    m.Observability.Metric(
+                        id=self._row_id(0, row),
+                        name=strings.value(columns.name_ids[row]),
+                        value=columns.values[row],
+                        unit=strings.value(columns.unit_ids[row]),
+                        metric_type=strings.value(columns.type_ids[row]),
+                        labels=self.label_sets.labels(columns.label_ids[row]),
+                        domain_events=[],
+                    )
+                )
+            except (c.ValidationError, IndexError) as e:
+                return r[m.Observability.Metric].fail_op("materialise metric", e)
+
+        def log_entry(self, row: int) -> p.Result[m.Observability.LogEntry]:
+            """Materialise the log entry entity of ``row``."""
+            columns, strings = self.logs, self.strings
+            try:
+                return r[m.Observability.LogEntry].ok(
+                    m.Observability.LogEntry(
+                        id=self._row_id(1, row),
+                        message=strings.value(columns.message_ids[row]),
+                        level=strings.value(columns.level_ids[row]),
+                        component=strings.value(columns.component_ids[row]),
+                        timestamp=datetime.fromtimestamp(columns.timestamps[row], UTC),
+                        context=self.label_sets.labels(columns.label_ids[row]),
+                        domain_events=[],
+                    )
+                )
+            except (c.ValidationError, IndexError) as e:
+                return r[m.Observability.LogEntry].fail_op("materialise log entry", e)
+
+        def alert(self, row: int) -> p.Result[m.Observability.Alert]:
+            """Materialise the alert entity of ``row``."""
+            columns, strings = self.alerts, self.strings
+            try:
+                return r[m.Observability.Alert].ok(
+                    m.Observability.Alert(
+                        id=self._row_id(2, row),
+                        title=strings.value(columns.title_ids[row]),
+                        message=strings.value(columns.message_ids[row]),
+                        severity=strings.value(columns.severity_ids[row]),
+                        source=strings.value(columns.source_ids[row]),
+                        labels=self.label_sets.labels(columns.label_ids[row]),
+                        domain_events=[],
+                    )
+                )
+            except (c.ValidationError, IndexError) as e:
+                return r[m.Observability.Alert].fail_op("materialise alert", e)
+
+        def iter_metrics(self) -> Iterator[m.Observability.Metric]:
+            """Yield the metric entities one at a time."""
+            for row in range(len(self.metrics)):
+                yield self.metric(row).value
+
+        def iter_log_entries(self) -> Iterator[m.Observability.LogEntry]:
+            """Yield the log entry entities one at a time."""
+            for row in range(len(self.logs)):
+                yield self.log_entry(row).value
+
+        def iter_alerts(self) -> Iterator[m.Observability.Alert]:
+            """Yield the alert entities one at a time."""
+            for row in range(len(self.alerts)):
+                yield self.alert(row).value
+
+        def footprint(
+            self, sample: int = c.Observability.COLUMNAR_FOOTPRINT_SAMPLE
+        ) -> t.JsonDict:
+            """Compare bytes per sample with the equivalent pydantic entities.
+
+            Args:
+                sample: Rows of each kind materialised to measure the models
+
+            Returns:
+                dict - ``rows``, ``columnar_bytes``,
+                ``columnar_bytes_per_sample``, ``entity_bytes_per_sample``
+                and ``ratio`` (entity over columnar bytes per sample)
+
+            Behavior:
+                - Entities are measured with tracemalloc while held alive,
+                  then released
+
+            """
+            rows = len(self)
+            started = not tracemalloc.is_tracing()
+            if started:
+                tracemalloc.start()
+            before = tracemalloc.get_traced_memory()[0]
+            entities = [
+                result.value
+                for result in (
+                    *map(self.metric, range(min(sample, len(self.metrics)))),
+                    *map(self.log_entry, range(min(sample, len(self.logs)))),
+                    *map(self.alert, range(min(sample, len(self.alerts)))),
+                )
+            ]
+            entity_bytes = tracemalloc.get_traced_memory()[0] - before
+            if started:
+                tracemalloc.stop()
+            columnar_per_sample = self.nbytes / rows if rows else 0.0
+            entity_per_sample = entity_bytes / len(entities) if entities else 0.0
+            return {
+                "rows": rows,
+                "columnar_bytes": self.nbytes,
+                "columnar_bytes_per_sample": columnar_per_sample,
+                "entity_bytes_per_sample": entity_per_sample,
+                "ratio": (
+                    entity_per_sample / columnar_per_sample
+                    if columnar_per_sample
+                    else 0.0
+                ),
+            }
+
+        def _row_id(self, kind: int, row: int) -> str:
+            """Return a stable per-row UUID: the batch UUID with row bits mixed in."""
+            return str(UUID(int=self._id_base ^ (kind << 32 | row)))
+
+    @staticmethod
+    def active_batch() -> FlextObservabilityColumnar.Batch:
+        """Return the global columnar batch instance.
+
+        Returns:
+            Batch - Global batch
+
+        """
+        if FlextObservabilityColumnar._batch_instance is None:
+            FlextObservabilityColumnar._batch_instance = (
+                FlextObservabilityColumnar.Batch()
+            )
+        return FlextObservabilityColumnar._batch_instance
+
+
+__all__: list[str] = ["FlextObservabilityColumnar"]
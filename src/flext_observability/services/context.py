@@ -13,10 +13,13 @@ FLEXT Pattern:
 
 from __future__ import annotations
 
+import threading
 from contextvars import ContextVar
+from typing import ClassVar
 from uuid import uuid4
 
 from flext_observability import c, m, p, r, t, u
+from flext_observability.services.overhead import FlextObservabilityOverhead
 
 
 class FlextObservabilityContext:
@@ -54,7 +57,9 @@ class FlextObservabilityContext:
     _correlation_id: ContextVar[str] = ContextVar("correlation_id", default="")
     _trace_id: ContextVar[str] = ContextVar("trace_id", default="")
     _span_id: ContextVar[str] = ContextVar("span_id", default="")
+    _sampled: ContextVar[bool] = ContextVar("sampled", default=False)
     _baggage: ContextVar[m.Dict | None] = ContextVar("baggage", default=None)
+    thread_spans: ClassVar[dict[int, tuple[str, str]] | None] = None
     logger = u.fetch_logger(__name__)
 
     @staticmethod
@@ -66,7 +71,7 @@ class FlextObservabilityContext:
     def clear_context() -> None:
         """Clear all context variables.
 
-        Clears correlation ID, trace ID, span ID, and baggage.
+        Clears correlation ID, trace ID, span ID, sampling flag and baggage.
         Use at end of request processing to prevent context leak.
 
         Example:
@@ -84,6 +89,7 @@ class FlextObservabilityContext:
         FlextObservabilityContext.clear_correlation_id()
         FlextObservabilityContext.clear_trace_id()
         FlextObservabilityContext.clear_span_id()
+        FlextObservabilityContext.update_sampled(sampled=False)
         FlextObservabilityContext.clear_baggage()
 
     @staticmethod
@@ -99,11 +105,13 @@ class FlextObservabilityContext:
     def clear_span_id() -> None:
         """Clear span ID from context."""
         FlextObservabilityContext._span_id.set("")
+        FlextObservabilityContext._publish_thread_span()
 
     @staticmethod
     def clear_trace_id() -> None:
         """Clear trace ID from context."""
         FlextObservabilityContext._trace_id.set("")
+        FlextObservabilityContext._publish_thread_span()
 
     @staticmethod
     def from_headers(headers: m.Dict | t.ScalarMapping) -> p.Result[bool]:
@@ -240,6 +248,27 @@ class FlextObservabilityContext:
         """
         return FlextObservabilityContext._correlation_id.get("")
 
+    @staticmethod
+    def sampled() -> bool:
+        """Return whether the current request was sampled."""
+        return FlextObservabilityContext._sampled.get()
+
+    @staticmethod
+    def sampled_span() -> tuple[str, str] | None:
+        """Return the (trace ID, span ID) to attach as an exemplar.
+
+        Returns:
+            The pair while the current request is sampled and carries a
+            trace ID, None otherwise (a single context read)
+
+        """
+        if not FlextObservabilityContext._sampled.get():
+            return None
+        trace_id = FlextObservabilityContext._trace_id.get()
+        if not trace_id:
+            return None
+        return trace_id, FlextObservabilityContext._span_id.get()
+
     @staticmethod
     def span_id() -> str:
         """Return current span ID."""
@@ -319,12 +348,21 @@ class FlextObservabilityContext:
         FlextObservabilityContext._correlation_id.set(correlation_id)
         return correlation_id
 
+    @staticmethod
+    def update_sampled(*, sampled: bool) -> None:
+        """Record the head sampling decision of the current request.
+
+        Sampled requests attach their trace ID as histogram exemplars.
+        """
+        FlextObservabilityContext._sampled.set(sampled)
+
     @staticmethod
     def update_span_id(span_id: str | None = None) -> str:
         """Update current span ID."""
         if span_id is None:
             span_id = str(uuid4())
         FlextObservabilityContext._span_id.set(span_id)
+        FlextObservabilityContext._publish_thread_span()
         return span_id
 
     @staticmethod
@@ -344,8 +382,40 @@ class FlextObservabilityContext:
         if trace_id is None:
             trace_id = str(uuid4())
         FlextObservabilityContext._trace_id.set(trace_id)
+        FlextObservabilityContext._publish_thread_span()
         return trace_id
 
+    @staticmethod
+    def track_thread_spans(*, enabled: bool) -> None:
+        """Start or stop publishing each thread's trace and span IDs.
+
+        Context variables cannot be read from another thread, so while
+        tracking is on every trace/span update also stores the pair under
+        the calling thread's ident in ``thread_spans`` (read by the sampling
+        profiler). Only updates made while tracking are seen, and coroutines
+        sharing a thread publish the pair they set last.
+
+        Args:
+            enabled: Whether updates are published
+
+        """
+        if not enabled:
+            FlextObservabilityContext.thread_spans = None
+            return
+        if FlextObservabilityContext.thread_spans is None:
+            FlextObservabilityContext.thread_spans = {}
+        FlextObservabilityContext._publish_thread_span()
+
+    @staticmethod
+    def _publish_thread_span() -> None:
+        """Publish the calling thread's trace/span pair while tracked."""
+        spans = FlextObservabilityContext.thread_spans
+        if spans is not None:
+            spans[threading.get_ident()] = (
+                FlextObservabilityContext._trace_id.get(),
+                FlextObservabilityContext._span_id.get(),
+            )
+
     @staticmethod
     def to_headers() -> m.Dict:
         """Get context as HTTP headers.
@@ -386,4 +456,11 @@ class FlextObservabilityContext:
         return m.Dict(dict(headers))
 
 
+FlextObservabilityOverhead.instrument(
+    FlextObservabilityContext, "from_headers", "context.from_headers"
+)
+FlextObservabilityOverhead.instrument(
+    FlextObservabilityContext, "to_headers", "context.to_headers"
+)
+
 __all__: list[str] = ["FlextObservabilityContext"]
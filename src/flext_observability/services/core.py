@@ -0,0 +1,173 @@
+"""Slim observability core with on-demand plug-ins.
+
+``FlextObservability`` composes the original services through its MRO, so
+importing it loads the HTTP frameworks' instrumentation, health runner,
+logging and the rest even when a job only needs a trace id and a counter.
+This core carries just the trace context, the metric aggregation store and
+the sampler; every heavier capability is a plug-in resolved by name and
+imported the first time it is attached. Newer services (alerting,
+multiprocess, spill, stats server, profiler) are plug-ins only and never
+facade bases.
+
+FLEXT Pattern:
+- Single FlextObservabilityCore class
+- Context, sampling and metrics delegated to their services
+- Plug-in table (name -> module, class) extended through register_plugin
+
+Key Features:
+- Importing the core loads no framework, health or profiler module
+- Plug-ins imported on first attach and cached afterwards
+- Third-party capabilities registered under their own names
+"""
+
+from __future__ import annotations
+
+import importlib
+import threading
+from typing import ClassVar
+
+from flext_observability import c, p, r, t, u
+from flext_observability.services.aggregation import FlextObservabilityAggregation
+from flext_observability.services.context import FlextObservabilityContext
+from flext_observability.services.sampling import FlextObservabilitySampling
+
+
+class FlextObservabilityCore:
+    """Context, metrics and sampling without the full service facade.
+
+    Usage:
+        ```python
+        from flext_observability import FlextObservabilityCore as core
+
+        core.context.update_trace_id()
+        if core.should_sample("checkout"):
+            core.record("jobs_total", 1.0, c.Observability.MetricType.COUNTER)
+
+        # Heavier capabilities only when needed
+        profiler = core.attach("profiler").value
+        profiler.start_profiler()
+        ```
+
+    Plug-ins:
+        Built-in names come from ``c.Observability.CORE_PLUGINS`` (health,
+        http, http_client, multiprocess, profiler, spill, ...);
+        ``register_plugin`` adds more.
+    """
+
+    logger = u.fetch_logger(__name__)
+    context: ClassVar[type[FlextObservabilityContext]] = FlextObservabilityContext
+    sampling: ClassVar[type[FlextObservabilitySampling]] = FlextObservabilitySampling
+    aggregation: ClassVar[type[FlextObservabilityAggregation]] = (
+        FlextObservabilityAggregation
+    )
+    _plugins: ClassVar[dict[str, tuple[str, str]]] = dict(c.Observability.CORE_PLUGINS)
+    _attached: ClassVar[dict[str, type]] = {}
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+
+    @staticmethod
+    def record(
+        name: str,
+        value: float,
+        metric_type: str = c.Observability.MetricType.GAUGE,
+        labels: t.StrMapping | None = None,
+    ) -> p.Result[bool]:
+        """Fold one observation into the global aggregation store.
+
+        Returns:
+            r[bool] - True once folded; fails when the name is registered
+            with another metric type
+
+        """
+        store = FlextObservabilityAggregation.active_store()
+        return store.record(name, value, metric_type, labels)
+
+    @staticmethod
+    def should_sample(operation: str | None = None, service: str | None = None) -> bool:
+        """Return the global sampler's decision for an operation."""
+        return FlextObservabilitySampling.should_sample(operation, service)
+
+    @staticmethod
+    def render_prometheus() -> str:
+        """Render the global aggregation store in Prometheus text format."""
+        return FlextObservabilityAggregation.active_store().render_prometheus()
+
+    @staticmethod
+    def plugins() -> tuple[str, ...]:
+        """Return the registered plug-in names, sorted."""
+        with FlextObservabilityCore._lock:
+            return tuple(sorted(FlextObservabilityCore._plugins))
+
+    @staticmethod
+    def attached() -> tuple[str, ...]:
+        """Return the names of the plug-ins imported so far, sorted."""
+        with FlextObservabilityCore._lock:
+            return tuple(sorted(FlextObservabilityCore._attached))
+
+    @staticmethod
+    def register_plugin(name: str, module: str, attribute: str) -> p.Result[bool]:
+        """Register a plug-in to be imported on its first attach.
+
+        Args:
+            name: Plug-in name passed to ``attach``
+            module: Dotted module path holding the capability
+            attribute: Class (or other type) exported by that module
+
+        Returns:
+            r[bool] - Ok when registered; fails when the name is already
+            attached to a different target
+
+        """
+        if not name or not module or not attribute:
+            return r[bool].fail_op(
+                "register plug-in", "Name, module and attribute must be non-empty"
+            )
+        with FlextObservabilityCore._lock:
+            current = FlextObservabilityCore._plugins.get(name)
+            if name in FlextObservabilityCore._attached and current != (
+                module,
+                attribute,
+            ):
+                return r[bool].fail_op(
+                    "register plug-in", f"Plug-in already attached: {name}"
+                )
+            FlextObservabilityCore._plugins[name] = (module, attribute)
+        return r[bool].ok(True)
+
+    @staticmethod
+    def attach(name: str) -> p.Result[type]:
+        """Import a registered plug-in (once) and return its class.
+
+        Args:
+            name: Registered plug-in name
+
+        Returns:
+            r[type] - Plug-in class; fails for unknown names or when the
+            plug-in (or one of its optional dependencies) cannot be imported
+
+        Behavior:
+            - Later calls return the cached class without importing again
+
+        """
+        with FlextObservabilityCore._lock:
+            attached = FlextObservabilityCore._attached.get(name)
+            target = FlextObservabilityCore._plugins.get(name)
+        if attached is not None:
+            return r[type].ok(attached)
+        if target is None:
+            return r[type].fail_op("attach plug-in", f"Unknown plug-in: {name}")
+        module, attribute = target
+        try:
+            plugin = getattr(importlib.import_module(module), attribute)
+        except (ImportError, AttributeError) as e:
+            return r[type].fail_op("attach plug-in", e)
+        if not isinstance(plugin, type):
+            return r[type].fail_op(
+                "attach plug-in", f"{module}.{attribute} is not a class"
+            )
+        with FlextObservabilityCore._lock:
+            plugin = FlextObservabilityCore._attached.setdefault(name, plugin)
+        FlextObservabilityCore.logger.debug(f"Observability plug-in attached: {name}")
+        return r[type].ok(plugin)
+
+
+__all__: list[str] = ["FlextObservabilityCore"]
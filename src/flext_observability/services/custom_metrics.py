@@ -21,6 +21,7 @@ from __future__ import annotations
 from collections.abc import MutableMapping
 
 from flext_observability import c, e, m, p, r, t, u
+from flext_observability.services.series import FlextObservabilitySeries
 
 
 class FlextObservabilityCustomMetrics:
@@ -196,6 +197,7 @@ class FlextObservabilityCustomMetrics:
             description: str,
             unit: str = "1",
             namespace: str = "default",
+            max_series: int | None = None,
         ) -> p.Result[bool]:
             """Register a custom metric.
 
@@ -205,6 +207,8 @@ class FlextObservabilityCustomMetrics:
                 description: Metric description for documentation
                 unit: Metric unit (default "1")
                 namespace: Namespace for metric organization
+                max_series: Series limit for ``name`` replacing the global
+                    per-metric default
 
             Returns:
                 r[bool] - Ok if registration successful
@@ -214,6 +218,7 @@ class FlextObservabilityCustomMetrics:
                 - Creates namespaced metric identifier
                 - Stores definition in registry
                 - Enables retrieval by name or namespace
+                - Applies ``max_series`` to the global series registry
 
             """
             try:
@@ -223,6 +228,7 @@ class FlextObservabilityCustomMetrics:
                     description=description,
                     unit=unit,
                     namespace=namespace,
+                    max_series=max_series,
                 )
             except c.EXC_MAPPING_TYPE as exc:
                 return e.fail_operation("Metric registration", exc, result_type=r[bool])
@@ -235,6 +241,7 @@ class FlextObservabilityCustomMetrics:
             description: str,
             unit: str,
             namespace: str,
+            max_series: int | None = None,
         ) -> p.Result[bool]:
             """Validate and store one metric definition."""
             validation_result = self._validate_metric_definition_input(
@@ -262,6 +269,9 @@ class FlextObservabilityCustomMetrics:
                 labels={},
             )
             self._namespaces[namespace] = namespace
+            limiter = FlextObservabilitySeries.active_registry().limiter
+            if max_series is not None and limiter is not None:
+                limiter.set_limit(name, max_series)
             FlextObservabilityCustomMetrics.logger.debug(
                 f"Metric registered: {namespaced_name} ({metric_type_enum.value})"
             )
@@ -375,6 +385,7 @@ class FlextObservabilityCustomMetrics:
         description: str,
         unit: str = "1",
         namespace: str = "default",
+        max_series: int | None = None,
     ) -> p.Result[bool]:
         """Register a metric.
 
@@ -384,6 +395,7 @@ class FlextObservabilityCustomMetrics:
             description: Metric description
             unit: Metric unit (default "1")
             namespace: Namespace (default "default")
+            max_series: Series limit for ``name`` (global default if None)
 
         Returns:
             r[bool] - Ok if successful
@@ -396,6 +408,7 @@ class FlextObservabilityCustomMetrics:
             description=description,
             unit=unit,
             namespace=namespace,
+            max_series=max_series,
         )
 
 
@@ -11,18 +11,29 @@ FLEXT Pattern:
 
 Key Features:
 - Error fingerprinting (group similar errors)
+- Memoized SHA256 fingerprints, opt-in 64-bit BLAKE2b for error storms
+- Message normalisation (numbers, UUIDs, hex, quoted strings, IPs) and
+  raising-frame locations for stable grouping
+- Cheap error entries materialised as models only on export
 - Alert deduplication (reduce noise)
-- Severity escalation (escalate repeated errors)
+- Severity escalation (escalate errors repeated within the window)
 - Rate limiting (prevent alert storms)
+- Bounded sliding-window counters (fixed ring per fingerprint, LRU cap)
 """
 
 from __future__ import annotations
 
+import heapq
+import math
+import threading
 import time
-from collections.abc import Callable, MutableMapping
+from collections import OrderedDict, deque
+from collections.abc import Callable, Sequence
+from hashlib import blake2b, sha256
 
 from flext_observability import c, m, p, r, t, u
 from flext_observability.services.context import FlextObservabilityContext
+from flext_observability.services.overhead import FlextObservabilityOverhead
 
 
 class FlextObservabilityErrorHandling:
@@ -47,9 +58,15 @@ class FlextObservabilityErrorHandling:
         should_alert = handler.should_alert_for_error(error)
         if should_alert:
             send_alert(error)
+
+        # Hot path: no model is built until the errors are exported
+        fingerprint = handler.record("DatabaseError", "Connection timeout")
+        events = handler.export_errors()
         ```
 
     Nested Classes:
+        Entry: Lightweight recorded error, materialised on export
+        Window: Sliding-window counter and alert state for one fingerprint
         Handler: Error handling and deduplication logic
     """
 
@@ -68,16 +85,280 @@ class FlextObservabilityErrorHandling:
             return stripped
         return message
 
+    class Entry:
+        """Lightweight recorded error, materialised as a model on export."""
+
+        __slots__ = (
+            "correlation_id",
+            "error_type",
+            "fingerprint",
+            "message",
+            "recorded_at",
+            "severity",
+        )
+
+        def __init__(
+            self,
+            error_type: str,
+            message: str,
+            severity: c.Observability.ErrorSeverity,
+            fingerprint: str,
+            correlation_id: str,
+        ) -> None:
+            """Initialize the entry with its already computed fingerprint."""
+            self.error_type = error_type
+            self.message = message
+            self.severity = severity
+            self.fingerprint = fingerprint
+            self.correlation_id = correlation_id
+            self.recorded_at = time.time()
+
+        def to_event(self) -> m.Observability.ErrorEvent:
+            """Materialise the entry as an ``ErrorEvent`` model."""
+            return m.Observability.ErrorEvent(
+                error_type=self.error_type,
+                message=self.message,
+                severity=self.severity,
+                fingerprint=self.fingerprint,
+                correlation_id=self.correlation_id,
+            )
+
+    class Window:
+        """Sliding-window error counter for one fingerprint.
+
+        A fixed ring of per-bucket counts covers the deduplication window, so
+        memory per fingerprint is constant; buckets that fall out of the
+        window are zeroed lazily when the ring advances.
+        """
+
+        __slots__ = ("bucket_sec", "counts", "epoch", "last_alert", "last_seen")
+
+        def __init__(self, now: float, window_sec: float, bucket_sec: float) -> None:
+            """Initialize an empty window ending at ``now``."""
+            self.bucket_sec = bucket_sec
+            self.counts = [0] * max(1, math.ceil(window_sec / bucket_sec))
+            self.epoch = int(now // bucket_sec)
+            self.last_alert = -math.inf
+            self.last_seen = now
+
+        def _advance(self, now: float) -> None:
+            """Zero the buckets that left the window since the last update."""
+            epoch = int(now // self.bucket_sec)
+            gap = epoch - self.epoch
+            if gap <= 0:
+                return
+            counts = self.counts
+            size = len(counts)
+            if gap >= size:
+                counts[:] = [0] * size
+            else:
+                for step in range(self.epoch + 1, epoch + 1):
+                    counts[step % size] = 0
+            self.epoch = epoch
+
+        def add(self, now: float, count: int = 1) -> None:
+            """Count ``count`` errors at ``now``."""
+            self._advance(now)
+            self.counts[self.epoch % len(self.counts)] += count
+            self.last_seen = now
+
+        def total(self, now: float) -> int:
+            """Return the number of errors inside the window ending at ``now``."""
+            self._advance(now)
+            return sum(self.counts)
+
+        def peek(self, now: float) -> int:
+            """Return the windowed count at ``now`` without advancing the ring.
+
+            Readers on other threads (stats snapshots) use this so they never
+            mutate a window that the recording thread is updating.
+            """
+            counts = self.counts
+            size = len(counts)
+            gap = int(now // self.bucket_sec) - self.epoch
+            if gap >= size:
+                return 0
+            epoch = self.epoch
+            expired = sum(
+                counts[step % size] for step in range(epoch + 1, epoch + gap + 1)
+            )
+            return sum(counts) - expired
+
     class Handler:
         """Error handling and deduplication handler."""
 
         def __init__(self) -> None:
             """Initialize error handler."""
-            self._error_counts: t.MutableIntMapping = {}
-            self._last_alert_time: MutableMapping[str, float] = {}
+            self._windows: OrderedDict[str, FlextObservabilityErrorHandling.Window] = (
+                OrderedDict()
+            )
+            self._lock = threading.Lock()
             self._alert_cooldown_sec = 60.0
             self._escalation_threshold = 5
-            self._deduplication_window_sec = 300
+            self._deduplication_window_sec = c.Observability.ERROR_WINDOW_SEC
+            self._window_bucket_sec = c.Observability.ERROR_WINDOW_BUCKET_SEC
+            self._max_fingerprints = c.Observability.MAX_TRACKED_FINGERPRINTS
+            self._fingerprint_mode = c.Observability.FingerprintMode.SECURE
+            self._fingerprints: dict[tuple[str, str, str], str] = {}
+            self._entries: deque[FlextObservabilityErrorHandling.Entry] = deque(
+                maxlen=c.Observability.ERROR_BUFFER_SIZE
+            )
+
+        @property
+        def fingerprint_mode(self) -> c.Observability.FingerprintMode:
+            """Algorithm used for fingerprints computed by this handler."""
+            return self._fingerprint_mode
+
+        def update_fingerprint_mode(
+            self, mode: c.Observability.FingerprintMode | str
+        ) -> p.Result[bool]:
+            """Select the fingerprint algorithm.
+
+            Args:
+                mode: ``secure`` (SHA256, the default, matching
+                    ``ErrorEvent.calculate_fingerprint``) or ``fast`` (64-bit
+                    BLAKE2b, opt-in)
+
+            Returns:
+                r[bool] - Ok if the mode is valid
+
+            Behavior:
+                - Clears the fingerprint memo; counts recorded under the
+                  previous mode keep their old fingerprints
+
+            """
+            try:
+                self._fingerprint_mode = c.Observability.FingerprintMode(mode)
+            except ValueError as error:
+                return r[bool].fail_op("update fingerprint mode", error)
+            self._fingerprints.clear()
+            return r[bool].ok(value=True)
+
+        def fingerprint(self, error_type: str, message: str, location: str = "") -> str:
+            """Return the fingerprint of an error type, message and location.
+
+            Args:
+                error_type: Error classification type
+                message: Error message (normalised before hashing)
+                location: ``filename:lineno`` of the raising frame, if known
+
+            Returns:
+                str - Hex fingerprint
+
+            Behavior:
+                - Variable tokens (numbers, UUIDs, hex, quoted strings, IPs) are
+                  replaced by placeholders, so ``Timeout after 3012ms`` and
+                  ``Timeout after 2999ms`` share a fingerprint
+                - Already-seen inputs are answered from a bounded memo
+
+            """
+            key = (error_type, message, location)
+            fingerprint = self._fingerprints.get(key)
+            if fingerprint is not None:
+                return fingerprint
+            normalized = u.Observability.Fingerprint.normalize_message(message)
+            payload = (
+                f"{error_type}:{normalized}@{location}"
+                if location
+                else f"{error_type}:{normalized}"
+            ).encode()
+            if self._fingerprint_mode == c.Observability.FingerprintMode.SECURE:
+                fingerprint = sha256(payload).hexdigest()
+            else:
+                fingerprint = blake2b(payload, digest_size=8).hexdigest()
+            fingerprints = self._fingerprints
+            if len(fingerprints) >= c.Observability.FINGERPRINT_MEMO_SIZE:
+                fingerprints.pop(next(iter(fingerprints)), None)
+            fingerprints[key] = fingerprint
+            return fingerprint
+
+        def fingerprint_of(self, error: m.Observability.ErrorEvent) -> str:
+            """Return the event's fingerprint, computing it without a model copy.
+
+            A preset fingerprint is kept (e.g. an alert's coalescing key); one
+            from ``calculate_fingerprint`` equals the default ``secure`` mode's.
+            """
+            return error.fingerprint or self.fingerprint(
+                error.error_type, error.message
+            )
+
+        def record(
+            self,
+            error_type: str,
+            message: str,
+            severity: c.Observability.ErrorSeverity = c.Observability.ErrorSeverity.ERROR,
+            *,
+            location: str = "",
+        ) -> str:
+            """Record an error without building a model.
+
+            Args:
+                error_type: Error classification type
+                message: Error message
+                severity: Error severity level
+                location: ``filename:lineno`` of the raising frame, if known
+
+            Returns:
+                str - Error fingerprint
+
+            Behavior:
+                - Memoized fingerprint, count update and a slotted entry in a
+                  bounded buffer; ``export_errors`` materialises the models
+                - Not logged per call, so an error storm stays cheap
+
+            """
+            fingerprint = self.fingerprint(error_type, message, location)
+            self._record_entry(error_type, message, severity, fingerprint)
+            return fingerprint
+
+        def record_exception(
+            self,
+            error: BaseException,
+            severity: c.Observability.ErrorSeverity = c.Observability.ErrorSeverity.ERROR,
+        ) -> str:
+            """Record a raised exception, grouped by type, message and location.
+
+            Args:
+                error: Exception to record
+                severity: Error severity level
+
+            Returns:
+                str - Error fingerprint
+
+            """
+            error_type = type(error).__name__
+            return self.record(
+                error_type,
+                str(error) or error_type,
+                severity,
+                location=u.Observability.Fingerprint.frame_location(error),
+            )
+
+        def record_occurrences(self, fingerprint: str, count: int = 1) -> int:
+            """Count occurrences of an already fingerprinted error.
+
+            Args:
+                fingerprint: Error fingerprint
+                count: Number of occurrences (e.g. a coalesced alert's count)
+
+            Returns:
+                int - Count within the deduplication window after the update
+
+            """
+            now = time.monotonic()
+            with self._lock:
+                window = self._window(fingerprint)
+                window.add(now, count)
+                return window.total(now)
+
+        def export_errors(self) -> Sequence[m.Observability.ErrorEvent]:
+            """Materialise the buffered error entries as ``ErrorEvent`` models.
+
+            Returns:
+                Sequence[ErrorEvent] - Buffered errors, oldest first
+
+            """
+            return [entry.to_event() for entry in list(self._entries)]
 
         def clear_error_counts(
             self, older_than_sec: float | None = None
@@ -85,7 +366,7 @@ class FlextObservabilityErrorHandling:
             """Clear error counts.
 
             Args:
-                older_than_sec: Clear only counts older than N seconds (None = clear all)
+                older_than_sec: Clear only fingerprints not seen for N seconds (None = clear all)
 
             Returns:
                 r[bool] - Ok if successful
@@ -93,11 +374,19 @@ class FlextObservabilityErrorHandling:
             """
 
             def operation() -> bool:
-                if older_than_sec is None:
-                    self._error_counts.clear()
-                    self._last_alert_time.clear()
-                else:
-                    self._error_counts.clear()
+                with self._lock:
+                    if older_than_sec is None:
+                        self._windows.clear()
+                        self._entries.clear()
+                    else:
+                        cutoff = time.monotonic() - older_than_sec
+                        stale = [
+                            fingerprint
+                            for fingerprint, window in self._windows.items()
+                            if window.last_seen < cutoff
+                        ]
+                        for fingerprint in stale:
+                            del self._windows[fingerprint]
                 FlextObservabilityErrorHandling.logger.debug("Error counts cleared")
                 return True
 
@@ -112,12 +401,45 @@ class FlextObservabilityErrorHandling:
                 fingerprint: Error fingerprint
 
             Returns:
-                int - Error count
+                int - Error count within the deduplication window
+
+            """
+            with self._lock:
+                window = self._windows.get(fingerprint)
+                if window is None:
+                    return 0
+                return window.total(time.monotonic())
+
+        def top_fingerprints(
+            self, limit: int = c.Observability.STATS_TOP_FINGERPRINTS
+        ) -> Sequence[t.JsonDict]:
+            """Return the fingerprints with the most errors in the window.
+
+            Args:
+                limit: Maximum number of fingerprints returned
+
+            Returns:
+                Sequence[dict] - ``fingerprint``, ``count`` and
+                ``last_seen_sec`` (seconds since the last occurrence), busiest
+                first; fingerprints with no errors left in the window are
+                omitted
 
             """
-            # Why: mro-4p0t — empty dict literal widens .get() to Any for mypy.
-            count: int = self._error_counts.get(fingerprint, 0)
-            return count
+            now = time.monotonic()
+            with self._lock:
+                counted = [
+                    (window.peek(now), fingerprint, window.last_seen)
+                    for fingerprint, window in self._windows.items()
+                ]
+            return [
+                {
+                    "fingerprint": fingerprint,
+                    "count": count,
+                    "last_seen_sec": round(now - last_seen, 3),
+                }
+                for count, fingerprint, last_seen in heapq.nlargest(limit, counted)
+                if count
+            ]
 
         def resolve_escalated_severity(
             self, error: m.Observability.ErrorEvent
@@ -130,10 +452,12 @@ class FlextObservabilityErrorHandling:
             Returns:
                 c.Observability.ErrorSeverity - Escalated severity
 
+            Behavior:
+                - Uses the count within the deduplication window, not the
+                  lifetime count, so a burst that has passed de-escalates
+
             """
-            if not error.fingerprint:
-                error = error.calculate_fingerprint()
-            count = self._error_counts.get(error.fingerprint, 0)
+            count = self.resolve_error_count(self.fingerprint_of(error))
             if count >= self._escalation_threshold * 3:
                 return c.Observability.ErrorSeverity.CRITICAL
             if count >= self._escalation_threshold * 2:
@@ -149,9 +473,9 @@ class FlextObservabilityErrorHandling:
                 error: Error that was alerted
 
             """
-            if not error.fingerprint:
-                error = error.calculate_fingerprint()
-            self._last_alert_time[error.fingerprint] = time.time()
+            fingerprint = self.fingerprint_of(error)
+            with self._lock:
+                self._window(fingerprint).last_alert = time.monotonic()
 
         def record_error(
             self, error: m.Observability.ErrorEvent
@@ -165,36 +489,56 @@ class FlextObservabilityErrorHandling:
                 r[ErrorEvent] - Updated error with fingerprint
 
             Behavior:
-                - Calculates fingerprint
+                - Calculates fingerprint (memoized, see ``fingerprint``)
                 - Updates error counts
                 - Sets correlation ID if available
+                - Copies the model once; use ``record`` to skip models entirely
 
             """
 
             def operation() -> m.Observability.ErrorEvent:
-                current_error = error.calculate_fingerprint()
-                try:
-                    correlation_id = FlextObservabilityContext.correlation_id()
-                except c.EXC_MAPPING_TYPE as e:
-                    FlextObservabilityErrorHandling.logger.warning(
-                        f"Could not set correlation_id, falling back to empty: {e}"
-                    )
-                    correlation_id = ""
-                current_error = current_error.model_copy(
-                    update={"correlation_id": correlation_id}
-                )
-                self._error_counts[current_error.fingerprint] = (
-                    self._error_counts.get(current_error.fingerprint, 0) + 1
+                fingerprint = self.fingerprint(error.error_type, error.message)
+                correlation_id = self._record_entry(
+                    error.error_type, error.message, error.severity, fingerprint
                 )
                 FlextObservabilityErrorHandling.logger.debug(
-                    f"Error recorded: {current_error.error_type} (fingerprint: {current_error.fingerprint[:8]})"
+                    f"Error recorded: {error.error_type} (fingerprint: {fingerprint[:8]})"
+                )
+                return error.model_copy(
+                    update={
+                        "fingerprint": fingerprint,
+                        "correlation_id": correlation_id,
+                    }
                 )
-                return current_error
 
             return self._run_with_result(
                 operation, error_prefix="Failed to record error"
             )
 
+        def _record_entry(
+            self,
+            error_type: str,
+            message: str,
+            severity: c.Observability.ErrorSeverity,
+            fingerprint: str,
+        ) -> str:
+            """Count and buffer one error; return its correlation ID."""
+            try:
+                correlation_id = FlextObservabilityContext.correlation_id()
+            except c.EXC_MAPPING_TYPE as e:
+                FlextObservabilityErrorHandling.logger.warning(
+                    f"Could not set correlation_id, falling back to empty: {e}"
+                )
+                correlation_id = ""
+            with self._lock:
+                self._window(fingerprint).add(time.monotonic())
+            self._entries.append(
+                FlextObservabilityErrorHandling.Entry(
+                    error_type, message, severity, fingerprint, correlation_id
+                )
+            )
+            return correlation_id
+
         def update_alert_cooldown(self, seconds: float) -> p.Result[bool]:
             """Update minimum seconds between alerts for the same error.
 
@@ -243,6 +587,22 @@ class FlextObservabilityErrorHandling:
             )
             return r[bool].ok(value=True)
 
+        def in_alert_cooldown(self, error: m.Observability.ErrorEvent) -> bool:
+            """Return whether an alert for the error was sent within the cooldown.
+
+            Args:
+                error: Error event to evaluate
+
+            Returns:
+                bool - True while repeats of the error should stay silent
+
+            """
+            fingerprint = self.fingerprint_of(error)
+            with self._lock:
+                window = self._windows.get(fingerprint)
+                last_alert = -math.inf if window is None else window.last_alert
+            return time.monotonic() - last_alert < self._alert_cooldown_sec
+
         def should_alert_for_error(self, error: m.Observability.ErrorEvent) -> bool:
             """Determine if error should trigger an alert.
 
@@ -258,15 +618,39 @@ class FlextObservabilityErrorHandling:
                 - Respects severity level
 
             """
-            if not error.fingerprint:
-                error = error.calculate_fingerprint()
             if error.severity == c.Observability.ErrorSeverity.CRITICAL:
                 return True
-            last_alert = self._last_alert_time.get(error.fingerprint, 0)
-            if time.time() - last_alert < self._alert_cooldown_sec:
-                return False
-            count = self._error_counts.get(error.fingerprint, 0)
-            return not count < self._escalation_threshold
+            fingerprint = self.fingerprint_of(error)
+            now = time.monotonic()
+            with self._lock:
+                window = self._windows.get(fingerprint)
+                if window is None:
+                    return False
+                if now - window.last_alert < self._alert_cooldown_sec:
+                    return False
+                return not window.total(now) < self._escalation_threshold
+
+        def _window(self, fingerprint: str) -> FlextObservabilityErrorHandling.Window:
+            """Return the fingerprint's window, creating it and evicting cold ones.
+
+            Touching a window moves it to the hot end; above the tracked
+            fingerprint cap the least recently touched window is dropped. The
+            caller holds ``_lock`` for the lookup and the update it makes.
+            """
+            windows = self._windows
+            window = windows.get(fingerprint)
+            if window is not None:
+                windows.move_to_end(fingerprint)
+                return window
+            window = FlextObservabilityErrorHandling.Window(
+                time.monotonic(),
+                self._deduplication_window_sec,
+                self._window_bucket_sec,
+            )
+            windows[fingerprint] = window
+            while len(windows) > self._max_fingerprints:
+                _ = windows.popitem(last=False)
+            return window
 
         def _run_with_result[TResult](
             self, operation: Callable[[], TResult], *, error_prefix: str
@@ -322,4 +706,8 @@ class FlextObservabilityErrorHandling:
         return handler.should_alert_for_error(error)
 
 
+FlextObservabilityOverhead.instrument(
+    FlextObservabilityErrorHandling.Handler, "record_error", "errors.record_error"
+)
+
 __all__: list[str] = ["FlextObservabilityErrorHandling"]
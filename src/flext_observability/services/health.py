@@ -1,7 +1,25 @@
-"""FLEXT Observability Health Domain Models.
+"""Concurrent health-check registry, runner and background scheduler.
 
-Provides focused health monitoring models following the namespace class pattern.
-Contains health check entities, configurations, and factory methods for health operations.
+Components register check callables (sync or ``async def``); the runner
+executes the expired ones concurrently - sync checks on a thread pool, async
+checks on a dedicated event loop - with a per-check timeout, caches every
+result for a TTL and aggregates them into one status. Once started, a
+scheduler refreshes every check on its own interval so probes are answered
+from the last known result (stale-while-revalidate) and never wait on a
+dependency.
+
+FLEXT Pattern:
+- Single FlextObservabilityHealth class (MRO mixin of the facade)
+- Nested Result, Check and Runner
+- Thread-safe global runner with lazily started executors
+
+Key Features:
+- Per-check timeout and result TTL
+- Single-flight refresh: concurrent probes share one in-flight execution
+- Hung checks never pile up (one execution per check at a time)
+- Critical failures make the aggregate unhealthy, others degrade it
+- Background schedule per check, with result age and staleness reported
+- Results exposed as HealthCheck entities and status/duration gauges
 
 Copyright (c) 2025 FLEXT Contributors
 SPDX-License-Identifier: MIT
@@ -9,13 +27,632 @@ SPDX-License-Identifier: MIT
 
 from __future__ import annotations
 
+import asyncio
+import inspect
+import threading
+import time
+from collections.abc import Iterable, Mapping, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import ClassVar
+
+from flext_observability import c, m, p, r, t, u
+from flext_observability.services.aggregation import FlextObservabilityAggregation
+
 
 class FlextObservabilityHealth:
     """Health monitoring mixin for FlextObservability MRO composition.
 
-    Health check factory method is defined on the facade (api.py).
-    This mixin provides health-related utilities and extensions.
+    The health check factory method is defined on the facade (api.py); this
+    mixin provides the check registry and concurrent runner.
+
+    Usage:
+        ```python
+        from flext_observability import FlextObservabilityHealth
+
+        runner = FlextObservabilityHealth.active_runner()
+        runner.register("database", ping_database, timeout_sec=1.0)
+        runner.register("broker", check_broker, critical=False)  # async def
+
+        payload = runner.status()
+        # {"status": "degraded", "stale": false, "checks": {"database": {...}}}
+
+        # Refresh in the background; probes return the last known result
+        runner.start()
+        payload = runner.status(wait_for_refresh=False)
+        ```
+
+    Nested Classes:
+        Result: Outcome of one check execution
+        Check: Registered check with its cached result
+        Runner: Registry, concurrent executor, scheduler and aggregation
     """
 
+    logger = u.fetch_logger(__name__)
+    _runner_instance: ClassVar[FlextObservabilityHealth.Runner | None] = None
+
+    class Result:
+        """Outcome of one check execution."""
+
+        __slots__ = (
+            "checked_at",
+            "component",
+            "critical",
+            "duration_sec",
+            "error",
+            "status",
+            "ttl_sec",
+        )
+
+        def __init__(
+            self,
+            component: str,
+            status: c.Observability.HealthStatus,
+            *,
+            critical: bool,
+            ttl_sec: float,
+            duration_sec: float = 0.0,
+            error: str = "",
+        ) -> None:
+            """Initialize a result stamped with the monotonic check time."""
+            self.component = component
+            self.status = status
+            self.critical = critical
+            self.ttl_sec = ttl_sec
+            self.duration_sec = duration_sec
+            self.error = error
+            self.checked_at = time.monotonic()
+
+        @property
+        def age_sec(self) -> float:
+            """Seconds since the check produced this result."""
+            return time.monotonic() - self.checked_at
+
+        @property
+        def stale(self) -> bool:
+            """Whether the result is older than its check's TTL."""
+            return self.age_sec >= self.ttl_sec
+
+        def details(self) -> t.Observability.DomainLabels:
+            """Return the scalar details shared by payloads and entities."""
+            details: dict[str, t.Scalar] = {
+                "critical": self.critical,
+                "duration_ms": round(self.duration_sec * 1000, 3),
+                "age_sec": round(self.age_sec, 3),
+                "stale": self.stale,
+            }
+            if self.error:
+                details["error"] = self.error
+            return details
+
+        def to_payload(self) -> t.JsonDict:
+            """Return the JSON payload served for this check."""
+            return {"status": self.status.value, **self.details()}
+
+        def to_entity(self) -> m.Observability.HealthCheck:
+            """Return the result as a HealthCheck entity."""
+            return m.Observability.HealthCheck(
+                component=self.component,
+                status=self.status.value,
+                details=self.details(),
+            )
+
+    class Check:
+        """Registered check with its cached result and in-flight execution."""
+
+        __slots__ = (
+            "critical",
+            "deadline",
+            "duration_gauge",
+            "func",
+            "in_flight",
+            "interval_sec",
+            "is_async",
+            "name",
+            "next_run",
+            "result",
+            "status_gauge",
+            "timeout_sec",
+            "ttl_sec",
+        )
+
+        def __init__(
+            self,
+            name: str,
+            func: t.Observability.HealthCheckCallable,
+            *,
+            timeout_sec: float,
+            ttl_sec: float,
+            interval_sec: float,
+            critical: bool,
+        ) -> None:
+            """Initialize a check that has not run yet."""
+            self.name = name
+            self.func = func
+            self.is_async = inspect.iscoroutinefunction(func)
+            self.timeout_sec = timeout_sec
+            self.ttl_sec = ttl_sec
+            self.interval_sec = interval_sec
+            self.critical = critical
+            self.result: FlextObservabilityHealth.Result | None = None
+            self.in_flight: Future[t.Observability.HealthOutcome] | None = None
+            self.deadline = 0.0
+            self.next_run = 0.0
+            store = FlextObservabilityAggregation.active_store()
+            labels = {"component": name}
+            self.status_gauge = store.handle(
+                "flext_health_check_status", c.Observability.MetricType.GAUGE, labels
+            ).unwrap()
+            self.duration_gauge = store.handle(
+                "flext_health_check_duration_seconds",
+                c.Observability.MetricType.GAUGE,
+                labels,
+            ).unwrap()
+
+        def expired(self, now: float) -> bool:
+            """Return whether the cached result is missing or older than the TTL."""
+            result = self.result
+            return result is None or now - result.checked_at >= self.ttl_sec
+
+        def store(
+            self,
+            status: c.Observability.HealthStatus,
+            duration_sec: float,
+            error: str = "",
+        ) -> None:
+            """Cache a new result and publish it as gauges."""
+            self.result = FlextObservabilityHealth.Result(
+                self.name,
+                status,
+                critical=self.critical,
+                ttl_sec=self.ttl_sec,
+                duration_sec=duration_sec,
+                error=error,
+            )
+            with FlextObservabilityAggregation.active_store().lock:
+                self.status_gauge.observe(
+                    c.Observability.HEALTH_STATUS_GAUGE_VALUES[status.value]
+                )
+                self.duration_gauge.observe(duration_sec)
+
+        def expire(self) -> bool:
+            """Report a timeout if the in-flight execution passed its deadline.
+
+            Returns:
+                bool - True when the execution timed out
+
+            """
+            future = self.in_flight
+            if future is None or future.done():
+                return False
+            if self.is_async:
+                _ = future.cancel()
+            self.store(
+                c.Observability.HealthStatus.UNHEALTHY,
+                self.timeout_sec,
+                f"Timed out after {self.timeout_sec}s",
+            )
+            return True
+
+    class Runner:
+        """Registry and concurrent executor of health checks."""
+
+        def __init__(
+            self, max_workers: int = c.Observability.HEALTH_CHECK_WORKERS
+        ) -> None:
+            """Initialize the runner; executors start on the first run.
+
+            Args:
+                max_workers: Thread pool size for sync checks
+
+            """
+            self._max_workers = max_workers
+            self._checks: dict[str, FlextObservabilityHealth.Check] = {}
+            # Reentrant: a check finishing before its done callback is added
+            # completes inside ``_submit``, which already holds the lock.
+            self._lock = threading.RLock()
+            self._executor: ThreadPoolExecutor | None = None
+            self._loop: asyncio.AbstractEventLoop | None = None
+            self._scheduler: threading.Thread | None = None
+            self._wakeup = threading.Event()
+            self._stopping = threading.Event()
+
+        @property
+        def checks(self) -> Sequence[str]:
+            """Names of the registered checks."""
+            return tuple(self._checks)
+
+        def register(
+            self,
+            name: str,
+            check: t.Observability.HealthCheckCallable,
+            *,
+            timeout_sec: float = c.Observability.HEALTH_CHECK_TIMEOUT_SEC,
+            ttl_sec: float = c.Observability.HEALTH_CHECK_TTL_SEC,
+            interval_sec: float | None = None,
+            critical: bool = True,
+        ) -> p.Result[bool]:
+            """Register (or replace) a component check.
+
+            Args:
+                name: Component name
+                check: Callable returning a bool or a HealthStatus value;
+                    ``async def`` callables run on the runner's event loop
+                timeout_sec: Maximum time a probe waits for this check
+                ttl_sec: How long a result is served from the cache
+                    before it is reported stale
+                interval_sec: Background refresh period once the scheduler
+                    runs (None = half the TTL, refreshing before staleness)
+                critical: Whether a failure makes the aggregate unhealthy
+                    (otherwise it is degraded)
+
+            Returns:
+                r[bool] - Ok once registered
+
+            """
+            if not name:
+                return r[bool].fail_op(
+                    "register health check", "Component name cannot be empty"
+                )
+            if (
+                timeout_sec <= 0
+                or ttl_sec < 0
+                or (interval_sec is not None and interval_sec <= 0)
+            ):
+                return r[bool].fail_op(
+                    "register health check",
+                    "Timeout and interval must be positive and TTL >= 0",
+                )
+            with self._lock:
+                self._checks[name] = FlextObservabilityHealth.Check(
+                    name,
+                    check,
+                    timeout_sec=timeout_sec,
+                    ttl_sec=ttl_sec,
+                    interval_sec=interval_sec or max(ttl_sec / 2, timeout_sec),
+                    critical=critical,
+                )
+            self._wakeup.set()
+            return r[bool].ok(value=True)
+
+        def unregister(self, name: str) -> bool:
+            """Remove a check; returns False when it was not registered."""
+            with self._lock:
+                return self._checks.pop(name, None) is not None
+
+        def run(
+            self,
+            names: Sequence[str] | None = None,
+            *,
+            force: bool = False,
+            wait_for_refresh: bool = True,
+        ) -> Mapping[str, FlextObservabilityHealth.Result]:
+            """Refresh expired checks concurrently and return every result.
+
+            Args:
+                names: Checks to include (None = all)
+                force: Refresh even results still inside their TTL
+                wait_for_refresh: Wait for refreshes (up to each timeout);
+                    False returns the last known results immediately and
+                    only waits for checks that never produced one
+
+            Returns:
+                Mapping - Component name to its latest result
+
+            Behavior:
+                - Fresh results are returned from the cache
+                - Expired checks start together; a check already in flight
+                  (started by a concurrent probe) is joined, not restarted
+                - Each check is awaited at most until its own deadline; a
+                  check past it reports a timeout and keeps running, its
+                  late result is cached when it completes
+
+            """
+            with self._lock:
+                selected = [
+                    check
+                    for name, check in self._checks.items()
+                    if names is None or name in names
+                ]
+                now = time.monotonic()
+                for check in selected:
+                    if check.in_flight is None and (force or check.expired(now)):
+                        self._submit(check, now)
+                waiting = [
+                    check
+                    for check in selected
+                    if check.in_flight is not None
+                    and (wait_for_refresh or check.result is None)
+                ]
+            for check in waiting:
+                future = check.in_flight
+                if future is None:
+                    continue
+                remaining = check.deadline - time.monotonic()
+                _ = wait((future,), timeout=max(0.0, remaining))
+                _ = check.expire()
+            return {
+                check.name: check.result
+                for check in selected
+                if check.result is not None
+            }
+
+        def status(
+            self,
+            names: Sequence[str] | None = None,
+            *,
+            force: bool = False,
+            wait_for_refresh: bool = True,
+        ) -> t.JsonDict:
+            """Return the aggregated health payload.
+
+            Args:
+                names: Checks to include (None = all)
+                force: Refresh even results still inside their TTL
+                wait_for_refresh: False serves the last known results and
+                    revalidates expired ones in the background
+
+            Returns:
+                dict - ``status``, ``stale`` (any result past its TTL) and
+                one payload per check
+
+            """
+            results = self.run(names, force=force, wait_for_refresh=wait_for_refresh)
+            return {
+                "status": FlextObservabilityHealth.aggregate(results.values()).value,
+                "stale": any(result.stale for result in results.values()),
+                "checks": {
+                    name: result.to_payload() for name, result in results.items()
+                },
+            }
+
+        def entities(
+            self, names: Sequence[str] | None = None
+        ) -> Sequence[m.Observability.HealthCheck]:
+            """Return the last known results as HealthCheck entities.
+
+            Expired results are revalidated in the background.
+            """
+            results = self.run(names, wait_for_refresh=False)
+            return [result.to_entity() for result in results.values()]
+
+        @property
+        def running(self) -> bool:
+            """Whether the background scheduler is running."""
+            return self._scheduler is not None
+
+        def start(self) -> None:
+            """Start refreshing every check on its interval in the background."""
+            with self._lock:
+                if self._scheduler is not None:
+                    return
+                self._stopping.clear()
+                scheduler = threading.Thread(
+                    target=self._schedule, name="flext-health-scheduler", daemon=True
+                )
+                self._scheduler = scheduler
+            scheduler.start()
+
+        def stop(self, timeout_sec: float = 5.0) -> None:
+            """Stop the background scheduler."""
+            with self._lock:
+                scheduler, self._scheduler = self._scheduler, None
+            if scheduler is not None:
+                self._stopping.set()
+                self._wakeup.set()
+                scheduler.join(timeout_sec)
+
+        def shutdown(self) -> None:
+            """Stop the scheduler and executors; executors restart on demand."""
+            self.stop()
+            with self._lock:
+                executor, self._executor = self._executor, None
+                loop, self._loop = self._loop, None
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+            if loop is not None:
+                _ = loop.call_soon_threadsafe(loop.stop)
+
+        def _schedule(self) -> None:
+            """Scheduler loop: sleep until the next due check or deadline."""
+            while not self._stopping.is_set():
+                try:
+                    delay = self._run_due()
+                except c.EXC_BASIC_TYPE as e:
+                    FlextObservabilityHealth.logger.warning(
+                        f"Health check scheduling failed: {e}"
+                    )
+                    delay = c.Observability.HEALTH_CHECK_TIMEOUT_SEC
+                _ = self._wakeup.wait(delay)
+                self._wakeup.clear()
+
+        def _run_due(self) -> float | None:
+            """Start due checks, time out overdue ones.
+
+            Returns:
+                float | None - Seconds until the next due run or deadline
+                (None = nothing registered)
+
+            """
+            with self._lock:
+                now = time.monotonic()
+                upcoming: list[float] = []
+                for check in self._checks.values():
+                    if check.in_flight is not None:
+                        if now >= check.deadline and check.expire():
+                            # Still hung: report the timeout again one
+                            # timeout later instead of spinning on it
+                            check.deadline = now + check.timeout_sec
+                        upcoming.append(check.deadline)
+                        continue
+                    if now >= check.next_run:
+                        self._submit(check, now)
+                        check.next_run = now + check.interval_sec
+                        upcoming.append(check.deadline)
+                    upcoming.append(check.next_run)
+                if not upcoming:
+                    return None
+                return max(0.0, min(upcoming) - now)
+
+        def _submit(self, check: FlextObservabilityHealth.Check, now: float) -> None:
+            """Start one execution of ``check`` (called under the lock)."""
+            started = time.perf_counter()
+            future: Future[t.Observability.HealthOutcome]
+            if check.is_async:
+                future = asyncio.run_coroutine_threadsafe(
+                    self._coroutine(check), self._event_loop()
+                )
+            else:
+                future = self._thread_pool().submit(self._call, check)
+            check.in_flight = future
+            check.deadline = now + check.timeout_sec
+            future.add_done_callback(lambda done: self.complete(check, done, started))
+
+        @staticmethod
+        def _call(
+            check: FlextObservabilityHealth.Check,
+        ) -> t.Observability.HealthOutcome:
+            """Run a sync check on a pool thread."""
+            outcome = check.func()
+            if inspect.isawaitable(outcome):
+                msg = f"Check {check.name} returned an awaitable; use async def"
+                raise TypeError(msg)
+            return outcome
+
+        @staticmethod
+        async def _coroutine(
+            check: FlextObservabilityHealth.Check,
+        ) -> t.Observability.HealthOutcome:
+            """Run an async check on the runner's event loop."""
+            outcome = check.func()
+            if inspect.isawaitable(outcome):
+                return await outcome
+            return outcome
+
+        def complete(
+            self,
+            check: FlextObservabilityHealth.Check,
+            future: Future[t.Observability.HealthOutcome],
+            started: float,
+        ) -> None:
+            """Cache the outcome of a finished (or cancelled) execution.
+
+            Runs under the runner lock, so the scheduler never sees a check
+            between clearing its execution and storing its result.
+            """
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                check.in_flight = None
+                if not future.cancelled():
+                    self._store_outcome(check, future, elapsed)
+
+        @staticmethod
+        def _store_outcome(
+            check: FlextObservabilityHealth.Check,
+            future: Future[t.Observability.HealthOutcome],
+            elapsed: float,
+        ) -> None:
+            """Store the result of a finished execution on its check."""
+            error = future.exception()
+            if error is not None:
+                check.store(
+                    c.Observability.HealthStatus.UNHEALTHY,
+                    elapsed,
+                    f"{type(error).__name__}: {error}",
+                )
+                return
+            outcome = future.result()
+            if isinstance(outcome, bool):
+                check.store(
+                    c.Observability.HealthStatus.HEALTHY
+                    if outcome
+                    else c.Observability.HealthStatus.UNHEALTHY,
+                    elapsed,
+                )
+            elif outcome in c.Observability.HealthStatus:
+                check.store(c.Observability.HealthStatus(outcome), elapsed)
+            else:
+                check.store(
+                    c.Observability.HealthStatus.UNHEALTHY,
+                    elapsed,
+                    f"Invalid health status: {outcome}",
+                )
+
+        def _thread_pool(self) -> ThreadPoolExecutor:
+            """Return the sync-check pool, creating it on first use."""
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers, thread_name_prefix="flext-health"
+                )
+            return self._executor
+
+        def _event_loop(self) -> asyncio.AbstractEventLoop:
+            """Return the async-check loop, starting its thread on first use."""
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever, name="flext-health-loop", daemon=True
+                ).start()
+                self._loop = loop
+            return self._loop
+
+    @staticmethod
+    def aggregate(
+        results: Iterable[FlextObservabilityHealth.Result],
+    ) -> c.Observability.HealthStatus:
+        """Aggregate check results into one status."""
+        status = c.Observability.HealthStatus.HEALTHY
+        for result in results:
+            if result.status == c.Observability.HealthStatus.HEALTHY:
+                continue
+            if (
+                result.critical
+                and result.status == c.Observability.HealthStatus.UNHEALTHY
+            ):
+                return c.Observability.HealthStatus.UNHEALTHY
+            status = c.Observability.HealthStatus.DEGRADED
+        return status
+
+    @staticmethod
+    def register_health_check(
+        name: str,
+        check: t.Observability.HealthCheckCallable,
+        *,
+        timeout_sec: float = c.Observability.HEALTH_CHECK_TIMEOUT_SEC,
+        ttl_sec: float = c.Observability.HEALTH_CHECK_TTL_SEC,
+        interval_sec: float | None = None,
+        critical: bool = True,
+    ) -> p.Result[bool]:
+        """Register a check on the global runner (see ``Runner.register``).
+
+        The global runner's scheduler is started by the registration, so the
+        check is refreshed in the background from then on.
+        """
+        runner = FlextObservabilityHealth.active_runner()
+        result = runner.register(
+            name,
+            check,
+            timeout_sec=timeout_sec,
+            ttl_sec=ttl_sec,
+            interval_sec=interval_sec,
+            critical=critical,
+        )
+        if result.success:
+            runner.start()
+        return result
+
+    @staticmethod
+    def active_runner() -> FlextObservabilityHealth.Runner:
+        """Return the global health-check runner instance.
+
+        Returns:
+            Runner - Global health-check runner
+
+        """
+        if FlextObservabilityHealth._runner_instance is None:
+            FlextObservabilityHealth._runner_instance = (
+                FlextObservabilityHealth.Runner()
+            )
+        return FlextObservabilityHealth._runner_instance
+
 
 __all__: list[str] = ["FlextObservabilityHealth"]
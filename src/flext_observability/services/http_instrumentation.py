@@ -14,27 +14,40 @@ Key Features:
 - Zero code changes needed in route handlers
 - Automatic correlation ID extraction/generation
 - HTTP request/response tracing
-- Latency metrics collection
+- Latency metrics collection (request duration histogram with exemplars
+  linking buckets to sampled trace IDs)
 - Error tracking and alerting
 - Async-safe with FastAPI
+- Optional /health, /ready and /metrics endpoints served from cached bytes
+  in front of the instrumentation (probes are neither logged nor counted)
+- Flask and Starlette are imported by ``setup_instrumentation``, never at
+  module import
 """
 
 from __future__ import annotations
 
+import threading
 import time
-from typing import TypeIs, override
-
-import flask
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.requests import Request
-from starlette.responses import Response
+from collections.abc import Awaitable, Callable, Iterable, MutableMapping
+from http import HTTPStatus
+from typing import TYPE_CHECKING, ClassVar, TypeIs, override
 
 from flext_observability import c, m, p, r, t, u
+from flext_observability.services.aggregation import FlextObservabilityAggregation
 from flext_observability.services.context import FlextObservabilityContext
+from flext_observability.services.health import FlextObservabilityHealth
 from flext_observability.services.logging_integration import FlextObservabilityLogging
+from flext_observability.services.multiprocess import FlextObservabilityMultiprocess
+from flext_observability.services.overhead import FlextObservabilityOverhead
+from flext_observability.services.sampling import FlextObservabilitySampling
+from flext_observability.services.switches import FlextObservabilitySwitches
 
-g = flask.g if hasattr(flask, "g") else None
-request = flask.request if hasattr(flask, "request") else None
+if TYPE_CHECKING:
+    import flask
+    from starlette.middleware.base import RequestResponseEndpoint
+    from starlette.requests import Request
+    from starlette.responses import Response
+    from starlette.types import ASGIApp, Receive, Scope, Send
 
 
 class FlextObservabilityHTTP:
@@ -49,19 +62,21 @@ class FlextObservabilityHTTP:
         from flext_observability import FlextObservabilityHTTP
 
         app = FastAPI()
-        FlextObservabilityHTTP.FastAPI.setup_instrumentation(app)
+        FlextObservabilityHTTP.FastAPI.setup_instrumentation(app, endpoints=True)
 
         # All HTTP requests now automatically traced and monitored!
-        # No changes needed to route handlers
+        # No changes needed to route handlers; /health, /ready and /metrics
+        # are answered before the instrumentation runs
         ```
 
     Nested Classes:
         Flask: Flask WSGI middleware
         FastAPI: FastAPI ASGI middleware
-        ASGI: Generic ASGI middleware base
+        Endpoints: Cached probe and metrics endpoints (WSGI and ASGI)
     """
 
     logger = u.fetch_logger(__name__)
+    _endpoint_cache_instance: FlextObservabilityHTTP.Endpoints.Cache | None = None
 
     @staticmethod
     def _matches_flask_app(
@@ -77,9 +92,329 @@ class FlextObservabilityHTTP:
         """Type guard to check if object is a FastAPI app."""
         return hasattr(obj, "add_middleware")
 
+    @staticmethod
+    def sample_request(method: str, path: str) -> None:
+        """Take the head sampling decision of the current request.
+
+        The decision is kept in the request context; sampled requests with a
+        trace ID attach it as exemplar to the duration histograms they feed.
+        """
+        FlextObservabilityContext.update_sampled(
+            sampled=FlextObservabilitySampling.should_sample(f"{method} {path}")
+        )
+
+    @staticmethod
+    def record_duration(method: str, status_code: int, duration_sec: float) -> None:
+        """Fold one server request duration into the HTTP duration histogram.
+
+        Labelled by method and status code only (never the raw path); a
+        sampled request becomes the exemplar of its bucket. Dispatches
+        through the metrics kill switch, so nothing is recorded while
+        metrics are disabled, whatever the traces state.
+        """
+        FlextObservabilityHTTP._record_duration_switch.impl(
+            method, status_code, duration_sec
+        )
+
+    @staticmethod
+    def _record_duration_enabled(
+        method: str, status_code: int, duration_sec: float
+    ) -> None:
+        """Record one request duration while the metrics signal is enabled."""
+        store = FlextObservabilityAggregation.active_store()
+        resolved = store.handle(
+            c.Observability.HTTP_SERVER_DURATION_METRIC,
+            c.Observability.MetricType.HISTOGRAM,
+            {
+                "http.request.method": method,
+                "http.response.status_code": str(status_code),
+            },
+        )
+        if resolved.failure:
+            return
+        series = resolved.value
+        span = FlextObservabilityContext.sampled_span()
+        with store.lock:
+            series.observe(duration_sec)
+            if span is not None:
+                series.exemplar(duration_sec, *span)
+
+    @staticmethod
+    def _record_duration_noop(
+        _method: str, _status_code: int, _duration_sec: float
+    ) -> None:
+        """Pre-built no-op used while the metrics signal is disabled."""
+
+    _record_duration_switch: ClassVar[FlextObservabilitySwitches.Switch] = (
+        FlextObservabilitySwitches.bind(
+            c.Observability.Signal.METRICS,
+            _record_duration_enabled,
+            _record_duration_noop,
+        )
+    )
+
+    class Endpoints:
+        """Built-in /health, /ready, /metrics and /metrics/openmetrics endpoints.
+
+        Payloads are rendered at most once per cache TTL into pre-serialized
+        bytes with pre-built headers; every probe in between is a dictionary
+        lookup plus one response write. The WSGI and ASGI middlewares answer
+        these paths before the framework (and its request instrumentation)
+        runs.
+        """
+
+        class Payload:
+            """Pre-serialized response (status, headers and body bytes)."""
+
+            __slots__ = (
+                "asgi_headers",
+                "body",
+                "status",
+                "status_line",
+                "wsgi_headers",
+            )
+
+            def __init__(self, status: int, content_type: str, body: bytes) -> None:
+                """Pre-build the status line and headers for both interfaces."""
+                self.status = int(status)
+                self.body = body
+                self.status_line = f"{status} {HTTPStatus(status).phrase}"
+                self.wsgi_headers = [
+                    ("Content-Type", content_type),
+                    ("Content-Length", str(len(body))),
+                    ("Cache-Control", "no-store"),
+                ]
+                self.asgi_headers = [
+                    (name.lower().encode(), value.encode())
+                    for name, value in self.wsgi_headers
+                ]
+
+        class Cache:
+            """Time-bounded cache of the rendered endpoint payloads."""
+
+            def __init__(
+                self,
+                ttl_sec: float = c.Observability.ENDPOINT_CACHE_TTL_SEC,
+                runner: FlextObservabilityHealth.Runner | None = None,
+                store: FlextObservabilityAggregation.Store | None = None,
+            ) -> None:
+                """Initialize the cache.
+
+                Args:
+                    ttl_sec: Maximum age of a served payload
+                    runner: Health runner (None = global runner)
+                    store: Aggregation store (None = global store, or every
+                        worker segment merged in multiprocess mode)
+
+                """
+                self._ttl_sec = ttl_sec
+                self._runner = runner
+                self._store = store
+                self._entries: dict[
+                    str, tuple[float, FlextObservabilityHTTP.Endpoints.Payload]
+                ] = {}
+                self._refresh_locks: dict[str, threading.Lock] = {}
+
+            def routes(
+                self,
+            ) -> dict[str, Callable[[], FlextObservabilityHTTP.Endpoints.Payload]]:
+                """Return the endpoint path to payload getter mapping."""
+                return {
+                    c.Observability.HEALTH_ENDPOINT_PATH: self.health,
+                    c.Observability.READY_ENDPOINT_PATH: self.ready,
+                    c.Observability.METRICS_ENDPOINT_PATH: self.metrics,
+                    c.Observability.OPENMETRICS_ENDPOINT_PATH: self.openmetrics,
+                }
+
+            def health(self) -> FlextObservabilityHTTP.Endpoints.Payload:
+                """Aggregated health with per-check results (503 when unhealthy)."""
+                return self._cached("health", self._render_health)
+
+            def ready(self) -> FlextObservabilityHTTP.Endpoints.Payload:
+                """Compact readiness status (503 when unhealthy)."""
+                return self._cached("ready", self._render_ready)
+
+            def metrics(self) -> FlextObservabilityHTTP.Endpoints.Payload:
+                """Prometheus text exposition of the aggregation store."""
+                return self._cached("metrics", self._render_metrics)
+
+            def openmetrics(self) -> FlextObservabilityHTTP.Endpoints.Payload:
+                """OpenMetrics exposition, histogram exemplars included."""
+                return self._cached("openmetrics", self._render_openmetrics)
+
+            def _cached(
+                self,
+                key: str,
+                render: Callable[[], FlextObservabilityHTTP.Endpoints.Payload],
+            ) -> FlextObservabilityHTTP.Endpoints.Payload:
+                """Return the cached payload, re-rendering it once it expired.
+
+                Each endpoint renders under its own lock. While one caller
+                re-renders, concurrent callers keep getting the previous
+                payload; callers with nothing cached wait, then reuse the
+                payload rendered meanwhile instead of rendering again.
+                """
+                entry = self._entries.get(key)
+                if entry is not None and time.monotonic() < entry[0]:
+                    return entry[1]
+                lock = self._refresh_locks.setdefault(key, threading.Lock())
+                if entry is None:
+                    _ = lock.acquire()
+                elif not lock.acquire(blocking=False):
+                    return entry[1]
+                try:
+                    entry = self._entries.get(key)
+                    now = time.monotonic()
+                    if entry is None or now >= entry[0]:
+                        entry = (now + self._ttl_sec, render())
+                        self._entries[key] = entry
+                finally:
+                    lock.release()
+                return entry[1]
+
+            def _health_status(self) -> t.JsonDict:
+                """Return the last known aggregated health without waiting."""
+                runner = self._runner or FlextObservabilityHealth.active_runner()
+                return runner.status(wait_for_refresh=False)
+
+            def _render_health(self) -> FlextObservabilityHTTP.Endpoints.Payload:
+                """Render the health payload."""
+                status = self._health_status()
+                return FlextObservabilityHTTP.Endpoints.json_payload(status)
+
+            def _render_ready(self) -> FlextObservabilityHTTP.Endpoints.Payload:
+                """Render the readiness payload."""
+                status = self._health_status()
+                ready = status["status"] != c.Observability.HealthStatus.UNHEALTHY
+                return FlextObservabilityHTTP.Endpoints.json_payload({
+                    "status": status["status"],
+                    "ready": ready,
+                })
+
+            def _render_metrics(self) -> FlextObservabilityHTTP.Endpoints.Payload:
+                """Render the Prometheus payload."""
+                if FlextObservabilityOverhead.enabled:
+                    _ = FlextObservabilityOverhead.export()
+                store = self._store or FlextObservabilityMultiprocess.exposition_store()
+                return FlextObservabilityHTTP.Endpoints.Payload(
+                    HTTPStatus.OK,
+                    c.Observability.PROMETHEUS_CONTENT_TYPE,
+                    store.render_prometheus().encode(),
+                )
+
+            def _render_openmetrics(self) -> FlextObservabilityHTTP.Endpoints.Payload:
+                """Render the OpenMetrics payload."""
+                if FlextObservabilityOverhead.enabled:
+                    _ = FlextObservabilityOverhead.export()
+                store = self._store or FlextObservabilityMultiprocess.exposition_store()
+                return FlextObservabilityHTTP.Endpoints.Payload(
+                    HTTPStatus.OK,
+                    c.Observability.OPENMETRICS_CONTENT_TYPE,
+                    store.render_openmetrics().encode(),
+                )
+
+        @staticmethod
+        def json_payload(body: t.JsonDict) -> FlextObservabilityHTTP.Endpoints.Payload:
+            """Serialize a health body; unhealthy maps to 503."""
+            status = (
+                HTTPStatus.SERVICE_UNAVAILABLE
+                if body.get("status") == c.Observability.HealthStatus.UNHEALTHY
+                else HTTPStatus.OK
+            )
+            return FlextObservabilityHTTP.Endpoints.Payload(
+                status,
+                c.Observability.HTTP_CONTENT_TYPE_JSON,
+                u.Cli.json_dumps(body).unwrap().encode(),
+            )
+
+        class WSGIMiddleware:
+            """WSGI wrapper answering endpoint paths before the application."""
+
+            def __init__(
+                self,
+                app: p.Observability.Http.WSGIApplication,
+                cache: FlextObservabilityHTTP.Endpoints.Cache | None = None,
+            ) -> None:
+                """Wrap ``app`` (None cache = global endpoint cache)."""
+                self._app = app
+                self._routes = (
+                    cache or FlextObservabilityHTTP.active_endpoint_cache()
+                ).routes()
+
+            def __call__(
+                self,
+                environ: MutableMapping[str, object],
+                start_response: Callable[..., Callable[[bytes], object]],
+            ) -> Iterable[bytes]:
+                """Serve a cached payload or delegate to the application."""
+                route = self._routes.get(str(environ.get("PATH_INFO", "")))
+                if route is None:
+                    return self._app(environ, start_response)
+                payload = route()
+                _ = start_response(payload.status_line, payload.wsgi_headers)
+                return (payload.body,)
+
+        class ASGIMiddleware:
+            """ASGI middleware answering endpoint paths before inner layers."""
+
+            def __init__(
+                self,
+                app: ASGIApp,
+                cache: FlextObservabilityHTTP.Endpoints.Cache | None = None,
+            ) -> None:
+                """Wrap ``app`` (None cache = global endpoint cache)."""
+                self._app = app
+                self._routes = (
+                    cache or FlextObservabilityHTTP.active_endpoint_cache()
+                ).routes()
+
+            async def __call__(
+                self, scope: Scope, receive: Receive, send: Send
+            ) -> None:
+                """Serve a cached payload or delegate to the inner application."""
+                route = (
+                    self._routes.get(scope["path"]) if scope["type"] == "http" else None
+                )
+                if route is None:
+                    await self._app(scope, receive, send)
+                    return
+                payload = route()
+                await send({
+                    "type": "http.response.start",
+                    "status": payload.status,
+                    "headers": payload.asgi_headers,
+                })
+                await send({"type": "http.response.body", "body": payload.body})
+
+    @staticmethod
+    def active_endpoint_cache() -> FlextObservabilityHTTP.Endpoints.Cache:
+        """Return the global endpoint payload cache.
+
+        Returns:
+            Cache - Global endpoint payload cache
+
+        """
+        if FlextObservabilityHTTP._endpoint_cache_instance is None:
+            FlextObservabilityHTTP._endpoint_cache_instance = (
+                FlextObservabilityHTTP.Endpoints.Cache()
+            )
+        return FlextObservabilityHTTP._endpoint_cache_instance
+
     class Flask:
         """Flask WSGI middleware for automatic HTTP instrumentation."""
 
+        request: ClassVar[flask.Request | None] = None
+        g: ClassVar[p.Observability.Http.FlaskGlobals | None] = None
+
+        @classmethod
+        def _bind_flask(cls) -> None:
+            """Import Flask and bind its request globals (first setup only)."""
+            if cls.request is None:
+                import flask
+
+                cls.request = flask.request
+                cls.g = flask.g
+
         @classmethod
         def _before_request_hook(cls) -> None:
             """Extract context and create span before request processing."""
@@ -101,9 +436,11 @@ class FlextObservabilityHTTP:
         @classmethod
         def _before_request_payload(cls) -> tuple[str, str, t.StrMapping]:
             """Prepare Flask before-request context and log payload."""
+            request, g = cls.request, cls.g
             headers_dict: t.StrMapping = dict(request.headers) if request else {}
             if request:
                 FlextObservabilityContext.from_headers(headers_dict)
+                FlextObservabilityHTTP.sample_request(request.method, request.path)
             correlation_id = FlextObservabilityContext.correlation_id()
             if g:
                 g.flext_start_time = time.time()
@@ -147,9 +484,13 @@ class FlextObservabilityHTTP:
                 response.status_code if hasattr(response, "status_code") else 200
             )
             is_error = status_code >= c.Observability.HTTP_ERROR_STATUS_THRESHOLD
+            request = cls.request
             request_method = request.method if request else "UNKNOWN"
             request_path = request.path if request else "UNKNOWN"
             duration_ms = cls._duration_ms()
+            FlextObservabilityHTTP.record_duration(
+                request_method, status_code, duration_ms / 1000
+            )
             FlextObservabilityLogging.log_with_context(
                 FlextObservabilityHTTP.logger,
                 c.Observability.ErrorSeverity.INFO.value
@@ -167,6 +508,7 @@ class FlextObservabilityHTTP:
         @classmethod
         def _duration_ms(cls) -> float:
             """Resolve Flask request duration from the stored start time."""
+            g = cls.g
             start_time = (
                 g.flext_start_time
                 if g is not None and hasattr(g, "flext_start_time")
@@ -183,6 +525,7 @@ class FlextObservabilityHTTP:
         @staticmethod
         def _error_handler(error: Exception) -> tuple[m.Dict, int]:
             """Handle exceptions with logging and alerting."""
+            request = FlextObservabilityHTTP.Flask.request
             try:
                 FlextObservabilityLogging.log_with_context(
                     FlextObservabilityHTTP.logger,
@@ -201,8 +544,26 @@ class FlextObservabilityHTTP:
                 )
             return (m.Dict({"error": str(error)}), 500)
 
+        @staticmethod
+        def _noop_before_request_hook() -> None:
+            """Pre-built before-request hook used while traces are disabled."""
+
+        @staticmethod
+        def _noop_after_request_hook(
+            response: p.Observability.Http.Response,
+        ) -> p.Observability.Http.Response:
+            """Pre-built after-request hook used while traces are disabled."""
+            return response
+
+        @staticmethod
+        def _noop_error_handler(error: Exception) -> tuple[m.Dict, int]:
+            """Pre-built error handler used while traces are disabled."""
+            return (m.Dict({"error": str(error)}), 500)
+
         @classmethod
-        def setup_instrumentation(cls, app: t.RegisterableService) -> p.Result[bool]:
+        def setup_instrumentation(
+            cls, app: t.RegisterableService, *, endpoints: bool = False
+        ) -> p.Result[bool]:
             """Set up Flask application HTTP instrumentation.
 
             Adds Flask middleware for automatic HTTP request tracing, metrics,
@@ -210,6 +571,8 @@ class FlextObservabilityHTTP:
 
             Args:
                 app: Flask application instance
+                endpoints: Also serve /health, /ready and /metrics from the
+                    endpoint cache, in front of the instrumentation
 
             Returns:
                 r[bool] - Ok if setup successful
@@ -220,6 +583,7 @@ class FlextObservabilityHTTP:
                 - Records metrics for duration and status
                 - Captures request context in logs
                 - Handles errors and exceptions
+                - Endpoint paths never reach Flask hooks (not logged/counted)
 
             Example:
                 ```python
@@ -227,7 +591,7 @@ class FlextObservabilityHTTP:
                 from flext_observability import FlextObservabilityHTTP
 
                 app = Flask(__name__)
-                FlextObservabilityHTTP.Flask.setup_instrumentation(app)
+                FlextObservabilityHTTP.Flask.setup_instrumentation(app, endpoints=True)
 
 
                 @app.route("/api/users")
@@ -238,21 +602,95 @@ class FlextObservabilityHTTP:
 
             """
             try:
-                return cls._setup_instrumentation(app)
+                result = cls._setup_instrumentation(app)
+                if result.success and endpoints:
+                    result = cls.register_endpoints(app)
             except c.EXC_MAPPING_TYPE as e:
                 return r[bool].fail_op("Flask instrumentation setup", e)
+            return result
+
+        @staticmethod
+        def register_endpoints(
+            app: t.RegisterableService,
+            cache: FlextObservabilityHTTP.Endpoints.Cache | None = None,
+        ) -> p.Result[bool]:
+            """Serve /health, /ready and /metrics in front of a Flask app.
+
+            Wraps ``app.wsgi_app`` so endpoint requests are answered from the
+            cache without routing, request hooks or instrumentation.
+
+            Args:
+                app: Flask application instance
+                cache: Endpoint payload cache (None = global cache)
+
+            Returns:
+                r[bool] - Ok once the endpoints are registered
+
+            """
+            if not hasattr(app, "wsgi_app"):
+                return r[bool].fail("Invalid Flask app - missing wsgi_app")
+            typed_app: p.Observability.Http.FlaskWSGIApp = app
+            typed_app.wsgi_app = FlextObservabilityHTTP.Endpoints.WSGIMiddleware(
+                typed_app.wsgi_app, cache
+            )
+            return r[bool].ok(value=True)
 
         @classmethod
         def _setup_instrumentation(cls, app: t.RegisterableService) -> p.Result[bool]:
             """Register Flask instrumentation hooks."""
             if not FlextObservabilityHTTP._matches_flask_app(app):
                 return r[bool].fail("Invalid Flask app - missing request hooks")
+            cls._bind_flask()
+            g = cls.g
             before_request_hook: p.Observability.Http.FlaskHook = app.before_request
             after_request_hook: p.Observability.Http.FlaskHook = app.after_request
             errorhandler: p.Observability.Http.FlaskErrorHandler = app.errorhandler
-            before_request_hook(cls._before_request_hook)
-            after_request_hook(cls._after_request_hook)
-            errorhandler(Exception)(cls._error_handler)
+            traces = c.Observability.Signal.TRACES
+            overhead = FlextObservabilityOverhead
+            before_switch = FlextObservabilitySwitches.bind(
+                traces,
+                cls._before_request_hook,
+                cls._noop_before_request_hook,
+                accounted_impl=overhead.measure("http.flask.before_request")(
+                    cls._before_request_hook
+                ),
+            )
+            after_switch = FlextObservabilitySwitches.bind(
+                traces,
+                cls._after_request_hook,
+                cls._noop_after_request_hook,
+                accounted_impl=overhead.measure("http.flask.after_request")(
+                    cls._after_request_hook
+                ),
+            )
+            error_switch = FlextObservabilitySwitches.bind(
+                traces,
+                cls._error_handler,
+                cls._noop_error_handler,
+                accounted_impl=overhead.measure("http.flask.error_handler")(
+                    cls._error_handler
+                ),
+            )
+
+            def before_request() -> None:
+                if g is not None:
+                    g.flext_overhead_start_ns = overhead.request_started()
+                return before_switch.impl()
+
+            def after_request(
+                response: p.Observability.Http.Response,
+            ) -> p.Observability.Http.Response:
+                response = after_switch.impl(response)
+                if g is not None:
+                    overhead.request_finished(getattr(g, "flext_overhead_start_ns", 0))
+                return response
+
+            def handle_error(error: Exception) -> tuple[m.Dict, int]:
+                return error_switch.impl(error)
+
+            before_request_hook(before_request)
+            after_request_hook(after_request)
+            errorhandler(Exception)(handle_error)
             FlextObservabilityHTTP.logger.debug(
                 "Flask HTTP instrumentation setup complete"
             )
@@ -262,7 +700,9 @@ class FlextObservabilityHTTP:
         """FastAPI ASGI middleware for automatic HTTP instrumentation."""
 
         @classmethod
-        def setup_instrumentation(cls, app: t.RegisterableService) -> p.Result[bool]:
+        def setup_instrumentation(
+            cls, app: t.RegisterableService, *, endpoints: bool = False
+        ) -> p.Result[bool]:
             """Set up FastAPI application HTTP instrumentation.
 
             Adds FastAPI middleware for automatic HTTP request tracing, metrics,
@@ -271,6 +711,8 @@ class FlextObservabilityHTTP:
 
             Args:
                 app: FastAPI application instance
+                endpoints: Also serve /health, /ready and /metrics from the
+                    endpoint cache, in front of the instrumentation
 
             Returns:
                 r[bool] - Ok if setup successful
@@ -282,6 +724,7 @@ class FlextObservabilityHTTP:
                 - Captures request context in logs
                 - Handles errors and exceptions
                 - Full async/await support
+                - Endpoint paths never reach the instrumentation middleware
 
             Example:
                 ```python
@@ -289,7 +732,8 @@ class FlextObservabilityHTTP:
                 from flext_observability import FlextObservabilityHTTP
 
                 app = FastAPI()
-                FlextObservabilityHTTP.FastAPI.setup_instrumentation(app)
+                instrumentation = FlextObservabilityHTTP.FastAPI
+                instrumentation.setup_instrumentation(app, endpoints=True)
 
 
                 @app.get("/api/users")
@@ -300,9 +744,35 @@ class FlextObservabilityHTTP:
 
             """
             try:
-                return cls._setup_instrumentation(app)
+                result = cls._setup_instrumentation(app)
+                if result.success and endpoints:
+                    result = cls.register_endpoints(app)
             except c.EXC_MAPPING_TYPE as e:
                 return r[bool].fail_op("FastAPI instrumentation setup", e)
+            return result
+
+        @staticmethod
+        def register_endpoints(app: t.RegisterableService) -> p.Result[bool]:
+            """Serve /health, /ready and /metrics in front of a FastAPI app.
+
+            Adds the endpoint middleware as the outermost layer (Starlette runs
+            the last added middleware first), so it must be registered after
+            the instrumentation middleware.
+
+            Args:
+                app: FastAPI application instance
+
+            Returns:
+                r[bool] - Ok once the endpoint middleware is registered
+
+            """
+            if not FlextObservabilityHTTP._matches_fastapi_app(app):
+                return r[bool].fail(
+                    "Invalid FastAPI app - missing add_middleware method"
+                )
+            typed_app: p.Observability.Http.FastAPIApp = app
+            typed_app.add_middleware(FlextObservabilityHTTP.Endpoints.ASGIMiddleware)
+            return r[bool].ok(value=True)
 
         @classmethod
         def _setup_instrumentation(cls, app: t.RegisterableService) -> p.Result[bool]:
@@ -311,7 +781,14 @@ class FlextObservabilityHTTP:
                 return r[bool].fail(
                     "Invalid FastAPI app - missing add_middleware method"
                 )
+            from starlette.middleware.base import BaseHTTPMiddleware
+
             typed_app: p.Observability.Http.FastAPIApp = app
+            dispatch_switch = FlextObservabilitySwitches.bind(
+                c.Observability.Signal.TRACES,
+                cls._instrumented_dispatch,
+                cls._passthrough_dispatch,
+            )
 
             # mro-ktv9 (kimi-c): middleware now extends BaseHTTPMiddleware so
             # Starlette actually invokes dispatch per request (was a plain class
@@ -324,11 +801,11 @@ class FlextObservabilityHTTP:
                     self, request: Request, call_next: RequestResponseEndpoint
                 ) -> Response:
                     """Process HTTP request with instrumentation."""
+                    start_ns = FlextObservabilityOverhead.request_started()
                     try:
-                        return await cls._dispatch_request(request, call_next)
-                    except c.EXC_MAPPING_TYPE as e:
-                        FlextObservabilityHTTP.logger.warning(f"Middleware error: {e}")
-                        raise
+                        return await dispatch_switch.impl(request, call_next)
+                    finally:
+                        FlextObservabilityOverhead.request_finished(start_ns)
 
             add_middleware = typed_app.add_middleware
             add_middleware(FlextObservabilityMiddleware)
@@ -337,6 +814,24 @@ class FlextObservabilityHTTP:
             )
             return r[bool].ok(value=True)
 
+        @classmethod
+        async def _instrumented_dispatch(
+            cls, request: Request, call_next: RequestResponseEndpoint
+        ) -> Response:
+            """Dispatch one request with instrumentation (traces enabled)."""
+            try:
+                return await cls._dispatch_request(request, call_next)
+            except c.EXC_MAPPING_TYPE as e:
+                FlextObservabilityHTTP.logger.warning(f"Middleware error: {e}")
+                raise
+
+        @staticmethod
+        def _passthrough_dispatch(
+            request: Request, call_next: RequestResponseEndpoint
+        ) -> Awaitable[Response]:
+            """Pre-built pass-through dispatch used while traces are disabled."""
+            return call_next(request)
+
         @classmethod
         async def _dispatch_request(
             cls, request: Request, call_next: RequestResponseEndpoint
@@ -344,6 +839,7 @@ class FlextObservabilityHTTP:
             """Process one FastAPI request with logging and correlation context."""
             headers_dict: t.MutableStrMapping = dict(request.headers.items())
             FlextObservabilityContext.from_headers(headers_dict)
+            FlextObservabilityHTTP.sample_request(request.method, request.url.path)
             correlation_id = FlextObservabilityContext.correlation_id()
             start_time = time.time()
             await FlextObservabilityHTTP._async_log_with_context(
@@ -383,6 +879,9 @@ class FlextObservabilityHTTP:
             status_code = (
                 response.status_code if hasattr(response, "status_code") else 200
             )
+            FlextObservabilityHTTP.record_duration(
+                request.method, status_code, duration_ms / 1000
+            )
             is_error = status_code >= c.Observability.HTTP_ERROR_STATUS_THRESHOLD
             await FlextObservabilityHTTP._async_log_with_context(
                 f"HTTP {request.method} {request.url.path} -> {status_code}",
@@ -431,4 +930,10 @@ class FlextObservabilityHTTP:
             )
 
 
+FlextObservabilityOverhead.instrument(
+    FlextObservabilityHTTP.FastAPI,
+    "_request_log_extra",
+    "http.fastapi.request_log_extra",
+)
+
 __all__: list[str] = ["FlextObservabilityHTTP"]
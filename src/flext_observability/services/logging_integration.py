@@ -21,6 +21,7 @@ from __future__ import annotations
 
 from flext_observability import c, m, p, r, t, u
 from flext_observability.services.context import FlextObservabilityContext
+from flext_observability.services.overhead import FlextObservabilityOverhead
 
 
 class FlextObservabilityLogging:
@@ -358,4 +359,8 @@ class FlextObservabilityLogging:
             return r[m.Observability.LogContext].fail_op("Context validation", e)
 
 
+FlextObservabilityOverhead.instrument(
+    FlextObservabilityLogging, "log_with_context", "logging.log_with_context"
+)
+
 __all__: list[str] = ["FlextObservabilityLogging"]
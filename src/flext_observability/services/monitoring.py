@@ -6,14 +6,31 @@ SPDX-License-Identifier: MIT
 
 from __future__ import annotations
 
+import inspect
 import time
-from collections.abc import Callable
+import weakref
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Generator,
+    Iterator,
+    Sequence,
+)
 from typing import ClassVar, override
 from uuid import uuid4
 
 from flext_core import FlextContainer
-from flext_observability import c, m, p, r, settings, t, u
+from flext_observability import c, m, p, r, t, u
+from flext_observability.services.aggregation import FlextObservabilityAggregation
+from flext_observability.services.alerting import FlextObservabilityAlerting
+from flext_observability.services.context import FlextObservabilityContext
+from flext_observability.services.error_handling import FlextObservabilityErrorHandling
+from flext_observability.services.overhead import FlextObservabilityOverhead
+from flext_observability.services.switches import FlextObservabilitySwitches
 from flext_observability.services.services import FlextObservabilityServices
+from flext_observability.services.temporality import FlextObservabilityTemporality
 
 
 class FlextObservabilityMonitor:
@@ -28,8 +45,15 @@ class FlextObservabilityMonitor:
     """
 
     _container_type: ClassVar[p.ContainerType] = FlextContainer
+    _monitor_instance: ClassVar[FlextObservabilityMonitor | None] = None
 
     object_callable = Callable[..., t.Scalar]
+    monitored_callable = (
+        Callable[..., t.Scalar]
+        | Callable[..., Awaitable[t.Scalar]]
+        | Callable[..., Iterator[t.Scalar]]
+        | Callable[..., AsyncIterator[t.Scalar]]
+    )
     logger: p.Logger = u.fetch_logger(__name__)
 
     class MonitoringHelpers:
@@ -52,82 +76,155 @@ class FlextObservabilityMonitor:
             monitor: FlextObservabilityMonitor,
             metric_name: str | None,
         ) -> t.Scalar:
-            """Execute function with monitoring."""
+            """Execute function with monitoring.
+
+            Records through the same ``MetricHandles`` bookkeeping as the
+            ``flext_monitor_function`` decorator.
+            """
+            decorators = FlextObservabilityMonitor.MonitoringDecorators
             function_name = getattr(func, "__name__", "unknown_function")
-            actual_metric_name = metric_name or f"function_execution_{function_name}"
-            start_time = time.time()
+            handles = FlextObservabilityMonitor.MetricHandles(
+                metric_name or f"function_execution_{function_name}"
+            )
+            start_ns = time.perf_counter_ns()
             try:
                 kwargs_dict = kwargs if isinstance(kwargs, dict) else {}
                 result = FlextObservabilityMonitor.MonitoringHelpers.call_any_function(
                     func, *args, **kwargs_dict
                 )
-                execution_time = time.time() - start_time
-                FlextObservabilityMonitor.MonitoringHelpers.record_success_metrics(
-                    monitor, actual_metric_name, execution_time
-                )
             except c.EXC_MAPPING_TYPE as e:
-                execution_time = time.time() - start_time
-                FlextObservabilityMonitor.MonitoringHelpers.record_error_metrics(
-                    monitor, actual_metric_name, execution_time, function_name, e
+                decorators.record_failure(
+                    handles,
+                    monitor,
+                    time.perf_counter_ns() - start_ns,
+                    function_name,
+                    e,
                 )
                 raise
-            else:
-                return result
-
-        @staticmethod
-        def record_error_metrics(
-            monitor: FlextObservabilityMonitor,
-            metric_name: str,
-            execution_time: float,
-            function_name: str,
-            error: Exception,
-        ) -> None:
-            """Record metrics and alerts for function execution errors."""
-            monitor.flext_record_metric(
-                f"{metric_name}_error_total", 1, c.Observability.MetricType.COUNTER
-            )
-            monitor.flext_record_metric(
-                f"{metric_name}_error_duration_seconds",
-                execution_time,
-                c.Observability.MetricType.HISTOGRAM,
+            decorators.record_completion(
+                handles, monitor, time.perf_counter_ns() - start_ns
             )
-            observability_service = monitor.observability_service
-            if observability_service:
-                try:
-                    alert_result = observability_service.create_alert(
-                        title=f"Function execution error: {function_name}",
-                        message=f"Function {function_name} failed with {type(error).__name__}",
-                        severity="high",
-                        source="monitoring",
-                    )
-                    if alert_result.failure:
-                        FlextObservabilityMonitor.logger.warning(
-                            f"Alert creation failed: {alert_result.error}"
-                        )
-                except c.EXC_BASIC_TYPE as e:
-                    FlextObservabilityMonitor.logger.warning(
-                        f"Alert creation failed: {e}"
-                    )
+            return result
 
         @staticmethod
-        def record_success_metrics(
-            monitor: FlextObservabilityMonitor, metric_name: str, execution_time: float
+        def alert_function_error(
+            monitor: FlextObservabilityMonitor, function_name: str, error: Exception
         ) -> None:
-            """Record metrics for successful function execution."""
-            monitor.flext_record_metric(
-                f"{metric_name}_duration_seconds",
-                execution_time,
-                c.Observability.MetricType.HISTOGRAM,
+            """Queue an alert for a failed monitored function execution.
+
+            Never blocks the failing call: the alert is fingerprinted by the
+            raising frame and handed to the asynchronous dispatcher, which
+            coalesces repeats and applies the error handler's policy.
+            """
+            if not monitor.observability_service:
+                return
+            try:
+                handler = FlextObservabilityErrorHandling.active_handler()
+                error_type = type(error).__name__
+                title = f"Function execution error: {function_name}"
+                _ = FlextObservabilityAlerting.dispatch_alert(
+                    title,
+                    f"Function {function_name} failed with {error_type}",
+                    severity=c.Observability.ErrorSeverity.ERROR,
+                    source="monitoring",
+                    fingerprint=handler.fingerprint(
+                        error_type,
+                        str(error) or error_type,
+                        u.Observability.Fingerprint.frame_location(error),
+                    ),
+                )
+            except c.EXC_BASIC_TYPE as e:
+                FlextObservabilityMonitor.logger.warning(f"Alert dispatch failed: {e}")
+
+    class MetricHandles:
+        """Aggregation series pre-resolved for one monitored function.
+
+        Resolved once at decoration time. Successful calls append their
+        duration to a deferred buffer (folded into the duration histogram and
+        the success counter in batches); failures fold straight into the
+        error series. No ``MetricEntry`` model is built and no series is
+        looked up by name on the call path. Calls made in a sampled request
+        also leave their trace as the exemplar of their duration bucket.
+        """
+
+        __slots__ = (
+            "error_duration",
+            "error_total",
+            "first_item",
+            "flush_size",
+            "lock",
+            "pending",
+            "success",
+        )
+
+        def __init__(self, metric_name: str, *, streaming: bool = False) -> None:
+            """Resolve the duration and outcome series for ``metric_name``.
+
+            Streaming (generator) functions also get a time-to-first-item
+            histogram.
+            """
+            store = FlextObservabilityAggregation.active_store()
+            histogram = c.Observability.MetricType.HISTOGRAM
+            counter = c.Observability.MetricType.COUNTER
+            self.lock = store.lock
+            self.success = store.buffer(
+                store.handle(f"{metric_name}_duration_seconds", histogram).unwrap(),
+                tally=store.handle(f"{metric_name}_success_total", counter).unwrap(),
             )
-            monitor.flext_record_metric(
-                f"{metric_name}_success_total", 1, c.Observability.MetricType.COUNTER
+            self.pending = self.success.pending
+            self.flush_size = c.Observability.METRIC_BUFFER_FLUSH_SIZE
+            self.error_total = store.handle(
+                f"{metric_name}_error_total", counter
+            ).unwrap()
+            self.error_duration = store.handle(
+                f"{metric_name}_error_duration_seconds", histogram
+            ).unwrap()
+            self.first_item = (
+                store.handle(f"{metric_name}_first_item_seconds", histogram).unwrap()
+                if streaming
+                else None
             )
-            monitor.increment_functions_monitored()
+
+        def record_success(self, elapsed_ns: int) -> None:
+            """Buffer one successful execution, folding full batches."""
+            duration = elapsed_ns / 1e9
+            self.success.append(duration)
+            span = FlextObservabilityContext.sampled_span()
+            if span is not None:
+                self.exemplar(duration, span)
+            if len(self.pending) >= self.flush_size:
+                _ = self.success.flush()
+
+        def exemplar(self, duration: float, span: tuple[str, str]) -> None:
+            """Keep a sampled execution as the exemplar of its duration bucket."""
+            with self.lock:
+                self.success.series.exemplar(duration, *span)
+
+        def record_error(self, elapsed_ns: int) -> None:
+            """Fold one failed execution into the pre-resolved series."""
+            duration = elapsed_ns / 1e9
+            span = FlextObservabilityContext.sampled_span()
+            with self.lock:
+                self.error_duration.observe(duration)
+                self.error_total.observe(1.0)
+                if span is not None:
+                    self.error_duration.exemplar(duration, *span)
+
+        def record_first_item(self, elapsed_ns: int) -> None:
+            """Fold the time a stream took to produce its first item."""
+            if self.first_item is None:
+                return
+            with self.lock:
+                self.first_item.observe(elapsed_ns / 1e9)
 
     @override
     def __init__(self, container: p.Container | None = None) -> None:
-        """Initialize monitor with real service orchestration and shared configuration."""
-        self._container = container or self._container_type.shared()
+        """Initialize monitor with real service orchestration and shared configuration.
+
+        The shared container is resolved on first access, so constructing
+        a monitor (e.g. the process-wide one, at decoration) stays cheap.
+        """
+        self._container: p.Container | None = container
         self.logger = u.fetch_logger(self.__class__.__name__)
         self._initialized = False
         self._running = False
@@ -136,6 +233,9 @@ class FlextObservabilityMonitor:
         self._metrics_service: p.Observability.ObservabilityService | None = None
         self._monitor_start_time = time.time()
         self._functions_monitored = 0
+        self._function_switches: weakref.WeakSet[FlextObservabilitySwitches.Switch] = (
+            weakref.WeakSet()
+        )
 
     def flext_health_status(self) -> p.Result[t.Observability.HealthMetricsDict]:
         """Resolve complete health status with real metrics."""
@@ -195,6 +295,7 @@ class FlextObservabilityMonitor:
                 service_result.error or "Service creation failed",
             )
         self._observability_service = service_result.value
+        FlextObservabilitySwitches.ensure_configured()
         self._metrics_service = self._observability_service
         self._health_service = self._observability_service
         self._initialized = True
@@ -229,27 +330,129 @@ class FlextObservabilityMonitor:
         value: float,
         metric_type: str = c.Observability.MetricType.GAUGE,
     ) -> p.Result[bool]:
-        """Record metric through the monitoring system with settings validation."""
+        """Record metric through the monitoring system.
+
+        Dispatches through the metrics kill switch: while metrics are disabled
+        the call resolves to a pre-built no-op returning a shared ok result.
+        """
+        return FlextObservabilityMonitor._record_metric_switch.impl(
+            self, name, value, metric_type
+        )
+
+    def _record_metric_enabled(
+        self, name: str, value: float, metric_type: str
+    ) -> p.Result[bool]:
+        """Record one metric while the metrics signal is enabled."""
         try:
             return self._record_metric_entry(name, value, metric_type)
         except c.EXC_BASIC_TYPE as e:
             return r[bool].fail_op("record metric", e)
 
+    @staticmethod
+    def _record_metric_noop(
+        _monitor: FlextObservabilityMonitor,
+        _name: str,
+        _value: float,
+        _metric_type: str,
+    ) -> p.Result[bool]:
+        """Pre-built no-op used while the metrics signal is disabled."""
+        return FlextObservabilityMonitor._NOOP_RECORDED
+
+    _NOOP_RECORDED: ClassVar[p.Result[bool]] = r[bool].ok(True)
+    _record_metric_switch: ClassVar[FlextObservabilitySwitches.Switch] = (
+        FlextObservabilitySwitches.bind(
+            c.Observability.Signal.METRICS,
+            _record_metric_enabled,
+            _record_metric_noop,
+            accounted_impl=FlextObservabilityOverhead.measure("metrics.record_metric")(
+                _record_metric_enabled
+            ),
+        )
+    )
+
     def _record_metric_entry(
         self, name: str, value: float, metric_type: str
     ) -> p.Result[bool]:
         """Build and record one monitoring metric entry."""
-        if not settings.Observability.metrics_enabled:
-            self.logger.debug("Metrics recording disabled in configuration")
-            return r[bool].ok(True)
         metric_result = self._build_metric_entry(name, value, metric_type)
         if metric_result.failure:
             return r[bool].fail_op(
                 "record metric", metric_result.error or "Failed to create metric"
             )
+        FlextObservabilityTemporality.active_recorder().record(name, value, metric_type)
         self.logger.debug("Recorded metric: %s=%s (%s)", name, value, metric_type)
         return r[bool].ok(True)
 
+    def flext_record_metrics(
+        self,
+        name: str,
+        values: Sequence[float],
+        metric_type: str = c.Observability.MetricType.HISTOGRAM,
+        *,
+        labels: t.StrMapping | None = None,
+        label_sets: Sequence[t.StrMapping] | None = None,
+        label_indices: Sequence[int] | None = None,
+    ) -> p.Result[int]:
+        """Record a batch of values for one metric in a single vectorized pass.
+
+        No per-value ``MetricEntry`` is built or logged; values are folded
+        straight into the aggregation store (see
+        ``FlextObservabilityAggregation.Store.record_bulk``). While metrics are
+        disabled the call resolves to a pre-built no-op.
+        """
+        return FlextObservabilityMonitor._record_metrics_switch.impl(
+            self,
+            name,
+            values,
+            metric_type,
+            labels=labels,
+            label_sets=label_sets,
+            label_indices=label_indices,
+        )
+
+    def _record_metrics_enabled(
+        self,
+        name: str,
+        values: Sequence[float],
+        metric_type: str,
+        *,
+        labels: t.StrMapping | None,
+        label_sets: Sequence[t.StrMapping] | None,
+        label_indices: Sequence[int] | None,
+    ) -> p.Result[int]:
+        """Record one batch while the metrics signal is enabled."""
+        result = FlextObservabilityAggregation.active_store().record_bulk(
+            name,
+            values,
+            metric_type,
+            labels=labels,
+            label_sets=label_sets,
+            label_indices=label_indices,
+        )
+        if result.success:
+            self.logger.debug("Recorded %s values for metric: %s", result.value, name)
+        return result
+
+    @staticmethod
+    def _record_metrics_noop(
+        _monitor: FlextObservabilityMonitor,
+        _name: str,
+        _values: Sequence[float],
+        _metric_type: str,
+        **_grouping: t.StrMapping | Sequence[t.StrMapping] | Sequence[int] | None,
+    ) -> p.Result[int]:
+        """Pre-built no-op used while the metrics signal is disabled."""
+        return FlextObservabilityMonitor._NOOP_RECORDED_BATCH
+
+    _NOOP_RECORDED_BATCH: ClassVar[p.Result[int]] = r[int].ok(0)
+    _record_metrics_switch: ClassVar[FlextObservabilitySwitches.Switch] = (
+        FlextObservabilitySwitches.bind(
+            c.Observability.Signal.METRICS,
+            _record_metrics_enabled,
+            _record_metrics_noop,
+        )
+    )
+
     @staticmethod
     def _build_metric_entry(
         name: str, value: float, metric_type: str
@@ -278,6 +481,7 @@ class FlextObservabilityMonitor:
             self.logger.info("Starting real observability monitoring")
             self._running = True
             self._monitor_start_time = time.time()
+            self._gate_function_switches()
             return r[bool].ok(True)
         except c.EXC_BASIC_TYPE as e:
             return r[bool].fail_op("start monitoring", e)
@@ -289,10 +493,63 @@ class FlextObservabilityMonitor:
         try:
             self.logger.info("Stopping observability monitoring")
             self._running = False
+            self._gate_function_switches()
             return r[bool].ok(True)
         except c.EXC_BASIC_TYPE as e:
             return r[bool].fail_op("stop monitoring", e)
 
+    def track_function_switch(self, switch: FlextObservabilitySwitches.Switch) -> None:
+        """Gate a decorated function's switch on this monitor's running state."""
+        self._function_switches.add(switch)
+        switch.gate(is_open=self.flext_monitoring_active())
+
+    def _gate_function_switches(self) -> None:
+        """Open or close every tracked function switch after a state change."""
+        is_open = self.flext_monitoring_active()
+        for switch in list(self._function_switches):
+            switch.gate(is_open=is_open)
+
+    @staticmethod
+    def active_monitor() -> FlextObservabilityMonitor:
+        """Return the process-wide monitor, initialized and running.
+
+        Initialized and started on first use; shared by every
+        ``flext_monitor_function`` decorator not given an explicit monitor.
+        A process-wide monitor stopped afterwards is returned as is.
+
+        Returns:
+            FlextObservabilityMonitor - Process-wide monitor
+
+        """
+        instance = FlextObservabilityMonitor.shared_monitor()
+        if not instance.flext_initialized():
+            _ = instance.flext_initialize_observability()
+            _ = instance.flext_start_monitoring()
+        return instance
+
+    @staticmethod
+    def shared_monitor() -> FlextObservabilityMonitor:
+        """Return the process-wide monitor without initializing it.
+
+        Decorators bind to this instance at decoration time; it is only
+        initialized and started by ``active_monitor()``, on the first call
+        of a decorated function.
+
+        Returns:
+            FlextObservabilityMonitor - Process-wide monitor
+
+        """
+        if FlextObservabilityMonitor._monitor_instance is None:
+            FlextObservabilityMonitor._monitor_instance = FlextObservabilityMonitor()
+        return FlextObservabilityMonitor._monitor_instance
+
+    @property
+    def container(self) -> p.Container:
+        """FLEXT container, the shared one unless given at construction."""
+        if self._container is None:
+            self._container = self._container_type.shared()
+        return self._container
+
     @property
     def observability_service(self) -> p.Observability.ObservabilityService | None:
         """The unified observability service."""
@@ -306,8 +563,8 @@ class FlextObservabilityMonitor:
     def flext_monitor_function(
         monitor: FlextObservabilityMonitor | None = None, metric_name: str | None = None
     ) -> Callable[
-        [FlextObservabilityMonitor.object_callable],
-        FlextObservabilityMonitor.object_callable,
+        [FlextObservabilityMonitor.monitored_callable],
+        FlextObservabilityMonitor.monitored_callable,
     ]:
         """Create function monitoring decorator with metrics collection."""
         return FlextObservabilityMonitor.MonitoringDecorators.flext_monitor_function(
@@ -322,43 +579,340 @@ class FlextObservabilityMonitor:
             monitor: FlextObservabilityMonitor | None = None,
             metric_name: str | None = None,
         ) -> Callable[
-            [FlextObservabilityMonitor.object_callable],
-            FlextObservabilityMonitor.object_callable,
+            [FlextObservabilityMonitor.monitored_callable],
+            FlextObservabilityMonitor.monitored_callable,
         ]:
             """Create function monitoring decorator with metrics collection.
 
-            Simplified decorator that records function execution metrics using flext-observability.
+            Args:
+                monitor: Monitor receiving the metrics (None = process-wide
+                    ``active_monitor()``, started by the first call)
+                metric_name: Metric name prefix (None =
+                    ``function_execution_<function name>``)
+
+            Returns:
+                Decorator recording duration and outcome of every call
+
+            Behavior:
+                - Binds the monitor and resolves its metric series once, at
+                  decoration time; the process-wide monitor is initialized
+                  and started on the first call instead, so decorating at
+                  import builds no services
+                - Times calls with ``time.perf_counter_ns``
+                - Coroutine functions are timed until the awaited result
+                - Sync and async generators are timed until exhaustion, with
+                  time to first item recorded separately and errors raised
+                  mid-stream recorded as failures
+                - Records only while the bound monitor is running; while it
+                  is stopped or metrics are disabled the original function is
+                  called directly through the metrics kill switch, so no
+                  state is checked per call
+
             """
+            decorators = FlextObservabilityMonitor.MonitoringDecorators
 
             def decorator(
-                func: FlextObservabilityMonitor.object_callable,
-            ) -> FlextObservabilityMonitor.object_callable:
-
-                def wrapper(*args: t.Scalar, **kwargs: t.Scalar) -> t.Scalar:
-                    active_monitor = monitor or FlextObservabilityMonitor()
-                    if not active_monitor.flext_initialized():
-                        init_result = active_monitor.flext_initialize_observability()
-                        if init_result.failure:
-                            return FlextObservabilityMonitor.MonitoringHelpers.call_any_function(
-                                func, *args, **kwargs
-                            )
-                    if active_monitor.flext_monitoring_active():
-                        return FlextObservabilityMonitor.MonitoringHelpers.execute_monitored_function(
-                            func, args, kwargs, active_monitor, metric_name
-                        )
-                    return (
-                        FlextObservabilityMonitor.MonitoringHelpers.call_any_function(
-                            func, *args, **kwargs
-                        )
+                func: FlextObservabilityMonitor.monitored_callable,
+            ) -> FlextObservabilityMonitor.monitored_callable:
+                bound_monitor = monitor or FlextObservabilityMonitor.shared_monitor()
+                if monitor is not None and not monitor.flext_initialized():
+                    _ = monitor.flext_initialize_observability()
+                function_name = getattr(func, "__name__", "unknown_function")
+                actual_metric_name = (
+                    metric_name or f"function_execution_{function_name}"
+                )
+                if inspect.isasyncgenfunction(func):
+                    wrapper = decorators.wrap_async_generator(
+                        func,
+                        bound_monitor,
+                        FlextObservabilityMonitor.MetricHandles(
+                            actual_metric_name, streaming=True
+                        ),
+                    )
+                elif inspect.iscoroutinefunction(func):
+                    wrapper = decorators.wrap_coroutine(
+                        func,
+                        bound_monitor,
+                        FlextObservabilityMonitor.MetricHandles(actual_metric_name),
+                    )
+                elif inspect.isgeneratorfunction(func):
+                    wrapper = decorators.wrap_generator(
+                        func,
+                        bound_monitor,
+                        FlextObservabilityMonitor.MetricHandles(
+                            actual_metric_name, streaming=True
+                        ),
+                    )
+                else:
+                    wrapper = decorators.wrap_function(
+                        func,
+                        bound_monitor,
+                        FlextObservabilityMonitor.MetricHandles(actual_metric_name),
                     )
-
                 wrapper.__name__ = getattr(func, "__name__", "wrapped_function")
+                wrapper.__qualname__ = getattr(func, "__qualname__", wrapper.__name__)
                 wrapper.__doc__ = getattr(func, "__doc__", wrapper.__doc__)
                 wrapper.__module__ = getattr(func, "__module__", __name__)
                 return wrapper
 
             return decorator
 
+        @staticmethod
+        def bind_switch(
+            wrapper: FlextObservabilityMonitor.monitored_callable,
+            func: FlextObservabilityMonitor.monitored_callable,
+            bound_monitor: FlextObservabilityMonitor,
+        ) -> FlextObservabilitySwitches.Switch:
+            """Bind a wrapper to the metrics switch and its monitor's state.
+
+            The wrapper is its own enabled implementation: while the switch
+            points at it the monitored body runs inline, any other binding
+            (original function, resolver) is dispatched. A switch bound to
+            the not yet started process-wide monitor stays closed on a
+            starter that runs once: it starts the monitor through
+            ``active_monitor()``, then tracks the switch and dispatches.
+            """
+            switch = FlextObservabilitySwitches.bind(
+                c.Observability.Signal.METRICS, wrapper, func
+            )
+            if (
+                bound_monitor.flext_initialized()
+                or bound_monitor is not FlextObservabilityMonitor.shared_monitor()
+            ):
+                bound_monitor.track_function_switch(switch)
+                return switch
+
+            def start(*args: t.Scalar, **kwargs: t.Scalar) -> object:
+                switch.noop_impl = func
+                _ = FlextObservabilityMonitor.active_monitor()
+                bound_monitor.track_function_switch(switch)
+                return switch.impl(*args, **kwargs)
+
+            switch.noop_impl = start
+            switch.gate(is_open=False)
+            return switch
+
+        @staticmethod
+        def record_failure(
+            handles: FlextObservabilityMonitor.MetricHandles,
+            bound_monitor: FlextObservabilityMonitor,
+            elapsed_ns: int,
+            function_name: str,
+            error: Exception,
+        ) -> None:
+            """Record a failed execution and raise its alert."""
+            handles.record_error(elapsed_ns)
+            FlextObservabilityMonitor.MonitoringHelpers.alert_function_error(
+                bound_monitor, function_name, error
+            )
+
+        @staticmethod
+        def record_completion(
+            handles: FlextObservabilityMonitor.MetricHandles,
+            bound_monitor: FlextObservabilityMonitor,
+            elapsed_ns: int,
+        ) -> None:
+            """Record a successful execution."""
+            handles.record_success(elapsed_ns)
+            bound_monitor.increment_functions_monitored()
+
+        @staticmethod
+        def wrap_function(
+            func: FlextObservabilityMonitor.object_callable,
+            bound_monitor: FlextObservabilityMonitor,
+            handles: FlextObservabilityMonitor.MetricHandles,
+        ) -> FlextObservabilityMonitor.object_callable:
+            """Wrap a plain function, timing until it returns."""
+            decorators = FlextObservabilityMonitor.MonitoringDecorators
+            function_name = getattr(func, "__name__", "unknown_function")
+            perf_counter_ns = time.perf_counter_ns
+            record_completion = decorators.record_completion
+
+            def wrapper(*args: t.Scalar, **kwargs: t.Scalar) -> t.Scalar:
+                impl = switch.impl
+                if impl is not wrapper:
+                    return impl(*args, **kwargs)
+                start_ns = perf_counter_ns()
+                try:
+                    result = func(*args, **kwargs)
+                except Exception as e:
+                    decorators.record_failure(
+                        handles,
+                        bound_monitor,
+                        perf_counter_ns() - start_ns,
+                        function_name,
+                        e,
+                    )
+                    raise
+                record_completion(handles, bound_monitor, perf_counter_ns() - start_ns)
+                return result
+
+            switch = decorators.bind_switch(wrapper, func, bound_monitor)
+            return wrapper
+
+        @staticmethod
+        def wrap_coroutine(
+            func: Callable[..., Awaitable[t.Scalar]],
+            bound_monitor: FlextObservabilityMonitor,
+            handles: FlextObservabilityMonitor.MetricHandles,
+        ) -> Callable[..., Awaitable[t.Scalar]]:
+            """Wrap a coroutine function, timing until the awaited result."""
+            decorators = FlextObservabilityMonitor.MonitoringDecorators
+            function_name = getattr(func, "__name__", "unknown_function")
+            perf_counter_ns = time.perf_counter_ns
+
+            async def wrapper(*args: t.Scalar, **kwargs: t.Scalar) -> t.Scalar:
+                impl = switch.impl
+                if impl is not wrapper:
+                    return await impl(*args, **kwargs)
+                start_ns = perf_counter_ns()
+                try:
+                    result = await func(*args, **kwargs)
+                except Exception as e:
+                    decorators.record_failure(
+                        handles,
+                        bound_monitor,
+                        perf_counter_ns() - start_ns,
+                        function_name,
+                        e,
+                    )
+                    raise
+                decorators.record_completion(
+                    handles, bound_monitor, perf_counter_ns() - start_ns
+                )
+                return result
+
+            switch = decorators.bind_switch(wrapper, func, bound_monitor)
+            return wrapper
+
+        @staticmethod
+        def wrap_generator(
+            func: Callable[..., Generator[t.Scalar, t.Scalar, t.Scalar]],
+            bound_monitor: FlextObservabilityMonitor,
+            handles: FlextObservabilityMonitor.MetricHandles,
+        ) -> Callable[..., Generator[t.Scalar, t.Scalar, t.Scalar]]:
+            """Wrap a generator function, timing first item and exhaustion.
+
+            ``send``/``throw``/``close`` are forwarded to the wrapped
+            generator; a consumer closing the stream early counts as success.
+            """
+            decorators = FlextObservabilityMonitor.MonitoringDecorators
+            function_name = getattr(func, "__name__", "unknown_function")
+            perf_counter_ns = time.perf_counter_ns
+
+            def wrapper(
+                *args: t.Scalar, **kwargs: t.Scalar
+            ) -> Generator[t.Scalar, t.Scalar, t.Scalar]:
+                impl = switch.impl
+                if impl is not wrapper:
+                    return (yield from impl(*args, **kwargs))
+                start_ns = perf_counter_ns()
+                generator = func(*args, **kwargs)
+                step: Callable[..., t.Scalar] = generator.send
+                value: t.Scalar | BaseException = None
+                first_item = True
+                while True:
+                    try:
+                        item = step(value)
+                    except StopIteration as stop:
+                        decorators.record_completion(
+                            handles, bound_monitor, perf_counter_ns() - start_ns
+                        )
+                        # Proxy semantics: the wrapped return value passes through.
+                        return stop.value  # ruff: ignore[return-in-generator]
+                    except Exception as e:
+                        decorators.record_failure(
+                            handles,
+                            bound_monitor,
+                            perf_counter_ns() - start_ns,
+                            function_name,
+                            e,
+                        )
+                        raise
+                    if first_item:
+                        handles.record_first_item(perf_counter_ns() - start_ns)
+                        first_item = False
+                    try:
+                        value = yield item
+                    except GeneratorExit:
+                        generator.close()
+                        decorators.record_completion(
+                            handles, bound_monitor, perf_counter_ns() - start_ns
+                        )
+                        raise
+                    # Everything but close() is thrown into the wrapped generator.
+                    except BaseException as thrown:  # ruff: ignore[blind-except]
+                        step, value = generator.throw, thrown
+                    else:
+                        step = generator.send
+
+            switch = decorators.bind_switch(wrapper, func, bound_monitor)
+            return wrapper
+
+        @staticmethod
+        def wrap_async_generator(
+            func: Callable[..., AsyncGenerator[t.Scalar, t.Scalar]],
+            bound_monitor: FlextObservabilityMonitor,
+            handles: FlextObservabilityMonitor.MetricHandles,
+        ) -> Callable[..., AsyncGenerator[t.Scalar, t.Scalar]]:
+            """Wrap an async generator function, timing first item and exhaustion.
+
+            ``asend``/``athrow``/``aclose`` are forwarded to the wrapped
+            generator; a consumer closing the stream early counts as success.
+            """
+            decorators = FlextObservabilityMonitor.MonitoringDecorators
+            function_name = getattr(func, "__name__", "unknown_function")
+            perf_counter_ns = time.perf_counter_ns
+
+            async def wrapper(
+                *args: t.Scalar, **kwargs: t.Scalar
+            ) -> AsyncGenerator[t.Scalar, t.Scalar]:
+                impl = switch.impl
+                recording = impl is wrapper
+                generator = (func if recording else impl)(*args, **kwargs)
+                start_ns = perf_counter_ns()
+                step: Awaitable[t.Scalar] = generator.asend(None)
+                first_item = recording
+                while True:
+                    try:
+                        item = await step
+                    except StopAsyncIteration:
+                        if recording:
+                            decorators.record_completion(
+                                handles, bound_monitor, perf_counter_ns() - start_ns
+                            )
+                        return
+                    except Exception as e:
+                        if recording:
+                            decorators.record_failure(
+                                handles,
+                                bound_monitor,
+                                perf_counter_ns() - start_ns,
+                                function_name,
+                                e,
+                            )
+                        raise
+                    if first_item:
+                        handles.record_first_item(perf_counter_ns() - start_ns)
+                        first_item = False
+                    try:
+                        sent = yield item
+                    except GeneratorExit:
+                        await generator.aclose()
+                        if recording:
+                            decorators.record_completion(
+                                handles, bound_monitor, perf_counter_ns() - start_ns
+                            )
+                        raise
+                    # Everything but aclose() is thrown into the wrapped generator.
+                    except BaseException as thrown:  # ruff: ignore[blind-except]
+                        step = generator.athrow(thrown)
+                    else:
+                        step = generator.asend(sent)
+
+            switch = decorators.bind_switch(wrapper, func, bound_monitor)
+            return wrapper
+
 
 flext_monitor_function = FlextObservabilityMonitor.flext_monitor_function
 """Module-level alias for FlextObservabilityMonitor.flext_monitor_function."""
@@ -0,0 +1,711 @@
+"""Multiprocess metric aggregation through per-worker shared segments.
+
+Pre-fork servers (gunicorn, uvicorn workers) keep one aggregation store per
+worker, so a scrape answered by one worker only sees that worker's series. In
+multiprocess mode every worker publishes its store into its own memory-mapped
+segment file in a shared directory and the exposition path merges every
+segment into one store.
+
+FLEXT Pattern:
+- Single FlextObservabilityMultiprocess class
+- Nested Record, Segment (single-writer mmap file) and Writer (publisher)
+- Global writer enabled explicitly, restarted in forked children
+
+Key Features:
+- Fixed binary layout: header plus one record per series (key, type, gauge
+  policy, count/sum/min/max/last and histogram buckets)
+- No cross-process locks: each segment has exactly one writer and readers
+  retry copies taken while the header generation counter is odd
+- Counters, histograms and summaries are summed; gauges follow a per-metric
+  merge policy (sum, max, min, latest)
+- Dead workers' segments are renamed: their counters keep contributing to
+  the totals, their gauges are dropped
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import math
+import mmap
+import os
+import struct
+import threading
+import time
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+from typing import ClassVar
+
+from flext_observability import c, p, r, t, u
+from flext_observability.services.aggregation import FlextObservabilityAggregation
+
+
+class FlextObservabilityMultiprocess:
+    """Shared-segment aggregation across worker processes.
+
+    Usage:
+        ```python
+        # gunicorn.conf.py
+        from flext_observability import FlextObservabilityMultiprocess
+
+
+        def post_fork(server, worker):
+            FlextObservabilityMultiprocess.enable("/run/app/metrics")
+
+
+        def child_exit(server, worker):
+            FlextObservabilityMultiprocess.mark_process_dead(
+                worker.pid, "/run/app/metrics"
+            )
+
+
+        # Application: gauges default to the sum over live workers
+        FlextObservabilityMultiprocess.active_writer().set_gauge_policy(
+            "queue_depth", c.Observability.GaugeMergePolicy.MAX
+        )
+        ```
+
+    Nested Classes:
+        Record: One series read back from a segment
+        Segment: Memory-mapped segment written by one process
+        Writer: Periodic publisher of the local store into its segment
+    """
+
+    logger = u.fetch_logger(__name__)
+    _writer_instance: ClassVar[FlextObservabilityMultiprocess.Writer | None] = None
+    _header = struct.Struct("<4sHHIIQQd")
+    _record = struct.Struct("<IHBBH6x")
+    _aggregate = struct.Struct("<q4d")
+    _types: ClassVar[tuple[c.Observability.MetricType, ...]] = tuple(
+        c.Observability.MetricType
+    )
+    _policies: ClassVar[tuple[c.Observability.GaugeMergePolicy, ...]] = tuple(
+        c.Observability.GaugeMergePolicy
+    )
+
+    class Record:
+        """One series as read back from a segment."""
+
+        __slots__ = (
+            "bounds",
+            "buckets",
+            "count",
+            "labels",
+            "last",
+            "max",
+            "metric_type",
+            "min",
+            "name",
+            "policy",
+            "published_at",
+            "sum",
+        )
+
+        def __init__(
+            self,
+            key: tuple[str, t.Observability.LabelSet, tuple[float, ...]],
+            kind: tuple[c.Observability.MetricType, c.Observability.GaugeMergePolicy],
+            aggregate: tuple[int, float, float, float, float],
+            buckets: tuple[int, ...],
+            published_at: float,
+        ) -> None:
+            """Initialize a record from its decoded parts."""
+            self.name, self.labels, self.bounds = key
+            self.metric_type, self.policy = kind
+            self.count, self.sum, self.min, self.max, self.last = aggregate
+            self.buckets = buckets
+            self.published_at = published_at
+
+    class Segment:
+        """Memory-mapped segment written by exactly one process.
+
+        Publishing brackets every write between two increments of the header
+        generation counter, so readers detect (and retry) copies taken while
+        a publish was in progress without any lock shared with the writer.
+        """
+
+        def __init__(
+            self,
+            path: Path,
+            pid: int,
+            size: int = c.Observability.MULTIPROCESS_SEGMENT_SIZE,
+        ) -> None:
+            """Create (or truncate) the segment file and map it."""
+            header = FlextObservabilityMultiprocess._header
+            self.path = path
+            self.pid = pid
+            self._offsets: dict[
+                tuple[str, t.Observability.LabelSet], tuple[int, int, int, int]
+            ] = {}
+            self._generation = 0
+            self._used = header.size
+            with path.open("w+b") as handle:
+                handle.truncate(max(size, header.size))
+                self._map = mmap.mmap(handle.fileno(), 0)
+            self._write_header()
+
+        def publish(
+            self,
+            series: Sequence[FlextObservabilityAggregation.Series],
+            policies: Mapping[str, c.Observability.GaugeMergePolicy],
+        ) -> int:
+            """Write the current state of ``series`` into the segment.
+
+            Args:
+                series: Detached series copies (``Store.capture``)
+                policies: Gauge merge policy per metric name
+
+            Returns:
+                int - Number of series written
+
+            """
+            record = FlextObservabilityMultiprocess._record
+            aggregate = FlextObservabilityMultiprocess._aggregate
+            metric_types = FlextObservabilityMultiprocess._types
+            merge_policies = FlextObservabilityMultiprocess._policies
+            default_policy = c.Observability.GaugeMergePolicy.SUM
+            self._generation += 1
+            self._write_header()
+            for entry in series:
+                location = self._offsets.get((entry.name, entry.labels))
+                if location is None:
+                    location = self._append(entry)
+                start, size, key_length, values_offset = location
+                policy = policies.get(entry.name, default_policy)
+                record.pack_into(
+                    self._map,
+                    start,
+                    size,
+                    key_length,
+                    metric_types.index(entry.metric_type),
+                    merge_policies.index(policy),
+                    len(entry.buckets),
+                )
+                aggregate.pack_into(
+                    self._map,
+                    values_offset,
+                    entry.count,
+                    entry.sum,
+                    entry.min,
+                    entry.max,
+                    entry.last,
+                )
+                if entry.buckets:
+                    struct.pack_into(
+                        f"<{len(entry.buckets)}q",
+                        self._map,
+                        values_offset + aggregate.size,
+                        *entry.buckets,
+                    )
+            self._generation += 1
+            self._write_header()
+            return len(series)
+
+        def close(self) -> None:
+            """Unmap the segment (the file is left for readers)."""
+            self._map.close()
+
+        def _append(
+            self, entry: FlextObservabilityAggregation.Series
+        ) -> tuple[int, int, int, int]:
+            """Reserve the record of a new series at the end of the segment."""
+            record = FlextObservabilityMultiprocess._record
+            aggregate = FlextObservabilityMultiprocess._aggregate
+            key = json.dumps(
+                [entry.name, entry.labels, entry.bounds], separators=(",", ":")
+            ).encode()
+            key_start = self._used + record.size
+            values_offset = key_start + -(-len(key) // 8) * 8
+            end = values_offset + aggregate.size + 8 * len(entry.buckets)
+            if end > len(self._map):
+                self._map.resize(max(end, 2 * len(self._map)))
+            self._map[key_start : key_start + len(key)] = key
+            location = (self._used, end - self._used, len(key), values_offset)
+            self._offsets[entry.name, entry.labels] = location
+            self._used = end
+            return location
+
+        def _write_header(self) -> None:
+            """Write the header with the current generation and used size."""
+            FlextObservabilityMultiprocess._header.pack_into(
+                self._map,
+                0,
+                c.Observability.MULTIPROCESS_SEGMENT_MAGIC,
+                c.Observability.MULTIPROCESS_FORMAT_VERSION,
+                0,
+                self.pid,
+                0,
+                self._generation,
+                self._used,
+                time.time(),
+            )
+
+    class Writer:
+        """Periodic publisher of the local store into this process's segment.
+
+        The recording path is untouched: observations keep folding into the
+        in-process store and a daemon thread copies the store into the
+        segment every interval (and once more at exit).
+        """
+
+        def __init__(
+            self,
+            directory: str | Path,
+            *,
+            interval_sec: float = c.Observability.MULTIPROCESS_PUBLISH_INTERVAL_SEC,
+            store: FlextObservabilityAggregation.Store | None = None,
+        ) -> None:
+            """Initialize a stopped writer for the shared ``directory``."""
+            self.directory = Path(directory)
+            self._interval_sec = interval_sec
+            self._store = store
+            self._policies: dict[str, c.Observability.GaugeMergePolicy] = {}
+            self._lock = threading.Lock()
+            self._stopping = threading.Event()
+            self._segment: FlextObservabilityMultiprocess.Segment | None = None
+            self._thread: threading.Thread | None = None
+            self._hooks_installed = False
+
+        @property
+        def path(self) -> Path:
+            """Segment file of the current process."""
+            return FlextObservabilityMultiprocess.segment_path(
+                self.directory, os.getpid()
+            )
+
+        @property
+        def running(self) -> bool:
+            """Whether the publisher thread is active."""
+            return self._thread is not None
+
+        def set_gauge_policy(self, name: str, policy: str) -> p.Result[bool]:
+            """Set how a gauge is merged across workers.
+
+            Args:
+                name: Gauge metric name
+                policy: ``sum`` (default), ``max``, ``min`` or ``latest``
+
+            Returns:
+                r[bool] - Ok if the policy is valid
+
+            """
+            try:
+                self._policies[name] = c.Observability.GaugeMergePolicy(policy)
+            except ValueError as e:
+                return r[bool].fail_op("set gauge merge policy", e)
+            return r[bool].ok(True)
+
+        def publish(self) -> int:
+            """Copy the local store into this process's segment now.
+
+            Returns:
+                int - Number of series written
+
+            """
+            store = self._store or FlextObservabilityAggregation.active_store()
+            series = store.capture()
+            with self._lock:
+                segment = self._segment
+                if segment is None or segment.pid != os.getpid():
+                    segment = self._open()
+                return segment.publish(series, self._policies)
+
+        def start(self) -> p.Result[bool]:
+            """Create the segment and start publishing in the background.
+
+            Returns:
+                r[bool] - Ok once publishing (also when already running)
+
+            """
+            with self._lock:
+                if self._thread is not None:
+                    return r[bool].ok(True)
+                try:
+                    if self._segment is None or self._segment.pid != os.getpid():
+                        _ = self._open()
+                except OSError as e:
+                    return r[bool].fail_op("start multiprocess writer", e)
+                self._stopping.clear()
+                self._thread = threading.Thread(
+                    target=self._run, name="flext-multiprocess-writer", daemon=True
+                )
+                self._thread.start()
+                if not self._hooks_installed:
+                    self._hooks_installed = True
+                    atexit.register(self.stop)
+                    os.register_at_fork(after_in_child=self._after_fork)
+            return r[bool].ok(True)
+
+        def stop(self, timeout_sec: float = 5.0) -> None:
+            """Stop the publisher thread after a final publish."""
+            with self._lock:
+                thread, self._thread = self._thread, None
+            if thread is None:
+                return
+            self._stopping.set()
+            thread.join(timeout_sec)
+            try:
+                _ = self.publish()
+            except c.EXC_BASIC_TYPE as e:
+                FlextObservabilityMultiprocess.logger.warning(
+                    f"Final multiprocess publish failed: {e}"
+                )
+
+        def _open(self) -> FlextObservabilityMultiprocess.Segment:
+            """Open this process's segment (caller holds the lock).
+
+            A leftover segment of an earlier process with the same pid is
+            retired first so its counters are kept rather than truncated.
+            """
+            self.directory.mkdir(parents=True, exist_ok=True)
+            pid = os.getpid()
+            _ = FlextObservabilityMultiprocess.mark_process_dead(pid, self.directory)
+            segment = FlextObservabilityMultiprocess.Segment(self.path, pid)
+            self._segment = segment
+            return segment
+
+        def _run(self) -> None:
+            """Publisher loop."""
+            while not self._stopping.wait(self._interval_sec):
+                try:
+                    _ = self.publish()
+                except c.EXC_BASIC_TYPE as e:
+                    FlextObservabilityMultiprocess.logger.warning(
+                        f"Multiprocess publish failed: {e}"
+                    )
+
+        def _after_fork(self) -> None:
+            """Give a forked child its own segment and publisher thread.
+
+            The child inherits a copy of the parent's store, whose values the
+            parent keeps publishing in its own segment. The copy is cleared
+            (series, buffers and recorder shards) so the child's segment
+            holds only what the child records and merged totals do not count
+            pre-fork observations twice.
+            """
+            was_running = self._thread is not None
+            self._lock = threading.Lock()
+            self._stopping = threading.Event()
+            self._segment = None
+            self._thread = None
+            (self._store or FlextObservabilityAggregation.active_store()).clear()
+            if was_running:
+                _ = self.start()
+
+    @staticmethod
+    def segment_path(directory: Path, pid: int) -> Path:
+        """Return the live segment file of ``pid`` in ``directory``."""
+        return directory / (
+            f"{c.Observability.MULTIPROCESS_LIVE_PREFIX}{pid}"
+            f"{c.Observability.MULTIPROCESS_SEGMENT_SUFFIX}"
+        )
+
+    @staticmethod
+    def read_segment(
+        path: Path,
+    ) -> Sequence[FlextObservabilityMultiprocess.Record] | None:
+        """Read a consistent copy of one segment.
+
+        Args:
+            path: Segment file
+
+        Returns:
+            Sequence[Record] | None - Records, or None when the file is gone,
+            invalid or stayed mid-publish for every retry
+
+        """
+        header = FlextObservabilityMultiprocess._header
+        for _ in range(c.Observability.MULTIPROCESS_READ_RETRIES):
+            try:
+                data = path.read_bytes()
+                with path.open("rb") as handle:
+                    current = handle.read(header.size)
+            except OSError:
+                return None
+            if len(data) < header.size or len(current) < header.size:
+                return None
+            magic, version, _, _, _, generation, used, published_at = (
+                header.unpack_from(data)
+            )
+            if (
+                magic != c.Observability.MULTIPROCESS_SEGMENT_MAGIC
+                or version != c.Observability.MULTIPROCESS_FORMAT_VERSION
+            ):
+                return None
+            if (
+                generation % 2 == 0
+                and used <= len(data)
+                and header.unpack(current)[5] == generation
+            ):
+                return FlextObservabilityMultiprocess._decode(data, used, published_at)
+            time.sleep(0.001)
+        return None
+
+    @staticmethod
+    def _decode(
+        data: bytes, used: int, published_at: float
+    ) -> Sequence[FlextObservabilityMultiprocess.Record]:
+        """Decode the records of a consistent segment copy."""
+        record = FlextObservabilityMultiprocess._record
+        aggregate = FlextObservabilityMultiprocess._aggregate
+        records: list[FlextObservabilityMultiprocess.Record] = []
+        offset = FlextObservabilityMultiprocess._header.size
+        while offset < used:
+            size, key_length, type_code, policy_code, bucket_count = record.unpack_from(
+                data, offset
+            )
+            if size <= 0:
+                break
+            key_start = offset + record.size
+            name, labels, bounds = json.loads(data[key_start : key_start + key_length])
+            values_offset = key_start + -(-key_length // 8) * 8
+            buckets: tuple[int, ...] = struct.unpack_from(
+                f"<{bucket_count}q", data, values_offset + aggregate.size
+            )
+            records.append(
+                FlextObservabilityMultiprocess.Record(
+                    (name, tuple(tuple(pair) for pair in labels), tuple(bounds)),
+                    (
+                        FlextObservabilityMultiprocess._types[type_code],
+                        FlextObservabilityMultiprocess._policies[policy_code],
+                    ),
+                    aggregate.unpack_from(data, values_offset),
+                    buckets,
+                    published_at,
+                )
+            )
+            offset += size
+        return records
+
+    @staticmethod
+    def merge(
+        directory: str | Path, bounds: tuple[float, ...] | None = None
+    ) -> FlextObservabilityAggregation.Store:
+        """Merge every segment in ``directory`` into a new store.
+
+        Args:
+            directory: Shared segment directory
+            bounds: Histogram bucket bounds of the workers (None = default)
+
+        Returns:
+            Store - Merged series, ready for ``render_prometheus``
+
+        Behavior:
+            - Counters, histograms and summaries are summed over live and
+              dead workers
+            - Gauges of live workers are combined by their merge policy;
+              gauges of dead workers are dropped
+            - Records of a name already merged with another type are skipped
+
+        """
+        multiprocess = FlextObservabilityMultiprocess
+        store = FlextObservabilityAggregation.Store(bounds)
+        gauges: dict[
+            tuple[str, t.Observability.LabelSet],
+            list[FlextObservabilityMultiprocess.Record],
+        ] = {}
+        live_prefix = c.Observability.MULTIPROCESS_LIVE_PREFIX
+        for path in sorted(
+            Path(directory).glob(f"*{c.Observability.MULTIPROCESS_SEGMENT_SUFFIX}")
+        ):
+            live = path.name.startswith(live_prefix)
+            for record in multiprocess.read_segment(path) or ():
+                if record.metric_type == c.Observability.MetricType.GAUGE:
+                    if live and record.count:
+                        gauges.setdefault((record.name, record.labels), []).append(
+                            record
+                        )
+                    continue
+                resolved = store.handle(
+                    record.name, record.metric_type, dict(record.labels)
+                )
+                if resolved.failure:
+                    continue
+                series = resolved.value
+                with store.lock:
+                    series.merge(
+                        count=record.count,
+                        total=record.sum,
+                        minimum=record.min,
+                        maximum=record.max,
+                        last=record.last,
+                        buckets=record.buckets
+                        if record.bounds == series.bounds
+                        else None,
+                    )
+        for (name, labels), records in gauges.items():
+            resolved = store.handle(
+                name, c.Observability.MetricType.GAUGE, dict(labels)
+            )
+            if resolved.failure:
+                continue
+            series = resolved.value
+            with store.lock:
+                series.merge(
+                    count=sum(record.count for record in records),
+                    total=math.fsum(record.sum for record in records),
+                    minimum=min(record.min for record in records),
+                    maximum=max(record.max for record in records),
+                    last=multiprocess.merge_gauge(records),
+                )
+        return store
+
+    @staticmethod
+    def merge_gauge(records: Sequence[FlextObservabilityMultiprocess.Record]) -> float:
+        """Combine the current value of one gauge across workers.
+
+        The policy of the most recently published worker wins; ``latest``
+        takes that worker's value.
+        """
+        latest = max(records, key=lambda record: record.published_at)
+        values = [record.last for record in records]
+        policy = latest.policy
+        if policy == c.Observability.GaugeMergePolicy.MAX:
+            return max(values)
+        if policy == c.Observability.GaugeMergePolicy.MIN:
+            return min(values)
+        if policy == c.Observability.GaugeMergePolicy.LATEST:
+            return latest.last
+        return math.fsum(values)
+
+    @staticmethod
+    def mark_process_dead(
+        pid: int, directory: str | Path | None = None
+    ) -> p.Result[bool]:
+        """Retire the segment of an exited worker.
+
+        The segment is renamed (a single atomic step), so its counters keep
+        contributing to the merged totals while its gauges are dropped.
+
+        Args:
+            pid: Exited worker process id
+            directory: Shared segment directory (None = configured directory)
+
+        Returns:
+            r[bool] - True if a live segment was retired
+
+        """
+        root = FlextObservabilityMultiprocess.resolve_directory(directory)
+        if root is None:
+            return r[bool].fail_op(
+                "mark process dead", "Multiprocess directory not configured"
+            )
+        source = FlextObservabilityMultiprocess.segment_path(root, pid)
+        target = root / (
+            f"{c.Observability.MULTIPROCESS_DEAD_PREFIX}{pid}-{time.time_ns()}"
+            f"{c.Observability.MULTIPROCESS_SEGMENT_SUFFIX}"
+        )
+        try:
+            _ = source.replace(target)
+        except FileNotFoundError:
+            return r[bool].ok(False)
+        except OSError as e:
+            return r[bool].fail_op("mark process dead", e)
+        return r[bool].ok(True)
+
+    @staticmethod
+    def sweep_dead_workers(directory: str | Path) -> int:
+        """Retire live segments whose process no longer exists.
+
+        Returns:
+            int - Number of segments retired
+
+        """
+        prefix = c.Observability.MULTIPROCESS_LIVE_PREFIX
+        suffix = c.Observability.MULTIPROCESS_SEGMENT_SUFFIX
+        retired = 0
+        for path in Path(directory).glob(f"{prefix}*{suffix}"):
+            pid_text = path.name.removeprefix(prefix).removesuffix(suffix)
+            if not pid_text.isdigit() or FlextObservabilityMultiprocess.process_alive(
+                int(pid_text)
+            ):
+                continue
+            if FlextObservabilityMultiprocess.mark_process_dead(
+                int(pid_text), directory
+            ).value:
+                retired += 1
+        return retired
+
+    @staticmethod
+    def process_alive(pid: int) -> bool:
+        """Return whether a process with ``pid`` exists."""
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            return True
+        return True
+
+    @staticmethod
+    def resolve_directory(directory: str | Path | None = None) -> Path | None:
+        """Return ``directory``, else the active writer's, else the configured one."""
+        if directory is not None:
+            return Path(directory)
+        writer = FlextObservabilityMultiprocess._writer_instance
+        if writer is not None:
+            return writer.directory
+        from flext_observability import settings
+
+        configured = settings.Observability.multiprocess_dir
+        return Path(configured) if configured else None
+
+    @staticmethod
+    def enable(
+        directory: str | Path | None = None,
+        *,
+        interval_sec: float = c.Observability.MULTIPROCESS_PUBLISH_INTERVAL_SEC,
+    ) -> p.Result[FlextObservabilityMultiprocess.Writer]:
+        """Enable multiprocess mode for the current process.
+
+        Args:
+            directory: Shared segment directory (None = ``multiprocess_dir``
+                setting)
+            interval_sec: Publish interval of the local store
+
+        Returns:
+            r[Writer] - Started global writer
+
+        """
+        root = FlextObservabilityMultiprocess.resolve_directory(directory)
+        if root is None:
+            return r[FlextObservabilityMultiprocess.Writer].fail_op(
+                "enable multiprocess mode", "Multiprocess directory not configured"
+            )
+        writer = FlextObservabilityMultiprocess._writer_instance
+        if writer is None or writer.directory != root:
+            if writer is not None:
+                writer.stop()
+            writer = FlextObservabilityMultiprocess.Writer(
+                root, interval_sec=interval_sec
+            )
+            FlextObservabilityMultiprocess._writer_instance = writer
+        result = writer.start()
+        if result.failure:
+            return r[FlextObservabilityMultiprocess.Writer].fail_op(
+                "enable multiprocess mode", result.error or "Writer failed to start"
+            )
+        return r[FlextObservabilityMultiprocess.Writer].ok(writer)
+
+    @staticmethod
+    def active_writer() -> FlextObservabilityMultiprocess.Writer | None:
+        """Return the global writer, or None when multiprocess mode is off."""
+        return FlextObservabilityMultiprocess._writer_instance
+
+    @staticmethod
+    def exposition_store() -> FlextObservabilityAggregation.Store:
+        """Return the store a scrape should render.
+
+        In multiprocess mode the local store is published first and every
+        worker segment is merged; otherwise the global store is returned.
+        """
+        writer = FlextObservabilityMultiprocess._writer_instance
+        store = FlextObservabilityAggregation.active_store()
+        if writer is None or not writer.running:
+            return store
+        _ = writer.publish()
+        _ = FlextObservabilityMultiprocess.sweep_dead_workers(writer.directory)
+        return FlextObservabilityMultiprocess.merge(writer.directory, store.bounds)
+
+
+__all__: list[str] = ["FlextObservabilityMultiprocess"]
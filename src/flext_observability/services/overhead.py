@@ -0,0 +1,464 @@
+"""Self-accounting of the time spent inside observability hot paths.
+
+An opt-in mode that measures what the package itself costs: every hot path
+(HTTP hooks, context propagation, context logging, sampling, metric
+recording) is timed with ``perf_counter_ns`` at entry and exit into
+per-thread counters, and the time spent in observability is reported as a
+share of the request time seen by the HTTP middlewares.
+
+FLEXT Pattern:
+- Single FlextObservabilityOverhead class
+- Nested per-thread Counters registered once per thread
+- Package hot paths rebound by ``configure`` (``instrument``) or bound
+  through a kill switch's accounted implementation
+
+Key Features:
+- Disabled by default: a disabled hot path runs its original function with
+  no wrapper (the setting is read on the first measured call, not at import)
+- Lock-free recording (each thread only writes its own counters)
+- Counters of finished threads folded into a retired total
+- Nested hot paths count once towards the observability total
+- Exported as ordinary metrics with a ratio gauge to alert on (2% budget)
+"""
+
+from __future__ import annotations
+
+import functools
+import threading
+import time
+import weakref
+from collections.abc import Callable, Sequence
+from typing import ClassVar
+
+from flext_observability import c, p, r, t, u
+from flext_observability.services.aggregation import FlextObservabilityAggregation
+from flext_observability.services.switches import FlextObservabilitySwitches
+
+
+class FlextObservabilityOverhead:
+    """Observer cost accounting for the package hot paths.
+
+    Usage:
+        ```python
+        from flext_observability import FlextObservabilityOverhead
+
+        # Opt in (or FLEXT_OBSERVABILITY_OBSERVABILITY__OVERHEAD_ACCOUNTING=1)
+        FlextObservabilityOverhead.configure(enabled=True)
+
+        # Per-path totals and the share of request time
+        report = FlextObservabilityOverhead.report()
+        report["ratio"]  # e.g. 0.004 -> 0.4% of request time
+
+        # Publish as metrics (flext_observability_overhead_ratio, ...)
+        FlextObservabilityOverhead.export()
+        ```
+
+    Nested Classes:
+        Counters: Per-thread accumulated time and call counts
+    """
+
+    logger = u.fetch_logger(__name__)
+    enabled: ClassVar[bool | None] = None
+    _local: ClassVar[threading.local] = threading.local()
+    _counters: ClassVar[list[FlextObservabilityOverhead.Counters]] = []
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+    _exported: ClassVar[dict[str, tuple[int, int]]] = {}
+    _exported_totals: ClassVar[tuple[int, int]] = (0, 0)
+    _instrumented: ClassVar[list[tuple[type, str, object, object]]] = []
+
+    class Counters:
+        """Accumulated hot-path time of one thread (written by that thread)."""
+
+        __slots__ = ("depth", "paths", "request_ns", "requests", "self_ns", "thread")
+
+        def __init__(self, thread: threading.Thread | None = None) -> None:
+            """Initialize empty counters owned by ``thread`` (None = retired)."""
+            self.depth = 0
+            self.paths: dict[str, list[int]] = {}
+            self.self_ns = 0
+            self.request_ns = 0
+            self.requests = 0
+            self.thread = None if thread is None else weakref.ref(thread)
+
+        @property
+        def alive(self) -> bool:
+            """Whether the owning thread can still write these counters."""
+            thread = None if self.thread is None else self.thread()
+            return thread is not None and thread.is_alive()
+
+        def add(self, path: str, elapsed_ns: int) -> None:
+            """Add one measured call (outermost calls also count as self time)."""
+            totals = self.paths.get(path)
+            if totals is None:
+                totals = self.paths[path] = [0, 0]
+            totals[0] += 1
+            totals[1] += elapsed_ns
+            if self.depth == 0:
+                self.self_ns += elapsed_ns
+
+        def fold(self, other: FlextObservabilityOverhead.Counters) -> None:
+            """Add the totals of ``other`` (no longer written) to these."""
+            for path, (calls, elapsed_ns) in other.paths.items():
+                totals = self.paths.setdefault(path, [0, 0])
+                totals[0] += calls
+                totals[1] += elapsed_ns
+            self.self_ns += other.self_ns
+            self.request_ns += other.request_ns
+            self.requests += other.requests
+
+    _retired: ClassVar[FlextObservabilityOverhead.Counters] = Counters()
+
+    @staticmethod
+    def thread_counters() -> FlextObservabilityOverhead.Counters:
+        """Return the calling thread's counters, registering them on first use.
+
+        Registering also retires the counters of finished threads, so
+        thread-per-request servers keep one entry per live thread.
+        """
+        local = FlextObservabilityOverhead._local
+        counters: FlextObservabilityOverhead.Counters | None = getattr(
+            local, "counters", None
+        )
+        if counters is None:
+            counters = FlextObservabilityOverhead.Counters(threading.current_thread())
+            local.counters = counters
+            with FlextObservabilityOverhead._lock:
+                FlextObservabilityOverhead._retire_finished()
+                FlextObservabilityOverhead._counters.append(counters)
+        return counters
+
+    @staticmethod
+    def measure[**P, R](path: str) -> Callable[[Callable[P, R]], Callable[P, R]]:
+        """Decorate a synchronous hot path so its time is accounted to ``path``.
+
+        Args:
+            path: Hot path name (e.g. ``"context.from_headers"``)
+
+        Returns:
+            Decorator timing each call while accounting is enabled
+
+        Behavior:
+            - Disabled: the call is forwarded after one attribute check; use
+              ``instrument`` or a switch's accounted implementation where
+              even that wrapper frame matters
+            - Time is inclusive; nested measured calls count once in the
+              observability total
+
+        """
+
+        def decorate(func: Callable[P, R]) -> Callable[P, R]:
+            perf_counter_ns = time.perf_counter_ns
+            overhead = FlextObservabilityOverhead
+
+            @functools.wraps(func)
+            def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+                enabled = overhead.enabled
+                if enabled is None:
+                    enabled = overhead.configure().map_or(False)
+                if not enabled:
+                    return func(*args, **kwargs)
+                counters = overhead.thread_counters()
+                counters.depth += 1
+                start_ns = perf_counter_ns()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    elapsed_ns = perf_counter_ns() - start_ns
+                    counters.depth -= 1
+                    counters.add(path, elapsed_ns)
+
+            return wrapper
+
+        return decorate
+
+    @staticmethod
+    def instrument(owner: type, name: str, path: str) -> None:
+        """Account calls of a class attribute to ``path`` while enabled.
+
+        Args:
+            owner: Class defining the hot path
+            name: Function, staticmethod or classmethod attribute name
+            path: Hot path name (e.g. ``"context.from_headers"``)
+
+        Behavior:
+            - ``configure`` rebinds the attribute: the ``measure`` wrapper
+              while enabled, the original function while disabled
+            - Until the setting is resolved the wrapper is bound, so the
+              first call reads it
+
+        """
+        original = owner.__dict__[name]
+        measure = FlextObservabilityOverhead.measure(path)
+        timed: object
+        if isinstance(original, staticmethod):
+            timed = staticmethod(measure(original.__func__))
+        elif isinstance(original, classmethod):
+            timed = classmethod(measure(original.__func__))
+        else:
+            timed = measure(original)
+        with FlextObservabilityOverhead._lock:
+            FlextObservabilityOverhead._instrumented.append((
+                owner,
+                name,
+                original,
+                timed,
+            ))
+        disabled = FlextObservabilityOverhead.enabled is False
+        setattr(owner, name, original if disabled else timed)
+
+    @staticmethod
+    def request_started() -> int:
+        """Return the request start mark (0 while accounting is disabled)."""
+        enabled = FlextObservabilityOverhead.enabled
+        if enabled is None:
+            enabled = FlextObservabilityOverhead.configure().map_or(False)
+        if not enabled:
+            return 0
+        return time.perf_counter_ns()
+
+    @staticmethod
+    def request_finished(start_ns: int) -> None:
+        """Account one request's wall time from its ``request_started`` mark.
+
+        HTTP middlewares take the mark before their first hook and finish it
+        after their last one, so the observability time of the request falls
+        inside the accounted request time.
+        """
+        if not start_ns:
+            return
+        counters = FlextObservabilityOverhead.thread_counters()
+        counters.requests += 1
+        counters.request_ns += time.perf_counter_ns() - start_ns
+
+    @staticmethod
+    def configure(*, enabled: bool | None = None) -> p.Result[bool]:
+        """Turn accounting on or off.
+
+        Args:
+            enabled: New state (None = ``overhead_accounting`` setting)
+
+        Returns:
+            r[bool] - Ok with the applied state
+
+        Behavior:
+            - Called lazily from measured hot paths and request hooks, so a
+              settings error is logged and leaves accounting disabled
+              instead of raising into the caller
+
+        """
+        try:
+            state = FlextObservabilityOverhead._resolve_state(enabled=enabled)
+        except c.EXC_BASIC_TYPE as e:
+            FlextObservabilityOverhead.logger.warning(
+                f"Overhead accounting left disabled: {e}"
+            )
+            FlextObservabilityOverhead._apply_state(enabled=False)
+            return r[bool].fail_op("configure overhead accounting", e)
+        FlextObservabilityOverhead._apply_state(enabled=state)
+        return r[bool].ok(state)
+
+    @staticmethod
+    def _resolve_state(*, enabled: bool | None) -> bool:
+        """Resolve the accounting state, falling back to ``settings``."""
+        from flext_observability import settings
+
+        return (
+            settings.Observability.overhead_accounting if enabled is None else enabled
+        )
+
+    @staticmethod
+    def _apply_state(*, enabled: bool) -> None:
+        """Store the state and rebind instrumented paths and switches."""
+        FlextObservabilityOverhead.enabled = enabled
+        with FlextObservabilityOverhead._lock:
+            instrumented = list(FlextObservabilityOverhead._instrumented)
+        for owner, name, original, timed in instrumented:
+            setattr(owner, name, timed if enabled else original)
+        FlextObservabilitySwitches.account(enabled=enabled)
+
+    @staticmethod
+    def reset() -> None:
+        """Zero every thread's counters and the export checkpoints."""
+        with FlextObservabilityOverhead._lock:
+            for counters in FlextObservabilityOverhead._counters:
+                counters.paths = {}
+                counters.self_ns = 0
+                counters.request_ns = 0
+                counters.requests = 0
+            FlextObservabilityOverhead._retired = FlextObservabilityOverhead.Counters()
+            FlextObservabilityOverhead._exported.clear()
+            FlextObservabilityOverhead._exported_totals = (0, 0)
+
+    @staticmethod
+    def _totals() -> tuple[dict[str, list[int]], int, int, int]:
+        """Sum every thread's counters into per-path and global totals."""
+        with FlextObservabilityOverhead._lock:
+            FlextObservabilityOverhead._retire_finished()
+            registered: Sequence[FlextObservabilityOverhead.Counters] = [
+                FlextObservabilityOverhead._retired,
+                *FlextObservabilityOverhead._counters,
+            ]
+        paths: dict[str, list[int]] = {}
+        self_ns = request_ns = requests = 0
+        for counters in registered:
+            for path, (calls, elapsed_ns) in counters.paths.copy().items():
+                totals = paths.setdefault(path, [0, 0])
+                totals[0] += calls
+                totals[1] += elapsed_ns
+            self_ns += counters.self_ns
+            request_ns += counters.request_ns
+            requests += counters.requests
+        return paths, self_ns, request_ns, requests
+
+    @staticmethod
+    def _retire_finished() -> None:
+        """Fold counters of finished threads into the retired total.
+
+        Caller holds the lock. A finished thread no longer writes, so its
+        counters are read safely and dropped once folded.
+        """
+        live: list[FlextObservabilityOverhead.Counters] = []
+        for counters in FlextObservabilityOverhead._counters:
+            if counters.alive:
+                live.append(counters)
+            else:
+                FlextObservabilityOverhead._retired.fold(counters)
+        FlextObservabilityOverhead._counters[:] = live
+
+    @staticmethod
+    def report() -> t.JsonDict:
+        """Return cumulative per-path totals and the observability share.
+
+        Returns:
+            dict - ``enabled``, ``paths`` (calls, seconds, mean_us per path),
+            ``observability_seconds``, ``request_seconds``, ``requests`` and
+            ``ratio`` (observability time / request time, 0.0 without requests)
+
+        """
+        paths, self_ns, request_ns, requests = FlextObservabilityOverhead._totals()
+        return {
+            "enabled": bool(FlextObservabilityOverhead.enabled),
+            "paths": {
+                path: {
+                    "calls": calls,
+                    "seconds": elapsed_ns / 1e9,
+                    "mean_us": elapsed_ns / calls / 1e3 if calls else 0.0,
+                }
+                for path, (calls, elapsed_ns) in sorted(paths.items())
+            },
+            "observability_seconds": self_ns / 1e9,
+            "request_seconds": request_ns / 1e9,
+            "requests": requests,
+            "ratio": self_ns / request_ns if request_ns else 0.0,
+        }
+
+    @staticmethod
+    def export(
+        store: FlextObservabilityAggregation.Store | None = None,
+        *,
+        budget_ratio: float = c.Observability.OVERHEAD_BUDGET_RATIO,
+    ) -> p.Result[float]:
+        """Publish the accounting as metrics and check the overhead budget.
+
+        Args:
+            store: Target store (None = global aggregation store)
+            budget_ratio: Share of request time above which the budget gauge
+                is raised and a warning logged
+
+        Returns:
+            r[float] - Observability share of request time since the previous
+            export (0.0 when no request was served in between)
+
+        Behavior:
+            - ``flext_observability_overhead_seconds_total{path}`` and
+              ``flext_observability_overhead_calls_total{path}`` counters
+            - ``flext_observability_self_seconds_total`` and
+              ``flext_observability_request_seconds_total`` counters
+            - ``flext_observability_overhead_ratio`` and
+              ``flext_observability_overhead_budget_exceeded`` gauges
+
+        """
+        try:
+            target = store or FlextObservabilityAggregation.active_store()
+            paths, self_ns, request_ns, _ = FlextObservabilityOverhead._totals()
+            self_delta, request_delta = FlextObservabilityOverhead._export_deltas(
+                target, paths, self_ns, request_ns
+            )
+            ratio = FlextObservabilityOverhead._export_share(
+                target, self_delta, request_delta, budget_ratio
+            )
+        except c.EXC_BASIC_TYPE as e:
+            return r[float].fail_op("export observability overhead", e)
+        return r[float].ok(ratio)
+
+    @staticmethod
+    def _export_deltas(
+        target: FlextObservabilityAggregation.Store,
+        paths: dict[str, list[int]],
+        self_ns: int,
+        request_ns: int,
+    ) -> tuple[int, int]:
+        """Record per-path counters since the previous export.
+
+        Returns:
+            tuple[int, int] - Observability and request nanoseconds since the
+            previous export
+
+        """
+        counter = c.Observability.MetricType.COUNTER
+        exported = FlextObservabilityOverhead._exported
+        with FlextObservabilityOverhead._lock:
+            for path, (calls, elapsed_ns) in paths.items():
+                last_calls, last_ns = exported.get(path, (0, 0))
+                exported[path] = (calls, elapsed_ns)
+                labels = {"path": path}
+                target.record(
+                    "flext_observability_overhead_seconds_total",
+                    (elapsed_ns - last_ns) / 1e9,
+                    counter,
+                    labels,
+                )
+                target.record(
+                    "flext_observability_overhead_calls_total",
+                    float(calls - last_calls),
+                    counter,
+                    labels,
+                )
+            last_self_ns, last_request_ns = FlextObservabilityOverhead._exported_totals
+            FlextObservabilityOverhead._exported_totals = (self_ns, request_ns)
+        self_delta = self_ns - last_self_ns
+        request_delta = request_ns - last_request_ns
+        target.record(
+            "flext_observability_self_seconds_total", self_delta / 1e9, counter
+        )
+        target.record(
+            "flext_observability_request_seconds_total", request_delta / 1e9, counter
+        )
+        return self_delta, request_delta
+
+    @staticmethod
+    def _export_share(
+        target: FlextObservabilityAggregation.Store,
+        self_delta: int,
+        request_delta: int,
+        budget_ratio: float,
+    ) -> float:
+        """Record the ratio and budget gauges; warn when over budget."""
+        gauge = c.Observability.MetricType.GAUGE
+        ratio = self_delta / request_delta if request_delta > 0 else 0.0
+        exceeded = ratio > budget_ratio
+        target.record("flext_observability_overhead_ratio", ratio, gauge)
+        target.record(
+            "flext_observability_overhead_budget_exceeded",
+            1.0 if exceeded else 0.0,
+            gauge,
+        )
+        if exceeded:
+            FlextObservabilityOverhead.logger.warning(
+                f"Observability overhead {ratio:.2%} of request time exceeds "
+                f"the {budget_ratio:.2%} budget"
+            )
+        return ratio
+
+
+__all__: list[str] = ["FlextObservabilityOverhead"]
@@ -8,16 +8,19 @@ FLEXT Pattern:
 - Metrics collection for observability operations
 - Memory and CPU tracking
 - Latency monitoring for instrumentation
+- psutil is imported and the process handle created on first resource read
 """
 
 from __future__ import annotations
 
 import time
-
-import psutil
+from typing import TYPE_CHECKING, ClassVar
 
 from flext_observability import c, m, p, r, t, u
 
+if TYPE_CHECKING:
+    import psutil
+
 
 class FlextObservabilityPerformance:
     """Performance monitoring for observability operations.
@@ -47,7 +50,7 @@ class FlextObservabilityPerformance:
     """
 
     logger = u.fetch_logger(__name__)
-    _process: psutil.Process = psutil.Process()
+    _process_instance: ClassVar[psutil.Process | None] = None
 
     class Monitor:
         """Individual operation performance monitor."""
@@ -108,7 +111,7 @@ class FlextObservabilityPerformance:
         def _cpu_percent(self) -> float:
             """Get current CPU usage percent."""
             try:
-                cpu: float = FlextObservabilityPerformance._process.cpu_percent(
+                cpu: float = FlextObservabilityPerformance.process().cpu_percent(
                     interval=0.01
                 )
             except c.EXC_MAPPING_TYPE:
@@ -119,13 +122,22 @@ class FlextObservabilityPerformance:
         def _memory_usage(self) -> float:
             """Get current memory usage in MB."""
             try:
-                memory_info = FlextObservabilityPerformance._process.memory_info()
+                memory_info = FlextObservabilityPerformance.process().memory_info()
                 rss_bytes: int = memory_info.rss
             except c.EXC_MAPPING_TYPE:
                 return 0.0
             else:
                 return float(rss_bytes) / 1024 / 1024
 
+    @staticmethod
+    def process() -> psutil.Process:
+        """Return the handle of the current process (created on first use)."""
+        if FlextObservabilityPerformance._process_instance is None:
+            import psutil
+
+            FlextObservabilityPerformance._process_instance = psutil.Process()
+        return FlextObservabilityPerformance._process_instance
+
     @staticmethod
     def fetch_system_resources() -> t.MappingKV[str, float]:
         """Fetch current system resource usage.
@@ -138,13 +150,14 @@ class FlextObservabilityPerformance:
 
         """
         try:
-            memory_info = FlextObservabilityPerformance._process.memory_info()
+            process = FlextObservabilityPerformance.process()
+            memory_info = process.memory_info()
             rss_bytes: int = memory_info.rss
             memory_mb: float = float(rss_bytes) / 1024 / 1024
             return {
                 "memory_mb": memory_mb,
-                "memory_percent": FlextObservabilityPerformance._process.memory_percent(),
-                "cpu_percent": FlextObservabilityPerformance._process.cpu_percent(),
+                "memory_percent": process.memory_percent(),
+                "cpu_percent": process.cpu_percent(),
             }
         except c.EXC_MAPPING_TYPE:
             return {"memory_mb": 0.0, "memory_percent": 0.0, "cpu_percent": 0.0}
@@ -0,0 +1,339 @@
+"""Continuous statistical profiler tagged with the trace context.
+
+A background thread samples every thread's stack through
+``sys._current_frames()`` at a fixed rate (100 Hz by default), tags each
+sample with the trace and span the sampled thread is working on and counts
+the folded stacks in a bounded table. The table renders flamegraph input
+(Brendan Gregg's folded format) for the whole process or a single trace, and
+the hottest frames of a span, so a slow trace can be broken down to code.
+
+FLEXT Pattern:
+- Single FlextObservabilityProfiler class
+- Nested Table (bounded folded-stack counts) and Profiler (sampling thread)
+- Thread-safe global profiler started on demand
+
+Key Features:
+- No tracing hooks: the profiled threads run unmodified between samples
+- Trace/span tags published per thread by FlextObservabilityContext
+- Bounded memory: past the limit span tags are shed before samples are
+  dropped (and counted)
+- Folded-stack output for flamegraph.pl, speedscope or inferno
+"""
+
+from __future__ import annotations
+
+import heapq
+import operator
+import sys
+import threading
+import time
+from pathlib import Path
+from types import CodeType, FrameType
+from typing import ClassVar
+
+from flext_observability import c, p, r, t, u
+from flext_observability.services.aggregation import FlextObservabilityAggregation
+from flext_observability.services.context import FlextObservabilityContext
+
+
+class FlextObservabilityProfiler:
+    """Sampling profiler integrated with the trace context.
+
+    Usage:
+        ```python
+        from flext_observability import FlextObservabilityProfiler
+
+        profiler = FlextObservabilityProfiler.active_profiler()
+        profiler.start()
+
+        # Flamegraph input for the process, or for one slow trace
+        profiler.write_folded("profile.folded")
+        folded = profiler.table.folded(trace_id=slow_trace_id)
+
+        # Where one span spent its samples
+        profiler.table.hot_frames(span_id)
+        ```
+
+    Nested Classes:
+        Table: Bounded counts of (trace, span, folded stack)
+        Profiler: Background sampling thread
+    """
+
+    logger = u.fetch_logger(__name__)
+    _profiler_instance: ClassVar[FlextObservabilityProfiler.Profiler | None] = None
+
+    class Table:
+        """Bounded folded-stack sample counts keyed by trace and span."""
+
+        def __init__(
+            self, max_stacks: int = c.Observability.PROFILER_MAX_STACKS
+        ) -> None:
+            """Initialize an empty table holding at most ``max_stacks`` keys."""
+            self.max_stacks = max_stacks
+            self.samples = 0
+            self.dropped = 0
+            self._counts: dict[tuple[str, str, str], int] = {}
+            self._lock = threading.Lock()
+
+        @property
+        def size(self) -> int:
+            """Number of distinct (trace, span, stack) keys held."""
+            return len(self._counts)
+
+        def add(self, trace_id: str, span_id: str, stack: str) -> None:
+            """Count one sample.
+
+            A new key past ``max_stacks`` is folded into the untagged entry
+            of the same stack; only when that entry is new too is the sample
+            dropped.
+            """
+            key = (trace_id, span_id, stack)
+            with self._lock:
+                self.samples += 1
+                count = self._counts.get(key)
+                if count is None and len(self._counts) >= self.max_stacks:
+                    key = ("", "", stack)
+                    count = self._counts.get(key)
+                    if count is None:
+                        self.dropped += 1
+                        return
+                self._counts[key] = (count or 0) + 1
+
+        def clear(self) -> None:
+            """Drop every count."""
+            with self._lock:
+                self._counts.clear()
+                self.samples = 0
+                self.dropped = 0
+
+        def stacks(
+            self, *, trace_id: str | None = None, span_id: str | None = None
+        ) -> dict[str, int]:
+            """Return sample counts per folded stack, optionally filtered.
+
+            Args:
+                trace_id: Only samples taken inside this trace
+                span_id: Only samples taken inside this span
+
+            Returns:
+                dict - Folded stack to sample count
+
+            """
+            with self._lock:
+                entries = list(self._counts.items())
+            stacks: dict[str, int] = {}
+            for (sample_trace, sample_span, stack), count in entries:
+                if trace_id is not None and sample_trace != trace_id:
+                    continue
+                if span_id is not None and sample_span != span_id:
+                    continue
+                stacks[stack] = stacks.get(stack, 0) + count
+            return stacks
+
+        def folded(
+            self, *, trace_id: str | None = None, span_id: str | None = None
+        ) -> str:
+            """Render flamegraph input: one ``frame;frame;frame count`` line each."""
+            stacks = self.stacks(trace_id=trace_id, span_id=span_id)
+            return "".join(
+                f"{stack} {count}\n" for stack, count in sorted(stacks.items())
+            )
+
+        def hot_frames(
+            self, span_id: str, limit: int = c.Observability.PROFILER_HOT_FRAMES
+        ) -> list[t.JsonDict]:
+            """Return the frames a span was sampled executing, busiest first.
+
+            Args:
+                span_id: Span whose samples are ranked
+                limit: Maximum number of frames
+
+            Returns:
+                list - ``{frame, samples, share}`` where ``share`` is the
+                fraction of the span's samples spent in that leaf frame
+
+            """
+            leaves: dict[str, int] = {}
+            for stack, count in self.stacks(span_id=span_id).items():
+                leaf = stack.rpartition(";")[2]
+                leaves[leaf] = leaves.get(leaf, 0) + count
+            total = sum(leaves.values())
+            return [
+                {"frame": frame, "samples": count, "share": count / total}
+                for frame, count in heapq.nlargest(
+                    limit, leaves.items(), key=operator.itemgetter(1)
+                )
+            ]
+
+    class Profiler:
+        """Background thread sampling every thread's stack."""
+
+        def __init__(
+            self,
+            *,
+            hz: float = c.Observability.PROFILER_SAMPLE_HZ,
+            max_stacks: int = c.Observability.PROFILER_MAX_STACKS,
+            max_depth: int = c.Observability.PROFILER_MAX_DEPTH,
+        ) -> None:
+            """Initialize a stopped profiler sampling ``hz`` times a second."""
+            self.hz = hz
+            self.max_depth = max_depth
+            self.table = FlextObservabilityProfiler.Table(max_stacks)
+            self._labels: dict[CodeType, str] = {}
+            self._lock = threading.Lock()
+            self._stopping = threading.Event()
+            self._thread: threading.Thread | None = None
+            store = FlextObservabilityAggregation.active_store()
+            self._sample_seconds = store.handle(
+                "flext_profiler_sample_seconds", c.Observability.MetricType.HISTOGRAM
+            ).unwrap()
+            self._store_lock = store.lock
+
+        @property
+        def running(self) -> bool:
+            """Whether the sampling thread is running."""
+            return self._thread is not None
+
+        def start(self) -> p.Result[bool]:
+            """Start sampling on a daemon thread.
+
+            Returns:
+                r[bool] - Ok once sampling (also when already running)
+
+            """
+            if self.hz <= 0:
+                return r[bool].fail(f"Sampling rate must be positive: {self.hz}")
+            with self._lock:
+                if self._thread is not None:
+                    return r[bool].ok(True)
+                FlextObservabilityContext.track_thread_spans(enabled=True)
+                self._stopping.clear()
+                self._thread = threading.Thread(
+                    target=self._run, name="flext-profiler", daemon=True
+                )
+                self._thread.start()
+            FlextObservabilityProfiler.logger.info(
+                f"Sampling profiler started at {self.hz:g} Hz"
+            )
+            return r[bool].ok(True)
+
+        def stop(self, timeout_sec: float = 5.0) -> None:
+            """Stop sampling; the collected table is kept."""
+            with self._lock:
+                thread = self._thread
+                if thread is None:
+                    return
+                self._stopping.set()
+                thread.join(timeout_sec)
+                self._thread = None
+                FlextObservabilityContext.track_thread_spans(enabled=False)
+
+        def sample_once(self) -> int:
+            """Take one sample of every other thread's stack.
+
+            Returns:
+                int - Number of threads sampled
+
+            """
+            start_ns = time.perf_counter_ns()
+            # The documented way to read other threads' stacks from Python.
+            frames = sys._current_frames()  # ruff: ignore[private-member-access]
+            own = threading.get_ident()
+            spans = FlextObservabilityContext.thread_spans or {}
+            sampled = 0
+            for ident, frame in frames.items():
+                if ident == own:
+                    continue
+                trace_id, span_id = spans.get(ident, ("", ""))
+                self.table.add(trace_id, span_id, self._fold(frame))
+                sampled += 1
+            # Request threads add and drop entries concurrently: iterate a
+            # list() snapshot (copied atomically), never a live keys view.
+            for ident in list(spans):
+                if ident not in frames:
+                    _ = spans.pop(ident, None)
+            elapsed_sec = (time.perf_counter_ns() - start_ns) / 1e9
+            with self._store_lock:
+                self._sample_seconds.observe(elapsed_sec)
+            return sampled
+
+        def write_folded(
+            self, path: str | Path, *, trace_id: str | None = None
+        ) -> p.Result[Path]:
+            """Write flamegraph input for the process (or one trace) to ``path``.
+
+            Returns:
+                r[Path] - Written file
+
+            """
+            target = Path(path)
+            try:
+                _ = target.write_text(
+                    self.table.folded(trace_id=trace_id), encoding="utf-8"
+                )
+            except OSError as e:
+                return r[Path].fail_op("write folded stacks", e)
+            return r[Path].ok(target)
+
+        def _fold(self, frame: FrameType) -> str:
+            """Fold a stack into ``root;...;leaf`` frame labels."""
+            labels: list[str] = []
+            current: FrameType | None = frame
+            while current is not None and len(labels) < self.max_depth:
+                labels.append(self._label(current))
+                current = current.f_back
+            labels.reverse()
+            return ";".join(labels)
+
+        def _label(self, frame: FrameType) -> str:
+            """Return the cached ``module:qualname`` label of a frame's code."""
+            code = frame.f_code
+            label = self._labels.get(code)
+            if label is None:
+                module = frame.f_globals.get("__name__", "?")
+                label = f"{module}:{code.co_qualname}".replace(";", ":")
+                self._labels[code] = label
+            return label
+
+        def _run(self) -> None:
+            """Sample until stopped."""
+            interval_sec = 1.0 / self.hz
+            while not self._stopping.wait(interval_sec):
+                try:
+                    _ = self.sample_once()
+                except c.EXC_BASIC_TYPE as e:
+                    FlextObservabilityProfiler.logger.warning(
+                        f"Profiler sample failed: {e}"
+                    )
+
+    @staticmethod
+    def active_profiler() -> FlextObservabilityProfiler.Profiler:
+        """Return the global profiler instance.
+
+        Returns:
+            Profiler - Global profiler (stopped until started)
+
+        """
+        if FlextObservabilityProfiler._profiler_instance is None:
+            FlextObservabilityProfiler._profiler_instance = (
+                FlextObservabilityProfiler.Profiler()
+            )
+        return FlextObservabilityProfiler._profiler_instance
+
+    @staticmethod
+    def start_profiler(
+        hz: float = c.Observability.PROFILER_SAMPLE_HZ,
+    ) -> p.Result[bool]:
+        """Start the global profiler at ``hz`` samples per second.
+
+        Returns:
+            r[bool] - Ok once sampling
+
+        """
+        profiler = FlextObservabilityProfiler.active_profiler()
+        if not profiler.running:
+            profiler.hz = hz
+        return profiler.start()
+
+
+__all__: list[str] = ["FlextObservabilityProfiler"]
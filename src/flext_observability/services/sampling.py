@@ -23,8 +23,9 @@ import random
 from collections.abc import MutableMapping
 from typing import Annotated, ClassVar
 
-from flext_observability import c, m, p, r, u
+from flext_observability import c, m, p, r, t, u
 from flext_observability.services.context import FlextObservabilityContext
+from flext_observability.services.overhead import FlextObservabilityOverhead
 
 
 class FlextObservabilitySampling:
@@ -102,6 +103,28 @@ class FlextObservabilitySampling:
                 rate = self._operation_overrides[operation]
             return rate
 
+        def snapshot(self) -> t.JsonDict:
+            """Return the effective sampling configuration.
+
+            Returns:
+                dict - Environment, default rate and every service/operation
+                override (keyed ``service:<name>`` / ``operation:<name>``)
+
+            """
+            payload: t.JsonDict = {
+                "environment": self._environment,
+                "default_rate": self._default_rate,
+            }
+            payload.update({
+                f"service:{name}": rate
+                for name, rate in list(self._service_overrides.items())
+            })
+            payload.update({
+                f"operation:{name}": rate
+                for name, rate in list(self._operation_overrides.items())
+            })
+            return payload
+
         def sampling_decision(
             self, operation: str | None = None, service: str | None = None
         ) -> c.Observability.SamplingDecision:
@@ -346,4 +369,8 @@ class FlextObservabilitySampling:
         return sampler.should_sample(operation=operation, service=service)
 
 
+FlextObservabilityOverhead.instrument(
+    FlextObservabilitySampling.Sampler, "should_sample", "sampling.should_sample"
+)
+
 __all__: list[str] = ["FlextObservabilitySampling"]
@@ -0,0 +1,308 @@
+"""Series identity: interned strings and dictionary-encoded label sets.
+
+Metric names, label keys and label values are interned once into integer
+IDs; a (key, value) pair gets its own ID and a series - a name plus its
+sorted pair IDs - is packed into a few bytes and mapped to a dense series
+ID. Hot paths resolve the ID once (or hit a bounded cache keyed by the
+label mapping as passed) and record against the int; exporters decode a
+series back to its name and label set once, when the series is created.
+
+FLEXT Pattern:
+- Single FlextObservabilitySeries class
+- Nested Registry (string, pair and series tables plus lookup cache)
+- Thread-safe global registry created on demand
+
+Key Features:
+- Dense int IDs for strings, label pairs and series
+- Series keys packed as ``uint32`` arrays: 4 bytes per label, no tuples
+- Bounded lookup cache: memory grows with distinct series only
+- Series creation gated by a FlextObservabilityCardinality.Limiter
+- ``Registry.nbytes`` / ``bytes_per_series`` for capacity planning
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+from array import array
+from collections.abc import Iterable
+from typing import ClassVar
+
+from flext_observability import c, t
+from flext_observability.services.cardinality import FlextObservabilityCardinality
+
+
+class FlextObservabilitySeries:
+    """Interning and label-set dictionary encoding for metric series.
+
+    Usage:
+        ```python
+        from flext_observability import FlextObservabilitySeries
+
+        registry = FlextObservabilitySeries.active_registry()
+        series_id = registry.series_id("http_requests_total", {"method": "GET"})
+
+        # Exporters turn the id back into name and sorted label set
+        name, labels = registry.decode(series_id)
+        ```
+
+    Nested Classes:
+        Registry: String, label-pair and series tables
+    """
+
+    _registry_instance: ClassVar[FlextObservabilitySeries.Registry | None] = None
+
+    class Registry:
+        """Append-only tables mapping strings, pairs and series to int IDs.
+
+        IDs are never reused: a series keeps its ID for the life of the
+        registry, so stores and batches can hold plain ints.
+        """
+
+        def __init__(
+            self,
+            cache_size: int = c.Observability.SERIES_CACHE_SIZE,
+            limiter: FlextObservabilityCardinality.Limiter | None = None,
+        ) -> None:
+            """Initialize empty tables and a lookup cache of ``cache_size``.
+
+            Without a ``limiter`` every distinct label set becomes a series.
+            """
+            self.cache_size = cache_size
+            self.limiter = limiter
+            self._strings: list[str] = []
+            self._string_ids: dict[str, int] = {}
+            self._pairs: array[int] = array("I")
+            self._pair_ids: dict[int, int] = {}
+            self._keys: list[bytes] = []
+            self._series_ids: dict[bytes, int] = {}
+            self._name_series: dict[int, int] = {}
+            self._overflow_ids: set[int] = set()
+            self._cache: dict[tuple[str, t.Observability.ScalarLabelSet], int] = {}
+            self._lock = threading.Lock()
+
+        def __len__(self) -> int:
+            """Number of distinct series."""
+            return len(self._keys)
+
+        @property
+        def strings(self) -> int:
+            """Number of distinct interned strings."""
+            return len(self._strings)
+
+        @property
+        def nbytes(self) -> int:
+            """Approximate bytes held by the tables (cache container included).
+
+            Interned strings are counted once; the cache adds at most
+            ``cache_size`` entries whatever the number of series.
+            """
+            return (
+                sys.getsizeof(self._strings)
+                + sys.getsizeof(self._string_ids)
+                + sum(sys.getsizeof(value) for value in self._strings)
+                + len(self._pairs) * self._pairs.itemsize
+                + sys.getsizeof(self._pair_ids)
+                + sys.getsizeof(self._keys)
+                + sys.getsizeof(self._series_ids)
+                + sum(sys.getsizeof(key) for key in self._keys)
+                + sys.getsizeof(self._cache)
+            )
+
+        @property
+        def bytes_per_series(self) -> float:
+            """Approximate table bytes per registered series."""
+            return self.nbytes / len(self._keys) if self._keys else 0.0
+
+        def overflowed(self, series_id: int) -> bool:
+            """Whether ``series_id`` is a metric's overflow series."""
+            return series_id in self._overflow_ids
+
+        def intern(self, value: str) -> int:
+            """Return the ID of a string, adding it on first sight."""
+            string_id = self._string_ids.get(value)
+            if string_id is None:
+                with self._lock:
+                    string_id = self._intern(value)
+            return string_id
+
+        def string(self, string_id: int) -> str:
+            """Return the string stored under ``string_id``."""
+            return self._strings[string_id]
+
+        def pair_id(self, key: str, value: str) -> int:
+            """Return the ID of a label pair, adding it on first sight."""
+            with self._lock:
+                return self._pair_id(self._intern(key), self._intern(value))
+
+        def series_id(self, name: str, labels: t.ScalarMapping | None = None) -> int:
+            """Return the series ID of a name and label mapping.
+
+            Args:
+                name: Metric name
+                labels: Label mapping; values are stored as strings
+
+            Returns:
+                int - Dense series ID, the same for any ordering of ``labels``
+
+            Behavior:
+                - A cache keyed by the mapping as passed answers repeated
+                  calls without sorting or interning
+                - The cache is dropped when it reaches ``cache_size``;
+                  unhashable label values bypass it
+                - A label set refused by the limiter resolves to the
+                  metric's ``otel.metric.overflow="true"`` series
+
+            """
+            cache_key = (name, tuple(labels.items()) if labels else ())
+            try:
+                series_id = self._cache.get(cache_key)
+            except TypeError:
+                cache_key = None
+                series_id = None
+            if series_id is not None:
+                return series_id
+            with self._lock:
+                pair_ids: list[int] = []
+                new_keys: list[str] = []
+                for key, value in (labels or {}).items():
+                    known = len(self._pairs)
+                    pair_ids.append(
+                        self._pair_id(self._intern(str(key)), self._intern(str(value)))
+                    )
+                    if len(self._pairs) != known:
+                        new_keys.append(str(key))
+                series_id = self._series_id(self._intern(name), pair_ids, new_keys)
+                if cache_key is not None:
+                    if len(self._cache) >= self.cache_size:
+                        self._cache.clear()
+                    self._cache[cache_key] = series_id
+            return series_id
+
+        def series_id_for(self, name_id: int, pair_ids: Iterable[int]) -> int:
+            """Return the series ID of an interned name and label pair IDs."""
+            with self._lock:
+                return self._series_id(name_id, list(pair_ids))
+
+        def decode(self, series_id: int) -> t.Observability.SeriesKey:
+            """Return the name and sorted label set of ``series_id``."""
+            ids: array[int] = array("I")
+            ids.frombytes(self._keys[series_id])
+            return self._strings[ids[0]], self._labels(ids[1:])
+
+        def decode_many(
+            self, series_ids: Iterable[int]
+        ) -> dict[int, t.Observability.SeriesKey]:
+            """Decode each distinct series ID once (e.g. per export flush)."""
+            decoded: dict[int, t.Observability.SeriesKey] = {}
+            for series_id in series_ids:
+                if series_id not in decoded:
+                    decoded[series_id] = self.decode(series_id)
+            return decoded
+
+        def _intern(self, value: str) -> int:
+            """Intern a string; the caller holds the lock."""
+            string_id = self._string_ids.get(value)
+            if string_id is None:
+                string_id = len(self._strings)
+                self._strings.append(value)
+                self._string_ids[value] = string_id
+            return string_id
+
+        def _pair_id(self, key_id: int, value_id: int) -> int:
+            """Intern a (key, value) ID pair; the caller holds the lock."""
+            packed = key_id << 32 | value_id
+            pair_id = self._pair_ids.get(packed)
+            if pair_id is None:
+                pair_id = len(self._pairs) // 2
+                self._pairs.extend((key_id, value_id))
+                self._pair_ids[packed] = pair_id
+            return pair_id
+
+        def _series_id(
+            self, name_id: int, pair_ids: list[int], new_keys: Iterable[str] = ()
+        ) -> int:
+            """Intern a packed series key; the caller holds the lock.
+
+            ``new_keys`` are the label keys whose value was first seen by
+            this lookup; they feed the limiter's cardinality sketch.
+            """
+            pair_ids.sort()
+            key = array("I", [name_id, *pair_ids]).tobytes()
+            series_id = self._series_ids.get(key)
+            if series_id is not None:
+                return series_id
+            limiter = self.limiter
+            if limiter is not None:
+                name = self._strings[name_id]
+                limiter.observe_new_values(name, new_keys)
+                metric_series = self._name_series.get(name_id, 0)
+                total_series = len(self._keys) - len(self._overflow_ids)
+                if not limiter.admit(name, metric_series, total_series):
+                    limiter.observe_overflow(name, self._labels(pair_ids))
+                    return self._overflow_series_id(name_id)
+            self._name_series[name_id] = self._name_series.get(name_id, 0) + 1
+            return self._add_series(key)
+
+        def _overflow_series_id(self, name_id: int) -> int:
+            """Return (creating) the overflow series of a metric name."""
+            overflow_key = self._intern(c.Observability.SERIES_OVERFLOW_LABEL)
+            pair_id = self._pair_id(overflow_key, self._intern("true"))
+            key = array("I", [name_id, pair_id]).tobytes()
+            series_id = self._series_ids.get(key)
+            if series_id is None:
+                series_id = self._add_series(key)
+                self._overflow_ids.add(series_id)
+            return series_id
+
+        def _add_series(self, key: bytes) -> int:
+            """Append a new series key; the caller holds the lock."""
+            series_id = len(self._keys)
+            self._keys.append(key)
+            self._series_ids[key] = series_id
+            return series_id
+
+        def _labels(self, pair_ids: Iterable[int]) -> t.Observability.LabelSet:
+            """Decode pair IDs into a sorted label set."""
+            strings, pairs = self._strings, self._pairs
+            return tuple(
+                sorted(
+                    (strings[pairs[2 * pair_id]], strings[pairs[2 * pair_id + 1]])
+                    for pair_id in pair_ids
+                )
+            )
+
+    @staticmethod
+    def active_registry() -> FlextObservabilitySeries.Registry:
+        """Return the global series registry instance.
+
+        Returns:
+            Registry - Global registry
+
+        """
+        if FlextObservabilitySeries._registry_instance is None:
+            limiter = FlextObservabilityCardinality.Limiter(
+                max_series=c.Observability.SERIES_LIMIT,
+                max_series_per_metric=c.Observability.SERIES_LIMIT_PER_METRIC,
+            )
+            FlextObservabilitySeries._registry_instance = (
+                FlextObservabilitySeries.Registry(limiter=limiter)
+            )
+        return FlextObservabilitySeries._registry_instance
+
+    @staticmethod
+    def cardinality_report() -> t.JsonDict:
+        """Return the global registry's limits and top cardinality drivers.
+
+        Returns:
+            dict - Limiter report plus the ``series`` count
+
+        """
+        registry = FlextObservabilitySeries.active_registry()
+        report: t.JsonDict = {"series": len(registry)}
+        if registry.limiter is not None:
+            report.update(registry.limiter.report())
+        return report
+
+
+__all__: list[str] = ["FlextObservabilitySeries"]
@@ -0,0 +1,543 @@
+"""Memory-mapped on-disk spill queue for telemetry during exporter outages.
+
+When the collector is unreachable, encoded telemetry batches are appended to
+memory-mapped segment files instead of piling up in memory; once the
+collector answers again they are replayed oldest first. The queue is bounded
+by a disk budget (oldest segments are evicted first) and recovers after a
+crash by scanning the segment headers and records.
+
+FLEXT Pattern:
+- Single FlextObservabilitySpill class
+- Nested Segment, Queue, HTTPSender and Exporter
+- Exporter with a lazily started daemon replay thread
+
+Key Features:
+- Append-only segments: ``[length][crc32][payload]`` records after a header
+  holding the segment sequence and the persisted read offset
+- Crash recovery: records are validated by CRC and a torn tail is dropped
+- Strict ordering: new batches queue behind spilled ones until replayed
+- Disk budget with oldest-segment eviction and own spill metrics
+- Exponential replay backoff while the collector stays down
+"""
+
+from __future__ import annotations
+
+import http.client
+import mmap
+import struct
+import threading
+import time
+import zlib
+from collections import deque
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from flext_observability import c, p, r, t, u
+from flext_observability.services.aggregation import FlextObservabilityAggregation
+
+
+class FlextObservabilitySpill:
+    """Durable spill queue and replaying exporter.
+
+    Usage:
+        ```python
+        from flext_observability import FlextObservabilitySpill
+
+        exporter = FlextObservabilitySpill.Exporter(
+            FlextObservabilitySpill.HTTPSender("http://collector:4318/v1/metrics"),
+            FlextObservabilitySpill.Queue("/var/lib/app/spill"),
+        )
+        exporter.start()
+
+        # Sent now, or spilled to disk and replayed in order later
+        exporter.submit(FlextObservabilitySpill.encode_metrics())
+        ```
+
+    Nested Classes:
+        Segment: One memory-mapped segment file
+        Queue: Ordered, disk-budgeted queue of segments
+        HTTPSender: POST transport to a collector endpoint
+        Exporter: Send-or-spill front end with background replay
+    """
+
+    logger = u.fetch_logger(__name__)
+    _header = struct.Struct("<4sHHQQ")
+    _record = struct.Struct("<II")
+
+    @staticmethod
+    def encode_metrics(
+        store: FlextObservabilityAggregation.Store | None = None,
+    ) -> bytes:
+        """Encode the current series of a store as one JSON batch.
+
+        Args:
+            store: Aggregation store (None = global store)
+
+        Returns:
+            bytes - ``{"timestamp": ..., "metrics": [...]}`` as UTF-8 JSON
+
+        """
+        source = store or FlextObservabilityAggregation.active_store()
+        batch: t.JsonDict = {
+            "timestamp": time.time(),
+            "metrics": list(source.snapshot()),
+        }
+        return u.Cli.json_dumps(batch).unwrap().encode()
+
+    class Segment:
+        """One memory-mapped segment file.
+
+        Payloads are written before their ``[length][crc32]`` record header,
+        so a crash mid-append leaves either a zero length (clean end) or a
+        CRC mismatch (torn tail); both end the scan during recovery.
+        """
+
+        __slots__ = (
+            "map",
+            "path",
+            "read_offset",
+            "records",
+            "sequence",
+            "write_offset",
+        )
+
+        def __init__(self, path: Path, sequence: int, mapped: mmap.mmap) -> None:
+            """Initialize a segment over an open mapping."""
+            self.path = path
+            self.sequence = sequence
+            self.map = mapped
+            self.read_offset = FlextObservabilitySpill._header.size
+            self.write_offset = FlextObservabilitySpill._header.size
+            self.records = 0
+
+        @property
+        def size(self) -> int:
+            """Mapped size of the segment file."""
+            return len(self.map)
+
+        @property
+        def pending_bytes(self) -> int:
+            """Bytes of records not yet consumed."""
+            return self.write_offset - self.read_offset
+
+        @staticmethod
+        def create(
+            path: Path, sequence: int, size: int
+        ) -> FlextObservabilitySpill.Segment:
+            """Create a zero-filled segment file of ``size`` bytes."""
+            with path.open("w+b") as handle:
+                handle.truncate(size)
+                mapped = mmap.mmap(handle.fileno(), 0)
+            segment = FlextObservabilitySpill.Segment(path, sequence, mapped)
+            segment.write_header()
+            return segment
+
+        @staticmethod
+        def recover(path: Path) -> FlextObservabilitySpill.Segment | None:
+            """Reopen a segment after a restart or crash.
+
+            Returns:
+                Segment | None - Segment positioned after its last valid
+                record, or None when the file is not a valid segment
+
+            """
+            header = FlextObservabilitySpill._header
+            record = FlextObservabilitySpill._record
+            with path.open("r+b") as handle:
+                if path.stat().st_size < header.size:
+                    return None
+                mapped = mmap.mmap(handle.fileno(), 0)
+            magic, version, _, sequence, read_offset = header.unpack_from(mapped)
+            if (
+                magic != c.Observability.SPILL_SEGMENT_MAGIC
+                or version != c.Observability.SPILL_FORMAT_VERSION
+            ):
+                mapped.close()
+                return None
+            segment = FlextObservabilitySpill.Segment(path, sequence, mapped)
+            position = header.size
+            records_before_read = 0
+            while position + record.size <= len(mapped):
+                length, checksum = record.unpack_from(mapped, position)
+                end = position + record.size + length
+                if (
+                    length == 0
+                    or end > len(mapped)
+                    or zlib.crc32(mapped[position + record.size : end]) != checksum
+                ):
+                    break
+                segment.records += 1
+                if end <= read_offset:
+                    records_before_read += 1
+                position = end
+            segment.write_offset = position
+            segment.read_offset = max(header.size, min(read_offset, position))
+            segment.records -= records_before_read
+            return segment
+
+        def append(self, payload: bytes) -> bool:
+            """Append one record; False when the segment has no room left."""
+            record = FlextObservabilitySpill._record
+            start = self.write_offset
+            end = start + record.size + len(payload)
+            if end > len(self.map):
+                return False
+            self.map[start + record.size : end] = payload
+            record.pack_into(self.map, start, len(payload), zlib.crc32(payload))
+            self.write_offset = end
+            self.records += 1
+            return True
+
+        def peek(self) -> bytes | None:
+            """Return the oldest unconsumed payload of this segment."""
+            if self.read_offset >= self.write_offset:
+                return None
+            record = FlextObservabilitySpill._record
+            length, _ = record.unpack_from(self.map, self.read_offset)
+            start = self.read_offset + record.size
+            return self.map[start : start + length]
+
+        def consume(self) -> None:
+            """Advance (and persist) the read offset past the oldest record."""
+            record = FlextObservabilitySpill._record
+            length, _ = record.unpack_from(self.map, self.read_offset)
+            self.read_offset += record.size + length
+            self.records -= 1
+            self.write_header()
+
+        def write_header(self) -> None:
+            """Persist the segment header (sequence and read offset)."""
+            FlextObservabilitySpill._header.pack_into(
+                self.map,
+                0,
+                c.Observability.SPILL_SEGMENT_MAGIC,
+                c.Observability.SPILL_FORMAT_VERSION,
+                0,
+                self.sequence,
+                self.read_offset,
+            )
+
+        def close(self, *, delete: bool = False) -> None:
+            """Unmap the segment, optionally deleting its file."""
+            self.map.close()
+            if delete:
+                self.path.unlink(missing_ok=True)
+
+    class Queue:
+        """Ordered, disk-budgeted queue of spill segments."""
+
+        def __init__(
+            self,
+            directory: str | Path,
+            *,
+            segment_size: int = c.Observability.SPILL_SEGMENT_SIZE,
+            max_bytes: int = c.Observability.SPILL_MAX_BYTES,
+            durable: bool = False,
+        ) -> None:
+            """Open the queue, recovering every segment left in ``directory``.
+
+            Args:
+                directory: Spill directory (created if missing)
+                segment_size: Size of each segment file
+                max_bytes: Disk budget over all segment files
+                durable: Flush each append to disk (survives power loss,
+                    not only process crashes)
+
+            """
+            self.directory = Path(directory)
+            self._segment_size = segment_size
+            self._max_bytes = max_bytes
+            self._durable = durable
+            self._lock = threading.Lock()
+            self._segments: deque[FlextObservabilitySpill.Segment] = deque()
+            self.dropped = 0
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._recover()
+
+        @property
+        def pending(self) -> int:
+            """Number of spilled batches awaiting replay."""
+            with self._lock:
+                return sum(segment.records for segment in self._segments)
+
+        @property
+        def disk_bytes(self) -> int:
+            """Bytes of segment files currently on disk."""
+            with self._lock:
+                return sum(segment.size for segment in self._segments)
+
+        def append(self, payload: bytes) -> p.Result[bool]:
+            """Spill one encoded batch behind every batch already queued.
+
+            Args:
+                payload: Encoded telemetry batch
+
+            Returns:
+                r[bool] - Ok once written to the segment mapping
+
+            """
+            try:
+                with self._lock:
+                    self._append(payload)
+            except OSError as e:
+                return r[bool].fail_op("spill telemetry batch", e)
+            return r[bool].ok(True)
+
+        def peek(self) -> bytes | None:
+            """Return the oldest spilled batch without consuming it."""
+            with self._lock:
+                while self._segments:
+                    head = self._segments[0]
+                    payload = head.peek()
+                    if payload is not None:
+                        return payload
+                    if len(self._segments) == 1:
+                        return None
+                    self._segments.popleft().close(delete=True)
+                return None
+
+        def pop(self) -> None:
+            """Consume the batch returned by the last ``peek``."""
+            with self._lock:
+                if not self._segments or self._segments[0].peek() is None:
+                    return
+                head = self._segments[0]
+                head.consume()
+                if head.read_offset >= head.write_offset and len(self._segments) > 1:
+                    self._segments.popleft().close(delete=True)
+
+        def close(self) -> None:
+            """Unmap every segment; files stay on disk for the next start."""
+            with self._lock:
+                for segment in self._segments:
+                    segment.close()
+                self._segments.clear()
+
+        def _recover(self) -> None:
+            """Reopen the segments left by an earlier process, oldest first."""
+            prefix = c.Observability.SPILL_SEGMENT_PREFIX
+            suffix = c.Observability.SPILL_SEGMENT_SUFFIX
+            recovered: list[FlextObservabilitySpill.Segment] = []
+            for path in self.directory.glob(f"{prefix}*{suffix}"):
+                segment = FlextObservabilitySpill.Segment.recover(path)
+                if segment is None:
+                    FlextObservabilitySpill.logger.warning(
+                        f"Ignoring invalid spill segment {path}"
+                    )
+                    continue
+                recovered.append(segment)
+            recovered.sort(key=lambda segment: segment.sequence)
+            for segment in recovered[:-1]:
+                if segment.records:
+                    self._segments.append(segment)
+                else:
+                    segment.close(delete=True)
+            if recovered:
+                self._segments.append(recovered[-1])
+            if self._segments:
+                FlextObservabilitySpill.logger.info(
+                    f"Recovered {sum(s.records for s in self._segments)} spilled "
+                    f"batches from {self.directory}"
+                )
+
+        def _append(self, payload: bytes) -> None:
+            """Write a batch to the tail segment (caller holds the lock)."""
+            tail = self._segments[-1] if self._segments else None
+            if tail is None or not tail.append(payload):
+                tail = self._roll(len(payload))
+                _ = tail.append(payload)
+            if self._durable:
+                tail.map.flush()
+            self._evict()
+
+        def _roll(self, payload_size: int) -> FlextObservabilitySpill.Segment:
+            """Start a new tail segment large enough for ``payload_size``."""
+            sequence = self._segments[-1].sequence + 1 if self._segments else 0
+            size = max(
+                self._segment_size,
+                FlextObservabilitySpill._header.size
+                + FlextObservabilitySpill._record.size
+                + payload_size,
+            )
+            path = self.directory / (
+                f"{c.Observability.SPILL_SEGMENT_PREFIX}{sequence:016d}"
+                f"{c.Observability.SPILL_SEGMENT_SUFFIX}"
+            )
+            segment = FlextObservabilitySpill.Segment.create(path, sequence, size)
+            self._segments.append(segment)
+            return segment
+
+        def _evict(self) -> None:
+            """Drop the oldest segments while the disk budget is exceeded."""
+            total = sum(segment.size for segment in self._segments)
+            while total > self._max_bytes and len(self._segments) > 1:
+                oldest = self._segments.popleft()
+                total -= oldest.size
+                self.dropped += oldest.records
+                FlextObservabilitySpill.logger.warning(
+                    f"Spill budget exceeded: dropped {oldest.records} batches"
+                )
+                oldest.close(delete=True)
+
+    class HTTPSender:
+        """POST encoded batches to a collector endpoint."""
+
+        def __init__(
+            self,
+            url: str,
+            *,
+            content_type: str = c.Observability.HTTP_CONTENT_TYPE_JSON,
+            timeout_sec: float = c.Observability.SPILL_EXPORT_TIMEOUT_SEC,
+        ) -> None:
+            """Initialize the sender with the endpoint and request timeout."""
+            self._url = url
+            self._content_type = content_type
+            self._timeout_sec = timeout_sec
+
+        def send(self, payload: bytes) -> p.Result[bool]:
+            """POST one batch; connection errors and error responses fail."""
+            try:
+                status = self._post(payload)
+            except (*c.EXC_BASIC_TYPE, http.client.HTTPException) as e:
+                return r[bool].fail_op("send telemetry batch", e)
+            if status >= c.Observability.HTTP_ERROR_STATUS_THRESHOLD:
+                return r[bool].fail_op("send telemetry batch", f"HTTP {status}")
+            return r[bool].ok(True)
+
+        def _post(self, payload: bytes) -> int:
+            """POST a batch to the endpoint and return the response status."""
+            target = urlsplit(self._url)
+            connection_type = (
+                http.client.HTTPSConnection
+                if target.scheme == "https"
+                else http.client.HTTPConnection
+            )
+            connection = connection_type(target.netloc, timeout=self._timeout_sec)
+            try:
+                connection.request(
+                    "POST",
+                    target.path or "/",
+                    body=payload,
+                    headers={"Content-Type": self._content_type},
+                )
+                return connection.getresponse().status
+            finally:
+                connection.close()
+
+    class Exporter:
+        """Send-or-spill front end with in-order background replay."""
+
+        def __init__(
+            self,
+            sender: p.Observability.BatchSender,
+            queue: FlextObservabilitySpill.Queue,
+            *,
+            retry_interval_sec: float = c.Observability.SPILL_RETRY_INTERVAL_SEC,
+            max_retry_interval_sec: float = (
+                c.Observability.SPILL_MAX_RETRY_INTERVAL_SEC
+            ),
+        ) -> None:
+            """Initialize the exporter over a transport and a spill queue."""
+            self._sender = sender
+            self.queue = queue
+            self._retry_interval_sec = retry_interval_sec
+            self._max_retry_interval_sec = max_retry_interval_sec
+            self._replay_lock = threading.Lock()
+            self._wakeup = threading.Event()
+            self._stopping = threading.Event()
+            self._thread: threading.Thread | None = None
+            store = FlextObservabilityAggregation.active_store()
+            counter = c.Observability.MetricType.COUNTER
+            self._sent = store.handle("flext_spill_sent_total", counter).unwrap()
+            self._spilled = store.handle("flext_spill_spilled_total", counter).unwrap()
+            self._replayed = store.handle(
+                "flext_spill_replayed_total", counter
+            ).unwrap()
+            self._pending = store.handle(
+                "flext_spill_pending_batches", c.Observability.MetricType.GAUGE
+            ).unwrap()
+            self._lock = store.lock
+
+        def submit(self, payload: bytes) -> p.Result[bool]:
+            """Send a batch now, or spill it when the collector is down.
+
+            While spilled batches are pending, new batches are queued behind
+            them so the collector receives everything in order. The pending
+            check, the send and the spill run under the replay lock, so a
+            concurrent submit or replay cannot overtake a batch.
+
+            Returns:
+                r[bool] - True if sent, False if spilled; failure only when
+                the batch could not be spilled either
+
+            """
+            with self._replay_lock:
+                sent = not self.queue.pending and self._sender.send(payload).success
+                result = r[bool].ok(True) if sent else self.queue.append(payload)
+            if result.failure:
+                return r[bool].fail_op(
+                    "export telemetry batch", result.error or "Spill failed"
+                )
+            with self._lock:
+                (self._sent if sent else self._spilled).observe(1.0)
+            return r[bool].ok(sent)
+
+        def flush(self) -> int:
+            """Replay spilled batches oldest first until one fails.
+
+            Returns:
+                int - Number of batches replayed
+
+            """
+            replayed = 0
+            with self._replay_lock:
+                while (payload := self.queue.peek()) is not None:
+                    if self._sender.send(payload).failure:
+                        break
+                    self.queue.pop()
+                    replayed += 1
+                pending = self.queue.pending
+            with self._lock:
+                if replayed:
+                    self._replayed.observe(float(replayed))
+                self._pending.observe(float(pending))
+            return replayed
+
+        def start(self) -> None:
+            """Start replaying spilled batches in the background."""
+            if self._thread is not None:
+                return
+            self._stopping.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="flext-spill-replay", daemon=True
+            )
+            self._thread.start()
+
+        def stop(self, timeout_sec: float = 5.0) -> None:
+            """Stop the replay thread; unsent batches stay on disk."""
+            thread, self._thread = self._thread, None
+            if thread is None:
+                return
+            self._stopping.set()
+            self._wakeup.set()
+            thread.join(timeout_sec)
+
+        def _run(self) -> None:
+            """Replay loop with exponential backoff while replays fail."""
+            delay = self._retry_interval_sec
+            while not self._stopping.is_set():
+                _ = self._wakeup.wait(delay)
+                self._wakeup.clear()
+                if self._stopping.is_set():
+                    return
+                try:
+                    _ = self.flush()
+                except (*c.EXC_BASIC_TYPE, http.client.HTTPException) as e:
+                    FlextObservabilitySpill.logger.warning(f"Spill replay failed: {e}")
+                if self.queue.pending:
+                    delay = min(delay * 2, self._max_retry_interval_sec)
+                else:
+                    delay = self._retry_interval_sec
+
+
+__all__: list[str] = ["FlextObservabilitySpill"]
@@ -0,0 +1,290 @@
+"""Local Unix-domain-socket stats server for in-process metrics.
+
+Serves one length-prefixed JSON snapshot of every metric series, the health
+status, the sampler configuration, the busiest error fingerprints and the
+process resources to each client that connects, so sidecars and the
+``flext-observability top`` command can read a process without an HTTP
+stack.
+
+FLEXT Pattern:
+- Single FlextObservabilityStatsServer class
+- Nested Server with a lazily started daemon accept thread
+- Thread-safe global server
+
+Key Features:
+- Snapshot built from detached series copies: writers are paused only for
+  the copy, never for serialization or the socket write
+- One encoded snapshot shared by every client inside a short TTL
+- ``!I`` length prefix followed by UTF-8 JSON (read by ``fetch_snapshot``)
+- Owner-only socket permissions; stale socket files are replaced
+"""
+
+from __future__ import annotations
+
+import os
+import socket
+import struct
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import ClassVar
+
+from flext_observability import c, p, r, t, u
+from flext_observability.services.aggregation import FlextObservabilityAggregation
+from flext_observability.services.error_handling import FlextObservabilityErrorHandling
+from flext_observability.services.health import FlextObservabilityHealth
+from flext_observability.services.overhead import FlextObservabilityOverhead
+from flext_observability.services.performance import FlextObservabilityPerformance
+from flext_observability.services.sampling import FlextObservabilitySampling
+from flext_observability.services.series import FlextObservabilitySeries
+
+
+class FlextObservabilityStatsServer:
+    """Unix-domain-socket snapshot server.
+
+    Usage:
+        ```python
+        from flext_observability import FlextObservabilityStatsServer
+
+        server = FlextObservabilityStatsServer.active_server()
+        server.start()
+        # flext-observability top --target unix:<server.path>
+        ```
+
+    Nested Classes:
+        Server: Socket listener serving cached snapshots
+    """
+
+    logger = u.fetch_logger(__name__)
+    _server_instance: ClassVar[FlextObservabilityStatsServer.Server | None] = None
+    _prefix = struct.Struct(c.Observability.SNAPSHOT_LENGTH_PREFIX_FORMAT)
+
+    @staticmethod
+    def default_path() -> str:
+        """Return the per-process socket path in the temporary directory."""
+        name = c.Observability.STATS_SOCKET_NAME.format(pid=os.getpid())
+        return str(Path(tempfile.gettempdir()) / name)
+
+    @staticmethod
+    def collect() -> t.JsonDict:
+        """Build one snapshot of the in-process observability state.
+
+        Returns:
+            dict - ``version``, ``pid``, ``timestamp``, ``metrics`` (series
+            snapshots), ``health``, ``sampling``, ``errors``, ``resources``,
+            ``overhead`` (observability self-accounting) and ``cardinality``
+            (series limits and top cardinality drivers)
+
+        Behavior:
+            - Metric series are copied under the store lock and serialized
+              after it is released
+            - Health reports the last known results; expired checks are
+              revalidated in the background instead of awaited
+
+        """
+        store = FlextObservabilityAggregation.active_store()
+        handler = FlextObservabilityErrorHandling.active_handler()
+        return {
+            "version": c.Observability.SNAPSHOT_FORMAT_VERSION,
+            "pid": os.getpid(),
+            "timestamp": time.time(),
+            "metrics": list(store.snapshot()),
+            "health": FlextObservabilityHealth.active_runner().status(
+                wait_for_refresh=False
+            ),
+            "sampling": FlextObservabilitySampling.active_sampler().snapshot(),
+            "errors": list(handler.top_fingerprints()),
+            "resources": dict(FlextObservabilityPerformance.fetch_system_resources()),
+            "overhead": FlextObservabilityOverhead.report(),
+            "cardinality": FlextObservabilitySeries.cardinality_report(),
+        }
+
+    @staticmethod
+    def encode(snapshot: t.JsonMapping) -> bytes:
+        """Encode a snapshot as a length prefix followed by UTF-8 JSON."""
+        body = u.Cli.json_dumps(snapshot).unwrap().encode()
+        return FlextObservabilityStatsServer._prefix.pack(len(body)) + body
+
+    class Server:
+        """Socket listener serving cached snapshots to every client."""
+
+        def __init__(
+            self,
+            path: str | None = None,
+            *,
+            ttl_sec: float = c.Observability.STATS_SNAPSHOT_TTL_SEC,
+        ) -> None:
+            """Initialize a stopped server bound to ``path`` once started."""
+            self.path = path or FlextObservabilityStatsServer.default_path()
+            self._ttl_sec = ttl_sec
+            self._lock = threading.Lock()
+            self._snapshot_lock = threading.Lock()
+            self._stopping = threading.Event()
+            self._listener: socket.socket | None = None
+            self._thread: threading.Thread | None = None
+            self._payload = b""
+            self._payload_at = -ttl_sec
+            self._served = 0
+
+        @property
+        def running(self) -> bool:
+            """Whether the accept thread is serving."""
+            return self._thread is not None
+
+        @property
+        def served(self) -> int:
+            """Number of snapshots written to clients."""
+            return self._served
+
+        def start(self) -> p.Result[bool]:
+            """Bind the socket and serve snapshots on a daemon thread.
+
+            Returns:
+                r[bool] - Ok once listening (also when already running)
+
+            """
+            with self._lock:
+                if self._thread is not None:
+                    return r[bool].ok(True)
+                try:
+                    listener = self._bind()
+                except OSError as e:
+                    return r[bool].fail_op("start stats server", e)
+                self._stopping.clear()
+                self._listener = listener
+                self._thread = threading.Thread(
+                    target=self._serve,
+                    args=(listener,),
+                    name="flext-stats-server",
+                    daemon=True,
+                )
+                self._thread.start()
+            FlextObservabilityStatsServer.logger.info(
+                f"Stats server listening on {self.path}"
+            )
+            return r[bool].ok(True)
+
+        def stop(self, timeout_sec: float = 5.0) -> None:
+            """Stop serving, close the listener and remove the socket file."""
+            with self._lock:
+                thread, self._thread = self._thread, None
+                listener, self._listener = self._listener, None
+            if thread is None or listener is None:
+                return
+            self._stopping.set()
+            self._wake()
+            thread.join(timeout_sec)
+            listener.close()
+            Path(self.path).unlink(missing_ok=True)
+
+        def payload(self) -> bytes:
+            """Return the encoded snapshot, rebuilt at most once per TTL.
+
+            Concurrent clients inside the TTL share one encoded snapshot, so a
+            polling sidecar costs one collection per TTL however often it
+            connects.
+            """
+            with self._snapshot_lock:
+                now = time.monotonic()
+                if now - self._payload_at >= self._ttl_sec:
+                    try:
+                        snapshot = FlextObservabilityStatsServer.collect()
+                    except c.EXC_BASIC_TYPE as e:
+                        FlextObservabilityStatsServer.logger.warning(
+                            f"Stats snapshot failed: {e}"
+                        )
+                        snapshot = {"error": str(e)}
+                    self._payload = FlextObservabilityStatsServer.encode(snapshot)
+                    self._payload_at = now
+                return self._payload
+
+        def _bind(self) -> socket.socket:
+            """Create the listening socket, replacing a stale socket file."""
+            path = Path(self.path)
+            if path.exists():
+                with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+                    try:
+                        probe.connect(self.path)
+                    except OSError:
+                        path.unlink()
+                    else:
+                        msg = f"{self.path} is served by another process"
+                        raise FileExistsError(msg)
+            listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                listener.bind(self.path)
+                path.chmod(c.Observability.STATS_SOCKET_MODE)
+                listener.listen(c.Observability.STATS_SOCKET_BACKLOG)
+            except OSError:
+                listener.close()
+                raise
+            return listener
+
+        def _wake(self) -> None:
+            """Unblock ``accept`` so the serving thread notices the stop."""
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+                try:
+                    client.connect(self.path)
+                except OSError as e:
+                    FlextObservabilityStatsServer.logger.debug(
+                        f"Stats server wake-up failed: {e}"
+                    )
+
+        def _serve(self, listener: socket.socket) -> None:
+            """Accept loop: write one snapshot per connection, then close."""
+            while not self._stopping.is_set():
+                try:
+                    client, _ = listener.accept()
+                except OSError:
+                    return
+                with client:
+                    if self._stopping.is_set():
+                        return
+                    client.settimeout(c.Observability.STATS_CLIENT_TIMEOUT_SEC)
+                    try:
+                        client.sendall(self.payload())
+                    except OSError as e:
+                        FlextObservabilityStatsServer.logger.debug(
+                            f"Stats client dropped: {e}"
+                        )
+                        continue
+                    self._served += 1
+
+    @staticmethod
+    def active_server() -> FlextObservabilityStatsServer.Server:
+        """Return the global stats server instance.
+
+        Returns:
+            Server - Global stats server (not started)
+
+        """
+        if FlextObservabilityStatsServer._server_instance is None:
+            FlextObservabilityStatsServer._server_instance = (
+                FlextObservabilityStatsServer.Server()
+            )
+        return FlextObservabilityStatsServer._server_instance
+
+    @staticmethod
+    def start_stats_server(path: str | None = None) -> p.Result[str]:
+        """Start the global stats server.
+
+        Args:
+            path: Socket path (None = per-process path in the temp directory)
+
+        Returns:
+            r[str] - Socket path being served
+
+        """
+        server = FlextObservabilityStatsServer.active_server()
+        if path is not None and not server.running:
+            server.path = path
+        result = server.start()
+        if result.failure:
+            return r[str].fail_op(
+                "start stats server", result.error or "Stats server failed"
+            )
+        return r[str].ok(server.path)
+
+
+__all__: list[str] = ["FlextObservabilityStatsServer"]
@@ -0,0 +1,240 @@
+"""Signal kill switches with pre-built no-op implementations.
+
+Lets instrumented functions, HTTP middlewares and recording APIs be swapped
+for no-op implementations when a signal (metrics, traces) is disabled, so a
+disabled signal costs a single attribute load and call instead of a settings
+lookup, a ``try`` block and a method dispatch on every call.
+
+FLEXT Pattern:
+- Single FlextObservabilitySwitches class
+- Nested Switch holder rebound at configuration time
+- Settings-driven defaults resolved lazily on first use
+
+Key Features:
+- One shared switch state per signal (metrics, traces)
+- Every bound switch is rebound when ``configure`` runs
+- Optional accounted implementation bound only while overhead accounting
+  is enabled
+- No per-call configuration checks on the hot path
+"""
+
+from __future__ import annotations
+
+import threading
+import weakref
+from collections.abc import Callable
+from typing import ClassVar
+
+from flext_observability import c, p, r, u
+
+
+class FlextObservabilitySwitches:
+    """Kill switches for observability signals.
+
+    Usage:
+        ```python
+        from flext_observability import FlextObservabilitySwitches, c
+
+        # Disable metrics for the whole process: every bound recording API,
+        # decorator and middleware now runs its pre-built no-op implementation
+        FlextObservabilitySwitches.configure(metrics_enabled=False)
+
+        # Bind a custom hot path to a signal
+        switch = FlextObservabilitySwitches.bind(
+            c.Observability.Signal.METRICS, record_sample, lambda *_: None
+        )
+        switch.impl(42)
+        ```
+
+    Nested Classes:
+        Switch: Holder whose ``impl`` is the active implementation
+    """
+
+    logger = u.fetch_logger(__name__)
+    _state: ClassVar[dict[c.Observability.Signal, bool] | None] = None
+    _accounting: ClassVar[bool | None] = None
+    _switches: ClassVar[weakref.WeakSet[FlextObservabilitySwitches.Switch]] = (
+        weakref.WeakSet()
+    )
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+
+    class Switch:
+        """Holder for the active implementation of one switched hot path."""
+
+        __slots__ = (
+            "__weakref__",
+            "accounted_impl",
+            "enabled_impl",
+            "impl",
+            "is_open",
+            "noop_impl",
+            "signal",
+            "signal_enabled",
+        )
+
+        def __init__[**P, R](
+            self,
+            signal: c.Observability.Signal,
+            enabled_impl: Callable[P, R],
+            noop_impl: Callable[P, R],
+            accounted_impl: Callable[P, R] | None = None,
+        ) -> None:
+            """Initialize the switch; the state is resolved on first call."""
+            self.signal = signal
+            self.enabled_impl = enabled_impl
+            self.noop_impl = noop_impl
+            self.accounted_impl = accounted_impl
+            self.is_open = True
+            self.signal_enabled = True
+            self.impl: Callable[..., R] = self._resolve_and_call
+
+        def _resolve_and_call[R](self, *args: object, **kwargs: object) -> R:
+            """Resolve the signal state once, then dispatch to the bound impl."""
+            FlextObservabilitySwitches.ensure_configured()
+            if self.impl == self._resolve_and_call:
+                self.apply(enabled=True)
+            result: R = self.impl(*args, **kwargs)
+            return result
+
+        def apply(self, *, enabled: bool) -> None:
+            """Rebind ``impl`` for the given signal state.
+
+            The accounted implementation replaces the enabled one unless
+            overhead accounting is known to be off; it reads the setting on
+            its first call while the accounting state is unresolved.
+            """
+            self.signal_enabled = enabled
+            if not (enabled and self.is_open):
+                self.impl = self.noop_impl
+            elif (
+                self.accounted_impl is None
+                or FlextObservabilitySwitches._accounting is False
+            ):
+                self.impl = self.enabled_impl
+            else:
+                self.impl = self.accounted_impl
+
+        def gate(self, *, is_open: bool) -> None:
+            """Open or close the switch independently of its signal.
+
+            A closed switch runs the no-op implementation even while the
+            signal is enabled (e.g. a decorated function whose monitor is not
+            running).
+            """
+            with FlextObservabilitySwitches._lock:
+                self.is_open = is_open
+                if self.impl != self._resolve_and_call:
+                    self.apply(enabled=self.signal_enabled)
+
+    @staticmethod
+    def bind[**P, R](
+        signal: c.Observability.Signal,
+        enabled_impl: Callable[P, R],
+        noop_impl: Callable[P, R],
+        *,
+        accounted_impl: Callable[P, R] | None = None,
+    ) -> FlextObservabilitySwitches.Switch:
+        """Create a switch that follows the state of ``signal``.
+
+        Args:
+            signal: Signal controlling the switch
+            enabled_impl: Implementation used while the signal is enabled
+            noop_impl: Pre-built implementation used while it is disabled
+            accounted_impl: Timed variant of ``enabled_impl`` used while
+                overhead accounting is enabled (see ``account``)
+
+        Returns:
+            Switch - Holder whose ``impl`` attribute is the active implementation
+
+        """
+        switch = FlextObservabilitySwitches.Switch(
+            signal, enabled_impl, noop_impl, accounted_impl
+        )
+        with FlextObservabilitySwitches._lock:
+            FlextObservabilitySwitches._switches.add(switch)
+            state = FlextObservabilitySwitches._state
+            if state is not None:
+                switch.apply(enabled=state[signal])
+        return switch
+
+    @staticmethod
+    def configure(
+        *, metrics_enabled: bool | None = None, traces_enabled: bool | None = None
+    ) -> p.Result[bool]:
+        """Apply signal states and rebind every switch.
+
+        Args:
+            metrics_enabled: Metrics state (None = ``settings`` value)
+            traces_enabled: Traces state (None = ``settings`` value)
+
+        Returns:
+            r[bool] - Ok once every switch is rebound
+
+        """
+        try:
+            state = FlextObservabilitySwitches._resolve_state(
+                metrics_enabled=metrics_enabled, traces_enabled=traces_enabled
+            )
+            FlextObservabilitySwitches._apply_state(state)
+        except c.EXC_BASIC_TYPE as e:
+            return r[bool].fail_op("configure observability signals", e)
+        FlextObservabilitySwitches.logger.debug(
+            f"Observability signals configured: {', '.join(f'{k}={v}' for k, v in state.items())}"
+        )
+        return r[bool].ok(value=True)
+
+    @staticmethod
+    def _resolve_state(
+        *, metrics_enabled: bool | None, traces_enabled: bool | None
+    ) -> dict[c.Observability.Signal, bool]:
+        """Resolve each signal state, falling back to ``settings``."""
+        from flext_observability import settings
+
+        observability_settings = settings.Observability
+        return {
+            c.Observability.Signal.METRICS: observability_settings.metrics_enabled
+            if metrics_enabled is None
+            else metrics_enabled,
+            c.Observability.Signal.TRACES: observability_settings.traces_enabled
+            if traces_enabled is None
+            else traces_enabled,
+        }
+
+    @staticmethod
+    def _apply_state(state: dict[c.Observability.Signal, bool]) -> None:
+        """Store the signal states and rebind every registered switch."""
+        with FlextObservabilitySwitches._lock:
+            FlextObservabilitySwitches._state = state
+            for switch in list(FlextObservabilitySwitches._switches):
+                switch.apply(enabled=state[switch.signal])
+
+    @staticmethod
+    def account(*, enabled: bool) -> None:
+        """Apply the overhead accounting state and rebind every switch.
+
+        Called by ``FlextObservabilityOverhead.configure``; switches with an
+        accounted implementation bind it only while accounting is enabled.
+        """
+        with FlextObservabilitySwitches._lock:
+            FlextObservabilitySwitches._accounting = enabled
+            state = FlextObservabilitySwitches._state
+            if state is None:
+                return
+            for switch in list(FlextObservabilitySwitches._switches):
+                switch.apply(enabled=state[switch.signal])
+
+    @staticmethod
+    def ensure_configured() -> None:
+        """Apply the settings-driven state if ``configure`` was never called."""
+        if FlextObservabilitySwitches._state is None:
+            _ = FlextObservabilitySwitches.configure()
+
+    @staticmethod
+    def enabled(signal: c.Observability.Signal) -> bool:
+        """Return whether a signal is currently enabled."""
+        FlextObservabilitySwitches.ensure_configured()
+        state = FlextObservabilitySwitches._state
+        return state is None or state[signal]
+
+
+__all__: list[str] = ["FlextObservabilitySwitches"]
@@ -0,0 +1,352 @@
+"""Cumulative and delta metric temporality over per-thread shards.
+
+Writers record into a shard owned by their thread, guarded by a lock only
+the owner and the collector ever take. Collection swaps each shard's active
+and standby tables (double buffering): the swap is two attribute stores
+under the shard lock, so a writer waits at most for that swap and an
+increment lands either in the table being collected or in the fresh one -
+never in neither. Swapped tables are folded into the cumulative aggregation
+store and - once deltas are wanted - into a pending delta; a delta export
+hands the pending delta over and starts a new one, so checkpointing touches
+only the series written since the previous export instead of diffing every
+cumulative series.
+
+FLEXT Pattern:
+- Single FlextObservabilityTemporality class
+- Nested Shard (double-buffered per-thread tables) and Recorder
+- Recorder attached to its aggregation store, flushed before every read
+
+Key Features:
+- Cumulative reads through the aggregation store, unchanged
+- Delta exports of everything recorded since the previous delta export
+- No lost increments and no writer blocked by serialization
+- Shards of finished threads drained and dropped on the next flush
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+import weakref
+from collections.abc import Sequence
+from typing import ClassVar
+
+from flext_observability import c, t
+from flext_observability.services.aggregation import FlextObservabilityAggregation
+
+
+class FlextObservabilityTemporality:
+    """Per-thread metric recording with cumulative and delta collection.
+
+    Usage:
+        ```python
+        from flext_observability import FlextObservabilityTemporality, c
+
+        recorder = FlextObservabilityTemporality.active_recorder()
+        recorder.record("jobs_total", 1.0, c.Observability.MetricType.COUNTER)
+
+        # Increments since the previous delta export
+        delta = recorder.export(c.Observability.Temporality.DELTA)
+
+        # Totals since start (also what the aggregation store renders)
+        total = recorder.export(c.Observability.Temporality.CUMULATIVE)
+        ```
+
+    Nested Classes:
+        Shard: Double-buffered series table owned by one thread
+        Recorder: Shard registry with cumulative and delta collection
+    """
+
+    _recorder_instance: ClassVar[FlextObservabilityTemporality.Recorder | None] = None
+
+    class Shard:
+        """Series tables of one writer thread.
+
+        ``active`` receives observations; ``standby`` is the reset table the
+        next ``swap`` puts in its place. Both keep their series between
+        swaps, so steady-state recording allocates nothing.
+        """
+
+        __slots__ = ("active", "lock", "standby", "thread")
+
+        def __init__(self, thread: threading.Thread) -> None:
+            """Initialize empty tables owned by ``thread``."""
+            self.lock = threading.Lock()
+            self.active: dict[int, FlextObservabilityAggregation.Series] = {}
+            self.standby: dict[int, FlextObservabilityAggregation.Series] = {}
+            self.thread = weakref.ref(thread)
+
+        @property
+        def alive(self) -> bool:
+            """Whether the owning thread can still record into this shard."""
+            thread = self.thread()
+            return thread is not None and thread.is_alive()
+
+        def swap(self) -> dict[int, FlextObservabilityAggregation.Series]:
+            """Put the standby table in place and return the filled one."""
+            with self.lock:
+                filled = self.active
+                self.active = self.standby
+                self.standby = filled
+            return filled
+
+    class Recorder:
+        """Records through per-thread shards into an aggregation store."""
+
+        def __init__(
+            self, store: FlextObservabilityAggregation.Store | None = None
+        ) -> None:
+            """Initialize a recorder feeding ``store`` (the global by default).
+
+            The store keeps a weak reference and flushes the recorder before
+            every read, so cumulative values include unflushed shards. A
+            pending delta is kept only when ``metrics_temporality`` is
+            ``delta`` or from the first delta collection on, so cumulative
+            setups hold no second copy of their series.
+            """
+            self._store = (
+                FlextObservabilityAggregation.active_store() if store is None else store
+            )
+            self._local = threading.local()
+            self._shards: list[FlextObservabilityTemporality.Shard] = []
+            self._shards_lock = threading.Lock()
+            self._collect_lock = threading.Lock()
+            self._delta: dict[int, FlextObservabilityAggregation.Series] = {}
+            self._keep_delta = (
+                self._temporality(None) == c.Observability.Temporality.DELTA
+            )
+            self._start_ns = time.time_ns()
+            self._delta_start_ns = self._start_ns
+            self._flushed_ns = self._start_ns
+            self._store.attach(self)
+
+        @property
+        def store(self) -> FlextObservabilityAggregation.Store:
+            """Aggregation store holding the cumulative series."""
+            return self._store
+
+        def record(
+            self,
+            name: str,
+            value: float,
+            metric_type: str = c.Observability.MetricType.GAUGE,
+            labels: t.StrMapping | None = None,
+        ) -> None:
+            """Record one observation into the calling thread's shard."""
+            series_id = self._store.registry.series_id(name, labels)
+            self.record_id(series_id, value, metric_type)
+
+        def record_id(
+            self,
+            series_id: int,
+            value: float,
+            metric_type: str = c.Observability.MetricType.GAUGE,
+        ) -> None:
+            """Record one observation of a registry series ID."""
+            shard = self._shard()
+            with shard.lock:
+                series = shard.active.get(series_id)
+                if series is None:
+                    series = FlextObservabilityAggregation.Series(
+                        "",
+                        (),
+                        c.Observability.MetricType(metric_type),
+                        self._store.bounds,
+                    )
+                    shard.active[series_id] = series
+                series.observe(float(value))
+
+        def flush(self) -> int:
+            """Swap every shard and fold it into the store (and kept delta).
+
+            Returns:
+                int - Number of observations folded
+
+            Behavior:
+                - Writers are held only for each shard's swap
+                - Store handles are resolved before the store lock is taken,
+                  which is then held once per shard
+                - Shards of finished threads are dropped once drained
+
+            """
+            folded = 0
+            with self._collect_lock:
+                started_ns = time.time_ns()
+                with self._shards_lock:
+                    shards = list(self._shards)
+                for shard in shards:
+                    # A thread found finished before its swap cannot write
+                    # to the fresh table, so the shard is drained for good.
+                    alive = shard.alive
+                    folded += self._fold(shard.swap())
+                    if not alive:
+                        with self._shards_lock:
+                            self._shards.remove(shard)
+                self._flushed_ns = started_ns
+            return folded
+
+        def clear(self) -> None:
+            """Drop unflushed shards and the pending delta.
+
+            Called by ``Store.clear``; shards of finished threads are dropped
+            and the delta window restarts now.
+            """
+            with self._collect_lock:
+                with self._shards_lock:
+                    shards = list(self._shards)
+                for shard in shards:
+                    alive = shard.alive
+                    for part in shard.swap().values():
+                        part.reset()
+                    if not alive:
+                        with self._shards_lock:
+                            self._shards.remove(shard)
+                self._delta = {}
+                self._delta_start_ns = self._flushed_ns = time.time_ns()
+
+        def collect(
+            self, temporality: str | None = None
+        ) -> Sequence[FlextObservabilityAggregation.Series]:
+            """Return detached series in the requested temporality.
+
+            Args:
+                temporality: ``cumulative`` or ``delta``; defaults to the
+                    ``metrics_temporality`` setting
+
+            Returns:
+                Sequence[Series] - Cumulative: every series of the store;
+                delta: the series recorded since the previous delta
+                collection, which this call checkpoints
+
+            """
+            if self._temporality(temporality) == c.Observability.Temporality.DELTA:
+                self._track_delta()
+                _ = self.flush()
+                with self._collect_lock:
+                    delta, self._delta = self._delta, {}
+                    self._delta_start_ns = time.time_ns()
+                return list(delta.values())
+            return self._store.capture()
+
+        def export(self, temporality: str | None = None) -> t.JsonDict:
+            """Collect and serialize the series with their time window.
+
+            Returns:
+                dict - ``temporality``, ``start_time_unix_nano`` (start of
+                the window), ``time_unix_nano`` and ``series`` snapshots
+
+            """
+            mode = self._temporality(temporality)
+            start_ns = self._start_ns
+            if mode == c.Observability.Temporality.DELTA:
+                self._track_delta()
+                start_ns = self._delta_start_ns
+            series = self.collect(mode)
+            return {
+                "temporality": mode.value,
+                "start_time_unix_nano": start_ns,
+                "time_unix_nano": time.time_ns(),
+                "series": [item.snapshot() for item in series],
+            }
+
+        def _track_delta(self) -> None:
+            """Start keeping the pending delta (on the first delta collection).
+
+            The window starts at the last flush: everything folded before it
+            is in the store only, everything after is still in the shards.
+            """
+            with self._collect_lock:
+                if not self._keep_delta:
+                    self._keep_delta = True
+                    self._delta_start_ns = self._flushed_ns
+
+        def _shard(self) -> FlextObservabilityTemporality.Shard:
+            """Return (registering on first use) the calling thread's shard."""
+            shard: FlextObservabilityTemporality.Shard | None = getattr(
+                self._local, "shard", None
+            )
+            if shard is None:
+                shard = FlextObservabilityTemporality.Shard(threading.current_thread())
+                self._local.shard = shard
+                with self._shards_lock:
+                    self._shards.append(shard)
+            return shard
+
+        def _fold(self, filled: dict[int, FlextObservabilityAggregation.Series]) -> int:
+            """Fold a swapped-out table, then reset it for reuse as standby.
+
+            Observations of a series the store refuses (its name has another
+            type) are dropped with the reset.
+            """
+            store = self._store
+            written: list[
+                tuple[
+                    int,
+                    FlextObservabilityAggregation.Series,
+                    FlextObservabilityAggregation.Series,
+                ]
+            ] = []
+            for series_id, part in filled.items():
+                if not part.count:
+                    continue
+                resolved = store.handle_id(series_id, part.metric_type)
+                if resolved.failure:
+                    part.reset()
+                    continue
+                written.append((series_id, part, resolved.value))
+            if not written:
+                return 0
+            folded = 0
+            keep_delta = self._keep_delta
+            with store.lock:
+                for series_id, part, target in written:
+                    aggregates = [target]
+                    if keep_delta:
+                        delta = self._delta.get(series_id)
+                        if delta is None:
+                            delta = FlextObservabilityAggregation.Series(
+                                target.name,
+                                target.labels,
+                                target.metric_type,
+                                store.bounds,
+                            )
+                            self._delta[series_id] = delta
+                        aggregates.append(delta)
+                    for aggregate in aggregates:
+                        aggregate.merge(
+                            count=part.count,
+                            total=part.sum,
+                            minimum=part.min,
+                            maximum=part.max,
+                            last=part.last,
+                            buckets=part.buckets,
+                        )
+                    folded += part.count
+                    part.reset()
+            return folded
+
+        @staticmethod
+        def _temporality(temporality: str | None) -> c.Observability.Temporality:
+            """Resolve a temporality name, falling back to the setting."""
+            if temporality is None:
+                from flext_observability import settings
+
+                temporality = settings.Observability.metrics_temporality
+            return c.Observability.Temporality(temporality)
+
+    @staticmethod
+    def active_recorder() -> FlextObservabilityTemporality.Recorder:
+        """Return the global recorder, feeding the global aggregation store.
+
+        Returns:
+            Recorder - Global recorder
+
+        """
+        if FlextObservabilityTemporality._recorder_instance is None:
+            FlextObservabilityTemporality._recorder_instance = (
+                FlextObservabilityTemporality.Recorder()
+            )
+        return FlextObservabilityTemporality._recorder_instance
+
+
+__all__: list[str] = ["FlextObservabilityTemporality"]
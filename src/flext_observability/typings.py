@@ -7,6 +7,8 @@ SPDX-License-Identifier: MIT
 
 from __future__ import annotations
 
+from collections.abc import Awaitable, Callable
+
 from flext_cli import t
 
 
@@ -18,6 +20,13 @@ class FlextObservabilityTypes(t):
 
         type DomainLabels = t.ScalarMapping
         type HealthMetricsDict = t.JsonMapping
+        type HealthOutcome = bool | str
+        type HealthCheckCallable = Callable[
+            [], HealthOutcome | Awaitable[HealthOutcome]
+        ]
+        type LabelSet = tuple[tuple[str, str], ...]
+        type ScalarLabelSet = tuple[tuple[str, t.Scalar], ...]
+        type SeriesKey = tuple[str, tuple[tuple[str, str], ...]]
 
 
 t = FlextObservabilityTypes
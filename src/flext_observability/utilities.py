@@ -9,8 +9,13 @@ SPDX-License-Identifier: MIT
 
 from __future__ import annotations
 
+import re
+from pathlib import Path
+from types import CodeType
+from typing import ClassVar
+
 from flext_cli import u
-from flext_observability import p, r
+from flext_observability import c, p, r
 
 
 class FlextObservabilityUtilities(u):
@@ -23,6 +28,55 @@ class FlextObservabilityUtilities(u):
     class Observability:
         """Observability-specific project utilities."""
 
+        class Fingerprint:
+            """Error fingerprint normalisation helpers."""
+
+            variables: ClassVar[re.Pattern[str]] = re.compile(
+                c.Observability.FINGERPRINT_VARIABLE_PATTERN
+            )
+            file_names: ClassVar[dict[CodeType, str]] = {}
+
+            @staticmethod
+            def normalize_message(message: str) -> str:
+                """Replace variable tokens so similar messages group together.
+
+                Quoted strings, UUIDs, IPs, hex values and numbers are replaced
+                by placeholders in one pass of a precompiled tokenizer, e.g.
+                ``Timeout after 3012ms for id=8812`` becomes
+                ``Timeout after <num>ms for id=<num>``.
+                """
+                placeholders = c.Observability.FINGERPRINT_VARIABLE_PLACEHOLDERS
+                return (
+                    FlextObservabilityUtilities.Observability.Fingerprint.variables.sub(
+                        lambda match: placeholders[match.lastgroup or "number"], message
+                    )
+                )
+
+            @staticmethod
+            def frame_location(error: BaseException) -> str:
+                """Return ``filename:lineno`` of the frame that raised ``error``.
+
+                The file name is cached per code object, so repeated errors
+                from the same function only walk the traceback. Returns an
+                empty string for exceptions that were never raised.
+                """
+                traceback = error.__traceback__
+                if traceback is None:
+                    return ""
+                while traceback.tb_next is not None:
+                    traceback = traceback.tb_next
+                code = traceback.tb_frame.f_code
+                file_names = (
+                    FlextObservabilityUtilities.Observability.Fingerprint.file_names
+                )
+                file_name = file_names.get(code)
+                if file_name is None:
+                    if len(file_names) >= c.Observability.FINGERPRINT_MEMO_SIZE:
+                        file_names.clear()
+                    file_name = Path(code.co_filename).name
+                    file_names[code] = file_name
+                return f"{file_name}:{traceback.tb_lineno}"
+
         class Performance:
             """Performance tracking helpers."""
 
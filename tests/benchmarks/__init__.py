@@ -0,0 +1,36 @@
+# AUTO-GENERATED FILE — Regenerate with: make gen
+"""Benchmarks package."""
+
+from __future__ import annotations
+
+from flext_core.lazy import build_lazy_import_map, install_lazy_exports
+
+_LAZY_IMPORTS = build_lazy_import_map({
+    ".test_hot_paths_benchmark": ("TestsFlextObservabilityHotPathsBenchmark",),
+    ".test_http_benchmark": ("TestsFlextObservabilityHTTPBenchmark",),
+    ".test_import_benchmark": ("TestsFlextObservabilityImportBenchmark",),
+    ".test_monitor_benchmark": ("TestsFlextObservabilityMonitorBenchmark",),
+    ".test_series_benchmark": ("TestsFlextObservabilitySeriesBenchmark",),
+    ".test_switches_benchmark": ("TestsFlextObservabilitySwitchesBenchmark",),
+    "flext_tests": (
+        "c",
+        "d",
+        "e",
+        "h",
+        "m",
+        "p",
+        "r",
+        "s",
+        "t",
+        "td",
+        "tf",
+        "tk",
+        "tm",
+        "tv",
+        "u",
+        "x",
+    ),
+})
+
+
+install_lazy_exports(__name__, globals(), _LAZY_IMPORTS, publish_all=False)
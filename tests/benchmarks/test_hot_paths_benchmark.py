@@ -0,0 +1,113 @@
+"""Benchmarks for the per-call hot paths of the services package.
+
+Each path is benchmarked with ``pytest-benchmark`` (baselines are stored and
+compared by ``make test WHAT=benchmarks``) and checked against the latency
+budgets of ``FlextObservabilityPerformance.performance_acceptable``.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Generator
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from flext_observability import (
+    FlextObservability,
+    FlextObservabilityColumnar,
+    FlextObservabilityContext,
+    FlextObservabilityErrorHandling,
+    FlextObservabilityLogging,
+    FlextObservabilityMonitor,
+    FlextObservabilitySampling,
+    FlextObservabilitySwitches,
+    m,
+)
+from flext_tests import tm
+from tests import u
+
+__all__ = ["TestsFlextObservabilityHotPathsBenchmark"]
+
+CALLS = 2_000
+HEADERS = {
+    "X-Correlation-ID": "corr-bench",
+    "X-Trace-ID": "trace-bench",
+    "X-Span-ID": "span-bench",
+}
+LOGGER = u.fetch_logger("flext_observability.benchmarks")
+BATCH = FlextObservabilityColumnar.Batch()
+
+
+def _error_event() -> m.Observability.ErrorEvent:
+    return m.Observability.ErrorEvent(error_type="TimeoutError", message="upstream 504")
+
+
+HOT_PATHS: dict[str, Callable[[], object]] = {
+    "sampling_should_sample": lambda: FlextObservabilitySampling.should_sample(
+        operation="GET /users", service="api"
+    ),
+    "context_from_headers": lambda: FlextObservabilityContext.from_headers(HEADERS),
+    "context_to_headers": FlextObservabilityContext.to_headers,
+    "context_log_with_context": lambda: FlextObservabilityLogging.log_with_context(
+        LOGGER, "debug", "bench", extra={"rows": 10}
+    ),
+    "metrics_flext_metric": lambda: FlextObservability.flext_metric(
+        "bench_rows_total", 1.0
+    ),
+    "metrics_columnar_append": lambda: BATCH.flext_metric("bench_rows_total", 1.0),
+    "errors_record_error": lambda: FlextObservabilityErrorHandling.record_error(
+        _error_event()
+    ),
+}
+
+
+@pytest.mark.usefixtures("metrics_enabled")
+class TestsFlextObservabilityHotPathsBenchmark:
+    """Sampling, context propagation, logging, metrics and error recording."""
+
+    @pytest.fixture
+    def metrics_enabled(self) -> Generator[None]:
+        """Enable metrics for the test and restore settings afterwards."""
+        FlextObservabilitySwitches.configure(metrics_enabled=True)
+        yield
+        FlextObservabilitySwitches.configure()
+
+    @pytest.mark.performance
+    @pytest.mark.parametrize("operation", sorted(HOT_PATHS))
+    def test_hot_path_within_latency_budget(self, operation: str) -> None:
+        """Every hot path stays inside its performance_acceptable budget."""
+        tm.that(
+            u.Observability.Tests.within_budget(operation, HOT_PATHS[operation], CALLS),
+            eq=True,
+        )
+
+    @pytest.mark.performance
+    @pytest.mark.parametrize("operation", sorted(HOT_PATHS))
+    def test_benchmark_hot_path(
+        self, benchmark: BenchmarkFixture, operation: str
+    ) -> None:
+        """Benchmark one hot path."""
+        _ = benchmark(HOT_PATHS[operation])
+
+    @pytest.mark.performance
+    def test_benchmark_flext_record_metric(self, benchmark: BenchmarkFixture) -> None:
+        """Benchmark recording a metric through the monitor."""
+        monitor = FlextObservabilityMonitor()
+        result = benchmark(
+            monitor.flext_record_metric, "bench_requests_total", 1.0, "counter"
+        )
+        tm.that(result.success, eq=True)
+        tm.that(
+            u.Observability.Tests.within_budget(
+                "metrics_flext_record_metric",
+                lambda: monitor.flext_record_metric(
+                    "bench_requests_total", 1.0, "counter"
+                ),
+                CALLS,
+            ),
+            eq=True,
+        )
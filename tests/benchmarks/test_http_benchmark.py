@@ -0,0 +1,83 @@
+"""Benchmarks for the Flask, FastAPI and httpx instrumentation hot paths.
+
+Requests go through the frameworks' in-process test clients and an httpx
+mock transport, so the numbers cover the instrumentation and the framework
+dispatch without any network I/O.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+
+import flask
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from flext_observability import FlextObservabilityHTTP, FlextObservabilityHTTPClient
+from flext_tests import tm
+from tests import u
+
+__all__ = ["TestsFlextObservabilityHTTPBenchmark"]
+
+CALLS = 200
+
+
+def _flask_get() -> Callable[[], object]:
+    app = flask.Flask(__name__)
+    app.add_url_rule("/ping", "ping", lambda: "pong")
+    tm.that(FlextObservabilityHTTP.Flask.setup_instrumentation(app).success, eq=True)
+    client = app.test_client()
+    return lambda: client.get("/ping")
+
+
+def _fastapi_get() -> Callable[[], object]:
+    fastapi = pytest.importorskip("fastapi")
+    testclient = pytest.importorskip("fastapi.testclient")
+    app = fastapi.FastAPI()
+    app.add_api_route("/ping", lambda: {"pong": True})
+    tm.that(FlextObservabilityHTTP.FastAPI.setup_instrumentation(app).success, eq=True)
+    client = testclient.TestClient(app)
+    return lambda: client.get("/ping")
+
+
+def _httpx_get() -> Callable[[], object]:
+    httpx = pytest.importorskip("httpx")
+    transport = httpx.MockTransport(lambda _request: httpx.Response(200))
+    client = httpx.Client(transport=transport)
+    tm.that(
+        FlextObservabilityHTTPClient.HTTPX.setup_instrumentation(client).success,
+        eq=True,
+    )
+    return lambda: client.get("http://bench.local/users")
+
+
+CLIENTS: dict[str, Callable[[], Callable[[], object]]] = {
+    "http_flask_request": _flask_get,
+    "http_fastapi_request": _fastapi_get,
+    "http_httpx_client_request": _httpx_get,
+}
+
+
+class TestsFlextObservabilityHTTPBenchmark:
+    """Instrumented server middlewares and client wrapping."""
+
+    @pytest.mark.performance
+    @pytest.mark.parametrize("operation", sorted(CLIENTS))
+    def test_request_within_latency_budget(self, operation: str) -> None:
+        """Instrumented requests stay inside the HTTP budget."""
+        tm.that(
+            u.Observability.Tests.within_budget(operation, CLIENTS[operation](), CALLS),
+            eq=True,
+        )
+
+    @pytest.mark.performance
+    @pytest.mark.parametrize("operation", sorted(CLIENTS))
+    def test_benchmark_request(
+        self, benchmark: BenchmarkFixture, operation: str
+    ) -> None:
+        """Benchmark one instrumented request."""
+        _ = benchmark(CLIENTS[operation]())
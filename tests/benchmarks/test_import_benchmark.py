@@ -0,0 +1,144 @@
+"""Import-time budget for the package and its instrumentation modules.
+
+Each check imports a module in a fresh interpreter under
+``python -X importtime`` and parses the per-module report from stderr, so
+the numbers cover a cold start exactly as CLI tools and short-lived jobs pay
+it.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+# Cold imports need a fresh interpreter; only sys.executable is ever run.
+import subprocess  # ruff: ignore[suspicious-subprocess-import]
+import sys
+
+import pytest
+
+from flext_tests import tm
+
+__all__ = ["TestsFlextObservabilityImportBenchmark"]
+
+# Cold import of the services, flext-core and flext-cli stack; leaves
+# headroom for slow CI hosts while catching an eager framework import
+# (Flask and Starlette alone add well over 100 ms).
+IMPORT_BUDGET_US = 1_500_000
+DEFERRED_MODULES = ("fastapi", "flask", "psutil", "starlette")
+IMPORTED_MODULES = (
+    "flext_observability",
+    "flext_observability.services.context",
+    "flext_observability.services.http_instrumentation",
+    "flext_observability.services.performance",
+)
+# The slim core over an already imported package: a few services and no
+# plug-in, so it must stay far below the full facade on both counts.
+SLIM_MODULE = "flext_observability.services.core"
+SLIM_IMPORT_BUDGET_US = 300_000
+SLIM_MEMORY_BUDGET_BYTES = 8 * 1024 * 1024
+PLUGIN_MODULES = (
+    "flext_observability.api",
+    "flext_observability.services.health",
+    "flext_observability.services.http_client_instrumentation",
+    "flext_observability.services.http_instrumentation",
+    "flext_observability.services.monitoring",
+    "flext_observability.services.profiler",
+)
+PACKAGE_PRELUDE = "from flext_observability import c, m, p, r, t, u\n"
+
+
+def _import_times(statement: str) -> dict[str, int]:
+    """Run ``statement`` with ``-X importtime``; return cumulative us per module."""
+    # Fixed argv: this interpreter and statements built from module constants.
+    completed = subprocess.run(  # ruff: ignore[subprocess-without-shell-equals-true]
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        check=True,
+        text=True,
+        timeout=60,
+    )
+    times: dict[str, int] = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def _traced_import_bytes(module: str) -> int:
+    """Peak bytes allocated importing ``module`` after the package prelude."""
+    # Fixed argv: this interpreter and statements built from module constants.
+    completed = subprocess.run(  # ruff: ignore[subprocess-without-shell-equals-true]
+        [
+            sys.executable,
+            "-c",
+            (
+                f"{PACKAGE_PRELUDE}import tracemalloc\n"
+                f"tracemalloc.start()\nimport {module}\n"
+                "print(tracemalloc.get_traced_memory()[1])"
+            ),
+        ],
+        capture_output=True,
+        check=True,
+        text=True,
+        timeout=60,
+    )
+    return int(completed.stdout.strip())
+
+
+class TestsFlextObservabilityImportBenchmark:
+    """Cold import cost and deferred optional dependencies."""
+
+    @pytest.mark.performance
+    @pytest.mark.parametrize("module", IMPORTED_MODULES)
+    def test_import_defers_optional_dependencies(self, module: str) -> None:
+        """Frameworks and psutil are not imported with the module."""
+        times = _import_times(f"import {module}")
+        tm.that(times, has=module)
+        for deferred in DEFERRED_MODULES:
+            tm.that(deferred in times, eq=False)
+
+    @pytest.mark.performance
+    @pytest.mark.parametrize("module", IMPORTED_MODULES)
+    def test_import_within_budget(self, module: str) -> None:
+        """A cold import of the module stays inside the startup budget."""
+        times = _import_times(f"import {module}")
+        tm.that(times[module], lt=IMPORT_BUDGET_US)
+
+    @pytest.mark.performance
+    def test_facade_import_defers_frameworks(self) -> None:
+        """Resolving the facade and its settings does not import frameworks."""
+        times = _import_times(
+            "from flext_observability import FlextObservability, settings\n"
+            "settings.Observability.service_name"
+        )
+        for deferred in DEFERRED_MODULES:
+            tm.that(deferred in times, eq=False)
+
+    @pytest.mark.performance
+    def test_slim_core_leaves_plugins_unimported(self) -> None:
+        """The core and its first use import no plug-in or framework."""
+        times = _import_times(
+            f"from {SLIM_MODULE} import FlextObservabilityCore as core\n"
+            "core.context.update_trace_id()\n"
+            "core.record('jobs_total', 1.0)\n"
+            "core.should_sample('job')"
+        )
+        for module in (*PLUGIN_MODULES, *DEFERRED_MODULES):
+            tm.that(module in times, eq=False)
+
+    @pytest.mark.performance
+    def test_slim_core_within_startup_budget(self) -> None:
+        """Importing the core on top of the package stays inside its budget."""
+        times = _import_times(f"{PACKAGE_PRELUDE}import {SLIM_MODULE}")
+        tm.that(times[SLIM_MODULE], lt=SLIM_IMPORT_BUDGET_US)
+
+    @pytest.mark.performance
+    def test_slim_core_within_memory_budget(self) -> None:
+        """The core allocates less than its budget and than the full facade."""
+        slim_bytes = _traced_import_bytes(SLIM_MODULE)
+        tm.that(slim_bytes, lt=SLIM_MEMORY_BUDGET_BYTES)
+        tm.that(slim_bytes, lt=_traced_import_bytes("flext_observability.api"))
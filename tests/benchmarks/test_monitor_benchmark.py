@@ -0,0 +1,67 @@
+"""Benchmarks for the enabled monitoring decorator hot path.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import timeit
+from collections.abc import Generator
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from flext_observability import FlextObservabilityMonitor, FlextObservabilitySwitches
+from flext_tests import tm
+
+__all__ = ["TestsFlextObservabilityMonitorBenchmark"]
+
+CALLS = 200_000
+# Two perf_counter_ns reads plus one buffered append per call; the budget
+# leaves headroom for slow CI hosts while catching a return to per-call
+# MetricEntry construction (tens of microseconds).
+MAX_ENABLED_OVERHEAD_NS = 1_000
+
+
+def _plain(value: int) -> int:
+    return value
+
+
+class TestsFlextObservabilityMonitorBenchmark:
+    """Decorator cost while metrics are enabled and the monitor runs."""
+
+    @pytest.fixture
+    def running_monitor(self) -> Generator[FlextObservabilityMonitor]:
+        """Provide a running monitor with metrics enabled."""
+        FlextObservabilitySwitches.configure(metrics_enabled=True)
+        monitor = FlextObservabilityMonitor()
+        monitor.flext_initialize_observability()
+        monitor.flext_start_monitoring()
+        yield monitor
+        monitor.flext_stop_monitoring()
+        FlextObservabilitySwitches.configure()
+
+    @pytest.mark.performance
+    def test_enabled_decorator_overhead_is_sub_microsecond(
+        self, running_monitor: FlextObservabilityMonitor
+    ) -> None:
+        """A recorded call costs well under a microsecond over a plain call."""
+        decorated = FlextObservabilityMonitor.flext_monitor_function(
+            monitor=running_monitor, metric_name="bench_enabled"
+        )(_plain)
+        plain_s = min(timeit.repeat(lambda: _plain(1), number=CALLS, repeat=5))
+        decorated_s = min(timeit.repeat(lambda: decorated(1), number=CALLS, repeat=5))
+        overhead_ns = (decorated_s - plain_s) / CALLS * 1e9
+        tm.that(overhead_ns, lt=MAX_ENABLED_OVERHEAD_NS)
+
+    @pytest.mark.performance
+    def test_benchmark_enabled_decorated_call(
+        self, benchmark: BenchmarkFixture, running_monitor: FlextObservabilityMonitor
+    ) -> None:
+        """Benchmark a recorded decorated call."""
+        decorated = FlextObservabilityMonitor.flext_monitor_function(
+            monitor=running_monitor, metric_name="bench_enabled_call"
+        )(_plain)
+        tm.that(benchmark(decorated, 1), eq=1)
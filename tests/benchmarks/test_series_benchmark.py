@@ -0,0 +1,55 @@
+"""Capacity and lookup benchmarks for the series registry.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from flext_observability import FlextObservabilitySeries
+from flext_tests import tm
+
+__all__ = ["TestsFlextObservabilitySeriesBenchmark"]
+
+SERIES_COUNT = 1_000_000
+# Packed key, dict slot and boxed ID per series with three labels; interned
+# strings and pairs are shared and the lookup cache is bounded.
+SERIES_BYTES_BUDGET = 160.0
+
+
+def _labels(index: int) -> dict[str, str]:
+    return {
+        "method": "GET",
+        "route": f"/items/{index % 1000}",
+        "tenant": str(index // 1000),
+    }
+
+
+class TestsFlextObservabilitySeriesBenchmark:
+    """One million series within budget; cached lookups on the hot path."""
+
+    @pytest.mark.performance
+    def test_million_series_within_memory_budget(self) -> None:
+        """Table memory per series stays flat up to a million series."""
+        registry = FlextObservabilitySeries.Registry()
+        for index in range(SERIES_COUNT):
+            _ = registry.series_id("http_requests_total", _labels(index))
+        tm.that(len(registry), eq=SERIES_COUNT)
+        tm.that(registry.strings, lt=2_100)
+        tm.that(registry.bytes_per_series, lt=SERIES_BYTES_BUDGET)
+        last = registry.decode(SERIES_COUNT - 1)
+        tm.that(last[1], eq=tuple(sorted(_labels(SERIES_COUNT - 1).items())))
+
+    @pytest.mark.performance
+    def test_benchmark_cached_series_id(self, benchmark: BenchmarkFixture) -> None:
+        """Benchmark resolving an already seen label mapping."""
+        registry = FlextObservabilitySeries.Registry()
+        labels = _labels(42)
+        expected = registry.series_id("http_requests_total", labels)
+        tm.that(
+            benchmark(registry.series_id, "http_requests_total", labels), eq=expected
+        )
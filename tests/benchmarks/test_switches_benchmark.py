@@ -0,0 +1,76 @@
+"""Benchmarks proving disabled signals cost close to nothing.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import timeit
+from collections.abc import Generator
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from flext_observability import FlextObservabilityMonitor, FlextObservabilitySwitches
+from flext_tests import tm
+
+__all__ = ["TestsFlextObservabilitySwitchesBenchmark"]
+
+CALLS = 200_000
+# A disabled decorator adds one wrapper frame plus one attribute call; allow
+# generous headroom for noisy CI hosts while still catching a real regression
+# (the enabled path costs tens of microseconds per call).
+MAX_DISABLED_OVERHEAD_NS = 500
+
+
+def _plain(value: int) -> int:
+    return value
+
+
+@pytest.mark.usefixtures("metrics_disabled")
+class TestsFlextObservabilitySwitchesBenchmark:
+    """Kill-switch cost when metrics are disabled."""
+
+    @pytest.fixture
+    def metrics_disabled(self) -> Generator[None]:
+        """Disable metrics for the test and restore settings afterwards."""
+        FlextObservabilitySwitches.configure(metrics_enabled=False)
+        yield
+        FlextObservabilitySwitches.configure()
+
+    @pytest.mark.performance
+    def test_disabled_decorator_overhead_is_near_zero(self) -> None:
+        """A decorated call costs at most a few hundred ns over a plain call."""
+        decorated = FlextObservabilityMonitor.flext_monitor_function()(_plain)
+        plain_s = min(timeit.repeat(lambda: _plain(1), number=CALLS, repeat=5))
+        decorated_s = min(timeit.repeat(lambda: decorated(1), number=CALLS, repeat=5))
+        overhead_ns = (decorated_s - plain_s) / CALLS * 1e9
+        tm.that(overhead_ns, lt=MAX_DISABLED_OVERHEAD_NS)
+
+    @pytest.mark.performance
+    def test_disabled_record_metric_returns_shared_ok(self) -> None:
+        """Disabled recording succeeds without touching the aggregation store."""
+        monitor = FlextObservabilityMonitor()
+        first = monitor.flext_record_metric("disabled_total", 1, "counter")
+        second = monitor.flext_record_metric("disabled_total", 1, "counter")
+        tm.that(first.success, eq=True)
+        tm.that(first is second, eq=True)
+
+    @pytest.mark.performance
+    def test_benchmark_disabled_record_metric(
+        self, benchmark: BenchmarkFixture
+    ) -> None:
+        """Benchmark the disabled ``flext_record_metric`` path."""
+        monitor = FlextObservabilityMonitor()
+        result = benchmark(monitor.flext_record_metric, "disabled_total", 1, "counter")
+        tm.that(result.success, eq=True)
+
+    @pytest.mark.performance
+    def test_benchmark_disabled_decorated_call(
+        self, benchmark: BenchmarkFixture
+    ) -> None:
+        """Benchmark a decorated call while metrics are disabled."""
+        decorated = FlextObservabilityMonitor.flext_monitor_function()(_plain)
+        tm.that(benchmark(decorated, 1), eq=1)
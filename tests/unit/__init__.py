@@ -6,9 +6,26 @@ from __future__ import annotations
 from flext_core.lazy import build_lazy_import_map, install_lazy_exports
 
 _LAZY_IMPORTS = build_lazy_import_map({
+    ".test_aggregation": ("TestsFlextObservabilityAggregation",),
+    ".test_alerting": ("TestsFlextObservabilityAlerting",),
+    ".test_cardinality": ("TestsFlextObservabilityCardinality",),
+    ".test_cli": ("TestsFlextObservabilityCli",),
+    ".test_columnar": ("TestsFlextObservabilityColumnar",),
     ".test_constants": ("TestsFlextObservabilityConstantsUnit",),
+    ".test_core": ("TestsFlextObservabilityCore",),
+    ".test_error_handling": ("TestsFlextObservabilityErrorHandling",),
     ".test_factory": ("TestsFlextObservabilityFactory",),
+    ".test_health": ("TestsFlextObservabilityHealth",),
+    ".test_http_endpoints": ("TestsFlextObservabilityHTTPEndpoints",),
     ".test_init": ("TestsFlextObservabilityInit",),
+    ".test_monitoring": ("TestsFlextObservabilityMonitoring",),
+    ".test_multiprocess": ("TestsFlextObservabilityMultiprocess",),
+    ".test_overhead": ("TestsFlextObservabilityOverhead",),
+    ".test_profiler": ("TestsFlextObservabilityProfiler",),
+    ".test_series": ("TestsFlextObservabilitySeries",),
+    ".test_spill": ("TestsFlextObservabilitySpill",),
+    ".test_stats_server": ("TestsFlextObservabilityStatsServer",),
+    ".test_temporality": ("TestsFlextObservabilityTemporality",),
     "flext_tests": (
         "c",
         "d",
@@ -0,0 +1,151 @@
+"""Behavioral tests for in-process metric aggregation and bulk recording.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+from flext_observability import FlextObservabilityAggregation, c
+from flext_tests import tm
+
+__all__ = ["TestsFlextObservabilityAggregation"]
+
+MetricType = c.Observability.MetricType
+
+
+class TestsFlextObservabilityAggregation:
+    """Public contract of the aggregation store."""
+
+    def test_record_bulk_folds_count_sum_and_extremes(self) -> None:
+        """A bulk batch produces the same aggregate as recording one by one."""
+        store = FlextObservabilityAggregation.Store()
+        result = store.record_bulk("etl_row_duration_seconds", [0.2, 0.001, 3.0])
+        tm.that(result.success, eq=True)
+        tm.that(result.value, eq=3)
+        (series,) = store.snapshot()
+        tm.that(series["count"], eq=3)
+        tm.that(abs(float(series["sum"]) - 3.201), lt=1e-9)
+        tm.that(series["min"], eq=0.001)
+        tm.that(series["max"], eq=3.0)
+
+    def test_record_bulk_increments_histogram_buckets(self) -> None:
+        """Each value lands in the first bucket whose upper bound covers it."""
+        store = FlextObservabilityAggregation.Store(bounds=(0.1, 1.0))
+        store.record_bulk("latency_seconds", [0.05, 0.1, 0.5, 2.0])
+        (series,) = store.snapshot()
+        tm.that(series["buckets"], eq=[2, 1, 1])
+
+    def test_record_bulk_groups_by_label_indices(self) -> None:
+        """Label indices route each value to its own series."""
+        store = FlextObservabilityAggregation.Store()
+        store.record_bulk(
+            "rows_total",
+            [1.0, 2.0, 3.0, 4.0],
+            MetricType.COUNTER,
+            label_sets=[{"step": "extract"}, {"step": "load"}],
+            label_indices=[0, 1, 1, 0],
+        )
+        totals = {
+            str(dict(series["labels"])["step"]): series["value"]
+            for series in store.snapshot()
+        }
+        tm.that(totals, eq={"extract": 5.0, "load": 5.0})
+
+    def test_record_bulk_rejects_out_of_range_label_index(self) -> None:
+        """An index outside the label sets fails instead of raising."""
+        store = FlextObservabilityAggregation.Store()
+        result = store.record_bulk(
+            "rows_total", [1.0], label_sets=[{"step": "load"}], label_indices=[3]
+        )
+        tm.that(result.failure, eq=True)
+        tm.that(result.error, has="out of range")
+
+    def test_handle_returns_the_same_series_for_equal_labels(self) -> None:
+        """Label order does not create a new series."""
+        store = FlextObservabilityAggregation.Store()
+        first = store.handle(
+            "requests_total", MetricType.COUNTER, {"a": "1", "b": "2"}
+        ).unwrap()
+        second = store.handle(
+            "requests_total", MetricType.COUNTER, {"b": "2", "a": "1"}
+        ).unwrap()
+        tm.that(first is second, eq=True)
+
+    def test_handle_refuses_a_second_type_for_a_name(self) -> None:
+        """A name keeps its first type across every label set."""
+        store = FlextObservabilityAggregation.Store()
+        counter = store.handle("jobs_total", MetricType.COUNTER).unwrap()
+        again = store.handle("jobs_total", MetricType.GAUGE)
+        other = store.handle("jobs_total", MetricType.GAUGE, {"queue": "mail"})
+        tm.that(again.failure, eq=True)
+        tm.that(again.error, has="is a counter")
+        tm.that(other.failure, eq=True)
+        tm.that(store.record("jobs_total", 1.0, MetricType.GAUGE).failure, eq=True)
+        tm.that(counter.metric_type, eq=MetricType.COUNTER)
+        tm.that(len(store.series()), eq=1)
+
+    def test_render_emits_one_type_line_per_family(self) -> None:
+        """Names sanitized to the same family share a single ``# TYPE`` line."""
+        store = FlextObservabilityAggregation.Store()
+        for name in ("a.b", "a.c", "a_b"):
+            _ = store.record(name, 1.0, MetricType.COUNTER)
+        for rendered in (store.render_prometheus(), store.render_openmetrics()):
+            types = [line for line in rendered.splitlines() if line.startswith("#")]
+            tm.that(types.count("# TYPE a_b counter"), eq=1)
+        lines = store.render_prometheus().splitlines()
+        tm.that(lines[:3], eq=["# TYPE a_b counter", "a_b 1.0", "a_b 1.0"])
+
+    def test_render_prometheus_expands_histograms_cumulatively(self) -> None:
+        """Histograms render cumulative buckets, sum and count per label set."""
+        store = FlextObservabilityAggregation.Store(bounds=(0.1, 1.0))
+        latency = store.handle(
+            "db-latency", MetricType.HISTOGRAM, {"op": 'a"b'}
+        ).unwrap()
+        for value in (0.05, 0.5, 5.0):
+            latency.observe(value)
+        store.handle("rows_total", MetricType.COUNTER).unwrap().observe(3.0)
+        lines = store.render_prometheus().splitlines()
+        tm.that(lines[0], eq="# TYPE db_latency histogram")
+        tm.that(lines[1], eq='db_latency_bucket{op="a\\"b",le="0.1"} 1')
+        tm.that(lines[3], eq='db_latency_bucket{op="a\\"b",le="+Inf"} 3')
+        tm.that(lines[5], eq='db_latency_count{op="a\\"b"} 3')
+        tm.that(lines[-1], eq="rows_total 3.0")
+
+    def test_exemplars_keep_latest_sampled_trace_per_bucket(self) -> None:
+        """Each bucket keeps its newest exemplar; other series stay bare."""
+        store = FlextObservabilityAggregation.Store(bounds=(0.1, 1.0))
+        latency = store.handle("api_latency_seconds", MetricType.HISTOGRAM).unwrap()
+        for value, trace_id in ((0.05, "t-1"), (0.5, "t-2"), (0.07, "t-3")):
+            latency.observe(value)
+            latency.exemplar(value, trace_id, "s-1")
+        gauge = store.handle("queue_depth", MetricType.GAUGE).unwrap()
+        gauge.exemplar(4.0, "t-4")
+        snapshot = {item["name"]: item for item in store.snapshot()}
+        exemplars = snapshot["api_latency_seconds"]["exemplars"]
+        tm.that([item["trace_id"] for item in exemplars], eq=["t-3", "t-2"])
+        tm.that([item["bucket"] for item in exemplars], eq=[0, 1])
+        tm.that(exemplars[0]["as_double"], eq=0.07)
+        tm.that("exemplars" in snapshot["queue_depth"], eq=False)
+        store.clear()
+        tm.that("exemplars" in store.snapshot()[0], eq=False)
+
+    def test_render_openmetrics_attaches_exemplars_to_buckets(self) -> None:
+        """OpenMetrics carries exemplars and ``_total`` counters; Prometheus not."""
+        store = FlextObservabilityAggregation.Store(bounds=(0.1, 1.0))
+        latency = store.handle("api_latency_seconds", MetricType.HISTOGRAM).unwrap()
+        latency.observe(0.5)
+        latency.exemplar(0.5, "4bf92f3577b34da6", "00f067aa0ba902b7")
+        store.handle("jobs_total", MetricType.COUNTER).unwrap().observe(2.0)
+        lines = store.render_openmetrics().splitlines()
+        tm.that(
+            lines[2],
+            has='api_latency_seconds_bucket{le="1.0"} 1 # '
+            '{trace_id="4bf92f3577b34da6",span_id="00f067aa0ba902b7"} 0.5 ',
+        )
+        tm.that(lines[1], eq='api_latency_seconds_bucket{le="0.1"} 0')
+        tm.that(lines[6], eq="# TYPE jobs counter")
+        tm.that(lines[7], eq="jobs_total 2.0")
+        tm.that(lines[-1], eq="# EOF")
+        tm.that("trace_id" in store.render_prometheus(), eq=False)
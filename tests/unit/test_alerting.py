@@ -0,0 +1,139 @@
+"""Behavioral tests for the asynchronous alert dispatcher.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from flext_observability import (
+    FlextObservabilityAlerting,
+    FlextObservabilityErrorHandling,
+    c,
+    t,
+)
+from flext_tests import tm
+
+__all__ = ["TestsFlextObservabilityAlerting"]
+
+Severity = c.Observability.ErrorSeverity
+
+
+def _dispatcher(
+    received: list[t.JsonDict], capacity: int = 100, *, escalation: bool = False
+) -> FlextObservabilityAlerting.Dispatcher:
+    dispatcher = FlextObservabilityAlerting.Dispatcher(
+        capacity=capacity,
+        handler=FlextObservabilityErrorHandling.Handler(),
+        escalation=escalation,
+    )
+    dispatcher.add_sink(FlextObservabilityAlerting.CallbackSink(received.append))
+    return dispatcher
+
+
+class TestsFlextObservabilityAlerting:
+    """Coalescing, overflow, cooldown and sinks."""
+
+    def test_same_fingerprint_notices_coalesce_with_count(self) -> None:
+        """Repeated alerts inside the window are delivered once with a count."""
+        received: list[t.JsonDict] = []
+        dispatcher = _dispatcher(received)
+        for attempt in range(5):
+            tm.that(
+                dispatcher.enqueue("DB down", f"refused after {attempt}ms"), eq=True
+            )
+        tm.that(dispatcher.drain(force=True), eq=1)
+        tm.that(len(received), eq=1)
+        tm.that(received[0]["count"], eq=5)
+        tm.that(received[0]["message"], eq="refused after 4ms")
+        dispatcher.stop()
+
+    def test_cooldown_suppresses_repeated_delivery(self) -> None:
+        """A second burst inside the handler cooldown is not delivered."""
+        received: list[t.JsonDict] = []
+        dispatcher = _dispatcher(received)
+        for _ in range(5):
+            _ = dispatcher.enqueue("DB down", "refused", fingerprint="db")
+        tm.that(dispatcher.drain(force=True), eq=1)
+        for _ in range(5):
+            _ = dispatcher.enqueue("DB down", "refused", fingerprint="db")
+        tm.that(dispatcher.drain(force=True), eq=0)
+        tm.that(len(received), eq=1)
+        dispatcher.stop()
+
+    def test_single_failure_alerts_without_escalation(self) -> None:
+        """By default one error alert is delivered; escalation is opt-in."""
+        received: list[t.JsonDict] = []
+        dispatcher = _dispatcher(received)
+        _ = dispatcher.enqueue("Job failed", "ValueError")
+        tm.that(dispatcher.drain(force=True), eq=1)
+        escalating = _dispatcher(received, escalation=True)
+        _ = escalating.enqueue("Job failed", "ValueError")
+        tm.that(escalating.drain(force=True), eq=0)
+        tm.that(len(received), eq=1)
+        dispatcher.stop()
+        escalating.stop()
+
+    def test_critical_alerts_bypass_escalation(self) -> None:
+        """A single critical alert is delivered immediately."""
+        received: list[t.JsonDict] = []
+        dispatcher = _dispatcher(received, escalation=True)
+        _ = dispatcher.enqueue("Disk full", "no space", severity=Severity.CRITICAL)
+        tm.that(dispatcher.drain(force=True), eq=1)
+        tm.that(received[0]["severity"], eq="critical")
+        dispatcher.stop()
+
+    def test_full_queue_drops_without_blocking(self) -> None:
+        """Overflow is rejected instead of blocking the producer."""
+        received: list[t.JsonDict] = []
+        dispatcher = _dispatcher(received, capacity=0)
+        tm.that(
+            dispatcher.enqueue("Disk full", "x", severity=Severity.CRITICAL), eq=False
+        )
+        tm.that(dispatcher.drain(force=True), eq=0)
+        tm.that(received, eq=[])
+
+    def test_file_sink_appends_json_lines(self, tmp_path: Path) -> None:
+        """Each delivered alert becomes one JSON line."""
+        target = tmp_path / "alerts.jsonl"
+        sink = FlextObservabilityAlerting.FileSink(target)
+        tm.that(sink.deliver({"title": "a", "count": 1}).success, eq=True)
+        tm.that(sink.deliver({"title": "b", "count": 2}).success, eq=True)
+        lines = target.read_text(encoding="utf-8").splitlines()
+        tm.that([json.loads(line)["title"] for line in lines], eq=["a", "b"])
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    @pytest.mark.filterwarnings("ignore:.*fork.*:DeprecationWarning")
+    def test_forked_child_starts_its_own_worker(self, tmp_path: Path) -> None:
+        """A child forked after the first dispatch still delivers its alerts."""
+        target = tmp_path / "alerts.jsonl"
+        dispatcher = FlextObservabilityAlerting.Dispatcher(
+            coalesce_window_sec=0.01, handler=FlextObservabilityErrorHandling.Handler()
+        )
+        dispatcher.add_sink(FlextObservabilityAlerting.FileSink(target))
+        _ = dispatcher.enqueue("Parent failed", "ValueError")
+        tm.that(dispatcher.drain(force=True), eq=1)
+        child = os.fork()
+        if child == 0:
+            code = 1
+            try:
+                _ = dispatcher.enqueue("Child failed", "KeyError")
+                deadline = time.monotonic() + 5.0
+                while time.monotonic() < deadline:
+                    if "Child failed" in target.read_text(encoding="utf-8"):
+                        code = 0
+                        break
+                    time.sleep(0.01)
+            finally:
+                os._exit(code)
+        _, status = os.waitpid(child, 0)
+        dispatcher.stop()
+        tm.that(os.waitstatus_to_exitcode(status), eq=0)
@@ -0,0 +1,110 @@
+"""Behavioral tests for series cardinality limits and overflow folding.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+from flext_observability import (
+    FlextObservabilityAggregation,
+    FlextObservabilityCardinality,
+    FlextObservabilityColumnar,
+    FlextObservabilityCustomMetrics,
+    FlextObservabilitySeries,
+    c,
+)
+from flext_tests import tm
+
+__all__ = ["TestsFlextObservabilityCardinality"]
+
+OVERFLOW = ((c.Observability.SERIES_OVERFLOW_LABEL, "true"),)
+
+
+def _limited(
+    *, max_series: int | None = None, max_series_per_metric: int | None = None
+) -> FlextObservabilitySeries.Registry:
+    limiter = FlextObservabilityCardinality.Limiter(
+        max_series=max_series, max_series_per_metric=max_series_per_metric
+    )
+    return FlextObservabilitySeries.Registry(limiter=limiter)
+
+
+class TestsFlextObservabilityCardinality:
+    """Per-metric and global limits, overflow series and top-k reports."""
+
+    def test_per_metric_limit_folds_into_overflow(self) -> None:
+        """Past the limit new label sets share the overflow series."""
+        registry = _limited(max_series_per_metric=3)
+        ids = [registry.series_id("hits_total", {"user": str(n)}) for n in range(6)]
+        tm.that(len(set(ids[:3])), eq=3)
+        tm.that(len(set(ids[3:])), eq=1)
+        tm.that(registry.overflowed(ids[5]), eq=True)
+        tm.that(registry.decode(ids[5]), eq=("hits_total", OVERFLOW))
+        tm.that(registry.series_id("hits_total", {"user": "0"}), eq=ids[0])
+        other = registry.series_id("errors_total", {"user": "9"})
+        tm.that(registry.overflowed(other), eq=False)
+
+    def test_global_limit_applies_across_metrics(self) -> None:
+        """The registry-wide limit caps the sum of every metric's series."""
+        registry = _limited(max_series=2)
+        _ = registry.series_id("a_total", {"k": "1"})
+        _ = registry.series_id("b_total", {"k": "1"})
+        third = registry.series_id("c_total", {"k": "1"})
+        tm.that(registry.decode(third), eq=("c_total", OVERFLOW))
+        report = registry.limiter.report() if registry.limiter else {}
+        tm.that(report["overflows"], eq=1)
+        tm.that(report["overflowed_metrics"], eq={"c_total": 1})
+
+    def test_report_names_the_exploding_label(self) -> None:
+        """The key sketch ranks the label that keeps adding values."""
+        registry = _limited(max_series_per_metric=50)
+        for n in range(200):
+            _ = registry.series_id(
+                "requests_total", {"method": "GET", "user_id": f"u{n}"}
+            )
+        report = registry.limiter.report(limit=1) if registry.limiter else {}
+        tm.that(report["top_label_keys"][0]["item"], eq="requests_total{user_id}")
+        values = report["top_label_values"]
+        tm.that(values[0]["item"], eq='requests_total{method="GET"}')
+        tm.that(values[0]["count"], eq=150)
+
+    def test_space_saving_keeps_heavy_hitters(self) -> None:
+        """Frequent items survive a full sketch with bounded error."""
+        sketch = FlextObservabilityCardinality.SpaceSaving(capacity=4)
+        for n in range(100):
+            sketch.offer("hot")
+            sketch.offer(f"cold-{n}")
+        top = sketch.top(1)[0]
+        tm.that(len(sketch), eq=4)
+        tm.that(top["item"], eq="hot")
+        count, error = top["count"], top["error"]
+        tm.that(isinstance(count, int) and isinstance(error, int), eq=True)
+        tm.that(count - error <= 100 <= count, eq=True)
+
+    def test_store_and_batch_honour_limits(self) -> None:
+        """Stores and columnar batches record refused label sets as overflow."""
+        registry = _limited(max_series_per_metric=1)
+        store = FlextObservabilityAggregation.Store(registry=registry)
+        store.record("depth", 1.0, labels={"queue": "a"})
+        store.record("depth", 2.0, labels={"queue": "b"})
+        tm.that(store.render_prometheus(), has='depth{otel_metric_overflow="true"}')
+        batch = FlextObservabilityColumnar.Batch(registry)
+        _ = batch.flext_metric("depth", 3.0, labels={"queue": "c"})
+        tm.that(dict(batch.metric(0).value.labels), eq=dict(OVERFLOW))
+
+    def test_registered_metric_limit_reaches_global_limiter(self) -> None:
+        """A custom metric's max_series overrides the per-metric default."""
+        registered = FlextObservabilityCustomMetrics.register_metric(
+            "cardinality_probe_total", "counter", "Probe", max_series=7
+        )
+        tm.that(registered.success, eq=True)
+        limiter = FlextObservabilitySeries.active_registry().limiter
+        tm.that(limiter is not None, eq=True)
+        if limiter is not None:
+            tm.that(limiter.limit("cardinality_probe_total"), eq=7)
+            tm.that(
+                limiter.limit("other_total"), eq=c.Observability.SERIES_LIMIT_PER_METRIC
+            )
+        tm.that(FlextObservabilitySeries.cardinality_report(), has="series")
@@ -0,0 +1,80 @@
+"""Behavioral tests for the flext-observability top view.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+from flext_observability import FlextObservabilityAggregation, c
+from flext_observability.cli import FlextObservabilityCli
+from flext_tests import tm
+
+__all__ = ["TestsFlextObservabilityCli"]
+
+MetricType = c.Observability.MetricType
+
+
+def _store() -> FlextObservabilityAggregation.Store:
+    store = FlextObservabilityAggregation.Store(bounds=(0.01, 0.1, 1.0))
+    checkout = store.handle(
+        "checkout_duration_seconds", MetricType.HISTOGRAM, {"svc": "shop"}
+    ).unwrap()
+    for value in (0.005, 0.05, 0.05, 0.5):
+        checkout.observe(value)
+    store.handle("queue_depth", MetricType.GAUGE).unwrap().observe(7.0)
+    return store
+
+
+class TestsFlextObservabilityCli:
+    """Exposition parsing, percentile estimation and incremental frames."""
+
+    def test_parse_prometheus_round_trips_store_series(self) -> None:
+        """Rendered histograms parse back into de-cumulated buckets."""
+        parsed = FlextObservabilityCli.parse_prometheus(_store().render_prometheus())
+        by_name = {str(series["name"]): series for series in parsed}
+        checkout = by_name["checkout_duration_seconds"]
+        tm.that(checkout["labels"], eq={"svc": "shop"})
+        tm.that(checkout["bounds"], eq=[0.01, 0.1, 1.0])
+        tm.that(checkout["buckets"], eq=[1, 2, 1, 0])
+        tm.that(checkout["count"], eq=4)
+        tm.that(by_name["queue_depth"]["value"], eq=7.0)
+
+    def test_percentiles_interpolate_within_buckets(self) -> None:
+        """The median falls inside the bucket holding the middle rank."""
+        p50, p95, p99 = FlextObservabilityCli.percentiles((0.1, 1.0), (0, 10, 0))
+        tm.that(p50, eq=0.55)
+        tm.that(p95 > p50, eq=True)
+        tm.that(p99 <= 1.0, eq=True)
+
+    def test_top_view_ranks_by_rate_and_skips_unchanged_frames(self) -> None:
+        """Moving series get a rate; frames are redrawn only when they change."""
+        store = _store()
+        view = FlextObservabilityCli.TopView(limit=5)
+        metrics = FlextObservabilityCli.parse_prometheus(store.render_prometheus())
+        tm.that(view.update({"metrics": metrics}, 0.0), none=False)
+        store.handle(
+            "checkout_duration_seconds", MetricType.HISTOGRAM, {"svc": "shop"}
+        ).unwrap().observe(0.05)
+        metrics = FlextObservabilityCli.parse_prometheus(store.render_prometheus())
+        frame = view.update({"metrics": metrics}, 2.0)
+        tm.that(frame, has="checkout_duration_seconds{svc=shop}")
+        tm.that(frame, has="0.5")
+        idle = view.update({"metrics": metrics}, 3.0)
+        tm.that(idle, none=False)
+        tm.that(view.update({"metrics": metrics}, 4.0), none=True)
+
+    def test_histogram_with_only_an_inf_bucket_has_empty_bounds(self) -> None:
+        """A bucket-less histogram still folds into the top view."""
+        text = (
+            "# TYPE jobs_seconds histogram\n"
+            'jobs_seconds_bucket{le="+Inf"} 3\n'
+            "jobs_seconds_sum 1.5\n"
+            "jobs_seconds_count 3\n"
+        )
+        metrics = FlextObservabilityCli.parse_prometheus(text)
+        tm.that(metrics[0]["bounds"], eq=[])
+        tm.that(metrics[0]["buckets"], eq=[3])
+        frame = FlextObservabilityCli.TopView(limit=5).update({"metrics": metrics}, 0.0)
+        tm.that(frame, has="jobs_seconds")
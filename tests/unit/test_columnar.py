@@ -0,0 +1,94 @@
+"""Behavioral tests for the columnar record batch.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import math
+from datetime import UTC, datetime
+
+from flext_observability import FlextObservabilityColumnar, c
+from flext_tests import tm
+
+__all__ = ["TestsFlextObservabilityColumnar"]
+
+
+class TestsFlextObservabilityColumnar:
+    """Row appends, interning, lazy entities and the footprint report."""
+
+    def test_metric_rows_materialise_as_entities(self) -> None:
+        """A metric row reads back as the entity the factory would build."""
+        batch = FlextObservabilityColumnar.Batch()
+        row = batch.flext_metric(
+            "http_requests_total", 3.0, tags={"method": "GET"}, labels={"code": 200}
+        ).value
+        metric = batch.metric(row).value
+        tm.that(metric.name, eq="http_requests_total")
+        tm.that(metric.value, eq=3.0)
+        tm.that(metric.unit, eq="count")
+        tm.that(metric.metric_type, eq=c.Observability.MetricType.COUNTER)
+        tm.that(dict(metric.labels), eq={"code": 200, "method": "GET"})
+        tm.that(batch.metric(row).value.id, eq=metric.id)
+
+    def test_repeated_names_and_labels_are_interned(self) -> None:
+        """Rows sharing a name and label set share their IDs."""
+        batch = FlextObservabilityColumnar.Batch()
+        for value in (1.0, 2.0, 3.0):
+            _ = batch.flext_metric("queue_depth", value, labels={"queue": "jobs"})
+        _ = batch.flext_metric("queue_depth", 4.0, labels={"queue": "mail"})
+        tm.that(len(batch.metrics), eq=4)
+        tm.that(set(batch.metrics.name_ids), eq={batch.strings.intern("queue_depth")})
+        tm.that(len(set(batch.metrics.label_ids)), eq=2)
+        tm.that(list(batch.metrics.values), eq=[1.0, 2.0, 3.0, 4.0])
+
+    def test_invalid_rows_are_rejected(self) -> None:
+        """Rows the models would reject never enter the columns."""
+        batch = FlextObservabilityColumnar.Batch()
+        tm.that(batch.flext_metric("", 1.0).failure, eq=True)
+        tm.that(batch.flext_metric("latency", math.nan).failure, eq=True)
+        bogus = batch.flext_metric("latency", 1.0, metric_type="bogus")
+        tm.that(bogus.failure, eq=True)
+        tm.that(batch.flext_log_entry("").failure, eq=True)
+        tm.that(batch.flext_alert("", "disk full").failure, eq=True)
+        tm.that(len(batch), eq=0)
+
+    def test_log_and_alert_rows_materialise(self) -> None:
+        """Log entries keep their timestamp; alerts keep their labels."""
+        batch = FlextObservabilityColumnar.Batch()
+        stamp = datetime(2025, 1, 2, 3, 4, 5, tzinfo=UTC)
+        log_row = batch.flext_log_entry(
+            "cache miss",
+            c.Observability.ErrorSeverity.WARNING,
+            component="cache",
+            timestamp=stamp,
+            context={"key": "user:1"},
+        ).value
+        alert_row = batch.flext_alert("Disk", "disk full", labels={"host": "a"}).value
+        entry = batch.log_entry(log_row).value
+        alert = batch.alert(alert_row).value
+        tm.that(entry.timestamp, eq=stamp)
+        tm.that(entry.level, eq="warning")
+        tm.that(dict(entry.context), eq={"key": "user:1"})
+        tm.that(alert.severity, eq=c.Observability.AlertLevel.WARNING)
+        tm.that(dict(alert.labels), eq={"host": "a"})
+        tm.that(alert.id != entry.id, eq=True)
+        tm.that(batch.log_entry(5).failure, eq=True)
+
+    def test_footprint_is_smaller_than_entities(self) -> None:
+        """Bytes per columnar sample are a fraction of an entity's."""
+        batch = FlextObservabilityColumnar.Batch()
+        for index in range(2_000):
+            _ = batch.flext_metric(
+                "http_request_duration_seconds",
+                0.001 * (index + 1),
+                labels={"method": "GET", "route": f"/items/{index % 20}"},
+            )
+        report = batch.footprint(sample=200)
+        tm.that(report["rows"], eq=2_000)
+        ratio = report["ratio"]
+        tm.that(isinstance(ratio, float) and ratio > 5.0, eq=True)
+        batch.clear()
+        tm.that(len(batch), eq=0)
@@ -0,0 +1,96 @@
+"""Behavioral tests for the slim observability core and its plug-ins.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+from flext_observability import (
+    FlextObservability,
+    FlextObservabilityAggregation,
+    FlextObservabilityAlerting,
+    FlextObservabilityCore,
+    FlextObservabilityHealth,
+    FlextObservabilityMultiprocess,
+    FlextObservabilityProfiler,
+    FlextObservabilitySpill,
+    FlextObservabilityStatsServer,
+    c,
+)
+from flext_tests import tm
+
+__all__ = ["TestsFlextObservabilityCore"]
+
+
+class TestsFlextObservabilityCore:
+    """Core delegation, plug-in attach and plug-in registration."""
+
+    def test_record_feeds_global_store(self) -> None:
+        """Observations recorded through the core land in the global store."""
+        tm.ok(
+            FlextObservabilityCore.record(
+                "core_jobs_total", 2.0, c.Observability.MetricType.COUNTER
+            )
+        )
+        series = (
+            FlextObservabilityAggregation
+            .active_store()
+            .handle("core_jobs_total", c.Observability.MetricType.COUNTER)
+            .unwrap()
+        )
+        tm.that(series.value, gt=1.0)
+        tm.that(FlextObservabilityCore.render_prometheus(), has="core_jobs_total")
+
+    def test_context_and_sampling_are_the_services(self) -> None:
+        """The core hands out the context service and the global sampler."""
+        trace_id = FlextObservabilityCore.context.update_trace_id("core-trace")
+        tm.that(FlextObservabilityCore.context.trace_id(), eq=trace_id)
+        tm.that(isinstance(FlextObservabilityCore.should_sample("core"), bool), eq=True)
+
+    def test_attach_returns_cached_plugin_class(self) -> None:
+        """Attaching a built-in plug-in imports it once and caches the class."""
+        tm.that(FlextObservabilityCore.plugins(), has="profiler")
+        profiler = FlextObservabilityCore.attach("profiler").value
+        tm.that(profiler is FlextObservabilityProfiler, eq=True)
+        tm.that(FlextObservabilityCore.attached(), has="profiler")
+        tm.that(FlextObservabilityCore.attach("profiler").value is profiler, eq=True)
+
+    def test_new_services_are_plugins_not_facade_bases(self) -> None:
+        """Later services attach by name and stay out of the facade MRO."""
+        for name, service in (
+            ("aggregation", FlextObservabilityAggregation),
+            ("alerting", FlextObservabilityAlerting),
+            ("multiprocess", FlextObservabilityMultiprocess),
+            ("profiler", FlextObservabilityProfiler),
+            ("spill", FlextObservabilitySpill),
+            ("stats_server", FlextObservabilityStatsServer),
+        ):
+            tm.that(FlextObservabilityCore.attach(name).value is service, eq=True)
+            tm.that(service in FlextObservability.__mro__, eq=False)
+        tm.that(hasattr(FlextObservability, "Segment"), eq=False)
+
+    def test_unknown_or_broken_plugins_fail(self) -> None:
+        """Unknown names and unimportable targets come back as failures."""
+        tm.that(FlextObservabilityCore.attach("missing").failure, eq=True)
+        _ = FlextObservabilityCore.register_plugin(
+            "broken", "flext_observability.services.absent", "Absent"
+        )
+        tm.that(FlextObservabilityCore.attach("broken").failure, eq=True)
+        tm.that(FlextObservabilityCore.attached(), ne=("broken",))
+
+    def test_register_plugin_under_new_name(self) -> None:
+        """Registered plug-ins attach like built-ins; attached ones are fixed."""
+        registered = FlextObservabilityCore.register_plugin(
+            "readiness",
+            "flext_observability.services.health",
+            "FlextObservabilityHealth",
+        )
+        tm.that(registered.success, eq=True)
+        plugin = FlextObservabilityCore.attach("readiness").value
+        tm.that(plugin is FlextObservabilityHealth, eq=True)
+        rebound = FlextObservabilityCore.register_plugin(
+            "readiness", "flext_observability.services.profiler", "Profiler"
+        )
+        tm.that(rebound.failure, eq=True)
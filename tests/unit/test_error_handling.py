@@ -0,0 +1,174 @@
+"""Behavioral tests for error fingerprinting and deferred materialisation.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from flext_observability import FlextObservabilityErrorHandling, c, m, u
+from flext_tests import tm
+
+__all__ = ["TestsFlextObservabilityErrorHandling"]
+
+FingerprintMode = c.Observability.FingerprintMode
+Severity = c.Observability.ErrorSeverity
+
+
+def _parse_row(row: int) -> None:
+    msg = f"bad row {row}"
+    raise ValueError(msg)
+
+
+def _load_row(row: int) -> None:
+    msg = f"bad row {row}"
+    raise ValueError(msg)
+
+
+class TestsFlextObservabilityErrorHandling:
+    """Fingerprint modes, memo and cheap error recording."""
+
+    def test_fast_fingerprint_is_stable_64_bit_hex(self) -> None:
+        """Fast fingerprints are 16 hex characters and deterministic."""
+        handler = FlextObservabilityErrorHandling.Handler()
+        other = FlextObservabilityErrorHandling.Handler()
+        for fast in (handler, other):
+            tm.that(fast.update_fingerprint_mode(FingerprintMode.FAST).success, eq=True)
+        first = handler.fingerprint("TimeoutError", "upstream timed out")
+        second = other.fingerprint("TimeoutError", "upstream timed out")
+        tm.that(len(first), eq=16)
+        tm.that(first, eq=second)
+        tm.that(handler.fingerprint("TimeoutError", "other"), ne=first)
+
+    def test_default_secure_mode_matches_model_fingerprint(self) -> None:
+        """The default mode keeps the SHA256 value computed by the model."""
+        handler = FlextObservabilityErrorHandling.Handler()
+        tm.that(handler.fingerprint_mode, eq=FingerprintMode.SECURE)
+        event = m.Observability.ErrorEvent(error_type="IOError", message="disk full")
+        tm.that(
+            handler.fingerprint("IOError", "disk full"),
+            eq=event.calculate_fingerprint().fingerprint,
+        )
+
+    def test_update_fingerprint_mode_rejects_unknown_mode(self) -> None:
+        """An unknown mode fails instead of raising."""
+        handler = FlextObservabilityErrorHandling.Handler()
+        tm.that(handler.update_fingerprint_mode("md5").failure, eq=True)
+        tm.that(handler.fingerprint_mode, eq=FingerprintMode.SECURE)
+
+    def test_model_fingerprint_does_not_split_counts(self) -> None:
+        """Events with and without a model fingerprint share one key."""
+        handler = FlextObservabilityErrorHandling.Handler()
+        event = m.Observability.ErrorEvent(
+            error_type="TimeoutError", message="Timeout after 3012ms"
+        )
+        recorded = handler.record_error(event).value
+        preset = event.calculate_fingerprint()
+        tm.that(preset.fingerprint, eq=recorded.fingerprint)
+        _ = handler.record_error(preset)
+        tm.that(handler.resolve_error_count(handler.fingerprint_of(preset)), eq=2)
+
+    def test_messages_differing_only_in_variable_tokens_share_fingerprint(self) -> None:
+        """Numbers, ids, IPs and quoted values do not split groups."""
+        handler = FlextObservabilityErrorHandling.Handler()
+        first = handler.record("TimeoutError", "Timeout after 3012ms for id=8812")
+        second = handler.record("TimeoutError", "Timeout after 2999ms for id=9120")
+        third = handler.record(
+            "TimeoutError", "Timeout after 15ms for id='a1' at 10.0.0.7:5432"
+        )
+        tm.that(second, eq=first)
+        tm.that(third, ne=first)
+        tm.that(handler.resolve_error_count(first), eq=2)
+
+    def test_record_exception_groups_by_raising_location(self) -> None:
+        """Same message raised from different lines yields different groups."""
+        handler = FlextObservabilityErrorHandling.Handler()
+        fingerprints: list[str] = []
+        for _ in range(2):
+            with pytest.raises(ValueError, match="bad row") as parsed:
+                _parse_row(17)
+            fingerprints.append(handler.record_exception(parsed.value))
+        with pytest.raises(ValueError, match="bad row") as loaded:
+            _load_row(99)
+        fingerprints.append(handler.record_exception(loaded.value))
+        location = u.Observability.Fingerprint.frame_location(loaded.value)
+        tm.that(fingerprints[0], eq=fingerprints[1])
+        tm.that(fingerprints[2], ne=fingerprints[0])
+        tm.that(location, has="test_error_handling.py:")
+
+    def test_record_counts_without_models_and_exports_events(self) -> None:
+        """``record`` only builds models when the buffer is exported."""
+        handler = FlextObservabilityErrorHandling.Handler()
+        fingerprint = ""
+        for _ in range(3):
+            fingerprint = handler.record("ConnectionError", "refused")
+        tm.that(handler.resolve_error_count(fingerprint), eq=3)
+        events = handler.export_errors()
+        tm.that(len(events), eq=3)
+        tm.that(events[0].fingerprint, eq=fingerprint)
+        tm.that(events[0].error_type, eq="ConnectionError")
+
+    def test_record_error_shares_counts_with_record(self) -> None:
+        """Model and model-free recording group under one fingerprint."""
+        handler = FlextObservabilityErrorHandling.Handler()
+        fingerprint = handler.record("KeyError", "missing id")
+        result = handler.record_error(
+            m.Observability.ErrorEvent(error_type="KeyError", message="missing id")
+        )
+        tm.that(result.success, eq=True)
+        tm.that(result.value.fingerprint, eq=fingerprint)
+        tm.that(handler.resolve_error_count(fingerprint), eq=2)
+
+    def test_escalation_uses_windowed_counts(self) -> None:
+        """Escalation follows the count inside the window; old buckets expire."""
+        handler = FlextObservabilityErrorHandling.Handler()
+        handler.update_escalation_threshold(2)
+        fingerprint = ""
+        for _ in range(2):
+            fingerprint = handler.record("BurstError", "spike", Severity.INFO)
+        event = m.Observability.ErrorEvent(
+            error_type="BurstError", message="spike", severity=Severity.INFO
+        )
+        tm.that(handler.resolve_escalated_severity(event), eq=Severity.WARNING)
+        tm.that(handler.resolve_error_count(fingerprint), eq=2)
+        window = FlextObservabilityErrorHandling.Window(0.0, 30, 10)
+        window.add(0.0)
+        window.add(15.0)
+        tm.that(window.total(15.0), eq=2)
+        tm.that(window.total(35.0), eq=1)
+        tm.that(window.total(100.0), eq=0)
+        tm.that(len(window.counts), eq=3)
+
+    def test_clear_error_counts_honours_older_than(self) -> None:
+        """Only fingerprints idle for longer than the cutoff are dropped."""
+        handler = FlextObservabilityErrorHandling.Handler()
+        fingerprint = handler.record("IdleError", "recent")
+        tm.that(handler.clear_error_counts(older_than_sec=3600).success, eq=True)
+        tm.that(handler.resolve_error_count(fingerprint), eq=1)
+        tm.that(handler.clear_error_counts(older_than_sec=-1).success, eq=True)
+        tm.that(handler.resolve_error_count(fingerprint), eq=0)
+
+    def test_concurrent_first_occurrences_share_one_window(self) -> None:
+        """Threads racing to create a fingerprint's window lose no counts."""
+        handler = FlextObservabilityErrorHandling.Handler()
+        fingerprints = [f"race-{index}" for index in range(200)]
+        workers = 8
+        barrier = threading.Barrier(workers)
+
+        def record() -> None:
+            _ = barrier.wait()
+            for fingerprint in fingerprints:
+                _ = handler.record_occurrences(fingerprint)
+
+        threads = [threading.Thread(target=record) for _ in range(workers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        counts = {handler.resolve_error_count(item) for item in fingerprints}
+        tm.that(counts, eq={workers})
@@ -0,0 +1,178 @@
+"""Behavioral tests for the concurrent health-check runner.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+from flext_observability import (
+    FlextObservabilityAggregation,
+    FlextObservabilityHealth,
+    c,
+)
+from flext_tests import tm
+
+__all__ = ["TestsFlextObservabilityHealth"]
+
+Status = c.Observability.HealthStatus
+
+
+class TestsFlextObservabilityHealth:
+    """Concurrency, timeouts, TTL caching and aggregation."""
+
+    def test_checks_run_concurrently(self) -> None:
+        """Sync and async checks overlap instead of adding up."""
+        runner = FlextObservabilityHealth.Runner()
+
+        def database() -> bool:
+            time.sleep(0.2)
+            return True
+
+        async def broker() -> str:
+            await asyncio.sleep(0.2)
+            return Status.HEALTHY
+
+        _ = runner.register("database", database)
+        _ = runner.register("broker", broker)
+        _ = runner.register("cache", database)
+        started = time.perf_counter()
+        payload = runner.status()
+        elapsed = time.perf_counter() - started
+        runner.shutdown()
+        tm.that(payload["status"], eq="healthy")
+        tm.that(elapsed < 0.5, eq=True)
+
+    def test_slow_check_times_out_without_blocking_probes(self) -> None:
+        """A hung check costs its timeout once, then probes return at once."""
+        runner = FlextObservabilityHealth.Runner()
+        release = threading.Event()
+        _ = runner.register("broker", release.wait, timeout_sec=0.05, critical=False)
+        first = runner.status()
+        started = time.perf_counter()
+        second = runner.status()
+        elapsed = time.perf_counter() - started
+        release.set()
+        runner.shutdown()
+        tm.that(first["status"], eq="degraded")
+        tm.that(second["checks"]["broker"]["error"], has="Timed out")
+        tm.that(elapsed < 0.05, eq=True)
+
+    def test_results_are_cached_for_ttl(self) -> None:
+        """Probes inside the TTL do not execute the check again."""
+        runner = FlextObservabilityHealth.Runner()
+        calls: list[int] = []
+
+        def database() -> bool:
+            calls.append(1)
+            return True
+
+        _ = runner.register("database", database, ttl_sec=60.0)
+        for _ in range(5):
+            _ = runner.status()
+        _ = runner.status(force=True)
+        runner.shutdown()
+        tm.that(len(calls), eq=2)
+
+    def test_failures_aggregate_by_criticality(self) -> None:
+        """Critical failures are unhealthy, others only degrade."""
+        runner = FlextObservabilityHealth.Runner()
+
+        def broken() -> bool:
+            msg = "connection refused"
+            raise ConnectionError(msg)
+
+        _ = runner.register("broker", broken, critical=False)
+        degraded = runner.status()
+        _ = runner.register("database", lambda: False)
+        unhealthy = runner.status()
+        runner.shutdown()
+        tm.that(degraded["status"], eq="degraded")
+        tm.that(degraded["checks"]["broker"]["error"], has="ConnectionError")
+        tm.that(unhealthy["status"], eq="unhealthy")
+
+    def test_scheduler_serves_last_known_result_immediately(self) -> None:
+        """With the scheduler running, probes never wait on a slow check."""
+        runner = FlextObservabilityHealth.Runner()
+
+        def database() -> bool:
+            time.sleep(0.2)
+            return True
+
+        _ = runner.register("database", database, ttl_sec=0.1, interval_sec=0.3)
+        runner.start()
+        time.sleep(0.3)
+        started = time.perf_counter()
+        payload = runner.status(wait_for_refresh=False)
+        elapsed = time.perf_counter() - started
+        runner.shutdown()
+        tm.that(elapsed < 0.05, eq=True)
+        tm.that(payload["status"], eq="healthy")
+        tm.that(payload["checks"]["database"], has="age_sec")
+
+    def test_registered_checks_refresh_without_starting_the_runner(self) -> None:
+        """Global registration starts the scheduler; no probe is needed."""
+        runs: list[float] = []
+
+        def heartbeat() -> bool:
+            runs.append(time.monotonic())
+            return True
+
+        tm.ok(
+            FlextObservabilityHealth.register_health_check(
+                "heartbeat", heartbeat, ttl_sec=0.1, interval_sec=0.05
+            )
+        )
+        runner = FlextObservabilityHealth.active_runner()
+        deadline = time.monotonic() + 2.0
+        while len(runs) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        _ = runner.unregister("heartbeat")
+        running = runner.running
+        runner.shutdown()
+        tm.that(running, eq=True)
+        tm.that(len(runs), gt=1)
+
+    def test_stale_results_are_flagged(self) -> None:
+        """Results older than the TTL are reported stale while revalidating."""
+        runner = FlextObservabilityHealth.Runner()
+        _ = runner.register("database", lambda: True, ttl_sec=0.05)
+        _ = runner.status()
+        time.sleep(0.1)
+        payload = runner.status(wait_for_refresh=False)
+        runner.shutdown()
+        tm.that(payload["stale"], eq=True)
+        tm.that(payload["checks"]["database"]["stale"], eq=True)
+
+    def test_results_exposed_as_entities_and_gauges(self) -> None:
+        """Each result is a HealthCheck entity and a status gauge."""
+        runner = FlextObservabilityHealth.Runner()
+        _ = runner.register("entity-db", lambda: Status.DEGRADED)
+        _ = runner.status()
+        entities = runner.entities()
+        runner.shutdown()
+        tm.that(entities[0].component, eq="entity-db")
+        tm.that(entities[0].status, eq="degraded")
+        gauge = (
+            FlextObservabilityAggregation
+            .active_store()
+            .handle(
+                "flext_health_check_status",
+                c.Observability.MetricType.GAUGE,
+                {"component": "entity-db"},
+            )
+            .unwrap()
+        )
+        tm.that(gauge.last, eq=0.5)
+
+    def test_register_rejects_invalid_checks(self) -> None:
+        """Empty names and non-positive timeouts fail."""
+        runner = FlextObservabilityHealth.Runner()
+        tm.that(runner.register("", lambda: True).failure, eq=True)
+        tm.that(runner.register("db", lambda: True, timeout_sec=0).failure, eq=True)
+        tm.that(runner.checks, eq=())
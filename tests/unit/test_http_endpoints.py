@@ -0,0 +1,173 @@
+"""Behavioral tests for the cached /health, /ready and /metrics endpoints.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from collections.abc import Callable, MutableMapping
+
+from starlette.types import Message, Receive, Scope, Send
+
+from flext_observability import (
+    FlextObservabilityAggregation,
+    FlextObservabilityContext,
+    FlextObservabilityHealth,
+    FlextObservabilityHTTP,
+    FlextObservabilitySwitches,
+    c,
+)
+from flext_tests import tm
+
+__all__ = ["TestsFlextObservabilityHTTPEndpoints"]
+
+Endpoints = FlextObservabilityHTTP.Endpoints
+
+
+def _cache(*, healthy: bool) -> FlextObservabilityHTTP.Endpoints.Cache:
+    runner = FlextObservabilityHealth.Runner()
+    _ = runner.register("database", lambda: healthy)
+    store = FlextObservabilityAggregation.Store()
+    store.handle("rows_total", c.Observability.MetricType.COUNTER).unwrap().observe(2.0)
+    return Endpoints.Cache(runner=runner, store=store)
+
+
+class TestsFlextObservabilityHTTPEndpoints:
+    """Cached payloads served in front of the instrumented application."""
+
+    def test_wsgi_serves_endpoints_without_calling_the_app(self) -> None:
+        """Endpoint paths never reach the wrapped application."""
+        app_calls: list[str] = []
+
+        def app(
+            environ: MutableMapping[str, object],
+            start_response: Callable[..., Callable[[bytes], object]],
+        ) -> list[bytes]:
+            app_calls.append(str(environ["PATH_INFO"]))
+            _ = start_response("200 OK", [])
+            return [b"app"]
+
+        responses: list[tuple[str, int]] = []
+
+        def start_response(
+            status: str, headers: list[tuple[str, str]]
+        ) -> Callable[[bytes], object]:
+            responses.append((status, len(headers)))
+            return app_calls.append
+
+        wsgi = Endpoints.WSGIMiddleware(app, _cache(healthy=True))
+        health = b"".join(wsgi({"PATH_INFO": "/health"}, start_response))
+        metrics = b"".join(wsgi({"PATH_INFO": "/metrics"}, start_response))
+        other = b"".join(wsgi({"PATH_INFO": "/users"}, start_response))
+        tm.that(json.loads(health)["status"], eq="healthy")
+        tm.that(metrics.decode(), has="rows_total 2.0")
+        tm.that(other, eq=b"app")
+        tm.that(app_calls, eq=["/users"])
+        tm.that(responses, eq=[("200 OK", 3), ("200 OK", 3), ("200 OK", 0)])
+
+    def test_unhealthy_readiness_returns_503(self) -> None:
+        """A failing critical check makes /ready unavailable."""
+        payload = _cache(healthy=False).ready()
+        tm.that(payload.status, eq=503)
+        tm.that(json.loads(payload.body), eq={"status": "unhealthy", "ready": False})
+
+    def test_payloads_are_reused_within_ttl(self) -> None:
+        """Repeated probes get the same pre-serialized payload object."""
+        cache = _cache(healthy=True)
+        tm.that(cache.health() is cache.health(), eq=True)
+        tm.that(cache.metrics() is cache.metrics(), eq=True)
+
+    def test_expired_payload_is_rendered_once_per_key(self) -> None:
+        """Concurrent cold callers of one endpoint share a single render."""
+        cache = _cache(healthy=True)
+        started = threading.Barrier(4)
+        payloads: list[Endpoints.Payload] = []
+
+        def probe() -> None:
+            _ = started.wait()
+            payloads.append(cache.metrics())
+
+        threads = [threading.Thread(target=probe) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        tm.that(len({id(payload) for payload in payloads}), eq=1)
+
+    def test_asgi_serves_endpoints_before_inner_layers(self) -> None:
+        """The ASGI middleware answers probes and delegates everything else."""
+        inner_paths: list[str] = []
+        sent: list[Message] = []
+
+        async def inner(scope: Scope, _receive: Receive, _send: Send) -> None:
+            await asyncio.sleep(0)
+            inner_paths.append(scope["path"])
+
+        async def receive() -> Message:
+            await asyncio.sleep(0)
+            return {"type": "http.request"}
+
+        async def send(message: Message) -> None:
+            await asyncio.sleep(0)
+            sent.append(message)
+
+        asgi = Endpoints.ASGIMiddleware(inner, _cache(healthy=True))
+
+        async def probe() -> None:
+            await asgi({"type": "http", "path": "/ready"}, receive, send)
+            await asgi({"type": "http", "path": "/users"}, receive, send)
+
+        asyncio.run(probe())
+        tm.that(inner_paths, eq=["/users"])
+        tm.that(sent[0]["status"], eq=200)
+        tm.that(json.loads(sent[1]["body"])["ready"], eq=True)
+
+    def test_openmetrics_endpoint_serves_request_exemplars(self) -> None:
+        """Sampled request durations surface as exemplars in OpenMetrics."""
+        FlextObservabilityContext.clear_context()
+        FlextObservabilityContext.update_trace_id("trace-http")
+        FlextObservabilityContext.update_sampled(sampled=True)
+        try:
+            FlextObservabilityHTTP.record_duration("GET", 200, 0.02)
+        finally:
+            FlextObservabilityContext.clear_context()
+        FlextObservabilityHTTP.record_duration("GET", 200, 0.03)
+        cache = Endpoints.Cache(store=FlextObservabilityAggregation.active_store())
+        payload = cache.openmetrics()
+        body = payload.body.decode()
+        tm.that(payload.wsgi_headers[0][1], eq=c.Observability.OPENMETRICS_CONTENT_TYPE)
+        tm.that(body, has="http_server_request_duration_seconds_bucket{http_request_")
+        tm.that(body, has=' # {trace_id="trace-http"} 0.02 ')
+        tm.that(body.count("trace_id="), eq=1)
+        tm.that(body.endswith("# EOF\n"), eq=True)
+
+    def test_request_duration_follows_the_metrics_switch(self) -> None:
+        """Disabled metrics drop request durations even with traces on."""
+        series = (
+            FlextObservabilityAggregation
+            .active_store()
+            .handle(
+                c.Observability.HTTP_SERVER_DURATION_METRIC,
+                c.Observability.MetricType.HISTOGRAM,
+                {"http.request.method": "PATCH", "http.response.status_code": "204"},
+            )
+            .unwrap()
+        )
+        before = series.count
+        try:
+            _ = FlextObservabilitySwitches.configure(
+                metrics_enabled=False, traces_enabled=True
+            )
+            FlextObservabilityHTTP.record_duration("PATCH", 204, 0.01)
+            disabled = series.count
+            _ = FlextObservabilitySwitches.configure(metrics_enabled=True)
+            FlextObservabilityHTTP.record_duration("PATCH", 204, 0.01)
+        finally:
+            _ = FlextObservabilitySwitches.configure()
+        tm.that(disabled, eq=before)
+        tm.that(series.count, eq=before + 1)
@@ -0,0 +1,252 @@
+"""Behavioral tests for the monitoring decorator hot path.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+from collections.abc import AsyncGenerator, Generator
+
+import pytest
+
+from flext_observability import (
+    FlextObservabilityAggregation,
+    FlextObservabilityAlerting,
+    FlextObservabilityContext,
+    FlextObservabilityErrorHandling,
+    FlextObservabilityMonitor,
+)
+from flext_tests import tm
+
+__all__ = ["TestsFlextObservabilityMonitoring"]
+
+
+def _series(name: str) -> dict[str, object]:
+    for series in FlextObservabilityAggregation.active_store().snapshot():
+        if series["name"] == name:
+            return dict(series)
+    return {"count": 0, "sum": 0.0}
+
+
+def _series_count(name: str) -> int:
+    return int(str(_series(name)["count"]))
+
+
+def _running_monitor() -> FlextObservabilityMonitor:
+    monitor = FlextObservabilityMonitor()
+    monitor.flext_initialize_observability()
+    monitor.flext_start_monitoring()
+    return monitor
+
+
+class TestsFlextObservabilityMonitoring:
+    """Decorator binding, handle pre-resolution and running-state gating."""
+
+    def test_decorator_without_monitor_binds_process_wide_monitor(self) -> None:
+        """Every decorator without a monitor shares ``active_monitor()``."""
+        first = FlextObservabilityMonitor.active_monitor()
+        tm.that(first is FlextObservabilityMonitor.active_monitor(), eq=True)
+        tm.that(first.flext_initialized(), eq=True)
+        tm.that(first.flext_monitoring_active(), eq=True)
+
+    def test_default_decorator_records_from_the_first_call(self) -> None:
+        """The process-wide monitor is started by the first decorated call."""
+
+        @FlextObservabilityMonitor.flext_monitor_function(metric_name="unit_default")
+        def triple(value: int) -> int:
+            return value * 3
+
+        tm.that(triple(2), eq=6)
+        tm.that(triple(3), eq=9)
+        monitor = FlextObservabilityMonitor.shared_monitor()
+        tm.that(monitor.flext_monitoring_active(), eq=True)
+        tm.that(_series_count("unit_default_success_total"), eq=2)
+
+    def test_decorated_calls_record_only_while_monitor_runs(self) -> None:
+        """Stopped monitors pass calls straight through to the function."""
+        monitor = FlextObservabilityMonitor()
+        monitor.flext_initialize_observability()
+
+        @FlextObservabilityMonitor.flext_monitor_function(
+            monitor=monitor, metric_name="unit_gated"
+        )
+        def double(value: int) -> int:
+            return value * 2
+
+        tm.that(double(2), eq=4)
+        tm.that(_series_count("unit_gated_success_total"), eq=0)
+        monitor.flext_start_monitoring()
+        tm.that(double(3), eq=6)
+        tm.that(double(4), eq=8)
+        monitor.flext_stop_monitoring()
+        tm.that(double(5), eq=10)
+        tm.that(_series_count("unit_gated_success_total"), eq=2)
+        tm.that(_series_count("unit_gated_duration_seconds"), eq=2)
+
+    def test_sampled_calls_attach_trace_exemplars(self) -> None:
+        """Only calls made in a sampled context leave an exemplar."""
+        monitor = _running_monitor()
+
+        @FlextObservabilityMonitor.flext_monitor_function(
+            monitor=monitor, metric_name="unit_exemplar"
+        )
+        def work() -> int:
+            return 1
+
+        FlextObservabilityContext.update_trace_id("trace-unsampled")
+        FlextObservabilityContext.update_sampled(sampled=False)
+        _ = work()
+        tm.that("exemplars" in _series("unit_exemplar_duration_seconds"), eq=False)
+        FlextObservabilityContext.update_trace_id("trace-sampled")
+        FlextObservabilityContext.update_sampled(sampled=True)
+        try:
+            _ = work()
+        finally:
+            FlextObservabilityContext.clear_context()
+        exemplars = _series("unit_exemplar_duration_seconds")["exemplars"]
+        tm.that(isinstance(exemplars, list), eq=True)
+        tm.that(
+            [item["trace_id"] for item in exemplars if isinstance(item, dict)],
+            eq=["trace-sampled"],
+        )
+        tm.that(_series_count("unit_exemplar_duration_seconds"), eq=2)
+
+    def test_decorated_errors_record_error_series_and_reraise(self) -> None:
+        """Failures land in the error series and propagate unchanged."""
+        monitor = _running_monitor()
+
+        @FlextObservabilityMonitor.flext_monitor_function(
+            monitor=monitor, metric_name="unit_failing"
+        )
+        def failing() -> int:
+            msg = "boom"
+            raise ValueError(msg)
+
+        with pytest.raises(ValueError, match="boom"):
+            failing()
+        tm.that(_series_count("unit_failing_error_total"), eq=1)
+        tm.that(_series_count("unit_failing_success_total"), eq=0)
+
+    def test_failure_alert_shares_the_recorded_error_fingerprint(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Alerts coalesce with ``record_exception`` for the same failure."""
+        monitor = _running_monitor()
+        fingerprints: list[str | None] = []
+
+        def dispatch(
+            title: str, message: str, *, fingerprint: str | None = None, **_: object
+        ) -> bool:
+            fingerprints.append(fingerprint)
+            return bool(title and message)
+
+        monkeypatch.setattr(
+            FlextObservabilityAlerting, "dispatch_alert", staticmethod(dispatch)
+        )
+
+        @FlextObservabilityMonitor.flext_monitor_function(
+            monitor=monitor, metric_name="unit_alerting"
+        )
+        def failing() -> int:
+            msg = "ledger locked"
+            raise KeyError(msg)
+
+        with pytest.raises(KeyError) as raised:
+            failing()
+        handler = FlextObservabilityErrorHandling.active_handler()
+        tm.that(fingerprints, eq=[handler.record_exception(raised.value)])
+
+    def test_coroutine_is_timed_until_awaited_result(self) -> None:
+        """Coroutine functions stay awaitable and record the awaited duration."""
+        monitor = _running_monitor()
+
+        @FlextObservabilityMonitor.flext_monitor_function(
+            monitor=monitor, metric_name="unit_async"
+        )
+        async def slow(value: int) -> int:
+            await asyncio.sleep(0.02)
+            return value
+
+        tm.that(inspect.iscoroutinefunction(slow), eq=True)
+        tm.that(asyncio.run(slow(7)), eq=7)
+        duration = _series("unit_async_duration_seconds")
+        tm.that(duration["count"], eq=1)
+        tm.that(float(str(duration["sum"])), gt=0.015)
+
+    def test_generator_records_first_item_and_total_time(self) -> None:
+        """Generators are timed to exhaustion and keep ``send`` semantics."""
+        monitor = _running_monitor()
+
+        @FlextObservabilityMonitor.flext_monitor_function(
+            monitor=monitor, metric_name="unit_stream"
+        )
+        def stream(count: int) -> Generator[int, int | None, str]:
+            for index in range(count):
+                received = yield index
+                if received is not None:
+                    yield received
+            return "done"  # ruff: ignore[return-in-generator]
+
+        tm.that(inspect.isgeneratorfunction(stream), eq=True)
+        generator = stream(2)
+        tm.that(next(generator), eq=0)
+        tm.that(generator.send(9), eq=9)
+        tm.that(list(generator), eq=[1])
+        tm.that(_series_count("unit_stream_first_item_seconds"), eq=1)
+        tm.that(_series_count("unit_stream_success_total"), eq=1)
+        with pytest.raises(StopIteration) as stop:
+            next(stream(0))
+        tm.that(stop.value.value, eq="done")
+
+    def test_generator_forwards_throw_and_records_any_exception(self) -> None:
+        """Thrown exceptions reach the generator; any Exception is a failure."""
+        monitor = _running_monitor()
+
+        class SourceError(Exception):
+            """Error type outside the usual mapping exceptions."""
+
+        @FlextObservabilityMonitor.flext_monitor_function(
+            monitor=monitor, metric_name="unit_throw"
+        )
+        def numbers() -> Generator[int]:
+            try:
+                yield 1
+            except KeyboardInterrupt:
+                yield -1
+            msg = "source lost"
+            raise SourceError(msg)
+
+        generator = numbers()
+        tm.that(next(generator), eq=1)
+        tm.that(generator.throw(KeyboardInterrupt()), eq=-1)
+        with pytest.raises(SourceError, match="source lost"):
+            next(generator)
+        tm.that(_series_count("unit_throw_error_total"), eq=1)
+        tm.that(_series_count("unit_throw_success_total"), eq=0)
+
+    def test_async_generator_records_errors_raised_mid_stream(self) -> None:
+        """An error after the first item is recorded as a failure."""
+        monitor = _running_monitor()
+
+        @FlextObservabilityMonitor.flext_monitor_function(
+            monitor=monitor, metric_name="unit_async_stream"
+        )
+        async def rows() -> AsyncGenerator[int]:
+            await asyncio.sleep(0)
+            yield 1
+            msg = "source lost"
+            raise ValueError(msg)
+
+        async def consume() -> list[int]:
+            return [row async for row in rows()]
+
+        tm.that(inspect.isasyncgenfunction(rows), eq=True)
+        with pytest.raises(ValueError, match="source lost"):
+            asyncio.run(consume())
+        tm.that(_series_count("unit_async_stream_first_item_seconds"), eq=1)
+        tm.that(_series_count("unit_async_stream_error_total"), eq=1)
+        tm.that(_series_count("unit_async_stream_success_total"), eq=0)
@@ -0,0 +1,161 @@
+"""Behavioral tests for multiprocess shared-segment aggregation.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import os
+import struct
+from pathlib import Path
+
+import pytest
+
+from flext_observability import (
+    FlextObservabilityAggregation,
+    FlextObservabilityMultiprocess,
+    c,
+)
+from flext_tests import tm
+
+__all__ = ["TestsFlextObservabilityMultiprocess"]
+
+MetricType = c.Observability.MetricType
+Policy = c.Observability.GaugeMergePolicy
+_MISSING_PID = 99_999_999
+
+
+def _publish(
+    directory: Path,
+    pid: int,
+    store: FlextObservabilityAggregation.Store,
+    policies: dict[str, c.Observability.GaugeMergePolicy] | None = None,
+) -> FlextObservabilityMultiprocess.Segment:
+    segment = FlextObservabilityMultiprocess.Segment(
+        FlextObservabilityMultiprocess.segment_path(directory, pid), pid
+    )
+    _ = segment.publish(store.capture(), policies or {})
+    return segment
+
+
+def _series(
+    store: FlextObservabilityAggregation.Store, name: str, metric_type: str
+) -> FlextObservabilityAggregation.Series:
+    return store.handle(name, metric_type, {"route": "/orders"}).unwrap()
+
+
+class TestsFlextObservabilityMultiprocess:
+    """Segment layout, merge policies, dead workers and torn reads."""
+
+    def test_counters_and_histograms_sum_across_workers(self, tmp_path: Path) -> None:
+        """Every worker's counts and buckets add up in the merged store."""
+        for pid in (101, 102, 103):
+            store = FlextObservabilityAggregation.Store()
+            store.record(
+                "requests_total", 2.0, MetricType.COUNTER, {"route": "/orders"}
+            )
+            store.record(
+                "latency_seconds", 0.02, MetricType.HISTOGRAM, {"route": "/orders"}
+            )
+            _publish(tmp_path, pid, store).close()
+        merged = FlextObservabilityMultiprocess.merge(tmp_path)
+        counter = _series(merged, "requests_total", MetricType.COUNTER)
+        histogram = _series(merged, "latency_seconds", MetricType.HISTOGRAM)
+        tm.that(counter.value, eq=6.0)
+        tm.that(histogram.count, eq=3)
+        tm.that(sum(histogram.buckets), eq=3)
+        tm.that(merged.render_prometheus(), has="requests_total")
+
+    def test_gauges_follow_merge_policy(self, tmp_path: Path) -> None:
+        """Gauges are summed by default and combined per their policy."""
+        for pid, depth in ((201, 4.0), (202, 9.0)):
+            store = FlextObservabilityAggregation.Store()
+            store.record("in_flight", depth, MetricType.GAUGE, {"route": "/orders"})
+            store.record("queue_depth", depth, MetricType.GAUGE, {"route": "/orders"})
+            _publish(tmp_path, pid, store, {"queue_depth": Policy.MAX}).close()
+        merged = FlextObservabilityMultiprocess.merge(tmp_path)
+        tm.that(_series(merged, "in_flight", MetricType.GAUGE).value, eq=13.0)
+        tm.that(_series(merged, "queue_depth", MetricType.GAUGE).value, eq=9.0)
+
+    def test_dead_worker_keeps_counters_and_drops_gauges(self, tmp_path: Path) -> None:
+        """A retired segment still counts but no longer reports gauges."""
+        store = FlextObservabilityAggregation.Store()
+        store.record("requests_total", 5.0, MetricType.COUNTER, {"route": "/orders"})
+        store.record("in_flight", 3.0, MetricType.GAUGE, {"route": "/orders"})
+        _publish(tmp_path, _MISSING_PID, store).close()
+        retired = FlextObservabilityMultiprocess.sweep_dead_workers(tmp_path)
+        merged = FlextObservabilityMultiprocess.merge(tmp_path)
+        tm.that(retired, eq=1)
+        tm.that(_series(merged, "requests_total", MetricType.COUNTER).value, eq=5.0)
+        tm.that(_series(merged, "in_flight", MetricType.GAUGE).count, eq=0)
+        again = FlextObservabilityMultiprocess.mark_process_dead(_MISSING_PID, tmp_path)
+        tm.that(again.value, eq=False)
+
+    def test_segment_grows_and_republishes_in_place(self, tmp_path: Path) -> None:
+        """New series extend the mapping; republishing updates their values."""
+        store = FlextObservabilityAggregation.Store()
+        for index in range(1000):
+            store.record(f"series_{index}", 1.0, MetricType.COUNTER)
+        segment = _publish(tmp_path, 301, store)
+        store.record("series_0", 1.0, MetricType.COUNTER)
+        _ = segment.publish(store.capture(), {})
+        size = segment.path.stat().st_size
+        segment.close()
+        merged = FlextObservabilityMultiprocess.merge(tmp_path)
+        tm.that(size, gt=c.Observability.MULTIPROCESS_SEGMENT_SIZE)
+        tm.that(len(merged.series()), eq=1000)
+        tm.that(merged.handle("series_0", MetricType.COUNTER).unwrap().value, eq=2.0)
+
+    def test_segment_mid_publish_is_not_read(self, tmp_path: Path) -> None:
+        """A copy taken while the generation counter is odd is rejected."""
+        path = FlextObservabilityMultiprocess.segment_path(tmp_path, 401)
+        header = struct.pack(
+            "<4sHHIIQQd",
+            c.Observability.MULTIPROCESS_SEGMENT_MAGIC,
+            c.Observability.MULTIPROCESS_FORMAT_VERSION,
+            0,
+            401,
+            0,
+            1,
+            40,
+            0.0,
+        )
+        _ = path.write_bytes(header)
+        tm.that(FlextObservabilityMultiprocess.read_segment(path), none=True)
+
+    def test_writer_publishes_local_store(self, tmp_path: Path) -> None:
+        """The writer copies its store into this process's segment."""
+        store = FlextObservabilityAggregation.Store()
+        writer = FlextObservabilityMultiprocess.Writer(tmp_path, store=store)
+        tm.that(writer.set_gauge_policy("in_flight", "median").failure, eq=True)
+        store.record("jobs_total", 1.0, MetricType.COUNTER)
+        tm.that(writer.publish(), eq=1)
+        records = FlextObservabilityMultiprocess.read_segment(writer.path)
+        tm.that(records is not None and records[0].name == "jobs_total", eq=True)
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    @pytest.mark.filterwarnings("ignore:.*fork.*:DeprecationWarning")
+    def test_forked_child_publishes_only_its_own_records(self, tmp_path: Path) -> None:
+        """A forked worker does not republish the counts it inherited."""
+        store = FlextObservabilityAggregation.Store()
+        writer = FlextObservabilityMultiprocess.Writer(
+            tmp_path, interval_sec=60.0, store=store
+        )
+        store.record("jobs_total", 10.0, MetricType.COUNTER)
+        tm.ok(writer.start())
+        child = os.fork()
+        if child == 0:
+            code = 1
+            try:
+                store.record("jobs_total", 1.0, MetricType.COUNTER)
+                writer.stop()
+                code = 0
+            finally:
+                os._exit(code)
+        _, status = os.waitpid(child, 0)
+        writer.stop()
+        merged = FlextObservabilityMultiprocess.merge(tmp_path)
+        tm.that(os.waitstatus_to_exitcode(status), eq=0)
+        tm.that(merged.handle("jobs_total", MetricType.COUNTER).unwrap().value, eq=11.0)
@@ -0,0 +1,159 @@
+"""Behavioral tests for observability overhead self-accounting.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Generator
+
+import pytest
+
+from flext_observability import (
+    FlextObservabilityAggregation,
+    FlextObservabilityContext,
+    FlextObservabilityOverhead,
+    c,
+)
+from flext_tests import tm
+
+__all__ = ["TestsFlextObservabilityOverhead"]
+
+
+@FlextObservabilityOverhead.measure("test.inner")
+def _inner() -> int:
+    time.sleep(0.001)
+    return 1
+
+
+@FlextObservabilityOverhead.measure("test.outer")
+def _outer() -> int:
+    return _inner() + _inner()
+
+
+def _started_ms_ago(milliseconds: float) -> int:
+    return time.perf_counter_ns() - int(milliseconds * 1_000_000)
+
+
+def _gauge(store: FlextObservabilityAggregation.Store, name: str) -> float:
+    return store.handle(name, c.Observability.MetricType.GAUGE).unwrap().value
+
+
+@pytest.mark.usefixtures("accounting")
+class TestsFlextObservabilityOverhead:
+    """Per-path accounting, nesting, request share and metric export."""
+
+    @pytest.fixture
+    def accounting(self) -> Generator[None]:
+        """Enable accounting on clean counters and restore the setting."""
+        FlextObservabilityOverhead.reset()
+        _ = FlextObservabilityOverhead.configure(enabled=True)
+        yield
+        _ = FlextObservabilityOverhead.configure()
+        FlextObservabilityOverhead.reset()
+
+    def test_disabled_paths_are_not_accounted(self) -> None:
+        """While disabled the decorated call runs without being counted."""
+        _ = FlextObservabilityOverhead.configure(enabled=False)
+        tm.that(_outer(), eq=2)
+        tm.that(FlextObservabilityOverhead.report()["paths"], eq={})
+
+    def test_disabled_hot_paths_run_unwrapped(self) -> None:
+        """Disabling rebinds instrumented hot paths to their plain functions."""
+        tm.that(hasattr(FlextObservabilityContext.to_headers, "__wrapped__"), eq=True)
+        _ = FlextObservabilityOverhead.configure(enabled=False)
+        tm.that(hasattr(FlextObservabilityContext.to_headers, "__wrapped__"), eq=False)
+
+    def test_settings_error_leaves_accounting_disabled(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A lazy configure that cannot read settings never raises into calls."""
+
+        def broken(*, enabled: bool | None) -> bool:
+            msg = f"settings unavailable ({enabled})"
+            raise ValueError(msg)
+
+        monkeypatch.setattr(
+            FlextObservabilityOverhead, "_resolve_state", staticmethod(broken)
+        )
+        FlextObservabilityOverhead.enabled = None
+        tm.that(_outer(), eq=2)
+        tm.that(FlextObservabilityOverhead.enabled, eq=False)
+        tm.that(FlextObservabilityOverhead.request_started(), eq=0)
+        result = FlextObservabilityOverhead.configure()
+        tm.that(result.failure, eq=True)
+        tm.that(result.error, has="settings unavailable")
+        tm.that(FlextObservabilityOverhead.report()["paths"], eq={})
+        monkeypatch.undo()
+
+    def test_nested_paths_count_once_in_total(self) -> None:
+        """Inner calls keep their own totals but are not added twice."""
+        tm.that(_outer(), eq=2)
+        report = FlextObservabilityOverhead.report()
+        paths = report["paths"]
+        tm.that(isinstance(paths, dict), eq=True)
+        outer = paths["test.outer"]
+        inner = paths["test.inner"]
+        tm.that(isinstance(outer, dict) and isinstance(inner, dict), eq=True)
+        tm.that(outer["calls"], eq=1)
+        tm.that(inner["calls"], eq=2)
+        tm.that(report["observability_seconds"], eq=outer["seconds"])
+
+    def test_ratio_is_share_of_request_time(self) -> None:
+        """Observability time is reported against the served request time."""
+        _ = _inner()
+        FlextObservabilityOverhead.request_finished(_started_ms_ago(1000.0))
+        report = FlextObservabilityOverhead.report()
+        ratio = report["ratio"]
+        tm.that(report["requests"], eq=1)
+        tm.that(isinstance(ratio, float) and 0.0 < ratio < 0.1, eq=True)
+
+    def test_counters_from_every_thread_are_summed(self) -> None:
+        """Each thread writes its own counters; the report adds them up."""
+        workers = [threading.Thread(target=_inner) for _ in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        _ = FlextObservabilityContext.to_headers()
+        paths = FlextObservabilityOverhead.report()["paths"]
+        tm.that(isinstance(paths, dict), eq=True)
+        inner = paths["test.inner"]
+        tm.that(isinstance(inner, dict) and inner["calls"] == 4, eq=True)
+        tm.that(paths, has="context.to_headers")
+
+    def test_finished_thread_counters_are_retired_into_totals(self) -> None:
+        """Counters of finished threads keep counting after they are folded."""
+        for _ in range(2):
+            worker = threading.Thread(target=_inner)
+            worker.start()
+            worker.join()
+            _ = FlextObservabilityOverhead.report()
+        paths = FlextObservabilityOverhead.report()["paths"]
+        tm.that(isinstance(paths, dict), eq=True)
+        inner = paths["test.inner"]
+        tm.that(isinstance(inner, dict) and inner["calls"] == 2, eq=True)
+
+    def test_export_publishes_metrics_and_budget(self) -> None:
+        """Export records interval deltas and flags an exceeded budget."""
+        store = FlextObservabilityAggregation.Store()
+        _ = _outer()
+        FlextObservabilityOverhead.request_finished(_started_ms_ago(1.0))
+        ratio = FlextObservabilityOverhead.export(store).value
+        tm.that(ratio, gt=c.Observability.OVERHEAD_BUDGET_RATIO)
+        tm.that(_gauge(store, "flext_observability_overhead_budget_exceeded"), eq=1.0)
+        calls = store.handle(
+            "flext_observability_overhead_calls_total",
+            c.Observability.MetricType.COUNTER,
+            {"path": "test.inner"},
+        ).unwrap()
+        tm.that(calls.value, eq=2.0)
+        FlextObservabilityOverhead.request_finished(_started_ms_ago(60_000.0))
+        tm.that(FlextObservabilityOverhead.export(store).value, eq=0.0)
+        tm.that(_gauge(store, "flext_observability_overhead_budget_exceeded"), eq=0.0)
+        tm.that(calls.value, eq=2.0)
+        tm.that(store.render_prometheus(), has="flext_observability_overhead_ratio")
@@ -0,0 +1,101 @@
+"""Behavioral tests for the trace-tagged sampling profiler.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Generator
+from pathlib import Path
+
+import pytest
+
+from flext_observability import FlextObservabilityContext, FlextObservabilityProfiler
+from flext_tests import tm
+
+__all__ = ["TestsFlextObservabilityProfiler"]
+
+
+def _park_in_span(ready: threading.Event, release: threading.Event) -> None:
+    FlextObservabilityContext.update_trace_id("trace-slow")
+    FlextObservabilityContext.update_span_id("span-slow")
+    ready.set()
+    _ = release.wait(5.0)
+
+
+class TestsFlextObservabilityProfiler:
+    """Span tagging, bounded table, folded output and the sampling thread."""
+
+    @pytest.fixture
+    def parked(self) -> Generator[FlextObservabilityProfiler.Profiler]:
+        """A started-tracking profiler and a thread parked inside a span."""
+        profiler = FlextObservabilityProfiler.Profiler()
+        FlextObservabilityContext.track_thread_spans(enabled=True)
+        ready, release = threading.Event(), threading.Event()
+        worker = threading.Thread(target=_park_in_span, args=(ready, release))
+        worker.start()
+        _ = ready.wait(5.0)
+        yield profiler
+        release.set()
+        worker.join()
+        FlextObservabilityContext.track_thread_spans(enabled=False)
+
+    def test_samples_are_tagged_with_thread_span(
+        self, parked: FlextObservabilityProfiler.Profiler
+    ) -> None:
+        """Samples of a thread carry the trace and span it last entered."""
+        tm.that(parked.sample_once(), gt=0)
+        folded = parked.table.folded(trace_id="trace-slow")
+        tm.that(folded, has="_park_in_span;threading:Event.wait")
+        hottest = parked.table.hot_frames("span-slow")[0]
+        tm.that(str(hottest["frame"]).startswith("threading:"), eq=True)
+        tm.that(hottest["share"], eq=1.0)
+
+    def test_table_sheds_tags_before_dropping(self) -> None:
+        """Past the limit samples lose their span tag, then get dropped."""
+        table = FlextObservabilityProfiler.Table(max_stacks=2)
+        table.add("", "", "main;work")
+        table.add("t1", "s1", "main;other")
+        table.add("t2", "s2", "main;work")
+        table.add("t3", "s3", "main;idle")
+        tm.that(table.size, eq=2)
+        tm.that(table.samples, eq=4)
+        tm.that(table.dropped, eq=1)
+        tm.that(table.stacks(), eq={"main;work": 2, "main;other": 1})
+        tm.that(table.folded(span_id="s1"), eq="main;other 1\n")
+
+    def test_write_folded_emits_flamegraph_lines(
+        self, parked: FlextObservabilityProfiler.Profiler, tmp_path: Path
+    ) -> None:
+        """Each folded line is ``frame;...;frame count``."""
+        _ = parked.sample_once()
+        written = parked.write_folded(tmp_path / "profile.folded").value
+        lines = written.read_text(encoding="utf-8").splitlines()
+        tm.that(len(lines), gt=0)
+        for line in lines:
+            stack, _, count = line.rpartition(" ")
+            tm.that(stack != "" and count.isdigit(), eq=True)
+
+    def test_background_sampling_collects_samples(
+        self, parked: FlextObservabilityProfiler.Profiler
+    ) -> None:
+        """The sampling thread keeps counting until stopped."""
+        parked.hz = 200.0
+        tm.that(parked.start().success, eq=True)
+        deadline = time.monotonic() + 5.0
+        while parked.table.samples < 10 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        parked.stop()
+        tm.that(parked.running, eq=False)
+        tm.that(parked.table.samples, gt=9)
+        tm.that(parked.table.hot_frames("span-slow"), ne=[])
+
+    def test_non_positive_rate_is_rejected(self) -> None:
+        """A profiler cannot start without a positive sampling rate."""
+        profiler = FlextObservabilityProfiler.Profiler(hz=0.0)
+        tm.that(profiler.start().failure, eq=True)
+        tm.that(profiler.running, eq=False)
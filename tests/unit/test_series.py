@@ -0,0 +1,73 @@
+"""Behavioral tests for series interning and label-set encoding.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+from flext_observability import (
+    FlextObservabilityAggregation,
+    FlextObservabilitySeries,
+    c,
+)
+from flext_tests import tm
+
+__all__ = ["TestsFlextObservabilitySeries"]
+
+
+class TestsFlextObservabilitySeries:
+    """Dense IDs, order-independent label sets, decoding and the store."""
+
+    def test_label_order_does_not_change_series(self) -> None:
+        """The same labels in any order resolve to one series ID."""
+        registry = FlextObservabilitySeries.Registry()
+        first = registry.series_id("requests_total", {"method": "GET", "code": "200"})
+        second = registry.series_id("requests_total", {"code": "200", "method": "GET"})
+        other = registry.series_id("requests_total", {"code": "500", "method": "GET"})
+        tm.that(first, eq=second)
+        tm.that(other, ne=first)
+        tm.that(len(registry), eq=2)
+        tm.that(registry.series_id("requests_total"), eq=2)
+
+    def test_decode_returns_name_and_sorted_labels(self) -> None:
+        """A series decodes to the canonical (name, sorted pairs) key."""
+        registry = FlextObservabilitySeries.Registry()
+        series_id = registry.series_id("latency_seconds", {"route": "/a", "code": 200})
+        tm.that(
+            registry.decode(series_id),
+            eq=("latency_seconds", (("code", "200"), ("route", "/a"))),
+        )
+        decoded = registry.decode_many([series_id, series_id])
+        tm.that(list(decoded), eq=[series_id])
+
+    def test_int_only_resolution_matches_mapping(self) -> None:
+        """Series IDs built from interned ints equal the mapping path."""
+        registry = FlextObservabilitySeries.Registry()
+        by_mapping = registry.series_id("jobs_total", {"queue": "mail"})
+        by_ids = registry.series_id_for(
+            registry.intern("jobs_total"), [registry.pair_id("queue", "mail")]
+        )
+        tm.that(by_ids, eq=by_mapping)
+        tm.that(registry.string(registry.intern("mail")), eq="mail")
+
+    def test_cache_is_bounded(self) -> None:
+        """Dropping the bounded lookup cache keeps every series ID stable."""
+        registry = FlextObservabilitySeries.Registry(cache_size=4)
+        ids = [registry.series_id("hits_total", {"user": str(n)}) for n in range(10)]
+        again = [registry.series_id("hits_total", {"user": str(n)}) for n in range(10)]
+        tm.that(again, eq=ids)
+        tm.that(registry.bytes_per_series, gt=0.0)
+
+    def test_store_records_by_series_id(self) -> None:
+        """Recording by ID and by name feeds the same store series."""
+        registry = FlextObservabilitySeries.Registry()
+        store = FlextObservabilityAggregation.Store(registry=registry)
+        series_id = registry.series_id("queue_depth", {"queue": "jobs"})
+        store.record_id(series_id, 5.0)
+        store.record("queue_depth", 7.0, labels={"queue": "jobs"})
+        series = store.handle_id(series_id, c.Observability.MetricType.GAUGE).unwrap()
+        tm.that(series.count, eq=2)
+        tm.that(series.labels, eq=(("queue", "jobs"),))
+        tm.that(store.render_prometheus(), has='queue_depth{queue="jobs"} 7.0')
@@ -0,0 +1,164 @@
+"""Behavioral tests for the memory-mapped spill queue and exporter.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import socketserver
+import struct
+import threading
+import time
+from pathlib import Path
+from typing import override
+
+from flext_observability import FlextObservabilitySpill
+from flext_tests import tm
+
+__all__ = ["TestsFlextObservabilitySpill"]
+
+
+class _Server(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+
+class _Collector:
+    """Local stand-in collector that can be taken down and brought back."""
+
+    def __init__(self) -> None:
+        self.received: list[bytes] = []
+        self.reply = b"HTTP/1.1 200 OK\r\nContent-Length: 0\r\n\r\n"
+        self._server: _Server | None = None
+        self.port = 0
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.port}/v1/metrics"
+
+    def up(self) -> None:
+        received = self.received
+        collector = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            @override
+            def handle(self) -> None:
+                length = 0
+                while (line := self.rfile.readline().strip()) != b"":
+                    name, _, value = line.partition(b":")
+                    if name.lower() == b"content-length":
+                        length = int(value)
+                received.append(self.rfile.read(length))
+                self.wfile.write(collector.reply)
+
+        self._server = _Server(("127.0.0.1", self.port), Handler)
+        self.port = self._server.server_address[1]
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def down(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+
+def _exporter(
+    collector: _Collector, directory: Path, retry_interval_sec: float = 1.0
+) -> FlextObservabilitySpill.Exporter:
+    return FlextObservabilitySpill.Exporter(
+        FlextObservabilitySpill.HTTPSender(collector.url, timeout_sec=1.0),
+        FlextObservabilitySpill.Queue(directory, segment_size=4096),
+        retry_interval_sec=retry_interval_sec,
+    )
+
+
+class TestsFlextObservabilitySpill:
+    """Outage spill, ordered replay, crash recovery and disk budget."""
+
+    def test_outage_spills_and_replays_in_order(self, tmp_path: Path) -> None:
+        """Batches sent during an outage arrive in order after recovery."""
+        collector = _Collector()
+        collector.up()
+        exporter = _exporter(collector, tmp_path)
+        tm.that(exporter.submit(b"batch-0").value, eq=True)
+        collector.down()
+        for index in range(1, 4):
+            tm.that(exporter.submit(f"batch-{index}".encode()).value, eq=False)
+        tm.that(exporter.flush(), eq=0)
+        collector.up()
+        tm.that(exporter.submit(b"batch-4").value, eq=False)
+        tm.that(exporter.flush(), eq=4)
+        collector.down()
+        expected = [f"batch-{index}".encode() for index in range(5)]
+        tm.that(collector.received, eq=expected)
+        tm.that(exporter.queue.pending, eq=0)
+
+    def test_malformed_response_spills_the_batch(self, tmp_path: Path) -> None:
+        """A protocol error from the collector spills instead of raising."""
+        collector = _Collector()
+        collector.reply = b"garbage\r\n\r\n"
+        collector.up()
+        exporter = _exporter(collector, tmp_path)
+        result = exporter.submit(b"batch-0")
+        collector.down()
+        tm.that(result.value, eq=False)
+        tm.that(exporter.queue.pending, eq=1)
+
+    def test_background_replay_after_collector_returns(self, tmp_path: Path) -> None:
+        """The replay thread drains the queue once the collector is back."""
+        collector = _Collector()
+        collector.up()
+        collector.down()
+        exporter = _exporter(collector, tmp_path, retry_interval_sec=0.05)
+        exporter.start()
+        _ = exporter.submit(b"late")
+        collector.up()
+        deadline = time.monotonic() + 5.0
+        while exporter.queue.pending and time.monotonic() < deadline:
+            time.sleep(0.02)
+        exporter.stop()
+        collector.down()
+        tm.that(collector.received, eq=[b"late"])
+
+    def test_recovers_pending_batches_after_crash(self, tmp_path: Path) -> None:
+        """A new queue resumes after the last consumed batch."""
+        queue = FlextObservabilitySpill.Queue(tmp_path)
+        for index in range(3):
+            _ = queue.append(f"batch-{index}".encode())
+        queue.pop()
+        recovered = FlextObservabilitySpill.Queue(tmp_path)
+        tm.that(recovered.pending, eq=2)
+        tm.that(recovered.peek(), eq=b"batch-1")
+        recovered.pop()
+        tm.that(recovered.peek(), eq=b"batch-2")
+
+    def test_torn_tail_is_dropped_on_recovery(self, tmp_path: Path) -> None:
+        """A record whose checksum does not match ends the recovered data."""
+        queue = FlextObservabilitySpill.Queue(tmp_path)
+        _ = queue.append(b"complete")
+        queue.close()
+        segment = next(tmp_path.iterdir())
+        with segment.open("r+b") as handle:
+            _ = handle.seek(24 + 8 + len(b"complete"))
+            _ = handle.write(struct.pack("<II", 4, 0) + b"torn")
+        recovered = FlextObservabilitySpill.Queue(tmp_path)
+        tm.that(recovered.pending, eq=1)
+        tm.that(recovered.peek(), eq=b"complete")
+        _ = recovered.append(b"next")
+        recovered.pop()
+        tm.that(recovered.peek(), eq=b"next")
+
+    def test_disk_budget_evicts_oldest_segments(self, tmp_path: Path) -> None:
+        """Above the budget whole oldest segments are dropped."""
+        queue = FlextObservabilitySpill.Queue(
+            tmp_path, segment_size=1024, max_bytes=3072
+        )
+        for index in range(40):
+            _ = queue.append(f"{index:04d}".encode() * 50)
+        tm.that(queue.disk_bytes <= 3072, eq=True)
+        tm.that(queue.dropped, gt=0)
+        tm.that(queue.pending + queue.dropped, eq=40)
+        oldest = queue.peek()
+        tm.that(oldest is not None and oldest.startswith(b"0000"), eq=False)
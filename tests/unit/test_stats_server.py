@@ -0,0 +1,109 @@
+"""Behavioral tests for the Unix-domain-socket stats server.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import itertools
+import threading
+import time
+from pathlib import Path
+
+from flext_observability import (
+    FlextObservabilityAggregation,
+    FlextObservabilityErrorHandling,
+    FlextObservabilityStatsServer,
+    c,
+)
+from flext_observability.cli import FlextObservabilityCli
+from flext_tests import tm
+
+__all__ = ["TestsFlextObservabilityStatsServer"]
+
+
+class TestsFlextObservabilityStatsServer:
+    """Snapshot content, caching, concurrent writers and socket lifecycle."""
+
+    def test_cli_reads_snapshot_from_socket(self, tmp_path: Path) -> None:
+        """The CLI fetches metrics, sampling and resources over the socket."""
+        FlextObservabilityAggregation.active_store().record(
+            "stats_server_requests_total", 3.0, c.Observability.MetricType.COUNTER
+        )
+        server = FlextObservabilityStatsServer.Server(str(tmp_path / "stats.sock"))
+        tm.that(server.start().success, eq=True)
+        snapshot = FlextObservabilityCli.fetch_snapshot(f"unix:{server.path}")
+        server.stop()
+        names = [series["name"] for series in snapshot["metrics"]]
+        tm.that(names, has="stats_server_requests_total")
+        tm.that(snapshot["version"], eq=c.Observability.SNAPSHOT_FORMAT_VERSION)
+        tm.that(snapshot["sampling"], has="default_rate")
+        tm.that(snapshot["resources"], has="memory_mb")
+        tm.that(snapshot["health"], has="status")
+        tm.that(Path(server.path).exists(), eq=False)
+
+    def test_snapshot_is_shared_inside_ttl(self, tmp_path: Path) -> None:
+        """Clients inside the TTL receive the same encoded snapshot."""
+        server = FlextObservabilityStatsServer.Server(
+            str(tmp_path / "stats.sock"), ttl_sec=60.0
+        )
+        tm.that(server.start().success, eq=True)
+        first = FlextObservabilityCli.fetch_snapshot(f"unix:{server.path}")
+        second = FlextObservabilityCli.fetch_snapshot(f"unix:{server.path}")
+        server.stop()
+        tm.that(first["timestamp"], eq=second["timestamp"])
+        tm.that(server.served, eq=2)
+
+    def test_snapshots_do_not_stop_writers(self) -> None:
+        """Writers keep recording between and during snapshot captures."""
+        store = FlextObservabilityAggregation.Store()
+        handle = store.handle(
+            "stats_server_writes", c.Observability.MetricType.COUNTER
+        ).unwrap()
+        stop = threading.Event()
+
+        def write() -> None:
+            while not stop.is_set():
+                with store.lock:
+                    handle.observe(1.0)
+
+        def wait_past(count: int) -> None:
+            deadline = time.monotonic() + 5.0
+            while handle.count <= count and time.monotonic() < deadline:
+                time.sleep(0)
+
+        writer = threading.Thread(target=write)
+        writer.start()
+        wait_past(0)
+        counts = []
+        for _ in range(20):
+            counts.append(store.capture()[0].count)
+            wait_past(counts[-1])
+        stop.set()
+        writer.join()
+        tm.that(counts[0], gt=0)
+        tm.that(all(a < b for a, b in itertools.pairwise(counts)), eq=True)
+        tm.that(handle.count, gt=counts[-1])
+
+    def test_top_fingerprints_are_busiest_first(self) -> None:
+        """Error fingerprints are reported by windowed count."""
+        handler = FlextObservabilityErrorHandling.Handler()
+        _ = handler.record_occurrences("quiet", 1)
+        _ = handler.record_occurrences("noisy", 7)
+        top = handler.top_fingerprints(limit=1)
+        tm.that(len(top), eq=1)
+        tm.that(top[0]["fingerprint"], eq="noisy")
+        tm.that(top[0]["count"], eq=7)
+
+    def test_live_socket_is_not_replaced(self, tmp_path: Path) -> None:
+        """A second server refuses a path another server is listening on."""
+        path = str(tmp_path / "stats.sock")
+        server = FlextObservabilityStatsServer.Server(path)
+        tm.that(server.start().success, eq=True)
+        second = FlextObservabilityStatsServer.Server(path)
+        result = second.start()
+        server.stop()
+        tm.that(result.failure, eq=True)
+        tm.that(second.running, eq=False)
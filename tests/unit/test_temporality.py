@@ -0,0 +1,151 @@
+"""Behavioral tests for cumulative and delta metric temporality.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from flext_observability import (
+    FlextObservabilityAggregation,
+    FlextObservabilitySeries,
+    FlextObservabilitySettings,
+    FlextObservabilityTemporality,
+    c,
+)
+from flext_tests import tm
+
+__all__ = ["TestsFlextObservabilityTemporality"]
+
+COUNTER = c.Observability.MetricType.COUNTER
+DELTA = c.Observability.Temporality.DELTA
+CUMULATIVE = c.Observability.Temporality.CUMULATIVE
+
+
+def _recorder() -> FlextObservabilityTemporality.Recorder:
+    store = FlextObservabilityAggregation.Store(
+        registry=FlextObservabilitySeries.Registry()
+    )
+    return FlextObservabilityTemporality.Recorder(store)
+
+
+def _total(series: list[FlextObservabilityAggregation.Series], name: str) -> float:
+    return sum(item.sum for item in series if item.name == name)
+
+
+class TestsFlextObservabilityTemporality:
+    """Delta checkpoints, cumulative reads and lossless concurrent collection."""
+
+    def test_delta_resets_between_exports(self) -> None:
+        """Each delta export holds only what was recorded since the last one."""
+        recorder = _recorder()
+        recorder.record("jobs_total", 2.0, COUNTER, {"queue": "mail"})
+        recorder.record("jobs_total", 3.0, COUNTER, {"queue": "mail"})
+        first = recorder.export(DELTA)
+        recorder.record("jobs_total", 4.0, COUNTER, {"queue": "mail"})
+        second = recorder.export(DELTA)
+        tm.that(first["temporality"], eq="delta")
+        tm.that([item["sum"] for item in first["series"]], eq=[5.0])
+        tm.that([item["sum"] for item in second["series"]], eq=[4.0])
+        tm.that(second["series"][0]["labels"], eq={"queue": "mail"})
+        tm.that(second["start_time_unix_nano"], gt=first["start_time_unix_nano"])
+        tm.that(recorder.export(DELTA)["series"], eq=[])
+
+    def test_cumulative_reads_include_unflushed_shards(self) -> None:
+        """The store flushes the recorder before every read."""
+        recorder = _recorder()
+        recorder.record("rows_total", 5.0, COUNTER)
+        _ = recorder.export(DELTA)
+        recorder.record("rows_total", 7.0, COUNTER)
+        cumulative = recorder.export(CUMULATIVE)
+        tm.that([item["sum"] for item in cumulative["series"]], eq=[12.0])
+        tm.that(recorder.store.render_prometheus(), has="rows_total 12.0")
+
+    def test_cumulative_setups_keep_no_delta_until_one_is_collected(self) -> None:
+        """Deltas start at the first delta collection, not at recorder start."""
+        recorder = _recorder()
+        recorder.record("rows_total", 5.0, COUNTER)
+        tm.that(_total(list(recorder.store.capture()), "rows_total"), eq=5.0)
+        first = recorder.export(DELTA)
+        tm.that(first["series"], eq=[])
+        recorder.record("rows_total", 2.0, COUNTER)
+        _ = recorder.export(CUMULATIVE)
+        tm.that(_total(list(recorder.collect(DELTA)), "rows_total"), eq=2.0)
+
+    def test_histogram_buckets_survive_the_swap(self) -> None:
+        """Bucket counts are folded into both temporalities."""
+        recorder = _recorder()
+        histogram = c.Observability.MetricType.HISTOGRAM
+        for value in (0.004, 0.02, 0.02, 7.0):
+            recorder.record("latency_seconds", value, histogram)
+        delta = recorder.collect(DELTA)
+        cumulative = recorder.collect(CUMULATIVE)
+        tm.that(sum(delta[0].buckets), eq=4)
+        tm.that(cumulative[0].buckets, eq=delta[0].buckets)
+        tm.that(delta[0].max, eq=7.0)
+
+    def test_store_clear_drops_unflushed_shards_and_delta(self) -> None:
+        """Nothing recorded before a store clear is folded in afterwards."""
+        recorder = _recorder()
+        recorder.record("rows_total", 5.0, COUNTER)
+        _ = recorder.flush()
+        recorder.record("rows_total", 7.0, COUNTER)
+        recorder.store.clear()
+        recorder.record("rows_total", 1.0, COUNTER)
+        tm.that(_total(list(recorder.collect(DELTA)), "rows_total"), eq=1.0)
+        tm.that(_total(list(recorder.collect(CUMULATIVE)), "rows_total"), eq=1.0)
+
+    def test_unknown_temporality_is_rejected(self) -> None:
+        """Only the two OpenTelemetry temporalities are accepted."""
+        recorder = _recorder()
+        with pytest.raises(ValueError, match="monthly"):
+            _ = recorder.collect("monthly")
+
+    def test_temporality_setting_is_validated(self) -> None:
+        """The setting accepts the enum values and rejects anything else."""
+        configured = FlextObservabilitySettings.model_validate({
+            "Observability": {"metrics_temporality": "delta"}
+        })
+        tm.that(configured.Observability.metrics_temporality, eq=DELTA)
+        with pytest.raises(c.ValidationError, match="metrics_temporality"):
+            _ = FlextObservabilitySettings.model_validate({
+                "Observability": {"metrics_temporality": "monthly"}
+            })
+
+    def test_concurrent_delta_exports_lose_no_updates(self) -> None:
+        """Deltas taken while writers run add up to every increment."""
+        recorder = _recorder()
+        writers, increments = 8, 5_000
+        done = threading.Event()
+        deltas: list[float] = []
+
+        def write(worker: int) -> None:
+            labels = {"worker": str(worker % 2)}
+            for _ in range(increments):
+                recorder.record("ops_total", 1.0, COUNTER, labels)
+
+        def collect() -> None:
+            while not done.is_set():
+                deltas.append(_total(list(recorder.collect(DELTA)), "ops_total"))
+
+        collector = threading.Thread(target=collect)
+        threads = [
+            threading.Thread(target=write, args=(worker,)) for worker in range(writers)
+        ]
+        collector.start()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        done.set()
+        collector.join()
+        deltas.append(_total(list(recorder.collect(DELTA)), "ops_total"))
+        expected = float(writers * increments)
+        tm.that(sum(deltas), eq=expected)
+        tm.that(_total(list(recorder.collect(CUMULATIVE)), "ops_total"), eq=expected)
+        tm.that(len(deltas), gt=1)
@@ -6,7 +6,14 @@ SPDX-License-Identifier: MIT
 
 from __future__ import annotations
 
-from flext_observability import FlextObservabilityUtilities
+import timeit
+from collections.abc import Callable
+
+from flext_observability import (
+    FlextObservabilityPerformance,
+    FlextObservabilityUtilities,
+    m,
+)
 from flext_tests import FlextTestsUtilities
 
 
@@ -15,6 +22,27 @@ class TestsFlextObservabilityUtilities(
 ):
     """Test utilities for flext-observability."""
 
+    class Observability(FlextObservabilityUtilities.Observability):
+        """Observability domain test utilities."""
+
+        class Tests:
+            """Observability test helpers."""
+
+            @staticmethod
+            def within_budget(
+                operation: str, call: Callable[[], object], calls: int
+            ) -> bool:
+                """Time ``calls`` runs of ``call`` against the operation's budget.
+
+                The best of three repeats is turned into a per-call mean and
+                checked with ``performance_acceptable``.
+                """
+                seconds = min(timeit.repeat(call, number=calls, repeat=3))
+                metrics = m.Observability.PerformanceMetrics(
+                    operation=operation, duration_ms=seconds / calls * 1e3
+                )
+                return FlextObservabilityPerformance.performance_acceptable(metrics)
+
 
 u = TestsFlextObservabilityUtilities
 __all__: list[str] = ["TestsFlextObservabilityUtilities", "u"]